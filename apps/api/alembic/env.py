@@ -17,7 +17,8 @@ config = context.config
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    # Keep loggers created before migrations run in process (e.g. by the tests)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
@@ -30,6 +31,10 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# A URL set on the Config by the caller (the test suite migrating its
+# template database) wins over DATABASE_URL
+database_url = config.get_main_option("sqlalchemy.url") or settings.DATABASE_URL
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -43,7 +48,7 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = settings.DATABASE_URL  # Get from environment variables
+    url = database_url
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -62,9 +67,9 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    # Get configuration and override URL with environment variable
+    # Get configuration and override URL (see database_url above)
     configuration = config.get_section(config.config_ini_section, {})
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
+    configuration["sqlalchemy.url"] = database_url
     
     connectable = engine_from_config(
         configuration,
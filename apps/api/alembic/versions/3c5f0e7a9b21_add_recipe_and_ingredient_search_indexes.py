@@ -0,0 +1,77 @@
+"""add recipe and ingredient search indexes
+
+The B-tree indexes on recipes.name and ingredients.name cannot serve
+ILIKE '%chick%' or typo-tolerant lookups. This adds pg_trgm GIN indexes on
+both names and a stored, weighted tsvector over recipe name (A),
+description (B) and instructions (C) with its own GIN index.
+
+Revision ID: 3c5f0e7a9b21
+Revises: f630f10f0423
+Create Date: 2026-10-17 13:02:47.118305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5f0e7a9b21"
+down_revision: Union[str, Sequence[str], None] = "f630f10f0423"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(instructions, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "recipes",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_DOCUMENT, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_recipes_search_vector",
+        "recipes",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_recipes_name_trgm",
+        "recipes",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_ingredients_name_trgm",
+        "ingredients",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ingredients_name_trgm", table_name="ingredients")
+    op.drop_index("ix_recipes_name_trgm", table_name="recipes")
+    op.drop_index("ix_recipes_search_vector", table_name="recipes")
+    op.drop_column("recipes", "search_vector")
+    # pg_trgm is left installed: other objects may depend on it
@@ -0,0 +1,37 @@
+"""index recipe_ingredients.recipe_id
+
+Grocery aggregation joins meal_plans to recipe_ingredients on recipe_id;
+without an index every planned meal forces a scan of the junction table.
+
+Revision ID: 52e21a81b390
+Revises: a1fabd0c3c69
+Create Date: 2026-10-17 09:12:31.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "52e21a81b390"
+down_revision: Union[str, Sequence[str], None] = "a1fabd0c3c69"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_recipe_ingredients_recipe_id"),
+        "recipe_ingredients",
+        ["recipe_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_recipe_ingredients_recipe_id"), table_name="recipe_ingredients"
+    )
@@ -0,0 +1,54 @@
+"""add keyset pagination indexes
+
+Composite (sort key, id) indexes for the keyset-paginated list endpoints,
+so "WHERE (name, id) > (...) ORDER BY name, id LIMIT n" is a single index
+range scan at any page depth. The (name, id) and (planned_date, id)
+indexes also serve every lookup the single-column ix_recipes_name and
+ix_meal_plans_planned_date did, so those are dropped. ix_ingredients_name
+stays: it enforces the unique ingredient name.
+
+Revision ID: 7d2b9c41e8a6
+Revises: 3c5f0e7a9b21
+Create Date: 2026-10-17 14:21:09.552018
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2b9c41e8a6"
+down_revision: Union[str, Sequence[str], None] = "3c5f0e7a9b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_recipes_name_id", "recipes", ["name", "id"], unique=False)
+    op.drop_index(op.f("ix_recipes_name"), table_name="recipes")
+    op.create_index(
+        "ix_ingredients_name_id", "ingredients", ["name", "id"], unique=False
+    )
+    op.create_index(
+        "ix_meal_plans_planned_date_id",
+        "meal_plans",
+        ["planned_date", "id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_meal_plans_planned_date"), table_name="meal_plans")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_meal_plans_planned_date"),
+        "meal_plans",
+        ["planned_date"],
+        unique=False,
+    )
+    op.drop_index("ix_meal_plans_planned_date_id", table_name="meal_plans")
+    op.drop_index("ix_ingredients_name_id", table_name="ingredients")
+    op.create_index(op.f("ix_recipes_name"), "recipes", ["name"], unique=False)
+    op.drop_index("ix_recipes_name_id", table_name="recipes")
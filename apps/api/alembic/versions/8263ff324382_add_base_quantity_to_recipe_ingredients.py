@@ -0,0 +1,163 @@
+"""add base_quantity and base_unit to recipe_ingredients
+
+Stores each recipe line converted to its base unit (g, ml, each, ...) so
+grocery aggregation can sum quantities written in different units.
+Existing rows are backfilled with the unit registry of core/units.py as
+it stood at this revision, frozen below so later registry changes cannot
+change what this revision writes.
+
+Revision ID: 8263ff324382
+Revises: 52e21a81b390
+Create Date: 2026-10-17 10:03:54.118240
+
+"""
+
+import re
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8263ff324382"
+down_revision: Union[str, Sequence[str], None] = "52e21a81b390"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Scale of base_quantity (Numeric(14, 4))
+BASE_QUANTITY_EXPONENT = Decimal("0.0001")
+
+# Unit name: (base unit, factor to it, other spellings)
+# fmt: off
+UNITS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "g": ("g", "1", ("gram", "grams", "gr", "gm", "gms")),
+    "kg": ("g", "1000", ("kilogram", "kilograms", "kilo", "kilos", "kgs")),
+    "mg": ("g", "0.001", ("milligram", "milligrams")),
+    "oz": ("g", "28.349523125", ("ounce", "ounces")),
+    "lb": ("g", "453.59237", ("lbs", "pound", "pounds")),
+    "ml": ("ml", "1", ("milliliter", "milliliters", "millilitre", "millilitres", "mls", "cc")),
+    "cl": ("ml", "10", ("centiliter", "centiliters", "centilitre", "centilitres")),
+    "dl": ("ml", "100", ("deciliter", "deciliters", "decilitre", "decilitres")),
+    "l": ("ml", "1000", ("liter", "liters", "litre", "litres", "ltr")),
+    "tsp": ("ml", "4.92892159375", ("teaspoon", "teaspoons", "tsps")),
+    "tbsp": ("ml", "14.78676478125", ("tablespoon", "tablespoons", "tbsps", "tbs", "tbl")),
+    "fl oz": ("ml", "29.5735295625", ("fluid ounce", "fluid ounces", "floz")),
+    "cup": ("ml", "236.5882365", ("cups",)),
+    "pint": ("ml", "473.176473", ("pints", "pt")),
+    "quart": ("ml", "946.352946", ("quarts", "qt")),
+    "gallon": ("ml", "3785.411784", ("gallons", "gal")),
+    "each": ("each", "1", ("ea", "whole", "piece", "pieces", "pc", "pcs")),
+    "dozen": ("each", "12", ("doz",)),
+    "clove": ("clove", "1", ("cloves",)),
+    "pinch": ("pinch", "1", ("pinches",)),
+    "dash": ("dash", "1", ("dashes",)),
+    "can": ("can", "1", ("cans", "tin", "tins")),
+    "bunch": ("bunch", "1", ("bunches",)),
+    "slice": ("slice", "1", ("slices",)),
+    "sprig": ("sprig", "1", ("sprigs",)),
+    "stalk": ("stalk", "1", ("stalks",)),
+    "head": ("head", "1", ("heads",)),
+    "handful": ("handful", "1", ("handfuls",)),
+}
+# fmt: on
+
+_MULTIPLIED = re.compile(r"^(\d+(?:\.\d+)?)\s*(.+)$")
+
+
+def _clean(text: str) -> str:
+    return " ".join(re.sub(r"(?<=[a-z])\.", " ", text.lower()).split())
+
+
+_ALIASES = {
+    _clean(alias): name
+    for name, (_, _, aliases) in UNITS.items()
+    for alias in (name, *aliases)
+}
+
+
+def _lookup(key: str) -> Optional[str]:
+    name = _ALIASES.get(key)
+    if name is None and key.endswith("s"):
+        name = _ALIASES.get(key[:-1])
+    return name
+
+
+def _resolve(unit: Optional[str]) -> Tuple[Decimal, Optional[str]]:
+    """(factor, base unit) of a free-form unit; unknown units are their own base"""
+    if unit is None or not unit.strip():
+        return Decimal(1), None
+    key = _clean(unit)
+    multiplier = Decimal(1)
+    name = _ALIASES.get(key)
+    if name is None:
+        match = _MULTIPLIED.match(key)
+        if match and _lookup(match.group(2)):
+            multiplier = Decimal(match.group(1))
+            name = _lookup(match.group(2))
+        else:
+            name = _lookup(key)
+    if name is None:
+        return Decimal(1), key
+    base_unit, factor, _ = UNITS[name]
+    return multiplier * Decimal(factor), base_unit
+
+
+def base_quantities(
+    quantities: Sequence[object], units: Sequence[Optional[str]]
+) -> Tuple[List[Optional[Decimal]], List[Optional[str]]]:
+    """Base quantities and units of recipe lines, as this revision converts them"""
+    resolved = {unit: _resolve(unit) for unit in set(units)}
+    converted: List[Optional[Decimal]] = []
+    base_units: List[Optional[str]] = []
+    for quantity, unit in zip(quantities, units):
+        factor, base_unit = resolved[unit]
+        base_units.append(base_unit)
+        converted.append(
+            None
+            if quantity is None
+            else (Decimal(str(quantity)) * factor).quantize(BASE_QUANTITY_EXPONENT)
+        )
+    return converted, base_units
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "recipe_ingredients",
+        sa.Column("base_quantity", sa.Numeric(precision=14, scale=4), nullable=True),
+    )
+    op.add_column(
+        "recipe_ingredients",
+        sa.Column("base_unit", sa.String(length=50), nullable=True),
+    )
+
+    connection = op.get_bind()
+    result = connection.execute(
+        sa.text("SELECT id, quantity, unit FROM recipe_ingredients").execution_options(
+            yield_per=BACKFILL_BATCH_SIZE
+        )
+    )
+    for rows in result.partitions():
+        converted, base_units = base_quantities(
+            [row.quantity for row in rows], [row.unit for row in rows]
+        )
+        connection.execute(
+            sa.text(
+                "UPDATE recipe_ingredients "
+                "SET base_quantity = :base_quantity, base_unit = :base_unit "
+                "WHERE id = :id"
+            ),
+            [
+                {"id": row.id, "base_quantity": quantity, "base_unit": unit}
+                for row, quantity, unit in zip(rows, converted, base_units)
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("recipe_ingredients", "base_unit")
+    op.drop_column("recipe_ingredients", "base_quantity")
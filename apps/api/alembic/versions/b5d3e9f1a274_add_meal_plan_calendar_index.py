@@ -0,0 +1,39 @@
+"""add meal plan calendar index
+
+Composite (planned_date, meal_type, id) index carrying recipe_id, so the
+calendar's week and month reads are an index-only range scan in grid
+order, whatever the length of the meal plan history. It complements
+ix_meal_plans_planned_date_id, which keyset pagination needs in
+(planned_date, id) order.
+
+Revision ID: b5d3e9f1a274
+Revises: 7d2b9c41e8a6
+Create Date: 2026-10-17 18:02:41.318507
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d3e9f1a274"
+down_revision: Union[str, Sequence[str], None] = "7d2b9c41e8a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_meal_plans_planned_date_meal_type",
+        "meal_plans",
+        ["planned_date", "meal_type", "id"],
+        unique=False,
+        postgresql_include=["recipe_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_meal_plans_planned_date_meal_type", table_name="meal_plans")
@@ -0,0 +1,83 @@
+"""unique meal plan slot
+
+One meal plan per (planned_date, meal_type), so batch scheduling can
+resolve conflicts server-side with INSERT ... ON CONFLICT. Slots that
+already hold several plans are not resolved here: the upgrade fails,
+listing them, until they have been merged or deleted by hand, since
+which plan to keep is the owner's call and a deleted plan could not be
+restored on downgrade.
+
+The constraint's index carries id and recipe_id and replaces
+ix_meal_plans_planned_date_meal_type, so calendar reads stay index-only.
+
+Revision ID: c7a1f4d8e260
+Revises: b5d3e9f1a274
+Create Date: 2026-10-17 19:11:27.604133
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a1f4d8e260"
+down_revision: Union[str, Sequence[str], None] = "b5d3e9f1a274"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Conflicting slots listed in the error; the rest are only counted
+LISTED_SLOTS = 20
+
+
+def _check_duplicate_slots() -> None:
+    slots = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT planned_date, meal_type, array_agg(id ORDER BY id) AS ids"
+                " FROM meal_plans GROUP BY planned_date, meal_type"
+                " HAVING count(*) > 1 ORDER BY planned_date, meal_type"
+            )
+        )
+        .all()
+    )
+    if not slots:
+        return
+    listed = [
+        f"  {planned_date} {meal_type}: meal_plans.id {', '.join(map(str, ids))}"
+        for planned_date, meal_type, ids in slots[:LISTED_SLOTS]
+    ]
+    if len(slots) > LISTED_SLOTS:
+        listed.append(f"  ... and {len(slots) - LISTED_SLOTS} more")
+    raise RuntimeError(
+        f"{len(slots)} meal plan slots hold more than one plan; keep one plan "
+        "per (planned_date, meal_type) and delete the others, then run the "
+        "upgrade again:\n" + "\n".join(listed)
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _check_duplicate_slots()
+    # op.create_unique_constraint cannot name INCLUDE columns
+    op.execute(
+        "ALTER TABLE meal_plans ADD CONSTRAINT uq_meal_plans_planned_date_meal_type "
+        "UNIQUE (planned_date, meal_type) INCLUDE (id, recipe_id)"
+    )
+    op.drop_index("ix_meal_plans_planned_date_meal_type", table_name="meal_plans")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_meal_plans_planned_date_meal_type",
+        "meal_plans",
+        ["planned_date", "meal_type", "id"],
+        unique=False,
+        postgresql_include=["recipe_id"],
+    )
+    op.drop_constraint(
+        "uq_meal_plans_planned_date_meal_type", "meal_plans", type_="unique"
+    )
@@ -0,0 +1,274 @@
+"""create weekly_grocery_items with incremental maintenance triggers
+
+Persists the grocery list per (Monday-based) week so reads are O(items)
+instead of O(meals x ingredients). Row-level triggers on meal_plans and
+recipe_ingredients apply +/- deltas for every insert, update and delete,
+including recipe deletes. Each trigger measures its delta against the
+current state of the other table. Row triggers queued by the referential
+actions of a recipe delete (SET NULL on meal_plans, CASCADE on
+recipe_ingredients) only fire once both actions have run, so they would
+see neither side; a BEFORE DELETE trigger on recipes therefore detaches
+its meal plans first, which subtracts the contribution exactly once.
+
+Revision ID: f630f10f0423
+Revises: 8263ff324382
+Create Date: 2026-10-17 11:26:08.904117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f630f10f0423"
+down_revision: Union[str, Sequence[str], None] = "8263ff324382"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UPSERT_CONFLICT = """
+    ON CONFLICT (week_start, ingredient_id, base_unit, is_optional) DO UPDATE
+    SET quantity = g.quantity + EXCLUDED.quantity,
+        quantity_count = g.quantity_count + EXCLUDED.quantity_count,
+        line_count = g.line_count + EXCLUDED.line_count,
+        updated_at = now()
+"""
+
+APPLY_MEAL_FUNCTION = f"""
+CREATE FUNCTION weekly_grocery_apply_meal(
+    p_recipe_id integer, p_planned_date date, p_sign integer
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    v_week date := date_trunc('week', p_planned_date)::date;
+BEGIN
+    IF p_recipe_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO weekly_grocery_items AS g
+        (week_start, ingredient_id, base_unit, is_optional,
+         quantity, quantity_count, line_count)
+    SELECT v_week, ri.ingredient_id, ri.base_unit, ri.is_optional,
+           p_sign * coalesce(sum(ri.base_quantity), 0),
+           p_sign * count(ri.base_quantity),
+           p_sign * count(*)
+    FROM recipe_ingredients ri
+    WHERE ri.recipe_id = p_recipe_id
+    GROUP BY ri.ingredient_id, ri.base_unit, ri.is_optional
+    {UPSERT_CONFLICT};
+
+    DELETE FROM weekly_grocery_items
+    WHERE week_start = v_week AND line_count <= 0;
+END;
+$$;
+"""
+
+APPLY_LINE_FUNCTION = f"""
+CREATE FUNCTION weekly_grocery_apply_line(
+    p_recipe_id integer, p_ingredient_id integer, p_base_unit varchar,
+    p_is_optional boolean, p_base_quantity numeric, p_sign integer
+) RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO weekly_grocery_items AS g
+        (week_start, ingredient_id, base_unit, is_optional,
+         quantity, quantity_count, line_count)
+    SELECT date_trunc('week', mp.planned_date)::date, p_ingredient_id,
+           p_base_unit, p_is_optional,
+           p_sign * coalesce(p_base_quantity, 0) * count(*),
+           p_sign * CASE WHEN p_base_quantity IS NULL THEN 0 ELSE count(*) END,
+           p_sign * count(*)
+    FROM meal_plans mp
+    WHERE mp.recipe_id = p_recipe_id
+    GROUP BY 1
+    {UPSERT_CONFLICT};
+
+    DELETE FROM weekly_grocery_items
+    WHERE ingredient_id = p_ingredient_id AND line_count <= 0;
+END;
+$$;
+"""
+
+MEAL_PLANS_TRIGGER_FUNCTION = """
+CREATE FUNCTION weekly_grocery_meal_plans_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM weekly_grocery_apply_meal(OLD.recipe_id, OLD.planned_date, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM weekly_grocery_apply_meal(NEW.recipe_id, NEW.planned_date, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+RECIPE_INGREDIENTS_TRIGGER_FUNCTION = """
+CREATE FUNCTION weekly_grocery_recipe_ingredients_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM weekly_grocery_apply_line(
+            OLD.recipe_id, OLD.ingredient_id, OLD.base_unit,
+            OLD.is_optional, OLD.base_quantity, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM weekly_grocery_apply_line(
+            NEW.recipe_id, NEW.ingredient_id, NEW.base_unit,
+            NEW.is_optional, NEW.base_quantity, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+RECIPES_TRIGGER_FUNCTION = """
+CREATE FUNCTION weekly_grocery_recipes_delete_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- Same effect as the SET NULL action, but as an ordinary statement
+    -- whose row triggers fire while recipe_ingredients is still intact
+    UPDATE meal_plans SET recipe_id = NULL WHERE recipe_id = OLD.id;
+    RETURN OLD;
+END;
+$$;
+"""
+
+TRIGGERS = [
+    """
+    CREATE TRIGGER weekly_grocery_meal_plans_insert_delete
+    AFTER INSERT OR DELETE ON meal_plans
+    FOR EACH ROW EXECUTE FUNCTION weekly_grocery_meal_plans_trigger()
+    """,
+    """
+    CREATE TRIGGER weekly_grocery_meal_plans_update
+    AFTER UPDATE OF recipe_id, planned_date ON meal_plans
+    FOR EACH ROW
+    WHEN (OLD.recipe_id IS DISTINCT FROM NEW.recipe_id
+          OR OLD.planned_date IS DISTINCT FROM NEW.planned_date)
+    EXECUTE FUNCTION weekly_grocery_meal_plans_trigger()
+    """,
+    """
+    CREATE TRIGGER weekly_grocery_recipe_ingredients_insert_delete
+    AFTER INSERT OR DELETE ON recipe_ingredients
+    FOR EACH ROW EXECUTE FUNCTION weekly_grocery_recipe_ingredients_trigger()
+    """,
+    """
+    CREATE TRIGGER weekly_grocery_recipe_ingredients_update
+    AFTER UPDATE ON recipe_ingredients
+    FOR EACH ROW
+    WHEN (OLD.recipe_id IS DISTINCT FROM NEW.recipe_id
+          OR OLD.ingredient_id IS DISTINCT FROM NEW.ingredient_id
+          OR OLD.base_unit IS DISTINCT FROM NEW.base_unit
+          OR OLD.base_quantity IS DISTINCT FROM NEW.base_quantity
+          OR OLD.is_optional IS DISTINCT FROM NEW.is_optional)
+    EXECUTE FUNCTION weekly_grocery_recipe_ingredients_trigger()
+    """,
+    """
+    CREATE TRIGGER weekly_grocery_recipes_delete
+    BEFORE DELETE ON recipes
+    FOR EACH ROW EXECUTE FUNCTION weekly_grocery_recipes_delete_trigger()
+    """,
+]
+
+BACKFILL = """
+INSERT INTO weekly_grocery_items
+    (week_start, ingredient_id, base_unit, is_optional,
+     quantity, quantity_count, line_count)
+SELECT date_trunc('week', mp.planned_date)::date, ri.ingredient_id,
+       ri.base_unit, ri.is_optional,
+       coalesce(sum(ri.base_quantity), 0), count(ri.base_quantity), count(*)
+FROM meal_plans mp
+JOIN recipe_ingredients ri ON ri.recipe_id = mp.recipe_id
+GROUP BY 1, ri.ingredient_id, ri.base_unit, ri.is_optional
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "weekly_grocery_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=False),
+        sa.Column("ingredient_id", sa.Integer(), nullable=False),
+        sa.Column("base_unit", sa.String(length=50), nullable=True),
+        sa.Column("is_optional", sa.Boolean(), nullable=False),
+        sa.Column(
+            "quantity",
+            sa.Numeric(precision=14, scale=4),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("quantity_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("line_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["ingredient_id"], ["ingredients.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "week_start",
+            "ingredient_id",
+            "base_unit",
+            "is_optional",
+            name="uq_weekly_grocery_items_line",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        op.f("ix_weekly_grocery_items_ingredient_id"),
+        "weekly_grocery_items",
+        ["ingredient_id"],
+        unique=False,
+    )
+    # Looked up by every recipe_ingredients trigger and by the SET NULL action
+    op.create_index(
+        op.f("ix_meal_plans_recipe_id"), "meal_plans", ["recipe_id"], unique=False
+    )
+
+    op.execute(APPLY_MEAL_FUNCTION)
+    op.execute(APPLY_LINE_FUNCTION)
+    op.execute(MEAL_PLANS_TRIGGER_FUNCTION)
+    op.execute(RECIPE_INGREDIENTS_TRIGGER_FUNCTION)
+    op.execute(RECIPES_TRIGGER_FUNCTION)
+    for trigger in TRIGGERS:
+        op.execute(trigger)
+
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS weekly_grocery_recipes_delete ON recipes")
+    op.execute(
+        "DROP TRIGGER IF EXISTS weekly_grocery_recipe_ingredients_update "
+        "ON recipe_ingredients"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS weekly_grocery_recipe_ingredients_insert_delete "
+        "ON recipe_ingredients"
+    )
+    op.execute("DROP TRIGGER IF EXISTS weekly_grocery_meal_plans_update ON meal_plans")
+    op.execute(
+        "DROP TRIGGER IF EXISTS weekly_grocery_meal_plans_insert_delete ON meal_plans"
+    )
+    op.execute("DROP FUNCTION IF EXISTS weekly_grocery_recipes_delete_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS weekly_grocery_recipe_ingredients_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS weekly_grocery_meal_plans_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS weekly_grocery_apply_line"
+        "(integer, integer, varchar, boolean, numeric, integer)"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS weekly_grocery_apply_meal(integer, date, integer)"
+    )
+    op.drop_index(op.f("ix_meal_plans_recipe_id"), table_name="meal_plans")
+    op.drop_index(
+        op.f("ix_weekly_grocery_items_ingredient_id"),
+        table_name="weekly_grocery_items",
+    )
+    op.drop_table("weekly_grocery_items")
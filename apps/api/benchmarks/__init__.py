@@ -0,0 +1,9 @@
+"""
+Performance benchmarks for MealMind API data paths.
+
+Benchmarks are not collected by the regular test run (pytest.ini only
+points at tests/). Each module is runnable on its own against the database
+in DATABASE_URL, for example:
+
+    uv run python -m benchmarks.grocery_aggregation
+"""
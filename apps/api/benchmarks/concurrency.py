@@ -0,0 +1,174 @@
+"""
+Event loop against threadpool concurrency benchmark.
+
+Serves one endpoint two ways and drives each with 500 concurrent clients
+by default:
+
+- async: an ``async def`` endpoint on an AsyncSession (asyncpg), as every
+  API endpoint is written
+- threadpool: a plain ``def`` endpoint on a psycopg2 Session, which
+  FastAPI runs in its threadpool (40 threads by default) - the pattern
+  that blocking database code forces
+
+Each request runs one statement that holds its connection for ``--db-ms``
+on the server (pg_sleep), standing in for a typical query. Both engines
+get the same pool, larger than the threadpool, so the threadpool is what
+limits the second mode; the async engine uses the API's InstrumentedPool.
+Requests go to the app in process through its ASGI interface (no HTTP
+client, server or sockets), so the numbers show how the app schedules
+work, not network or HTTP parsing costs. Reports requests/s and
+p50/p95/p99/max latency.
+
+Usage:
+    uv run python -m benchmarks.concurrency
+    uv run python -m benchmarks.concurrency --clients 1000 --requests 20000 --db-ms 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import List
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.types import ASGIApp, Message
+
+from core.config import settings
+from core.db import InstrumentedPool, to_async_url
+
+STATEMENT = text("SELECT pg_sleep(:seconds)")
+
+
+def create_app(database_url: str, pool_size: int, db_seconds: float) -> FastAPI:
+    """App serving GET /async and GET /threadpool with equal pools"""
+    async_engine = create_async_engine(
+        to_async_url(database_url),
+        poolclass=InstrumentedPool,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    sync_engine = create_engine(
+        make_url(database_url).set(drivername="postgresql+psycopg2"),
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    async_sessions = async_sessionmaker(async_engine)
+    sync_sessions = sessionmaker(sync_engine)
+    app = FastAPI()
+    app.state.engines = (async_engine, sync_engine)
+
+    @app.get("/async")
+    async def on_event_loop():
+        async with async_sessions() as session:
+            await session.execute(STATEMENT, {"seconds": db_seconds})
+        return {"status": "ok"}
+
+    @app.get("/threadpool")
+    def in_threadpool():
+        with sync_sessions() as session:
+            session.execute(STATEMENT, {"seconds": db_seconds})
+        return {"status": "ok"}
+
+    return app
+
+
+async def request(app: ASGIApp, path: str) -> int:
+    """Send GET ``path`` straight to the ASGI app; the response status"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def load(
+    app: ASGIApp, path: str, clients: int, requests: int, report: bool = True
+) -> None:
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def user() -> None:
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            status = await request(app, path)
+            latencies.append(time.perf_counter() - start)
+            errors += status != 200
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    if not report:
+        return
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    p50, p95, p99 = (percentiles[i - 1] * 1000 for i in (50, 95, 99))
+    print(
+        f"{path.lstrip('/'):<10} {requests / elapsed:8.0f} req/s"
+        f"  p50={p50:7.1f} ms  p95={p95:7.1f} ms  p99={p99:7.1f} ms"
+        f"  max={max(latencies) * 1000:7.1f} ms  errors={errors}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    app = create_app(args.database_url, args.pool_size, args.db_ms / 1000)
+    async_engine, sync_engine = app.state.engines
+    print(
+        f"{args.clients} clients, {args.requests} requests, "
+        f"{args.db_ms} ms per statement, pool of {args.pool_size}"
+    )
+    try:
+        for path in ("/async", "/threadpool"):
+            # Open the pool's connections before timing
+            await load(app, path, args.pool_size, args.pool_size, report=False)
+            await load(app, path, args.clients, args.requests)
+    finally:
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--db-ms", type=float, default=5.0)
+    parser.add_argument("--pool-size", type=int, default=60)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
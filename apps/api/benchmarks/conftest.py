@@ -0,0 +1,383 @@
+"""
+Query benchmark suite configuration.
+
+The suite times the API's key data paths against databases seeded with
+the synthetic data generator (tests/fixtures/factories.py) at each scale
+in ``--benchmark-scales``. A seeded database is built once into a
+template, named after the migrations and the generator (see
+tests/fixtures/databases.py), and cloned for every run, so only the first
+run at a scale pays for seeding it.
+
+Every test runs inside a transaction that is rolled back, and with
+``benchmark`` (benchmarks/harness.py) timing its path. At the end results
+can be saved as JSON and compared against a saved baseline; a path slower
+than a ``--benchmark-compare-fail`` threshold fails the run.
+
+Query plans are checked against one more seeded database, plan_database
+(see benchmarks/test_query_plans.py).
+
+Usage:
+    uv run pytest benchmarks --benchmark-json=benchmarks/baselines/baseline.json
+    uv run pytest benchmarks --benchmark-compare=benchmarks/baselines/baseline.json
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import List
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    Comparison,
+    Threshold,
+    compare,
+    load,
+    save,
+)
+from core.config import settings
+from core.db import to_async_url
+from tests.fixtures import factories
+from tests.fixtures.databases import (
+    ProvisionReport,
+    migration_key,
+    provision_database,
+    rolled_back_session,
+)
+
+API_DIR = Path(__file__).parent.parent
+
+DEFAULT_THRESHOLD = "median:25%"
+
+# plan_database: a benchmark scale, with years of meal plans
+PLAN_SCALE = "100k"
+PLAN_YEARS = 20
+
+RESULTS = pytest.StashKey[List[BenchmarkResult]]()
+COMPARISON = pytest.StashKey[Comparison]()
+
+
+def threshold(text: str) -> Threshold:
+    # Named for argparse's "invalid threshold value" message
+    return Threshold.parse(text)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "query benchmark suite")
+    group.addoption(
+        "--benchmark-scales",
+        default="1k,10k,100k",
+        help="comma-separated dataset scales to seed and time (default: %(default)s)",
+    )
+    group.addoption("--benchmark-seed", type=int, default=42)
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=20,
+        help="timed rounds per path (default: %(default)s)",
+    )
+    group.addoption(
+        "--benchmark-warmup",
+        type=int,
+        default=2,
+        help="untimed rounds before timing (default: %(default)s)",
+    )
+    group.addoption(
+        "--benchmark-json", type=Path, metavar="PATH", help="save results as JSON"
+    )
+    group.addoption(
+        "--benchmark-compare",
+        type=Path,
+        metavar="PATH",
+        help="compare results against a baseline saved with --benchmark-json",
+    )
+    group.addoption(
+        "--benchmark-compare-fail",
+        action="append",
+        type=threshold,
+        metavar="STAT:LIMIT",
+        help="fail when STAT grows by more than LIMIT (25%%, or seconds) over the"
+        " baseline; repeatable (default: median:25%%)",
+    )
+    group.addoption(
+        "--plans-update",
+        action="store_true",
+        help="record the current plan outlines in benchmarks/plans/",
+    )
+
+
+def pytest_configure(config):
+    config.stash[RESULTS] = []
+
+
+def _scales(config) -> List[str]:
+    scales = [
+        scale.strip().lower()
+        for scale in config.getoption("benchmark_scales").split(",")
+        if scale.strip()
+    ]
+    unknown = sorted(set(scales) - set(factories.SCALES))
+    if unknown:
+        raise pytest.UsageError(
+            f"Unknown benchmark scales {', '.join(unknown)};"
+            f" expected some of {', '.join(factories.SCALES)}"
+        )
+    return scales
+
+
+def pytest_generate_tests(metafunc):
+    if "seeded" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "seeded", _scales(metafunc.config), indirect=True, scope="session"
+        )
+
+
+@dataclass
+class SeededDatabase:
+    """A database seeded at ``scale``, and the rows the paths are timed on"""
+
+    scale: str
+    url: str
+    provisioned: ProvisionReport
+    # The most planned recipe: the largest cascade
+    recipe_id: int
+    # The week with the most planned meals
+    week: date
+    # An ingredient of median popularity
+    ingredient_name: str
+
+
+def _database_url(database: str) -> str:
+    url = make_url(settings.DATABASE_URL).set(database=database)
+    return url.render_as_string(hide_password=False)
+
+
+def _seeded_template_key(alembic_cfg: Config, scale: factories.Scale) -> str:
+    # A new generator, scale or seed builds a new template, as new
+    # migrations do
+    digest = hashlib.sha256(migration_key(alembic_cfg).encode())
+    digest.update(Path(factories.__file__).read_bytes())
+    digest.update(repr(scale).encode())
+    return digest.hexdigest()[:12]
+
+
+def _migrate_and_seed(scale: factories.Scale):
+    def build(database: str) -> None:
+        url = _database_url(database)
+        alembic_cfg = Config(str(API_DIR / "alembic.ini"))
+        alembic_cfg.set_main_option("sqlalchemy.url", url)
+        command.upgrade(alembic_cfg, "head")
+        report = asyncio.run(factories.seed_database(url, scale))
+        print(f"Seeded {database}: {report.summary()}")
+        # Set the visibility map too, so index-only scans are what they
+        # would be on a settled database
+        engine = create_engine(url, isolation_level="AUTOCOMMIT")
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("VACUUM (ANALYZE)"))
+        finally:
+            engine.dispose()
+
+    return build
+
+
+def _pick_rows(url: str) -> dict:
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            recipe_id = conn.execute(
+                text(
+                    "SELECT recipe_id FROM meal_plans WHERE recipe_id IS NOT NULL"
+                    " GROUP BY recipe_id ORDER BY count(*) DESC, recipe_id LIMIT 1"
+                )
+            ).scalar_one()
+            week = conn.execute(
+                text(
+                    "SELECT date_trunc('week', planned_date)::date AS week"
+                    " FROM meal_plans GROUP BY week ORDER BY count(*) DESC, week"
+                    " LIMIT 1"
+                )
+            ).scalar_one()
+            ingredient_name = conn.execute(
+                text(
+                    "SELECT name FROM ("
+                    "  SELECT i.name, count(*) AS uses,"
+                    "         percent_rank() OVER (ORDER BY count(*), i.id) AS rank"
+                    "  FROM ingredients i"
+                    "  JOIN recipe_ingredients ri ON ri.ingredient_id = i.id"
+                    "  GROUP BY i.id"
+                    ") used ORDER BY abs(rank - 0.5), name LIMIT 1"
+                )
+            ).scalar_one()
+    finally:
+        engine.dispose()
+    return {"recipe_id": recipe_id, "week": week, "ingredient_name": ingredient_name}
+
+
+def _seeded_database(
+    database: str, name: str, scale: factories.Scale
+) -> SeededDatabase:
+    alembic_cfg = Config(str(API_DIR / "alembic.ini"))
+    admin_engine = create_engine(
+        _database_url("postgres"), isolation_level="AUTOCOMMIT"
+    )
+    try:
+        provisioned = provision_database(
+            admin_engine,
+            database,
+            alembic_cfg,
+            _migrate_and_seed(scale),
+            key=_seeded_template_key(alembic_cfg, scale),
+        )
+    finally:
+        admin_engine.dispose()
+    url = _database_url(database)
+    return SeededDatabase(name, url, provisioned, **_pick_rows(url))
+
+
+@pytest.fixture(scope="session")
+def seeded(request) -> SeededDatabase:
+    """The database seeded at the requested scale, cloned from its template"""
+    name = request.param
+    scale = factories.Scale.named(name, seed=request.config.getoption("benchmark_seed"))
+    database = f"{make_url(settings.DATABASE_URL).database}_bench_{name}"
+    return _seeded_database(database, name, scale)
+
+
+@pytest.fixture(scope="session")
+def plan_database(request) -> SeededDatabase:
+    """
+    The database query plans are checked against (benchmarks/query_plans.py).
+
+    Benchmark scales plan a year of meals, which leaves meal_plans small
+    enough that a sequential scan is the right plan. Plans are checked at
+    one scale instead, with PLAN_YEARS of meal plans, so every table a
+    critical query reads is large enough for its index to matter.
+    """
+    scale = factories.Scale.named(
+        PLAN_SCALE,
+        seed=request.config.getoption("benchmark_seed"),
+        plan_days=PLAN_YEARS * 365,
+    )
+    database = f"{make_url(settings.DATABASE_URL).database}_plans"
+    return _seeded_database(database, "plans", scale)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def bench_engine(seeded):
+    engine = create_async_engine(to_async_url(seeded.url))
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def bench_session(bench_engine):
+    """An AsyncSession on the seeded database, rolled back after the test"""
+    async with rolled_back_session(bench_engine) as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session")
+async def plan_engine(plan_database):
+    engine = create_async_engine(to_async_url(plan_database.url))
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def plan_session(plan_engine):
+    """An AsyncSession on plan_database, rolled back after the test"""
+    async with rolled_back_session(plan_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def benchmark(request, bench_session):
+    """
+    Times an async data path; see benchmarks/harness.py.
+
+    The session's identity map is cleared before every round, so each
+    round loads what a fresh request would.
+    """
+    callspec = getattr(request.node, "callspec", None)
+    params = dict(callspec.params) if callspec else {}
+    if "seeded" in params:
+        params["scale"] = params.pop("seeded")
+    fixture = Benchmark(
+        name=request.node.name,
+        group=request.node.originalname.removeprefix("test_"),
+        params=params,
+        rounds=request.config.getoption("benchmark_rounds"),
+        warmup=request.config.getoption("benchmark_warmup"),
+        between_rounds=bench_session.expunge_all,
+    )
+    yield fixture
+    if fixture.result is not None:
+        request.config.stash[RESULTS].append(fixture.result)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    results = config.stash.get(RESULTS, [])
+    if not results:
+        return
+    json_path = config.getoption("benchmark_json")
+    if json_path:
+        save(json_path, results, scales=_scales(config))
+    baseline_path = config.getoption("benchmark_compare")
+    if baseline_path:
+        thresholds = config.getoption("benchmark_compare_fail") or [
+            Threshold.parse(DEFAULT_THRESHOLD)
+        ]
+        comparison = compare(results, load(baseline_path), thresholds)
+        config.stash[COMPARISON] = comparison
+        if comparison.regressions:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(RESULTS, [])
+    if not results:
+        return
+    terminalreporter.section("benchmarks (ms)")
+    terminalreporter.write_line(
+        f"{'name':<44} {'min':>9} {'median':>9} {'mean':>9} {'p95':>9} {'rounds':>6}"
+    )
+    for result in sorted(results, key=lambda r: (r.group, r.name)):
+        stats = result.stats
+        terminalreporter.write_line(
+            f"{result.name:<44} {stats.min * 1000:9.3f} {stats.median * 1000:9.3f}"
+            f" {stats.mean * 1000:9.3f} {stats.p95 * 1000:9.3f} {stats.rounds:6d}"
+        )
+    json_path = config.getoption("benchmark_json")
+    if json_path:
+        terminalreporter.write_line(f"Saved results to {json_path}")
+
+    comparison = config.stash.get(COMPARISON, None)
+    if comparison is None:
+        return
+    baseline_path = config.getoption("benchmark_compare")
+    for name in comparison.new:
+        terminalreporter.write_line(f"{name}: not in {baseline_path}")
+    if comparison.regressions:
+        terminalreporter.write_line(
+            f"Performance has regressed against {baseline_path}:", red=True, bold=True
+        )
+        for regression in comparison.regressions:
+            terminalreporter.write_line(f"  {regression}", red=True)
+    else:
+        terminalreporter.write_line(
+            f"No regressions against {baseline_path}", green=True
+        )
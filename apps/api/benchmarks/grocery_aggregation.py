@@ -0,0 +1,217 @@
+"""
+Grocery aggregation benchmark.
+
+Seeds a synthetic year of meal plans (365 days x lunch/dinner = 730 slots)
+over a catalog of thousands of ingredients, then times build_grocery_list
+for weekly and full-year ranges and reports p50/p99 latency against the
+targets. Everything runs inside one transaction that is rolled back at the
+end, so the target database is left untouched.
+
+Usage:
+    uv run python -m benchmarks.grocery_aggregation
+    uv run python -m benchmarks.grocery_aggregation --iterations 500 --ingredients 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from core.config import settings
+from core.db import to_async_url
+from core.units import canonicalize_many
+from models import Category, Ingredient, MealPlan, MealType, Recipe, RecipeIngredient
+from services.grocery import build_grocery_list
+
+UNITS = ["g", "kg", "ml", "l", "tbsp", "tsp", "cup", "whole", None]
+YEAR_START = date(2025, 1, 1)
+
+# Default latency targets in milliseconds (override on the command line)
+WEEK_P50_MS = 15.0
+WEEK_P99_MS = 50.0
+YEAR_P50_MS = 150.0
+YEAR_P99_MS = 400.0
+
+
+async def _insert_ids(conn: AsyncConnection, table, rows: List[dict]) -> List[int]:
+    result = await conn.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+    )
+    return list(result.scalars())
+
+
+async def seed_year(
+    conn: AsyncConnection,
+    rng: random.Random,
+    categories: int,
+    ingredients: int,
+    recipes: int,
+) -> None:
+    """Insert a synthetic catalog, recipes and a full year of meal plans"""
+    category_ids = await _insert_ids(
+        conn,
+        Category.__table__,
+        [{"name": f"bench-category-{i}"} for i in range(categories)],
+    )
+    ingredient_ids = await _insert_ids(
+        conn,
+        Ingredient.__table__,
+        [
+            {
+                "name": f"bench-ingredient-{i}",
+                # Roughly one in ten ingredients is uncategorised
+                "category_id": rng.choice(category_ids) if rng.random() > 0.1 else None,
+            }
+            for i in range(ingredients)
+        ],
+    )
+    recipe_ids = await _insert_ids(
+        conn,
+        Recipe.__table__,
+        [{"name": f"bench-recipe-{i}", "servings": 4} for i in range(recipes)],
+    )
+
+    lines = []
+    for recipe_id in recipe_ids:
+        for order, ingredient_id in enumerate(
+            rng.sample(ingredient_ids, rng.randint(5, 15))
+        ):
+            lines.append(
+                {
+                    "recipe_id": recipe_id,
+                    "ingredient_id": ingredient_id,
+                    "quantity": Decimal(rng.randint(1, 5000)) / 100,
+                    "unit": rng.choice(UNITS),
+                    "display_order": order,
+                    "is_optional": rng.random() < 0.1,
+                }
+            )
+    # Core inserts bypass the ORM listener, so convert units in one batch
+    base_quantities, base_units = canonicalize_many(
+        [line["quantity"] for line in lines], [line["unit"] for line in lines]
+    )
+    for line, base_quantity, base_unit in zip(lines, base_quantities, base_units):
+        line["base_quantity"] = base_quantity
+        line["base_unit"] = base_unit
+    await conn.execute(insert(RecipeIngredient.__table__), lines)
+
+    plans = []
+    for day in range(365):
+        for meal_type in (MealType.LUNCH, MealType.DINNER):
+            plans.append(
+                {
+                    "planned_date": YEAR_START + timedelta(days=day),
+                    "meal_type": meal_type,
+                    # A few slots are left empty (no recipe chosen yet)
+                    "recipe_id": (
+                        rng.choice(recipe_ids) if rng.random() > 0.05 else None
+                    ),
+                }
+            )
+    await conn.execute(insert(MealPlan.__table__), plans)
+    # Autovacuum never sees uncommitted rows; give the planner real statistics
+    await conn.execute(text("ANALYZE"))
+
+
+async def _time_ranges(
+    session: AsyncSession, ranges: List[tuple[date, date]]
+) -> List[float]:
+    timings = []
+    for start_date, end_date in ranges:
+        started = time.perf_counter()
+        await build_grocery_list(session, start_date, end_date)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _percentile(timings: List[float], pct: int) -> float:
+    return statistics.quantiles(timings, n=100, method="inclusive")[pct - 1]
+
+
+def _report(
+    label: str, timings: List[float], p50_target: float, p99_target: float
+) -> bool:
+    p50 = _percentile(timings, 50)
+    p99 = _percentile(timings, 99)
+    ok = p50 <= p50_target and p99 <= p99_target
+    print(
+        f"{label:<6} n={len(timings):<5} p50={p50:8.2f} ms (target {p50_target:.0f})"
+        f"  p99={p99:8.2f} ms (target {p99_target:.0f})  {'OK' if ok else 'MISS'}"
+    )
+    return ok
+
+
+async def run(args: argparse.Namespace) -> bool:
+    rng = random.Random(args.seed)
+    engine = create_async_engine(to_async_url(args.database_url))
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                started = time.perf_counter()
+                await seed_year(
+                    conn, rng, args.categories, args.ingredients, args.recipes
+                )
+                print(f"Seeded synthetic year in {time.perf_counter() - started:.2f}s")
+
+                session = AsyncSession(bind=conn)
+                week_ranges = []
+                for _ in range(args.iterations):
+                    start_date = YEAR_START + timedelta(days=rng.randint(0, 358))
+                    week_ranges.append((start_date, start_date + timedelta(days=6)))
+                year_ranges = [(YEAR_START, YEAR_START + timedelta(days=364))] * max(
+                    args.iterations // 10, 10
+                )
+
+                # Warm up plan and buffer caches before measuring
+                await _time_ranges(session, week_ranges[:5] + year_ranges[:2])
+
+                week_ok = _report(
+                    "week",
+                    await _time_ranges(session, week_ranges),
+                    args.week_p50_ms,
+                    args.week_p99_ms,
+                )
+                year_ok = _report(
+                    "year",
+                    await _time_ranges(session, year_ranges),
+                    args.year_p50_ms,
+                    args.year_p99_ms,
+                )
+                await session.close()
+                return week_ok and year_ok
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--categories", type=int, default=40)
+    parser.add_argument("--ingredients", type=int, default=3000)
+    parser.add_argument("--recipes", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--week-p50-ms", type=float, default=WEEK_P50_MS)
+    parser.add_argument("--week-p99-ms", type=float, default=WEEK_P99_MS)
+    parser.add_argument("--year-p50-ms", type=float, default=YEAR_P50_MS)
+    parser.add_argument("--year-p99-ms", type=float, default=YEAR_P99_MS)
+    args = parser.parse_args(argv)
+
+    return 0 if asyncio.run(run(args)) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
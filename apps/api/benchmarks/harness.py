@@ -0,0 +1,236 @@
+"""
+Benchmark harness for the pytest query suite.
+
+pytest-benchmark's fixture times synchronous callables, and every data
+path here is a coroutine on an AsyncSession, so the suite carries its own
+fixture in the same style:
+
+    async def test_recipe_detail(benchmark, bench_session, seeded):
+        detail = await benchmark(get_recipe_detail, bench_session, seeded.recipe_id)
+
+``benchmark(target, *args)`` awaits ``target`` for ``warmup`` untimed
+rounds and then ``rounds`` timed ones, and returns the last result.
+``benchmark.pedantic`` adds per-round ``setup`` and ``teardown`` outside
+the timing, for paths that change data. Results are written as JSON in
+pytest-benchmark's layout (a ``benchmarks`` list of names and ``stats``),
+and compare() checks them against a baseline saved the same way.
+
+A threshold is ``<stat>:<value>``: ``median:25%`` fails a path whose
+median grew by more than 25% over the baseline, ``median:0.002`` one
+whose median grew by more than 2 ms. Timings are in seconds throughout.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+STATS = ("min", "max", "mean", "median", "stddev", "p95")
+
+
+@dataclass
+class Stats:
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+    p95: float
+
+    @classmethod
+    def from_timings(cls, timings: Sequence[float]) -> "Stats":
+        if not timings:
+            raise ValueError("No timings to summarize")
+        ordered = sorted(timings)
+        return cls(
+            rounds=len(ordered),
+            min=ordered[0],
+            max=ordered[-1],
+            mean=statistics.fmean(ordered),
+            median=statistics.median(ordered),
+            stddev=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            p95=ordered[math.ceil(0.95 * len(ordered)) - 1],
+        )
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    params: Dict[str, Any]
+    stats: Stats
+
+
+class Benchmark:
+    """The ``benchmark`` fixture: times an async data path round by round"""
+
+    def __init__(
+        self,
+        name: str,
+        group: str,
+        params: Optional[Dict[str, Any]] = None,
+        rounds: int = 20,
+        warmup: int = 2,
+        between_rounds: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.name = name
+        self.group = group
+        self.params = params or {}
+        self.rounds = rounds
+        self.warmup = warmup
+        # Untimed, before every round; the suite clears the session's
+        # identity map so no round is served by an earlier one
+        self.between_rounds = between_rounds
+        self.result: Optional[BenchmarkResult] = None
+
+    async def __call__(
+        self, target: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        return await self.pedantic(target, args, kwargs)
+
+    async def pedantic(
+        self,
+        target: Callable[..., Awaitable[Any]],
+        args: Sequence[Any] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        setup: Optional[Callable[[], Awaitable[Any]]] = None,
+        teardown: Optional[Callable[[], Awaitable[Any]]] = None,
+        rounds: Optional[int] = None,
+        warmup: Optional[int] = None,
+    ) -> Any:
+        """Time ``target`` with untimed ``setup``/``teardown`` around each round"""
+        if self.result is not None:
+            raise RuntimeError("benchmark can only be used once per test")
+        kwargs = kwargs or {}
+        rounds = self.rounds if rounds is None else rounds
+        warmup = self.warmup if warmup is None else warmup
+        timings: List[float] = []
+        result = None
+        for index in range(warmup + rounds):
+            if self.between_rounds is not None:
+                self.between_rounds()
+            if setup is not None:
+                await setup()
+            started = time.perf_counter()
+            result = await target(*args, **kwargs)
+            elapsed = time.perf_counter() - started
+            if teardown is not None:
+                await teardown()
+            if index >= warmup:
+                timings.append(elapsed)
+        self.result = BenchmarkResult(
+            self.name, self.group, self.params, Stats.from_timings(timings)
+        )
+        return result
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """How far ``stat`` may grow over the baseline: a percentage or seconds"""
+
+    stat: str
+    value: float
+    percent: bool
+
+    @classmethod
+    def parse(cls, text: str) -> "Threshold":
+        stat, _, value = text.partition(":")
+        if stat not in STATS or not value:
+            raise ValueError(
+                f"Invalid threshold {text!r}; expected <stat>:<percent>% or "
+                f"<stat>:<seconds> with stat one of {', '.join(STATS)}"
+            )
+        percent = value.endswith("%")
+        return cls(stat, float(value.rstrip("%")), percent)
+
+    def allowed(self, baseline: float) -> float:
+        if self.percent:
+            return baseline * (1 + self.value / 100)
+        return baseline + self.value
+
+    def __str__(self) -> str:
+        return f"{self.stat}:{self.value:g}{'%' if self.percent else ''}"
+
+
+@dataclass
+class Regression:
+    name: str
+    threshold: Threshold
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        change = (self.current / self.baseline - 1) * 100 if self.baseline else math.inf
+        return (
+            f"{self.name}: {self.threshold.stat} {self.current * 1000:.3f} ms against "
+            f"{self.baseline * 1000:.3f} ms in the baseline ({change:+.0f}%, "
+            f"allowed {self.threshold})"
+        )
+
+
+@dataclass
+class Comparison:
+    regressions: List[Regression] = field(default_factory=list)
+    # Benchmarks with no baseline entry to compare against
+    new: List[str] = field(default_factory=list)
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "python_version": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def to_json(results: Sequence[BenchmarkResult], **info: Any) -> Dict[str, Any]:
+    return {
+        "machine_info": {**machine_info(), **info},
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": [asdict(result) for result in results],
+    }
+
+
+def save(path: Path, results: Sequence[BenchmarkResult], **info: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_json(results, **info), indent=2) + "\n")
+
+
+def load(path: Path) -> Dict[str, Stats]:
+    """Stats per benchmark name in a saved results file"""
+    data = json.loads(path.read_text())
+    return {
+        entry["name"]: Stats(**entry["stats"]) for entry in data.get("benchmarks", [])
+    }
+
+
+def compare(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, Stats],
+    thresholds: Sequence[Threshold],
+) -> Comparison:
+    """Every threshold each result exceeds against its baseline entry"""
+    comparison = Comparison()
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            comparison.new.append(result.name)
+            continue
+        for threshold in thresholds:
+            before = getattr(previous, threshold.stat)
+            after = getattr(result.stats, threshold.stat)
+            if after > threshold.allowed(before):
+                comparison.regressions.append(
+                    Regression(result.name, threshold, before, after)
+                )
+    return comparison
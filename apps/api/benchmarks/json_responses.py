@@ -0,0 +1,181 @@
+"""
+JSON response serialization benchmark.
+
+Builds a page of synthetic read models (1,000 rows by default) for three
+listings - recipes, meal plans (dates and enums) and grocery items
+(Decimal quantities) - and times turning each page into a response body
+three ways:
+
+- fastapi: Pydantic models built from the rows, returned from an endpoint
+  with a ``response_model``: FastAPI validates and converts them again,
+  then JSONResponse encodes with the stdlib json module
+- pydantic: the same models encoded by ``model_dump_json``, as the
+  response cache renders them
+- orjson: the read models encoded directly by core.serialization.dumps,
+  as listings are served with FAST_JSON_RESPONSES on
+
+All three bodies are checked to be identical before timing. Reports the
+best of ``--repeats`` runs per 1,000 rows. No database is needed.
+
+Usage:
+    uv run python -m benchmarks.json_responses
+    uv run python -m benchmarks.json_responses --rows 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Type
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from pydantic import BaseModel
+
+from core.pagination import KeysetPage
+from core.projections import read_model
+from core.serialization import dumps
+from models import MealType
+from schemas.grocery import GroceryItem
+from schemas.meal_plan import MealPlanSummary
+from schemas.pagination import Page
+from schemas.recipe import RecipeSummary
+from services.meal_plans import MealPlanListRow
+from services.recipes import RecipeListRow
+
+UNITS = ["g", "ml", "each", None]
+
+
+@read_model
+class GroceryItemRow:
+    ingredient_id: int
+    ingredient_name: str
+    unit: Optional[str]
+    quantity: Optional[Decimal]
+    line_count: int
+    category_id: Optional[int]
+    category_name: Optional[str]
+
+
+def recipe_rows(rng: random.Random, count: int) -> List[RecipeListRow]:
+    return [
+        RecipeListRow(
+            id=index,
+            name=f"Recipe {index}",
+            description="Slow-cooked and seasoned to taste",
+            servings=rng.randint(1, 8),
+            prep_time_minutes=rng.randint(5, 60),
+            cook_time_minutes=rng.choice([None, 30, 90]),
+        )
+        for index in range(count)
+    ]
+
+
+def meal_plan_rows(rng: random.Random, count: int) -> List[MealPlanListRow]:
+    return [
+        MealPlanListRow(
+            id=index,
+            planned_date=date(2025, 1, 1) + timedelta(days=index // 2),
+            meal_type=rng.choice(list(MealType)),
+            recipe_id=rng.choice([None, rng.randint(1, 10_000)]),
+            notes=rng.choice([None, "Leftovers"]),
+        )
+        for index in range(count)
+    ]
+
+
+def grocery_rows(rng: random.Random, count: int) -> List[GroceryItemRow]:
+    return [
+        GroceryItemRow(
+            ingredient_id=index,
+            ingredient_name=f"Ingredient {index}",
+            unit=rng.choice(UNITS),
+            quantity=rng.choice([None, Decimal(rng.randint(1, 50_000)) / 100]),
+            line_count=rng.randint(1, 12),
+            category_id=index % 20,
+            category_name=f"Aisle {index % 20}",
+        )
+        for index in range(count)
+    ]
+
+
+CASES = [
+    ("recipes", recipe_rows, RecipeSummary),
+    ("meal plans", meal_plan_rows, MealPlanSummary),
+    ("grocery", grocery_rows, GroceryItem),
+]
+
+
+def validated(rows: List[Any], model: Type[BaseModel]) -> BaseModel:
+    return Page[model](
+        items=[model.model_validate(row, from_attributes=True) for row in rows],
+        next_cursor="cursor",
+    )
+
+
+async def best(body: Callable[[], Any], repeats: int) -> float:
+    fastest = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = body()
+        if asyncio.iscoroutine(result):
+            await result
+        fastest = min(fastest, time.perf_counter() - started)
+    return fastest
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    per_1k = 1000 / args.rows
+    print(f"{args.rows} rows per page, best of {args.repeats}, per 1,000 rows")
+    for label, make_rows, model in CASES:
+        rows = make_rows(rng, args.rows)
+        page = KeysetPage(items=rows, next_cursor="cursor")
+        route = APIRoute("/", endpoint=lambda: None, response_model=Page[model])
+        field = route.response_field
+
+        async def fastapi_body() -> bytes:
+            content = await serialize_response(
+                field=field, response_content=validated(rows, model)
+            )
+            return JSONResponse(content).body
+
+        def pydantic_body() -> bytes:
+            return validated(rows, model).model_dump_json().encode()
+
+        def orjson_body() -> bytes:
+            return dumps(page)
+
+        expected = await fastapi_body()
+        assert pydantic_body() == expected and orjson_body() == expected, label
+
+        timings = [
+            await best(fastapi_body, args.repeats),
+            await best(pydantic_body, args.repeats),
+            await best(orjson_body, args.repeats),
+        ]
+        fastapi_ms, pydantic_ms, orjson_ms = (t * per_1k * 1000 for t in timings)
+        print(
+            f"{label:<11} fastapi={fastapi_ms:6.2f} ms  pydantic={pydantic_ms:6.2f} ms"
+            f"  orjson={orjson_ms:6.2f} ms  ({fastapi_ms / orjson_ms:4.1f}x)"
+        )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
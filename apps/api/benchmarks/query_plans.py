@@ -0,0 +1,193 @@
+"""
+Plan assertions for the API's critical queries.
+
+A CriticalQuery names a statement an endpoint depends on and the indexes
+its plan must read. check_plan() runs ``EXPLAIN (ANALYZE, FORMAT JSON)``
+on it and lists what is wrong with the plan:
+
+- a Seq Scan on a large table (LARGE_TABLE_ROWS rows or more);
+- an expected index that the plan does not read;
+- a scan whose estimated rows are off from the rows it read by more
+  than ``misestimate`` times, the misestimate that tips a planner into a
+  different plan once the table grows.
+
+Each query's plan outline (node types, joins, indexes and relations,
+without costs) is recorded in benchmarks/plans/<name>.txt. A failing
+check shows the outline diffed against the recorded one, so the report
+says how the plan changed, not only that it is wrong:
+
+    Index Scan using ix_meal_plans_planned_date_id on meal_plans
+    -> Seq Scan on meal_plans
+
+A plan that changed without failing a check only warns
+(PlanChangedWarning); record it with ``--plans-update``.
+"""
+
+from __future__ import annotations
+
+import difflib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ClauseElement
+
+from core.explain import PlanNode, explain, index_names
+
+PLANS_DIR = Path(__file__).parent / "plans"
+
+# Tables at least this large must not be read with a sequential scan
+LARGE_TABLE_ROWS = 10_000
+
+
+class PlanChangedWarning(UserWarning):
+    """A plan differs from its recorded outline but passes its checks"""
+
+
+@dataclass(frozen=True)
+class CriticalQuery:
+    """A named statement and the indexes its plan must read"""
+
+    name: str
+    # Builds the statement from the rows picked in the seeded database
+    build: Callable[[Any], ClauseElement]
+    indexes: Tuple[str, ...]
+    misestimate: float = 10.0
+
+
+@dataclass
+class PlanCheck:
+    query: CriticalQuery
+    plan: PlanNode
+    problems: List[str]
+    outline: List[str]
+    # None until the query's outline is first recorded
+    recorded: Optional[List[str]]
+
+    @property
+    def changed(self) -> bool:
+        return self.outline != self.recorded
+
+    def diff(self) -> str:
+        if self.recorded is None:
+            return f"No recorded plan in {outline_path(self.query.name)}"
+        lines = difflib.unified_diff(
+            self.recorded,
+            self.outline,
+            fromfile=f"recorded {self.query.name}",
+            tofile=f"current {self.query.name}",
+            lineterm="",
+        )
+        return "\n".join(lines) if self.changed else "Plan matches the recorded one"
+
+    def report(self) -> str:
+        return "\n".join(
+            [
+                f"Plan of {self.query.name} fails its checks:",
+                *(f"  - {problem}" for problem in self.problems),
+                "",
+                self.diff(),
+                "",
+                "Current plan (estimated/actual rows per loop):",
+                *outline(self.plan, rows=True),
+            ]
+        )
+
+
+def _describe(node: PlanNode) -> str:
+    # Worded like EXPLAIN's text format: "Index Scan using <index> on <table>"
+    description = node["Node Type"]
+    if "Join Type" in node and node["Join Type"] != "Inner":
+        description += f" ({node['Join Type']})"
+    if "Index Name" in node:
+        description += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        description += f" on {node['Relation Name']}"
+    return description
+
+
+def outline(plan: PlanNode, rows: bool = False, depth: int = 0) -> List[str]:
+    """The plan as indented lines, one per node, with no costs or timings"""
+    line = "    " * depth + ("-> " if depth else "") + _describe(plan)
+    if rows:
+        line += f"  rows={plan['Plan Rows']:g}/{plan.get('Actual Rows', 0):g}"
+    lines = [line]
+    for child in plan.get("Plans", []):
+        lines.extend(outline(child, rows, depth + 1))
+    return lines
+
+
+def outline_path(name: str) -> Path:
+    return PLANS_DIR / f"{name}.txt"
+
+
+def read_outline(name: str) -> Optional[List[str]]:
+    path = outline_path(name)
+    if not path.exists():
+        return None
+    return path.read_text().splitlines()
+
+
+def record_outline(name: str, lines: List[str]) -> None:
+    PLANS_DIR.mkdir(exist_ok=True)
+    outline_path(name).write_text("\n".join(lines) + "\n")
+
+
+async def table_rows(session: AsyncSession) -> Dict[str, int]:
+    """Planner row estimates (reltuples) of the public tables"""
+    result = await session.execute(
+        text(
+            "SELECT relname, reltuples::bigint FROM pg_class"
+            " WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+        )
+    )
+    return {name: rows for name, rows in result}
+
+
+def _scans(plan: PlanNode, limited: bool = False) -> Iterator[Tuple[PlanNode, bool]]:
+    # Nodes under a Limit stop early, so they read fewer rows than their
+    # (whole-input) estimate by design
+    if "Relation Name" in plan:
+        yield plan, limited
+    for child in plan.get("Plans", []):
+        yield from _scans(child, limited or plan["Node Type"] == "Limit")
+
+
+def plan_problems(
+    query: CriticalQuery, plan: PlanNode, rows: Dict[str, int]
+) -> List[str]:
+    """What is wrong with ``plan``, given the row counts of its tables"""
+    problems = []
+    for node, limited in _scans(plan):
+        relation = node["Relation Name"]
+        if (
+            node["Node Type"] == "Seq Scan"
+            and rows.get(relation, 0) >= LARGE_TABLE_ROWS
+        ):
+            problems.append(f"Seq Scan on {relation} ({rows[relation]} rows)")
+        # Loops that never ran read nothing to compare with
+        if limited or not node.get("Actual Loops"):
+            continue
+        estimated, actual = node["Plan Rows"], node["Actual Rows"]
+        ratio = max(estimated, 1) / max(actual, 1)
+        if not 1 / query.misestimate <= ratio <= query.misestimate:
+            problems.append(
+                f"{_describe(node)} estimated {estimated:g} rows and read "
+                f"{actual:g} (allowed {query.misestimate:g}x)"
+            )
+    used = index_names(plan)
+    for index in query.indexes:
+        if index not in used:
+            problems.append(f"{index} is not used")
+    return problems
+
+
+async def check_plan(
+    session: AsyncSession, query: CriticalQuery, database: Any
+) -> PlanCheck:
+    """Explain ``query`` against ``database`` and check its plan"""
+    plan = await explain(session, query.build(database), analyze=True)
+    problems = plan_problems(query, plan, await table_rows(session))
+    return PlanCheck(query, plan, problems, outline(plan), read_outline(query.name))
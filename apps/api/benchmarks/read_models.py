@@ -0,0 +1,183 @@
+"""
+Read-model materialization benchmark.
+
+Imports a synthetic catalog (5,000 recipes of 5-15 lines by default), then
+reads every ingredient line with its ingredient, category and brand three
+ways and reports time and retained Python heap (tracemalloc) per row:
+
+- entities: RecipeIngredient entities with their Ingredient, Category and
+  Brand through the ORM (joined, populated with contains_eager)
+- rows: the same columns as SQLAlchemy Row tuples
+- read models: the same columns as RecipeLineRow read models
+  (core/projections.py), as the projection recipe detail strategy does
+
+Each read runs ``--repeats`` times; the fastest is reported. Everything
+runs inside one transaction that is rolled back at the end.
+
+Usage:
+    uv run python -m benchmarks.read_models
+    uv run python -m benchmarks.read_models --recipes 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, List, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import contains_eager
+
+from core.config import settings
+from core.db import to_async_url
+from core.projections import fetch_into, select_into
+from models import Brand, Category, Ingredient, RecipeIngredient
+from schemas.recipe import RecipeRecord
+from services.recipe_import import import_recipes
+from services.recipes import RecipeLineRow
+
+UNITS = ["g", "ml", "tbsp", "tsp", "cup", None]
+
+COLUMNS = (
+    RecipeIngredient.id,
+    RecipeIngredient.quantity,
+    RecipeIngredient.unit,
+    RecipeIngredient.base_quantity,
+    RecipeIngredient.base_unit,
+    RecipeIngredient.preparation,
+    RecipeIngredient.display_order,
+    RecipeIngredient.is_optional,
+    Ingredient.id,
+    Ingredient.name,
+    Category.id,
+    Category.name,
+    Brand.id,
+    Brand.name,
+)
+
+
+def _records(rng: random.Random, recipes: int, ingredients: int):
+    for index in range(recipes):
+        yield RecipeRecord(
+            name=f"Read model recipe {index}",
+            ingredients=[
+                {
+                    "ingredient": f"Read model ingredient {name}",
+                    "quantity": str(rng.randint(1, 500)),
+                    "unit": rng.choice(UNITS),
+                    "display_order": order,
+                }
+                for order, name in enumerate(
+                    rng.sample(range(ingredients), rng.randint(5, 15)), start=1
+                )
+            ],
+        )
+
+
+def _joined(statement: Select) -> Select:
+    return (
+        statement.join(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+        .outerjoin(Category, Category.id == Ingredient.category_id)
+        .outerjoin(Brand, Brand.id == Ingredient.brand_id)
+    )
+
+
+async def entities(session: AsyncSession) -> Sequence[Any]:
+    statement = _joined(select(RecipeIngredient)).options(
+        contains_eager(RecipeIngredient.ingredient).options(
+            contains_eager(Ingredient.category), contains_eager(Ingredient.brand)
+        )
+    )
+    return (await session.scalars(statement)).all()
+
+
+async def rows(session: AsyncSession) -> Sequence[Any]:
+    return (await session.execute(_joined(select(*COLUMNS)))).all()
+
+
+async def read_models(session: AsyncSession) -> Sequence[Any]:
+    return await fetch_into(
+        session, RecipeLineRow, _joined(select_into(RecipeLineRow, *COLUMNS))
+    )
+
+
+async def measure(
+    label: str,
+    session: AsyncSession,
+    read: Callable[[AsyncSession], Awaitable[Sequence[Any]]],
+    repeats: int,
+) -> None:
+    best = float("inf")
+    for _ in range(repeats):
+        session.expunge_all()
+        gc.collect()
+        started = time.perf_counter()
+        result = await read(session)
+        best = min(best, time.perf_counter() - started)
+        del result
+
+    # Heap still held by the result (and the session's identity map) once
+    # the read returns, per row
+    session.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    result = await read(session)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(result)
+    del result
+    print(
+        f"{label:<12} {count} rows  {best * 1e6 / count:6.2f} us/row"
+        f"  retained={retained / count:6.0f} B/row"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    engine = create_async_engine(to_async_url(args.database_url))
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                session = AsyncSession(bind=conn, expire_on_commit=False)
+                report = await import_recipes(
+                    session, _records(rng, args.recipes, args.ingredients)
+                )
+                print(
+                    f"Imported {report.recipes} recipes, "
+                    f"{report.ingredient_lines} lines in {report.seconds:.2f}s"
+                )
+                for label, read in (
+                    ("entities", entities),
+                    ("rows", rows),
+                    ("read models", read_models),
+                ):
+                    await measure(label, session, read, args.repeats)
+                await session.close()
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--recipes", type=int, default=5_000)
+    parser.add_argument("--ingredients", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
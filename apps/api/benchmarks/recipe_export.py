@@ -0,0 +1,151 @@
+"""
+Streaming export benchmark.
+
+Imports a synthetic catalog (20,000 recipes of 5-15 lines by default), then
+exports it twice and reports time to first byte, total time and peak
+Python heap (tracemalloc):
+
+- stream: services.exports.export_recipes (server-side cursor, chunked)
+- buffered: every Recipe loaded through the ORM with its ingredient graph,
+  then serialized as one response body - the approach that runs small
+  containers out of memory
+
+Everything runs inside one transaction that is rolled back at the end.
+
+Usage:
+    uv run python -m benchmarks.recipe_export
+    uv run python -m benchmarks.recipe_export --recipes 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.config import settings
+from core.db import to_async_url
+from models import Recipe
+from schemas.recipe import RecipeDetail, RecipeRecord
+from services.exports import export_recipes
+from services.recipe_import import import_recipes
+from services.recipes import RECIPE_DETAIL_LOADERS
+
+UNITS = ["g", "ml", "tbsp", "tsp", "cup", None]
+
+
+def _records(rng: random.Random, recipes: int, ingredients: int):
+    for index in range(recipes):
+        yield RecipeRecord(
+            name=f"Export recipe {index}",
+            instructions="Chop everything. " * 10,
+            servings=rng.randint(1, 8),
+            ingredients=[
+                {
+                    "ingredient": f"Export ingredient {name}",
+                    "quantity": str(rng.randint(1, 500)),
+                    "unit": rng.choice(UNITS),
+                    "display_order": order,
+                }
+                for order, name in enumerate(
+                    rng.sample(range(ingredients), rng.randint(5, 15)), start=1
+                )
+            ],
+        )
+
+
+async def streamed(session: AsyncSession, first_byte: Callable[[], None]) -> int:
+    @asynccontextmanager
+    async def sessions():
+        yield session
+
+    size = 0
+    async for chunk in export_recipes(sessions, "jsonl"):
+        if not size:
+            first_byte()
+        size += len(chunk)
+    return size
+
+
+async def buffered(session: AsyncSession, first_byte: Callable[[], None]) -> int:
+    recipes = (
+        await session.scalars(
+            select(Recipe).options(*RECIPE_DETAIL_LOADERS["selectin"])
+        )
+    ).all()
+    body = (
+        "["
+        + ",".join(
+            RecipeDetail.model_validate(recipe).model_dump_json() for recipe in recipes
+        )
+        + "]"
+    )
+    first_byte()
+    session.expunge_all()
+    return len(body)
+
+
+async def measure(
+    label: str,
+    session: AsyncSession,
+    export: Callable[[AsyncSession, Callable[[], None]], Awaitable[int]],
+) -> None:
+    first = []
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = await export(session, lambda: first.append(time.perf_counter()))
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<9} {size / 2**20:7.1f} MiB  ttfb={(first[0] - started) * 1000:8.1f} ms"
+        f"  total={total:6.2f}s  peak heap={peak / 2**20:7.1f} MiB"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    engine = create_async_engine(to_async_url(args.database_url))
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                session = AsyncSession(bind=conn, expire_on_commit=False)
+                report = await import_recipes(
+                    session, _records(rng, args.recipes, args.ingredients)
+                )
+                print(
+                    f"Imported {report.recipes} recipes, "
+                    f"{report.ingredient_lines} lines in {report.seconds:.2f}s"
+                )
+                await measure("stream", session, streamed)
+                await measure("buffered", session, buffered)
+                await session.close()
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--recipes", type=int, default=20_000)
+    parser.add_argument("--ingredients", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
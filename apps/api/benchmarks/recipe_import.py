@@ -0,0 +1,159 @@
+"""
+Bulk recipe import benchmark.
+
+Writes a synthetic JSON Lines file (1,000 recipes of 5-15 ingredient lines
+over a catalog of a few hundred ingredient names by default), imports it
+with the batched pipeline and reports rows per second, then imports a
+sample the row-at-a-time ORM way (``session.add`` per recipe, resolving
+every ingredient with a query) for comparison. Everything runs inside one
+transaction that is rolled back at the end.
+
+Usage:
+    uv run python -m benchmarks.recipe_import
+    uv run python -m benchmarks.recipe_import --recipes 10000 --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.config import settings
+from core.db import to_async_url
+from models import Category, Ingredient, Recipe, RecipeIngredient
+from schemas.recipe import RecipeRecord
+from services.recipe_files import read_jsonl
+from services.recipe_import import DEFAULT_BATCH_SIZE, import_recipes
+
+UNITS = ["g", "kg", "ml", "l", "tbsp", "tsp", "cup", "clove", None]
+CATEGORIES = ["Produce", "Dairy", "Pantry", "Meat", "Spices", "Bakery"]
+
+
+def _recipe(rng: random.Random, index: int, ingredients: int) -> dict:
+    names = rng.sample(range(ingredients), rng.randint(5, 15))
+    return {
+        "name": f"Benchmark recipe {index}",
+        "servings": rng.randint(1, 8),
+        "instructions": "Combine everything and cook until done.",
+        "ingredients": [
+            {
+                "ingredient": f"Benchmark ingredient {name}",
+                "category": CATEGORIES[name % len(CATEGORIES)],
+                "quantity": str(rng.randint(1, 500)),
+                "unit": rng.choice(UNITS),
+                "display_order": order,
+            }
+            for order, name in enumerate(names, start=1)
+        ],
+    }
+
+
+def write_file(path: str, rng: random.Random, recipes: int, ingredients: int) -> None:
+    with open(path, "w", encoding="utf-8") as out:
+        for index in range(recipes):
+            out.write(json.dumps(_recipe(rng, index, ingredients)) + "\n")
+
+
+async def orm_import(session: AsyncSession, records: List[RecipeRecord]) -> int:
+    """Baseline: one ORM object per row, one lookup per ingredient line"""
+    rows = 0
+    for record in records:
+        recipe = Recipe(name=record.name, servings=record.servings)
+        session.add(recipe)
+        for line in record.ingredients:
+            ingredient = await session.scalar(
+                select(Ingredient).where(Ingredient.name == line.ingredient)
+            )
+            if ingredient is None:
+                category = await session.scalar(
+                    select(Category).where(Category.name == line.category)
+                )
+                ingredient = Ingredient(
+                    name=line.ingredient,
+                    category=category or Category(name=line.category),
+                )
+                session.add(ingredient)
+                await session.flush()
+            session.add(
+                RecipeIngredient(
+                    recipe=recipe,
+                    ingredient=ingredient,
+                    quantity=line.quantity,
+                    unit=line.unit,
+                    display_order=line.display_order,
+                )
+            )
+            rows += 1
+        await session.flush()
+        rows += 1
+    return rows
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    engine = create_async_engine(to_async_url(args.database_url))
+    try:
+        with tempfile.NamedTemporaryFile("w+", suffix=".jsonl") as tmp:
+            write_file(tmp.name, rng, args.recipes, args.ingredients)
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                try:
+                    session = AsyncSession(bind=conn, autoflush=False)
+                    with open(tmp.name, encoding="utf-8") as stream:
+                        report = await import_recipes(
+                            session, read_jsonl(stream), batch_size=args.batch_size
+                        )
+                    print(
+                        f"pipeline  {report.recipes} recipes + "
+                        f"{report.ingredient_lines} lines in {report.seconds:.2f}s"
+                        f"  {report.rows_per_second:10.0f} rows/s"
+                    )
+
+                    with open(tmp.name, encoding="utf-8") as stream:
+                        sample = [
+                            record.model_copy(update={"name": f"ORM {record.name}"})
+                            for _, record in zip(
+                                range(args.orm_sample), read_jsonl(stream)
+                            )
+                        ]
+                    started = time.perf_counter()
+                    rows = await orm_import(session, sample)
+                    seconds = time.perf_counter() - started
+                    print(
+                        f"orm       {len(sample)} recipes + "
+                        f"{rows - len(sample)} lines in {seconds:.2f}s"
+                        f"  {rows / seconds:10.0f} rows/s"
+                    )
+                    print(f"speedup   {report.rows_per_second / (rows / seconds):.1f}x")
+                    await session.close()
+                finally:
+                    await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--recipes", type=int, default=1_000)
+    parser.add_argument("--ingredients", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--orm-sample", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
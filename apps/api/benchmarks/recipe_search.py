@@ -0,0 +1,255 @@
+"""
+Recipe and ingredient search benchmark.
+
+Seeds a synthetic catalog (100k recipes, 50k ingredients by default), runs
+ANALYZE, then for each query shape - common word, rare word, substring,
+multi-word and typo (fuzzy tier) - checks with EXPLAIN (FORMAT JSON) that
+the plan reads the search indexes and never sequentially scans recipes or
+ingredients, and reports end-to-end p50/p99 latency against the targets. Everything
+runs inside one transaction that is rolled back at the end.
+
+Usage:
+    uv run python -m benchmarks.recipe_search
+    uv run python -m benchmarks.recipe_search --recipes 250000 --iterations 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Callable, List, Set
+
+from sqlalchemy import Select, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from core.config import settings
+from core.db import to_async_url
+from core.explain import explain, index_names, seq_scans
+from models import Ingredient, Recipe
+from services.search import (
+    ingredient_fuzzy_query,
+    ingredient_search_query,
+    recipe_fuzzy_query,
+    recipe_search_query,
+    search_ingredients,
+    search_recipes,
+)
+
+ADJECTIVES = [
+    "spicy", "smoky", "creamy", "crispy", "zesty", "hearty", "tangy", "garlicky",
+    "sticky", "herby", "golden", "rustic", "quick", "slow", "charred", "lemony",
+    "sweet", "sour", "buttery", "peppery", "fiery", "light", "classic", "easy",
+]  # fmt: skip
+PROTEINS = [
+    "chicken", "beef", "pork", "lamb", "salmon", "tofu", "shrimp", "chickpea",
+    "lentil", "turkey", "halibut", "tempeh", "duck", "mushroom", "egg", "paneer",
+    "cod", "tuna", "venison", "sausage", "bacon", "ham", "crab", "scallop",
+    "mussel", "squid", "seitan", "quinoa", "bean", "pea", "cauliflower", "squash",
+    "aubergine", "halloumi", "ricotta", "feta", "trout", "mackerel", "sardine",
+    "pheasant", "rabbit", "goat", "veal", "octopus", "lobster", "clam", "barley",
+    "polenta",
+]  # fmt: skip
+DISHES = [
+    "curry", "stew", "tacos", "salad", "soup", "risotto", "skewers", "pie",
+    "bowl", "stir fry", "casserole", "burger", "flatbread", "noodles", "bake",
+    "gratin", "wraps", "chili", "tagine", "frittata", "pasta", "lasagne",
+    "dumplings", "pilaf", "paella", "ramen", "pho", "chowder", "quiche",
+    "fritters", "kebab", "biryani", "hotpot", "empanadas", "galette", "tart",
+    "sliders", "ragu", "gnocchi", "tostadas",
+]  # fmt: skip
+METHODS = [
+    "roast", "simmer", "braise", "grill", "saute", "poach", "steam", "bake",
+    "toast", "marinate", "whisk", "fold", "knead", "blanch", "reduce", "glaze",
+]  # fmt: skip
+PRODUCE = [
+    "onion", "garlic", "tomato", "carrot", "celery", "pepper", "spinach", "kale",
+    "potato", "leek", "zucchini", "eggplant", "cabbage", "fennel", "lime", "ginger",
+]  # fmt: skip
+
+EXACT_INDEXES = {"ix_recipes_search_vector", "ix_recipes_name_trgm"}
+FUZZY_INDEXES = {"ix_recipes_name_trgm"}
+
+# (label, query, query builder whose plan is checked, indexes it must read);
+# the typo only reaches the fuzzy tier because nothing matches exactly
+RECIPE_QUERIES = [
+    ("common", "chicken", recipe_search_query, EXACT_INDEXES),
+    ("rare", "tagine", recipe_search_query, EXACT_INDEXES),
+    ("substring", "fritt", recipe_search_query, EXACT_INDEXES),
+    ("phrase", "smoky lamb chili", recipe_search_query, EXACT_INDEXES),
+    ("typo", "halibot", recipe_fuzzy_query, FUZZY_INDEXES),
+]
+# (query, query builder)
+INGREDIENT_QUERIES = [
+    ("ging", ingredient_search_query),
+    ("smoked paprika", ingredient_search_query),
+    ("fenel", ingredient_fuzzy_query),
+]
+SEARCH_INDEXES = [
+    "ix_recipes_search_vector",
+    "ix_recipes_name_trgm",
+    "ix_ingredients_name_trgm",
+]
+
+# Default latency targets in milliseconds (override on the command line).
+# Every synthetic word matches thousands of recipes, so these cover ranking
+# a few thousand candidates, not just the index probe.
+P50_MS = 50.0
+P99_MS = 100.0
+
+
+def _recipe(rng: random.Random, index: int) -> dict:
+    dish = rng.choice(DISHES)
+    protein = rng.choice(PROTEINS)
+    steps = " ".join(
+        f"{rng.choice(METHODS).capitalize()} the {rng.choice(PRODUCE)}."
+        for _ in range(rng.randint(3, 8))
+    )
+    return {
+        "name": f"{rng.choice(ADJECTIVES).capitalize()} {protein} {dish} {index}",
+        "description": f"A {rng.choice(ADJECTIVES)} {dish} with "
+        f"{rng.choice(PRODUCE)} and {rng.choice(PRODUCE)}.",
+        "instructions": f"{steps} Add the {protein} and serve.",
+        "servings": rng.randint(1, 8),
+    }
+
+
+async def seed_catalog(
+    conn: AsyncConnection, rng: random.Random, recipes: int, ingredients: int
+) -> None:
+    """Insert synthetic recipes and ingredients in batches"""
+    batch = 5000
+    for start in range(0, recipes, batch):
+        await conn.execute(
+            insert(Recipe.__table__),
+            [_recipe(rng, i) for i in range(start, min(start + batch, recipes))],
+        )
+    await conn.execute(
+        insert(Ingredient.__table__),
+        [
+            {"name": f"{rng.choice(ADJECTIVES)} {rng.choice(PRODUCE)} {i}"}
+            for i in range(ingredients - 1)
+        ]
+        + [{"name": "smoked paprika"}],
+    )
+    # Autovacuum never sees uncommitted rows: merge the GIN pending lists
+    # (whose size the planner charges to every index scan) and give the
+    # planner real statistics, as a vacuumed production table would have
+    for index in SEARCH_INDEXES:
+        await conn.execute(
+            text("SELECT gin_clean_pending_list(CAST(:index AS regclass))"),
+            {"index": index},
+        )
+    await conn.execute(text("ANALYZE recipes"))
+    await conn.execute(text("ANALYZE ingredients"))
+
+
+async def check_plan(
+    session: AsyncSession, label: str, query: Select, expected: Set[str], table: str
+) -> bool:
+    """EXPLAIN ``query`` and verify it reads ``expected`` without seq-scanning"""
+    plan = await explain(session, query)
+    used = index_names(plan)
+    scanned = [name for name in seq_scans(plan) if name == table]
+    ok = expected <= used and not scanned
+    print(
+        f"  plan {label:<10} indexes={sorted(used)}"
+        f"{' seq scan on ' + table if scanned else ''}  {'OK' if ok else 'MISS'}"
+    )
+    return ok
+
+
+async def _time(
+    session: AsyncSession, search: Callable, query: str, iterations: int
+) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await search(session, query)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(label: str, timings: List[float], p50_target: float, p99_target: float):
+    percentiles = statistics.quantiles(timings, n=100, method="inclusive")
+    p50, p99 = percentiles[49], percentiles[98]
+    ok = p50 <= p50_target and p99 <= p99_target
+    print(
+        f"  time {label:<10} n={len(timings):<4} p50={p50:7.2f} ms"
+        f"  p99={p99:7.2f} ms  {'OK' if ok else 'MISS'}"
+    )
+    return ok
+
+
+async def run(args: argparse.Namespace) -> bool:
+    rng = random.Random(args.seed)
+    engine = create_async_engine(to_async_url(args.database_url))
+    ok = True
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                started = time.perf_counter()
+                await seed_catalog(conn, rng, args.recipes, args.ingredients)
+                print(
+                    f"Seeded {args.recipes} recipes and {args.ingredients} "
+                    f"ingredients in {time.perf_counter() - started:.2f}s"
+                )
+
+                session = AsyncSession(bind=conn)
+                print("recipes")
+                for label, query, build, expected in RECIPE_QUERIES:
+                    ok &= await check_plan(
+                        session, label, build(query), expected, "recipes"
+                    )
+                    await _time(session, search_recipes, query, 3)
+                    ok &= _report(
+                        label,
+                        await _time(session, search_recipes, query, args.iterations),
+                        args.p50_ms,
+                        args.p99_ms,
+                    )
+                print("ingredients")
+                for query, build in INGREDIENT_QUERIES:
+                    ok &= await check_plan(
+                        session,
+                        query,
+                        build(query),
+                        {"ix_ingredients_name_trgm"},
+                        "ingredients",
+                    )
+                    ok &= _report(
+                        query,
+                        await _time(
+                            session, search_ingredients, query, args.iterations
+                        ),
+                        args.p50_ms,
+                        args.p99_ms,
+                    )
+                await session.close()
+                return ok
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--recipes", type=int, default=100_000)
+    parser.add_argument("--ingredients", type=int, default=50_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--p50-ms", type=float, default=P50_MS)
+    parser.add_argument("--p99-ms", type=float, default=P99_MS)
+    args = parser.parse_args(argv)
+
+    return 0 if asyncio.run(run(args)) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Key data paths, timed against seeded databases.
+
+Each test times one path as the API runs it, once per scale in
+``--benchmark-scales``, on rows picked from the seeded data so the work
+grows with the dataset: the most planned recipe, the busiest week and an
+ingredient of median popularity. Results, JSON output and baseline
+gating are described in benchmarks/conftest.py.
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from models import MealPlan, Recipe, RecipeIngredient
+from services.grocery import build_grocery_list
+from services.meal_plans import list_meal_plans
+from services.recipes import get_recipe_detail
+from services.search import search_ingredients
+from services.weekly_grocery import read_weekly_grocery_list, week_end
+
+
+class TestDataPaths:
+    """Reads and writes behind the most used endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_recipe_detail(self, benchmark, bench_session, seeded):
+        detail = await benchmark(get_recipe_detail, bench_session, seeded.recipe_id)
+
+        assert detail.id == seeded.recipe_id
+        assert detail.ingredients
+
+    @pytest.mark.asyncio
+    async def test_weekly_plan(self, benchmark, bench_session, seeded):
+        page = await benchmark(
+            list_meal_plans,
+            bench_session,
+            limit=14,
+            start_date=seeded.week,
+            end_date=week_end(seeded.week),
+        )
+
+        assert page.items
+        assert all(item.planned_date >= seeded.week for item in page.items)
+
+    @pytest.mark.asyncio
+    async def test_grocery_aggregation(self, benchmark, bench_session, seeded):
+        grocery = await benchmark(
+            build_grocery_list, bench_session, seeded.week, week_end(seeded.week)
+        )
+
+        assert grocery.aisles
+
+    @pytest.mark.asyncio
+    async def test_weekly_grocery_list(self, benchmark, bench_session, seeded):
+        grocery = await benchmark(read_weekly_grocery_list, bench_session, seeded.week)
+
+        assert grocery.aisles
+
+    @pytest.mark.asyncio
+    async def test_ingredient_lookup_by_name(self, benchmark, bench_session, seeded):
+        results = await benchmark(
+            search_ingredients, bench_session, seeded.ingredient_name
+        )
+
+        assert results.items[0].name == seeded.ingredient_name
+
+    @pytest.mark.asyncio
+    async def test_recipe_cascade_delete(self, benchmark, bench_session, seeded):
+        # Every round deletes the same recipe inside a savepoint that the
+        # (untimed) teardown rolls back
+        savepoints = []
+
+        async def begin():
+            savepoints.append(await bench_session.begin_nested())
+
+        async def rollback():
+            await savepoints.pop().rollback()
+
+        async def delete_recipe():
+            recipe = await bench_session.get(Recipe, seeded.recipe_id)
+            await bench_session.delete(recipe)
+            await bench_session.flush()
+
+        await benchmark.pedantic(delete_recipe, setup=begin, teardown=rollback)
+
+        lines = await bench_session.scalar(
+            select(func.count())
+            .select_from(RecipeIngredient)
+            .where(RecipeIngredient.recipe_id == seeded.recipe_id)
+        )
+        plans = await bench_session.scalar(
+            select(func.count())
+            .select_from(MealPlan)
+            .where(MealPlan.recipe_id == seeded.recipe_id)
+        )
+        assert lines > 0 and plans > 0
@@ -0,0 +1,124 @@
+"""
+Query plans of the critical queries, checked against a seeded database.
+
+Every query in CRITICAL_QUERIES is explained against plan_database (see
+benchmarks/conftest.py) and must read its indexes, with no sequential
+scan on a large table and row estimates close to what it read (see
+benchmarks/query_plans.py). A migration or query change that loses an
+index fails here with a diff of the plan against the recorded one.
+
+After an intended plan change, record the new outlines:
+    uv run pytest benchmarks/test_query_plans.py --plans-update
+"""
+
+import warnings
+
+import pytest
+from sqlalchemy import select
+
+from benchmarks.query_plans import (
+    CriticalQuery,
+    PlanChangedWarning,
+    check_plan,
+    record_outline,
+)
+from models import Ingredient
+from services.grocery import grocery_list_query
+from services.ingredients import INGREDIENT_KEYSET, ingredient_list_query
+from services.meal_plans import (
+    MEAL_PLAN_KEYSET,
+    calendar_query,
+    meal_plan_list_query,
+    month_range,
+)
+from services.recipes import (
+    RECIPE_KEYSET,
+    recipe_line_rows_query,
+    recipe_list_query,
+    recipe_row_query,
+)
+from services.search import ingredient_search_query, recipe_search_query
+from services.weekly_grocery import week_end, weekly_grocery_query
+
+CRITICAL_QUERIES = [
+    CriticalQuery(
+        "recipe_row",
+        lambda db: recipe_row_query(db.recipe_id),
+        indexes=("recipes_pkey",),
+    ),
+    CriticalQuery(
+        "recipe_lines",
+        lambda db: recipe_line_rows_query(db.recipe_id),
+        indexes=("ix_recipe_ingredients_recipe_id", "ingredients_pkey"),
+    ),
+    CriticalQuery(
+        "recipe_list_page",
+        lambda db: RECIPE_KEYSET.apply(recipe_list_query(), None, 50),
+        indexes=("ix_recipes_name_id",),
+    ),
+    CriticalQuery(
+        "meal_plan_week",
+        lambda db: MEAL_PLAN_KEYSET.apply(
+            meal_plan_list_query(db.week, week_end(db.week)), None, 14
+        ),
+        indexes=("ix_meal_plans_planned_date_id",),
+    ),
+    CriticalQuery(
+        "meal_plan_calendar_month",
+        lambda db: calendar_query(*month_range(db.week.year, db.week.month)),
+        indexes=("uq_meal_plans_planned_date_meal_type",),
+    ),
+    CriticalQuery(
+        "grocery_week",
+        lambda db: grocery_list_query(db.week, week_end(db.week)),
+        indexes=(
+            "uq_meal_plans_planned_date_meal_type",
+            "ix_recipe_ingredients_recipe_id",
+        ),
+    ),
+    CriticalQuery(
+        "weekly_grocery_week",
+        lambda db: weekly_grocery_query(db.week),
+        indexes=("uq_weekly_grocery_items_line",),
+    ),
+    CriticalQuery(
+        "ingredient_list_page",
+        lambda db: INGREDIENT_KEYSET.apply(ingredient_list_query(), None, 50),
+        indexes=("ix_ingredients_name_id",),
+    ),
+    CriticalQuery(
+        # How recipe imports resolve existing ingredient names to ids; the
+        # covering index answers it without the heap
+        "ingredient_by_name",
+        lambda db: select(Ingredient.id, Ingredient.name).where(
+            Ingredient.name.in_([db.ingredient_name])
+        ),
+        indexes=("ix_ingredients_name_id",),
+    ),
+    CriticalQuery(
+        "ingredient_search",
+        lambda db: ingredient_search_query(db.ingredient_name),
+        indexes=("ix_ingredients_name_trgm",),
+    ),
+    CriticalQuery(
+        "recipe_search",
+        lambda db: recipe_search_query(db.ingredient_name),
+        indexes=("ix_recipes_search_vector", "ix_recipes_name_trgm"),
+    ),
+]
+
+
+class TestQueryPlans:
+    """Plans of the queries behind the most used endpoints."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", CRITICAL_QUERIES, ids=lambda query: query.name)
+    async def test_plan(self, request, plan_session, plan_database, query):
+        check = await check_plan(plan_session, query, plan_database)
+
+        if request.config.getoption("plans_update"):
+            record_outline(query.name, check.outline)
+        if check.problems:
+            pytest.fail(check.report(), pytrace=False)
+        if check.changed and not request.config.getoption("plans_update"):
+            warnings.warn(PlanChangedWarning(check.diff()))
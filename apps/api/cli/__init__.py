@@ -0,0 +1,7 @@
+"""
+Command line entry points for maintenance tasks.
+
+Run from apps/api with the same environment as the API, for example:
+
+    uv run python -m cli.grocery check 2025-03-03 --weeks 4
+"""
@@ -0,0 +1,67 @@
+"""
+Streaming data export.
+
+    uv run python -m cli.export recipes -o recipes.jsonl
+    uv run python -m cli.export recipes --format csv > recipes.csv
+    uv run python -m cli.export meal-plans --start-date 2025-01-01 -o plans.csv
+
+Rows are read through a server-side cursor and written as they arrive, so
+memory stays flat however large the database is. Recipe exports load
+back with ``python -m cli.recipes import`` and meal plan exports with
+``python -m cli.meal_plans import``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import date
+from typing import List, TextIO
+
+from core.db import dispose_db, get_sessionmaker, init_db
+from services.exports import export_meal_plans, export_recipes
+from services.recipe_files import FORMATS, format_for_path
+
+
+async def write_export(args: argparse.Namespace, format: str, out: TextIO) -> None:
+    if args.kind == "recipes":
+        chunks = export_recipes(get_sessionmaker(), format)
+    else:
+        chunks = export_meal_plans(
+            get_sessionmaker(), format, args.start_date, args.end_date
+        )
+    async for chunk in chunks:
+        out.write(chunk)
+
+
+async def run(args: argparse.Namespace) -> int:
+    format = args.format or format_for_path(args.output or "")
+    init_db()
+    try:
+        if args.output is None:
+            await write_export(args, format, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                await write_export(args, format, out)
+        return 0
+    finally:
+        await dispose_db()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("kind", choices=("recipes", "meal-plans"))
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    parser.add_argument(
+        "--format", choices=FORMATS, help="default: from the output file extension"
+    )
+    parser.add_argument("--start-date", type=date.fromisoformat)
+    parser.add_argument("--end-date", type=date.fromisoformat)
+    args = parser.parse_args(argv)
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Consistency checker for the materialized weekly grocery lists.
+
+    uv run python -m cli.grocery check 2025-03-03 --weeks 4
+    uv run python -m cli.grocery check 2025-03-03 --repair
+    uv run python -m cli.grocery rebuild 2025-03-03
+
+``check`` recomputes each week from meal_plans/recipe_ingredients and
+prints every line that differs from weekly_grocery_items; it exits with
+status 1 when discrepancies remain. ``--repair`` rebuilds the weeks that
+differ. ``rebuild`` unconditionally rebuilds the given weeks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from typing import List
+
+from core.db import dispose_db, get_sessionmaker, init_db
+from services.weekly_grocery import diff_week, rebuild_week, week_start
+
+
+def _weeks(first_day: date, count: int) -> List[date]:
+    first = week_start(first_day)
+    return [first + timedelta(weeks=offset) for offset in range(count)]
+
+
+async def check(weeks: List[date], repair: bool) -> int:
+    remaining = 0
+    async with get_sessionmaker()() as session:
+        for week in weeks:
+            discrepancies = await diff_week(session, week)
+            if not discrepancies:
+                print(f"{week}: OK")
+                continue
+
+            print(f"{week}: {len(discrepancies)} discrepancies")
+            for line in discrepancies:
+                print(
+                    f"  ingredient={line.ingredient_id} unit={line.unit} "
+                    f"optional={line.is_optional} "
+                    f"expected={line.expected} actual={line.actual}"
+                )
+            if repair:
+                rows = await rebuild_week(session, week)
+                await session.commit()
+                print(f"  rebuilt {rows} rows")
+            else:
+                remaining += len(discrepancies)
+    return remaining
+
+
+async def rebuild(weeks: List[date]) -> None:
+    async with get_sessionmaker()() as session:
+        for week in weeks:
+            rows = await rebuild_week(session, week)
+            print(f"{week}: rebuilt {rows} rows")
+        await session.commit()
+
+
+async def run(args: argparse.Namespace) -> int:
+    init_db()
+    try:
+        weeks = _weeks(args.day, args.weeks)
+        if args.command == "check":
+            return 1 if await check(weeks, args.repair) else 0
+        await rebuild(weeks)
+        return 0
+    finally:
+        await dispose_db()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("check", "rebuild"):
+        command = subparsers.add_parser(name)
+        command.add_argument(
+            "day", type=date.fromisoformat, help="any day in the first week"
+        )
+        command.add_argument("--weeks", type=int, default=1, help="number of weeks")
+        if name == "check":
+            command.add_argument("--repair", action="store_true")
+    args = parser.parse_args(argv)
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
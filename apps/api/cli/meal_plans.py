@@ -0,0 +1,79 @@
+"""
+Meal plan import.
+
+    uv run python -m cli.meal_plans import meal-plans.csv
+    uv run python -m cli.meal_plans import meal-plans.jsonl --keep-existing
+    cat meal-plans.jsonl | uv run python -m cli.meal_plans import - --format jsonl
+
+Reads meal plan exports (see services/meal_plan_import.py for how recipes
+are matched) in one transaction: a bad line or an unknown recipe rolls the
+whole import back. Planned slots are replaced unless --keep-existing is
+given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import List, TextIO
+
+from core.db import dispose_db, get_sessionmaker, init_db
+from services.meal_plan_import import (
+    MealPlanFileError,
+    import_meal_plans,
+    read_meal_plans,
+)
+from services.meal_plan_scheduling import UnknownRecipeError
+from services.recipe_files import FORMATS, format_for_path
+
+
+async def import_file(stream: TextIO, format: str, overwrite: bool) -> int:
+    async with get_sessionmaker()() as session:
+        try:
+            report = await import_meal_plans(
+                session, read_meal_plans(stream, format), overwrite=overwrite
+            )
+        except (MealPlanFileError, UnknownRecipeError) as e:
+            await session.rollback()
+            print(f"Import failed, nothing written: {e}", file=sys.stderr)
+            return 1
+        await session.commit()
+
+    print(f"Planned {report.created} new and {report.updated} existing slots")
+    return 0
+
+
+async def run(args: argparse.Namespace) -> int:
+    format = args.format or format_for_path(args.path)
+    overwrite = not args.keep_existing
+    init_db()
+    try:
+        if args.path == "-":
+            return await import_file(sys.stdin, format, overwrite)
+        with open(args.path, encoding="utf-8", newline="") as stream:
+            return await import_file(stream, format, overwrite)
+    finally:
+        await dispose_db()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    command = subparsers.add_parser("import")
+    command.add_argument("path", help="meal plan file, or - for standard input")
+    command.add_argument(
+        "--format", choices=FORMATS, help="default: from the file extension"
+    )
+    command.add_argument(
+        "--keep-existing",
+        action="store_true",
+        help="leave slots that are already planned as they are",
+    )
+    args = parser.parse_args(argv)
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+Profiling tokens for production requests.
+
+    uv run python -m cli.profiling token --ttl 900
+
+Prints an ``X-Profile`` header value signed with PROFILING_SECRET that is
+valid for ``--ttl`` seconds. Send it with the slow request and fetch the
+profile named by the response's ``X-Profile-Id`` header:
+
+    curl -H "X-Profile: $TOKEN" -D - https://api/recipes/42
+    curl -H "X-Profile: $TOKEN" https://api/profiles/<id> -o slow.speedscope.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import List
+
+from core.config import settings
+from core.profiling import sign_token
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    token = commands.add_parser("token", help="print a signed X-Profile value")
+    token.add_argument(
+        "--ttl", type=int, default=900, help="seconds the token is valid (900)"
+    )
+    args = parser.parse_args(argv)
+
+    if not settings.PROFILING_SECRET:
+        print("PROFILING_SECRET is not set", file=sys.stderr)
+        return 1
+    print(sign_token(settings.PROFILING_SECRET, int(time.time()) + args.ttl))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
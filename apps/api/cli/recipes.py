@@ -0,0 +1,91 @@
+"""
+Bulk recipe import.
+
+    uv run python -m cli.recipes import recipes.jsonl
+    uv run python -m cli.recipes import recipes.csv --batch-size 1000
+    cat recipes.jsonl | uv run python -m cli.recipes import - --format jsonl
+
+Files are streamed (see services/recipe_files.py for both formats) and
+written in one transaction: a parse error on any line rolls the whole
+import back. Progress and throughput are printed after every batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import List, TextIO
+
+from core.db import dispose_db, get_sessionmaker, init_db
+from schemas.recipe import RecipeImportReport
+from services.recipe_files import (
+    FORMATS,
+    RecipeFileError,
+    format_for_path,
+    read_recipes,
+)
+from services.recipe_import import DEFAULT_BATCH_SIZE, import_recipes
+
+
+def _print_progress(report: RecipeImportReport) -> None:
+    print(
+        f"  {report.recipes} recipes, {report.ingredient_lines} lines "
+        f"({report.rows_per_second:.0f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+async def import_file(stream: TextIO, format: str, batch_size: int) -> int:
+    async with get_sessionmaker()() as session:
+        try:
+            report = await import_recipes(
+                session,
+                read_recipes(stream, format),
+                batch_size=batch_size,
+                progress=_print_progress,
+            )
+        except RecipeFileError as e:
+            await session.rollback()
+            print(f"Import failed, nothing written: {e}", file=sys.stderr)
+            return 1
+        await session.commit()
+
+    print(
+        f"Imported {report.recipes} recipes and {report.ingredient_lines} "
+        f"ingredient lines in {report.seconds:.2f}s "
+        f"({report.rows_per_second:.0f} rows/s); created "
+        f"{report.ingredients_created} ingredients, "
+        f"{report.categories_created} categories, {report.brands_created} brands"
+    )
+    return 0
+
+
+async def run(args: argparse.Namespace) -> int:
+    format = args.format or format_for_path(args.path)
+    init_db()
+    try:
+        if args.path == "-":
+            return await import_file(sys.stdin, format, args.batch_size)
+        with open(args.path, encoding="utf-8", newline="") as stream:
+            return await import_file(stream, format, args.batch_size)
+    finally:
+        await dispose_db()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    command = subparsers.add_parser("import")
+    command.add_argument("path", help="recipe file, or - for standard input")
+    command.add_argument(
+        "--format", choices=FORMATS, help="default: from the file extension"
+    )
+    command.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
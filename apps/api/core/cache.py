@@ -0,0 +1,201 @@
+"""
+Caching primitives.
+
+LRUCache is a bounded in-process mapping with least-recently-used eviction
+and an optional time-to-live per entry. It is not thread-safe and is meant
+to be used from the event loop only. Every lookup is counted in
+CacheStats, so a cache in front of the database can show that it removes
+round trips.
+
+CacheBackend is the interface of caches shared between worker processes:
+a byte-string key/value store with expiry, set-if-absent and counters.
+MemoryBackend implements it in process (one worker, tests); RedisBackend
+(core/redis.py) implements it on redis.asyncio. ``create_backend``
+picks one from a URL.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional
+from typing import Protocol, Sequence, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Lookup and eviction counters of one cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded mapping with LRU eviction and an optional TTL per entry"""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        # key -> (expires_at, value); the first entry is the least recently used
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether ``key`` holds a live entry (not counted as a lookup)"""
+        entry = self._entries.get(key)  # type: ignore[call-overload]
+        return entry is not None and entry[0] > self._clock()
+
+    def values(self) -> List[V]:
+        """Live values, least recently used first (not counted as lookups)"""
+        now = self._clock()
+        return [
+            value for expires_at, value in self._entries.values() if expires_at > now
+        ]
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[1]
+            del self._entries[key]
+            self.stats.expirations += 1
+        self.stats.misses += 1
+        return default
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """Live entries among ``keys``; absent keys are left out"""
+        found: Dict[K, V] = {}
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                found[key] = entry[1]
+                continue
+            if entry is not None:
+                del self._entries[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+        return found
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl`` overrides the cache-wide time-to-live"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = float("inf") if ttl is None else self._clock() + ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def set_many(self, items: Iterable[Tuple[K, V]]) -> None:
+        for key, value in items:
+            self.set(key, value)
+
+    def invalidate(self, key: K) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+
+class CacheError(Exception):
+    """A shared cache backend could not be reached or refused a command"""
+
+
+class CacheBackend(Protocol):
+    """Byte-string store shared by every worker process"""
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]: ...
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store ``value``, expiring after ``ttl`` seconds (never if None)"""
+
+    async def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """Store ``value`` only if ``key`` is absent; whether it was stored"""
+
+    async def incr(self, key: str) -> int:
+        """Increment the integer at ``key`` (0 if absent) and return it"""
+
+    async def delete(self, key: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryBackend:
+    """CacheBackend in process memory, bounded by LRU eviction"""
+
+    def __init__(
+        self, maxsize: int = 10_000, clock: Callable[[], float] = time.monotonic
+    ):
+        self.entries: LRUCache[str, bytes] = LRUCache(maxsize, clock=clock)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        found = self.entries.get_many(keys)
+        return [found.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.entries.set(key, value, ttl)
+
+    async def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        if key in self.entries:
+            return False
+        self.entries.set(key, value, ttl)
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self.entries.get(key) or 0) + 1
+        self.entries.set(key, str(value).encode())
+        return value
+
+    async def delete(self, key: str) -> None:
+        self.entries.invalidate(key)
+
+    async def close(self) -> None:
+        self.entries.clear()
+
+
+def create_backend(url: Optional[str] = None) -> CacheBackend:
+    """MemoryBackend for no URL or ``memory://``, RedisBackend for ``redis://``"""
+    if not url or url.startswith("memory://"):
+        return MemoryBackend()
+    if url.startswith(("redis://", "rediss://")):
+        from core.redis import RedisBackend
+
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported cache URL: {url}")
@@ -0,0 +1,153 @@
+"""
+HTTP conditional requests.
+
+Endpoints whose representation is fully determined by a few ``updated_at``
+columns get strong validators without loading their rows. A dependency
+runs one cheap aggregate query (services build them, e.g. the latest
+``updated_at`` and a row count), turns the result into Validators, and
+raises NotModified when the request's ``If-None-Match`` (or, without one,
+``If-Modified-Since``) shows the client already has that version. The
+exception handler answers 304 before the endpoint loads or serializes
+anything. Otherwise the validators are left on the request state and
+ConditionalMiddleware adds them to the 200 response.
+
+ETags are strong: a digest of REPRESENTATION_VERSION and the aggregate
+values, which change whenever the response bytes would. Bump
+REPRESENTATION_VERSION when a response schema changes. Validated
+responses carry ``Cache-Control: no-cache`` so browsers always revalidate
+instead of guessing a freshness lifetime from Last-Modified.
+
+``updated_at`` columns are naive timestamps from the database clock and
+are taken to be UTC.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Part of every ETag; bump when a validated response schema changes
+REPRESENTATION_VERSION = 1
+
+# request.state attribute holding the Validators of the current request
+STATE_KEY = "validators"
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag and Last-Modified of one version of a representation"""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def of(cls, *parts: Any, last_modified: Optional[datetime] = None) -> Validators:
+        """Validators whose ETag digests ``parts`` (and the last modification)"""
+        state = "|".join(map(str, (REPRESENTATION_VERSION, last_modified, *parts)))
+        digest = hashlib.blake2b(state.encode(), digest_size=16).hexdigest()
+        return cls(
+            etag=f'"{digest}"',
+            last_modified=None if last_modified is None else _utc(last_modified),
+        )
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def _opaque_tag(tag: str) -> str:
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header lists ``etag`` (or is ``*``)"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or _opaque_tag(etag) in map(_opaque_tag, tags)
+
+
+def not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """Whether ``last_modified`` is no later than an If-Modified-Since date"""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have whole-second resolution
+    return _utc(last_modified).replace(microsecond=0) <= _utc(since)
+
+
+def is_not_modified(headers: Any, validators: Validators) -> bool:
+    """RFC 9110 evaluation of If-None-Match, then If-Modified-Since"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, validators.etag)
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None and validators.last_modified is not None:
+        return not_modified_since(if_modified_since, validators.last_modified)
+    return False
+
+
+class NotModified(Exception):
+    """The client's copy is current; answered with 304 by the handler"""
+
+    def __init__(self, validators: Validators):
+        self.validators = validators
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(status_code=304, headers=exc.validators.headers())
+
+
+def check_conditional(request: Request, validators: Optional[Validators]) -> None:
+    """
+    Raise NotModified if the request's preconditions match ``validators``.
+
+    Otherwise remember them for ConditionalMiddleware. ``None`` (e.g. the
+    resource does not exist) leaves the response alone.
+    """
+    if validators is None:
+        return
+    setattr(request.state, STATE_KEY, validators)
+    if request.method in ("GET", "HEAD") and is_not_modified(
+        request.headers, validators
+    ):
+        raise NotModified(validators)
+
+
+class ConditionalMiddleware:
+    """Add the validators a dependency computed to successful responses"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_validators(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                validators = scope.get("state", {}).get(STATE_KEY)
+                if validators is not None:
+                    headers = MutableHeaders(scope=message)
+                    for name, value in validators.headers().items():
+                        headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,6 +11,56 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "MealMind API"
     DEBUG: bool = False
 
+    # Connection pool tuning for the shared async engine (see core/db.py)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+
+    # pg_trgm word similarity needed for a fuzzy name match (see services/search.py)
+    SEARCH_WORD_SIMILARITY_THRESHOLD: float = 0.45
+
+    # How the recipe detail graph is loaded (see services/recipes.py)
+    RECIPE_DETAIL_LOADER: Literal["selectin", "joined", "cached", "projection"] = (
+        "cached"
+    )
+
+    # Category/brand/ingredient lookups cached in process (see services/catalog.py)
+    CATALOG_CACHE_SIZE: int = 10_000
+    CATALOG_CACHE_TTL_SECONDS: float = 300.0
+    CATALOG_CACHE_WARM: bool = True
+
+    # Response cache shared by workers: redis://host:6379/0, or unset for an
+    # in-process one (see services/response_cache.py)
+    RESPONSE_CACHE_URL: Optional[str] = None
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    RESPONSE_CACHE_ENABLED: bool = True
+
+    # Listings encoded straight from read models with orjson, skipping
+    # Pydantic validation (see core/serialization.py)
+    FAST_JSON_RESPONSES: bool = False
+
+    # Request and SQL instrumentation exported on /metrics (see
+    # core/instrumentation.py): distinct normalized statements tracked, and
+    # repetitions of one SELECT within a request reported as a likely N+1
+    METRICS_MAX_STATEMENTS: int = 500
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Readiness probe (see core/health.py): SELECT 1 through the pool, bounded
+    # by a timeout, with the result reused for a short window
+    READINESS_TIMEOUT_SECONDS: float = 1.0
+    READINESS_CACHE_SECONDS: float = 2.0
+
+    # Per-request sampling profiler (see core/profiling.py): requests carrying
+    # X-Profile are profiled when DEBUG is on or with a token signed by
+    # PROFILING_SECRET; profiles are kept in memory and, if set, in PROFILING_DIR
+    PROFILING_SECRET: Optional[str] = None
+    PROFILING_INTERVAL_SECONDS: float = 0.005
+    PROFILING_STORE_SIZE: int = 50
+    PROFILING_DIR: Optional[str] = None
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False
     )
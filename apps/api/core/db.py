@@ -0,0 +1,229 @@
+"""
+Shared async database layer.
+
+One process-wide SQLAlchemy async engine (asyncpg driver) backed by an
+instrumented connection pool. The engine is created and disposed by the
+FastAPI lifespan hook in main.py; request handlers obtain sessions through
+the ``get_session`` dependency (or the ``SessionDep`` alias), and streaming
+handlers through ``SessionFactoryDep``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Annotated, Any, AsyncContextManager, Callable, Optional
+
+from fastapi import Depends
+from greenlet import getcurrent
+from sqlalchemy import exc
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util import await_only
+
+from core.config import Settings, settings
+
+ASYNC_DRIVERNAME = "postgresql+asyncpg"
+
+
+def to_async_url(database_url: str) -> URL:
+    """Rewrite a postgres:// or postgresql[+driver]:// URL to use asyncpg"""
+    return make_url(database_url).set(drivername=ASYNC_DRIVERNAME)
+
+
+@dataclass
+class PoolMetrics:
+    """Counters describing how long callers waited for a pooled connection"""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record_wait(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        if waited > self.wait_seconds_max:
+            self.wait_seconds_max = waited
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout wait time and exposes saturation
+
+    Checkouts are admitted first come, first served. The underlying queue
+    lets a caller arriving just as a connection is returned take it ahead
+    of callers already waiting, so under sustained saturation some requests
+    wait many times longer than the rest. A semaphore sized to the pool's
+    capacity queues them fairly instead.
+    """
+
+    def __init__(
+        self, creator: Any, pool_size: int = 5, max_overflow: int = 10, **kw: Any
+    ):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        # max_overflow=-1 means unbounded; saturation is then relative to pool_size
+        self.capacity = pool_size + max(max_overflow, 0)
+        self.metrics = PoolMetrics()
+        self._admission = (
+            asyncio.Semaphore(self.capacity) if max_overflow >= 0 else None
+        )
+        # Greenlets inside _do_get; QueuePool._do_get retries by calling it again
+        self._admitted: set[Any] = set()
+
+    def _do_get(self) -> Any:
+        current = getcurrent()
+        if current in self._admitted:
+            return super()._do_get()
+        start = time.perf_counter()
+        self._admit()
+        self._admitted.add(current)
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self._release()
+            self.metrics.timeouts += 1
+            raise
+        except BaseException:
+            self._release()
+            raise
+        finally:
+            self._admitted.discard(current)
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def _do_return_conn(self, record: Any) -> None:
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._release()
+
+    def _admit(self) -> None:
+        if self._admission is None:
+            return
+        try:
+            await_only(asyncio.wait_for(self._admission.acquire(), self._timeout))
+        except asyncio.TimeoutError:
+            self.metrics.timeouts += 1
+            raise exc.TimeoutError(
+                "QueuePool limit of size %d overflow %d reached, "
+                "connection timed out, timeout %0.2f"
+                % (self.size(), self.overflow(), self._timeout)
+            ) from None
+
+    def _release(self) -> None:
+        if self._admission is not None:
+            self._admission.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Point-in-time snapshot of pool occupancy and checkout wait metrics"""
+        checked_out = self.checkedout()
+        metrics = self.metrics
+        return {
+            "pool_size": self.size(),
+            "capacity": self.capacity,
+            "checked_out": checked_out,
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "saturation": checked_out / self.capacity if self.capacity else 0.0,
+            "checkouts": metrics.checkouts,
+            "timeouts": metrics.timeouts,
+            "wait_seconds_total": metrics.wait_seconds_total,
+            "wait_seconds_max": metrics.wait_seconds_max,
+            "wait_seconds_avg": (
+                metrics.wait_seconds_total / metrics.checkouts
+                if metrics.checkouts
+                else 0.0
+            ),
+        }
+
+
+def create_engine(config: Settings = settings) -> AsyncEngine:
+    """Build an async engine with the pool tuned from application settings"""
+    return create_async_engine(
+        to_async_url(config.DATABASE_URL),
+        poolclass=InstrumentedPool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        echo=config.DB_ECHO,
+    )
+
+
+_engine: Optional[AsyncEngine] = None
+_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def init_db(config: Settings = settings) -> AsyncEngine:
+    """Create the process-wide engine and session factory (idempotent)"""
+    global _engine, _sessionmaker
+    if _engine is None:
+        _engine = create_engine(config)
+        _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False)
+    return _engine
+
+
+async def dispose_db() -> None:
+    """Close every pooled connection and forget the engine"""
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
+
+
+def get_engine() -> AsyncEngine:
+    if _engine is None:
+        raise RuntimeError(
+            "Database engine is not initialised; call init_db() from the app lifespan"
+        )
+    return _engine
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    if _sessionmaker is None:
+        raise RuntimeError(
+            "Database engine is not initialised; call init_db() from the app lifespan"
+        )
+    return _sessionmaker
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding a session bound to the shared pool"""
+    async with get_sessionmaker()() as session:
+        yield session
+
+
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+async def get_session_factory() -> SessionFactory:
+    """
+    FastAPI dependency for handlers whose work outlives the request scope.
+
+    Dependencies with ``yield`` are closed before a StreamingResponse body
+    is iterated, so streaming handlers open their own session from this
+    factory instead of using SessionDep.
+    """
+    return get_sessionmaker()
+
+
+SessionFactoryDep = Annotated[SessionFactory, Depends(get_session_factory)]
+
+
+def pool_stats() -> dict[str, Any]:
+    """Pool metrics for the shared engine, or an empty dict before startup"""
+    if _engine is None:
+        return {}
+    return _engine.pool.stats()  # type: ignore[attr-defined]
@@ -0,0 +1,66 @@
+"""
+EXPLAIN helpers for verifying query plans.
+
+``Explain(statement)`` wraps any selectable so it can be executed like a
+normal statement, with the same bound parameters, and returns Postgres'
+JSON plan. ``plan_nodes`` flattens that plan so callers can look for
+sequential scans or check which indexes were used.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterator, List, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+PlanNode = Dict[str, Any]
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON[, ANALYZE]) <statement>``"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    options = "FORMAT JSON, ANALYZE, BUFFERS" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
+
+async def explain(
+    session: AsyncSession, statement: ClauseElement, analyze: bool = False
+) -> PlanNode:
+    """Plan (the top "Plan" node) Postgres chooses for ``statement``"""
+    raw = await session.scalar(Explain(statement, analyze=analyze))
+    document = json.loads(raw) if isinstance(raw, str) else raw
+    return document[0]["Plan"]
+
+
+def plan_nodes(plan: PlanNode) -> Iterator[PlanNode]:
+    """Depth-first walk over a plan node and all of its children"""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def index_names(plan: PlanNode) -> Set[str]:
+    """Names of every index the plan reads"""
+    return {node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node}
+
+
+def seq_scans(plan: PlanNode) -> List[str]:
+    """Relations the plan reads with a sequential scan"""
+    return [
+        node["Relation Name"]
+        for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan"
+    ]
@@ -0,0 +1,106 @@
+"""
+Readiness of the service to take traffic.
+
+Liveness (``/health/live``) only shows that the process answers.
+Readiness (``/health/ready``) also needs the database: ReadinessCheck
+runs ``SELECT 1`` on a connection from the shared pool, inside a
+transaction whose ``statement_timeout`` is READINESS_TIMEOUT_SECONDS, and
+gives up waiting for the pool or the server after the same time. A
+saturated pool or an unreachable server therefore reports "not ready"
+promptly instead of hanging the probe.
+
+The result is cached for READINESS_CACHE_SECONDS and concurrent checks
+share one probe, so however often orchestrators poll, at most one
+connection per worker is used for health checks, once per window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncContextManager, Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+Connect = Callable[[], AsyncContextManager[AsyncConnection]]
+
+
+@dataclass(frozen=True)
+class Readiness:
+    ready: bool
+    latency_seconds: float
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        database: Dict[str, Any] = {"latency_seconds": self.latency_seconds}
+        if self.error is not None:
+            database["error"] = self.error
+        return {
+            "status": "ready" if self.ready else "unavailable",
+            "database": database,
+        }
+
+
+class ReadinessCheck:
+    """Time-bounded database probe with a cached, shared result"""
+
+    def __init__(
+        self,
+        ttl: float,
+        timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.probes = 0
+        self._clock = clock
+        self._result: Optional[Readiness] = None
+        self._expires_at = 0.0
+        self._probe: Optional[asyncio.Task[Readiness]] = None
+
+    def reset(self) -> None:
+        self._result = None
+        self._expires_at = 0.0
+
+    async def check(self, connect: Connect) -> Readiness:
+        """The cached result, or the result of a probe through ``connect``"""
+        if self._result is not None and self._clock() < self._expires_at:
+            return self._result
+        if self._probe is None or self._probe.done():
+            self._probe = asyncio.create_task(self._run(connect))
+        # A caller giving up must not cancel the probe the others wait for
+        return await asyncio.shield(self._probe)
+
+    async def _run(self, connect: Connect) -> Readiness:
+        self.probes += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._select_one(connect), self.timeout)
+        except asyncio.TimeoutError:
+            error: Optional[str] = f"No answer within {self.timeout:g}s"
+        except Exception as e:
+            # The endpoint is unauthenticated; details only go to the log
+            logger.warning("Readiness check failed: %s", e)
+            error = type(e).__name__
+        else:
+            error = None
+        result = Readiness(error is None, time.perf_counter() - start, error)
+        self._result = result
+        self._expires_at = self._clock() + self.ttl
+        return result
+
+    async def _select_one(self, connect: Connect) -> None:
+        async with connect() as connection:
+            async with connection.begin() as transaction:
+                # Integer milliseconds; SET does not take bind parameters
+                timeout_ms = max(1, int(self.timeout * 1000))
+                await connection.execute(
+                    text(f"SET LOCAL statement_timeout = {timeout_ms}")
+                )
+                await connection.scalar(text("SELECT 1"))
+                await transaction.rollback()
@@ -0,0 +1,256 @@
+"""
+Request and database instrumentation exported on ``/metrics``.
+
+MetricsMiddleware times every HTTP request and labels it with the route
+template (``/recipes/{recipe_id}``, not the concrete path, so the number
+of series stays bounded; unmatched paths share one label). The duration
+runs until the last body chunk is sent, so streaming responses are timed
+in full.
+
+``before_cursor_execute``/``after_cursor_execute`` listeners on every
+Engine time each SQL statement and group the timings by normalized SQL:
+literals and bind parameters become ``?``, IN lists and multi-row VALUES
+collapse to one element, so an expanding IN over 3 or 300 ids is one
+statement. Distinct statements are capped at METRICS_MAX_STATEMENTS; the
+rest are counted under ``other``.
+
+While a request runs, the statements it issues are also counted per
+request. A SELECT repeated at least N_PLUS_ONE_THRESHOLD times in one
+request is the signature of an N+1 query - a lazy load or a loop issuing
+one query per row - and is logged and counted with its route. Writes are
+left out, since batched inserts legitimately repeat one statement.
+
+Connection pool gauges and counters are copied from core.db after every
+request and before every scrape. Each worker exports only its own pool,
+and a scrape is served by one worker, so the others' pools must already
+be in the shared metric files (see core/metrics.py).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter as StatementCounts
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Optional, Set
+
+from prometheus_client import Counter, Gauge, Histogram, Summary
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+from core.db import pool_stats
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUESTS = Counter(
+    "mealmind_http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "mealmind_http_request_duration_seconds",
+    "HTTP request latency until the last body chunk is sent",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "mealmind_http_requests_in_progress",
+    "HTTP requests being served",
+    multiprocess_mode="livesum",
+)
+HTTP_REQUEST_STATEMENTS = Histogram(
+    "mealmind_http_request_db_statements",
+    "SQL statements executed per HTTP request",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+DB_STATEMENT_DURATION = Histogram(
+    "mealmind_db_statement_duration_seconds",
+    "Latency of every SQL statement",
+    buckets=(0.0005, 0.001, 0.0025, *Histogram.DEFAULT_BUCKETS),
+)
+DB_STATEMENTS = Summary(
+    "mealmind_db_statement_seconds",
+    "Count and total time of SQL statements by normalized statement",
+    ("statement",),
+)
+N_PLUS_ONE = Counter(
+    "mealmind_db_n_plus_one_total",
+    "Requests that repeated one SELECT at least N_PLUS_ONE_THRESHOLD times",
+    ("method", "route", "statement"),
+)
+
+# By pool_stats() key. Workers' pools add up, except for the fractions
+# and maxima, which report the worst worker's
+POOL_GAUGES = {
+    key: Gauge(f"mealmind_db_pool_{key}", documentation, multiprocess_mode=mode)
+    for key, documentation, mode in [
+        ("pool_size", "Connections kept open by the pool", "livesum"),
+        ("capacity", "Connections the pool may open, overflow included", "livesum"),
+        ("checked_out", "Connections in use", "livesum"),
+        ("checked_in", "Idle connections", "livesum"),
+        ("overflow", "Connections open beyond pool_size", "livesum"),
+        ("saturation", "Fraction of capacity in use", "livemax"),
+        ("wait_seconds_max", "Longest wait for a connection", "livemax"),
+    ]
+}
+POOL_COUNTERS = {
+    "checkouts": Counter("mealmind_db_pool_checkouts_total", "Connection checkouts"),
+    "timeouts": Counter(
+        "mealmind_db_pool_timeouts_total",
+        "Checkouts that timed out waiting for a connection",
+    ),
+    "wait_seconds_total": Counter(
+        "mealmind_db_pool_wait_seconds_total", "Time spent waiting for connections"
+    ),
+}
+
+# Normalized statements with a series of their own, in this worker
+statement_labels: Set[str] = set()
+
+# Pool counter values already added to POOL_COUNTERS
+_pool_counted: Dict[str, float] = {}
+
+UNMATCHED_ROUTE = "unmatched"
+OTHER_STATEMENT = "other"
+
+# Statements counted for the request being served, by normalized SQL
+_request_statements: ContextVar[Optional[StatementCounts[str]]] = ContextVar(
+    "request_statements", default=None
+)
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_CAST = re.compile(
+    r"\?::[A-Za-z_]+(?:\([\d, ]*\))?(?: (?:WITH|WITHOUT) TIME ZONE)?(?:\[\])?"
+)
+_NUMBER = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_GROUP = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_sql(statement: str) -> str:
+    """One label for every execution of a statement, whatever its parameters"""
+    sql = _COMMENT.sub(" ", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _CAST.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(?)", sql)
+    sql = _REPEATED_GROUP.sub(r"\1", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def statement_label(statement: str) -> str:
+    """Normalized SQL, or ``other`` once METRICS_MAX_STATEMENTS are tracked"""
+    sql = normalize_sql(statement)
+    if sql in statement_labels:
+        return sql
+    if len(statement_labels) >= settings.METRICS_MAX_STATEMENTS:
+        return OTHER_STATEMENT
+    statement_labels.add(sql)
+    return sql
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    elapsed = time.perf_counter() - conn.info["statement_started"].pop()
+    label = statement_label(statement)
+    DB_STATEMENT_DURATION.observe(elapsed)
+    DB_STATEMENTS.labels(label).observe(elapsed)
+    counts = _request_statements.get()
+    if counts is not None:
+        counts[label] += 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_timer(context) -> None:
+    started = context.connection and context.connection.info.get("statement_started")
+    if started:
+        started.pop()
+
+
+def _route_label(scope: Scope) -> str:
+    # FastAPI puts the matched APIRoute in the scope while routing
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def _report_n_plus_one(method: str, route: str, counts: StatementCounts[str]) -> None:
+    threshold = settings.N_PLUS_ONE_THRESHOLD
+    for sql, count in counts.items():
+        if count >= threshold and sql.startswith("SELECT"):
+            N_PLUS_ONE.labels(method, route, sql).inc()
+            logger.warning(
+                "Possible N+1: %s %s ran the same SELECT %d times: %s",
+                method,
+                route,
+                count,
+                sql,
+            )
+
+
+class MetricsMiddleware:
+    """Record latency, status and SQL statements of every HTTP request"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        counts: StatementCounts[str] = StatementCounts()
+        token = _request_statements.set(counts)
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            _request_statements.reset(token)
+
+            method, route = scope["method"], _route_label(scope)
+            HTTP_REQUESTS.labels(method, route, status).inc()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+            HTTP_REQUEST_STATEMENTS.labels(method, route).observe(sum(counts.values()))
+            _report_n_plus_one(method, route, counts)
+            update_pool_metrics()
+
+
+def update_pool_metrics() -> None:
+    """Copy the shared engine's pool stats into this worker's pool metrics"""
+    stats = pool_stats()
+    if not stats:
+        return
+    for key, gauge in POOL_GAUGES.items():
+        gauge.set(stats[key])
+    for key, counter in POOL_COUNTERS.items():
+        value = stats[key]
+        counted = _pool_counted.get(key, 0.0)
+        # A new engine starts its counts from zero again
+        counter.inc(value - counted if value >= counted else value)
+        _pool_counted[key] = value
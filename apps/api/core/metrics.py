@@ -0,0 +1,47 @@
+"""
+Prometheus exposition across worker processes.
+
+Metrics are prometheus_client's. Several uvicorn workers serve one port,
+and a scrape reaches whichever worker accepts it, so series kept in each
+process would seem to reset from one scrape to the next. Set
+PROMETHEUS_MULTIPROC_DIR to an empty directory before the workers start
+(the Dockerfile does): every worker then writes its samples to files
+there, and render() merges the files of all workers into one
+exposition. Counters and histograms are summed; each gauge declares how
+it is merged (``multiprocess_mode``). Without the variable, as in tests
+and single-process runs, the process's own registry is rendered.
+
+A worker that shuts down cleanly drops its live gauges (``live*`` modes)
+with process_exited(); its counters stay in the sums, so totals never go
+backwards.
+"""
+
+from __future__ import annotations
+
+import os
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry
+from prometheus_client import generate_latest, multiprocess
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+MULTIPROC_DIR_VARIABLE = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_VARIABLE))
+
+
+def render() -> bytes:
+    """Every worker's metrics, or this process's, in the text exposition format"""
+    if not multiprocess_enabled():
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def process_exited() -> None:
+    """Drop this worker's live gauges from the merged metrics"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
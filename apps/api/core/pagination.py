@@ -0,0 +1,140 @@
+"""
+Keyset (cursor) pagination.
+
+OFFSET pagination makes Postgres produce and throw away every row before
+the requested page, so page N costs O(N). Keyset pagination instead
+remembers the sort key of the last row served and asks for rows strictly
+after it:
+
+    WHERE (name, id) > (:last_name, :last_id) ORDER BY name, id LIMIT :n
+
+With a composite B-tree index on exactly those columns, that is one index
+descent plus ``n`` index entries whatever the page depth. The key always
+ends in the primary key so it is unique and no row is skipped or repeated
+when values tie.
+
+Cursors handed to clients are opaque: URL-safe base64 of the JSON-encoded
+key values. They are not signed - a forged cursor can only select a
+different starting point in the same ordered listing.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import starmap
+from typing import Any, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from sqlalchemy import Row, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded for the given keyset"""
+
+
+class Keyset:
+    """Ordered NOT NULL key columns of a listing; the last one must be unique"""
+
+    def __init__(self, *columns: InstrumentedAttribute) -> None:
+        self.columns: Tuple[InstrumentedAttribute, ...] = columns
+
+    def key(self, row: Any) -> Tuple[Any, ...]:
+        """Sort key of a column row, an entity row, an ORM instance or a read model"""
+        if isinstance(row, Row):
+            try:
+                return tuple(row._mapping[column] for column in self.columns)
+            except KeyError:
+                # select(Model): the row holds the entity itself
+                row = row[0]
+        return tuple(getattr(row, column.key) for column in self.columns)
+
+    def encode(self, key: Sequence[Any]) -> str:
+        """Opaque cursor token for a sort key"""
+        payload = json.dumps([_to_json(value) for value in key], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+    def decode(self, cursor: str) -> Tuple[Any, ...]:
+        """Sort key from a cursor token produced by ``encode``"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("wrong number of key values")
+            return tuple(
+                _from_json(value, column.type.python_type)
+                for value, column in zip(values, self.columns)
+            )
+        except (ValueError, TypeError, ArithmeticError, binascii.Error) as e:
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+    def apply(
+        self, query: Select, after: Optional[Sequence[Any]], limit: int
+    ) -> Select:
+        """Order ``query`` by the keyset and restrict it to the page after ``after``"""
+        if after is not None:
+            query = query.where(tuple_(*self.columns) > tuple_(*after))
+        # One extra row tells us whether another page exists without a COUNT
+        return query.order_by(*self.columns).limit(limit + 1)
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of results and the cursor of the page after it"""
+
+    items: List[T]
+    next_cursor: Optional[str]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, python_type: type) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    if not isinstance(value, python_type):
+        raise TypeError(f"expected {python_type.__name__}, got {value!r}")
+    return value
+
+
+async def fetch_keyset_page(
+    session: AsyncSession,
+    query: Select,
+    keyset: Keyset,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    model: Optional[Type[Any]] = None,
+) -> KeysetPage[Any]:
+    """
+    Execute ``query`` for the page after ``cursor`` (the first page if None).
+
+    ``query`` must select every keyset column and must not be ordered; rows
+    are returned as-is, or as ``model`` read models when given (see
+    core/projections.py). Raises InvalidCursorError for a malformed cursor.
+    """
+    after = keyset.decode(cursor) if cursor else None
+    result = await session.execute(keyset.apply(query, after, limit))
+    rows = list(starmap(model, result.tuples())) if model else result.all()
+    if len(rows) <= limit:
+        return KeysetPage(items=list(rows), next_cursor=None)
+    items = list(rows[:limit])
+    return KeysetPage(items=items, next_cursor=keyset.encode(keyset.key(items[-1])))
@@ -0,0 +1,355 @@
+"""
+Opt-in sampling profiler for single requests.
+
+A request carrying an ``X-Profile`` header is profiled when the header is
+allowed: any value when ``DEBUG`` is on, otherwise a token signed with
+PROFILING_SECRET (``python -m cli.profiling token``) that has not expired.
+Anything else is served normally, so the header is harmless in production
+without the secret.
+
+While a profiled request runs, a background thread samples the stack of
+the event loop thread every PROFILING_INTERVAL_SECONDS. The loop serves
+other requests concurrently, so a sample only records the stack when the
+profiled request's own middleware frame is on it, i.e. its coroutine
+chain is the one running; otherwise it is counted as ``(request not
+running)`` - time spent awaiting the database, the cache or the loop.
+Samples are weighted by the time since the previous one, so the profile
+adds up to wall-clock time. Every SQL statement the request
+executes is recorded with its start offset and duration (not its
+parameters). Plain ``def`` endpoints run in a worker thread, so their own
+work shows up as not running; their SQL is still recorded.
+
+The response carries an ``X-Profile-Id`` header. Profiles are kept in a
+small in-process LRU (and written to PROFILING_DIR when set), and are
+served by ``GET /profiles/{id}`` as speedscope JSON - the request's
+samples plus an evented "SQL" timeline - as collapsed stacks for
+flamegraph.pl, or as the statement list.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache import LRUCache
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+NOT_RUNNING = "(request not running)"
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+
+
+def sign_token(secret: str, expires: int) -> str:
+    """A profiling token valid until the Unix time ``expires``"""
+    digest = hmac.new(secret.encode(), str(expires).encode(), hashlib.sha256)
+    return f"{expires}.{digest.hexdigest()}"
+
+
+def verify_token(token: str, secret: str, now: Optional[float] = None) -> bool:
+    expires, _, _ = token.partition(".")
+    if not expires.isdigit():
+        return False
+    if int(expires) < (time.time() if now is None else now):
+        return False
+    return hmac.compare_digest(token, sign_token(secret, int(expires)))
+
+
+def profiling_allowed(header: Optional[str]) -> bool:
+    """Whether an X-Profile header value unlocks profiling"""
+    if not header:
+        return False
+    if settings.DEBUG:
+        return True
+    secret = settings.PROFILING_SECRET
+    return bool(secret) and verify_token(header, secret)
+
+
+@dataclass(frozen=True)
+class Frame:
+    name: str
+    file: str
+    line: int
+
+    @classmethod
+    def of(cls, frame: FrameType) -> Frame:
+        code = frame.f_code
+        return cls(code.co_qualname, _short_path(code.co_filename), code.co_firstlineno)
+
+    def __str__(self) -> str:
+        label = f"{self.name} ({self.file}:{self.line})" if self.file else self.name
+        # ";" separates frames in collapsed stacks
+        return label.replace(";", ",")
+
+
+def _short_path(filename: str) -> str:
+    path = Path(filename)
+    if path.is_relative_to(APP_ROOT):
+        return str(path.relative_to(APP_ROOT))
+    _, marker, rest = filename.rpartition("site-packages/")
+    return rest if marker else path.name
+
+
+Stack = Tuple[Frame, ...]
+
+NOT_RUNNING_STACK: Stack = (Frame(NOT_RUNNING, "", 0),)
+
+
+class Sampler:
+    """Samples one thread's stack while a given frame is on it"""
+
+    def __init__(
+        self,
+        interval: float,
+        root: Optional[FrameType] = None,
+        max_samples: int = 100_000,
+    ):
+        self.interval = interval
+        # Frame stacks are cut at (e.g. the middleware's, for one request);
+        # a stack without it is another task's, or the idle loop's
+        self.root = root
+        self.max_samples = max_samples
+        # (stack from root to leaf, seconds since the previous sample)
+        self.samples: List[Tuple[Stack, float]] = []
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        # Held while a sample is appended, so none lands after stop()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling without waiting for the thread, which exits on its own"""
+        with self._lock:
+            self._stop.set()
+
+    def _stack(self) -> Stack:
+        frame = sys._current_frames().get(self._thread_id)
+        frames: List[Frame] = []
+        while frame is not None:
+            frames.append(Frame.of(frame))
+            if frame is self.root:
+                break
+            frame = frame.f_back
+        else:
+            if self.root is not None:
+                return NOT_RUNNING_STACK
+        return tuple(reversed(frames))
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            if len(self.samples) >= self.max_samples:
+                break
+            stack = self._stack()
+            now = time.perf_counter()
+            with self._lock:
+                if self._stop.is_set():
+                    break
+                self.samples.append((stack, now - last))
+            last = now
+
+
+@dataclass
+class Statement:
+    sql: str
+    # Seconds from the start of the request
+    start: float
+    duration: float
+
+
+@dataclass
+class Profile:
+    """Samples and SQL statements of one profiled request"""
+
+    method: str
+    path: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    status: Optional[int] = None
+    duration: float = 0.0
+    samples: List[Tuple[Stack, float]] = field(default_factory=list)
+    statements: List[Statement] = field(default_factory=list)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": self.duration,
+            "samples": len(self.samples),
+            "statements": len(self.statements),
+            "statement_seconds": sum(s.duration for s in self.statements),
+        }
+
+    def statement_list(self) -> List[Dict[str, Any]]:
+        return [
+            {"sql": s.sql, "start_seconds": s.start, "duration_seconds": s.duration}
+            for s in self.statements
+        ]
+
+    def collapsed(self) -> str:
+        """Folded stacks (``a;b;c count``) for flamegraph.pl and speedscope"""
+        counts: Dict[str, int] = {}
+        for stack, _ in self.samples:
+            folded = ";".join(map(str, stack))
+            counts[folded] = counts.get(folded, 0) + 1
+        return "".join(f"{folded} {count}\n" for folded, count in counts.items())
+
+    def speedscope(self) -> Dict[str, Any]:
+        """speedscope file: sampled request stacks and an evented SQL timeline"""
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Frame, int] = {}
+
+        def frame_index(frame: Frame) -> int:
+            if frame not in index:
+                index[frame] = len(frames)
+                entry: Dict[str, Any] = {"name": frame.name}
+                if frame.file:
+                    entry.update(file=frame.file, line=frame.line)
+                frames.append(entry)
+            return index[frame]
+
+        samples = [[frame_index(f) for f in stack] for stack, _ in self.samples]
+        events: List[Dict[str, Any]] = []
+        for statement in self.statements:
+            frame = frame_index(Frame(statement.sql, "", 0))
+            end = statement.start + statement.duration
+            events.append({"type": "O", "frame": frame, "at": statement.start})
+            events.append({"type": "C", "frame": frame, "at": end})
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "mealmind",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": samples,
+                    "weights": [weight for _, weight in self.samples],
+                },
+                {
+                    "type": "evented",
+                    "name": "SQL",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "events": events,
+                },
+            ],
+        }
+
+
+# Profiles of recent requests, by id
+profiles: LRUCache[str, Profile] = LRUCache(maxsize=settings.PROFILING_STORE_SIZE)
+
+_current_profile: ContextVar[Optional[Profile]] = ContextVar(
+    "current_profile", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _statement_started(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        context._profile_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _statement_finished(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    started = getattr(context, "_profile_started", None)
+    if profile is not None and started is not None:
+        profile.statements.append(
+            Statement(
+                statement, started - profile._start, time.perf_counter() - started
+            )
+        )
+
+
+def save(profile: Profile) -> None:
+    profiles.set(profile.id, profile)
+    if settings.PROFILING_DIR:
+        directory = Path(settings.PROFILING_DIR)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{profile.id}.speedscope.json"
+            path.write_text(json.dumps(profile.speedscope()))
+        except OSError as e:
+            logger.warning("Profile %s not written: %s", profile.id, e)
+
+
+class ProfilerMiddleware:
+    """Profile requests that carry an allowed X-Profile header"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith("/profiles")
+            or not profiling_allowed(Headers(scope=scope).get(PROFILE_HEADER))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(method=scope["method"], path=scope["path"])
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile.id
+            await send(message)
+
+        sampler = Sampler(settings.PROFILING_INTERVAL_SECONDS, root=sys._getframe())
+        token = _current_profile.set(profile)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            _current_profile.reset(token)
+            profile.duration = time.perf_counter() - profile._start
+            profile.samples = sampler.samples
+            save(profile)
+            logger.info(
+                "Profiled %s in %.3fs: %d samples, %d statements (profile %s)",
+                profile.name,
+                profile.duration,
+                len(profile.samples),
+                len(profile.statements),
+                profile.id,
+            )
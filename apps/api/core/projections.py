@@ -0,0 +1,60 @@
+"""
+Read-model projections.
+
+Hot read paths select plain columns and materialize each row into a small
+slotted dataclass (a read model) rather than an ORM entity. An entity
+costs, per row, an identity map entry, an InstanceState for change
+tracking with its attribute dict, and instrumented attribute access; a
+slotted instance is one fixed-size object with no ``__dict__``.
+
+Declare a read model with ``@read_model`` and select into it with
+``select_into(Model, *columns)``, which labels the columns after the
+fields so the statement and the dataclass cannot drift apart. Then
+``fetch_into`` builds one instance per row positionally. Read models are
+plain values: nothing tracks them, and nothing is loaded on attribute
+access. ``benchmarks/read_models.py`` compares the cost per row with
+entities and Row tuples.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from itertools import starmap
+from typing import Any, List, Optional, Type, TypeVar
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+def read_model(cls: Type[T]) -> Type[T]:
+    """Make ``cls`` a slotted dataclass; treat instances as read-only"""
+    # Not frozen: a frozen dataclass' __init__ goes through
+    # object.__setattr__ for every field, several times slower to construct
+    return dataclass(slots=True)(cls)
+
+
+def select_into(model: Type[Any], *columns: ColumnElement[Any]) -> Select:
+    """SELECT ``columns`` labelled after ``model``'s fields, in field order"""
+    names = [field.name for field in fields(model)]
+    if len(names) != len(columns):
+        raise ValueError(
+            f"{model.__name__} has {len(names)} fields, got {len(columns)} columns"
+        )
+    return select(*(column.label(name) for name, column in zip(names, columns)))
+
+
+async def fetch_into(session: AsyncSession, model: Type[T], statement: Any) -> List[T]:
+    """Every row of ``statement`` as a ``model`` instance"""
+    result = await session.execute(statement)
+    return list(starmap(model, result.tuples()))
+
+
+async def fetch_one_into(
+    session: AsyncSession, model: Type[T], statement: Any
+) -> Optional[T]:
+    """The first row of ``statement`` as a ``model`` instance, or None"""
+    row = (await session.execute(statement)).first()
+    return None if row is None else model(*row)
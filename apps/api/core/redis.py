@@ -0,0 +1,76 @@
+"""
+Redis cache backend.
+
+RedisBackend implements CacheBackend (core/cache.py) on ``redis.asyncio``,
+so it talks to Redis, Valkey or any other server speaking the protocol.
+
+Connections come from a blocking pool of ``max_connections``: a command
+waits up to ``timeout`` for a free connection, and connecting and reading
+a reply are bounded by the same timeout. The client drops a connection
+that fails mid-command rather than reusing it. Every failure, an error
+reply included, surfaces as CacheError.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, List, Optional, Sequence
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from core.cache import CacheError
+
+
+class RedisBackend:
+    """CacheBackend on a Redis-protocol server, e.g. ``redis://cache:6379/0``"""
+
+    def __init__(self, url: str, max_connections: int = 10, timeout: float = 1.0):
+        self.pool = BlockingConnectionPool.from_url(
+            url,
+            # RESP2: redis-py 8 otherwise opens with HELLO 3, which older
+            # servers and tests/fixtures/fake_redis.py refuse
+            protocol=2,
+            max_connections=max_connections,
+            timeout=timeout,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+        self.client = Redis(connection_pool=self.pool)
+
+    async def _call(self, command: str, reply: Awaitable[Any]) -> Any:
+        try:
+            return await reply
+        except (RedisError, OSError, asyncio.TimeoutError) as e:
+            raise CacheError(f"Redis {command} failed: {e!r}") from e
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._call("GET", self.client.get(key))
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self._call("MGET", self.client.mget(keys))
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        await self._call("SET", self.client.set(key, value, px=_expiry(ttl)))
+
+    async def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        stored = self.client.set(key, value, px=_expiry(ttl), nx=True)
+        return await self._call("SET", stored) is not None
+
+    async def incr(self, key: str) -> int:
+        return await self._call("INCR", self.client.incr(key))
+
+    async def delete(self, key: str) -> None:
+        await self._call("DEL", self.client.delete(key))
+
+    async def ping(self) -> bool:
+        return await self._call("PING", self.client.ping())
+
+    async def close(self) -> None:
+        await self.client.aclose(close_connection_pool=True)
+
+
+def _expiry(ttl: Optional[float]) -> Optional[int]:
+    return None if ttl is None else max(1, int(ttl * 1000))
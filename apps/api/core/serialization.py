@@ -0,0 +1,57 @@
+"""
+Fast JSON serialization of trusted read models.
+
+A response returned the default FastAPI way is paid for three times: the
+endpoint builds Pydantic models from its rows (validating every field),
+FastAPI validates the returned value again against ``response_model`` and
+converts it to plain Python, and the stdlib ``json`` module encodes that.
+For rows the API has just read from its own database none of that
+validation can find anything.
+
+With FAST_JSON_RESPONSES on, listings return their read models
+(core/projections.py) in a FastJSONResponse instead, and ``dumps`` encodes
+them with orjson in one pass: dataclasses (slotted read models included)
+by field, dates and datetimes as ISO 8601, enums by value and Decimals as
+strings - the JSON Pydantic produces for the same schemas. The endpoint
+keeps its ``response_model`` for the OpenAPI schema; FastAPI passes a
+returned Response through untouched.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+# Pydantic writes UTC datetimes with a "Z" suffix
+OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """``content`` as JSON, without validation"""
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+
+def render(content: Any) -> bytes:
+    """JSON of a Pydantic model, or of read models through ``dumps``"""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    return dumps(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSONResponse encoded by ``dumps``"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,199 @@
+"""
+Unit registry and quantity conversion.
+
+Recipe lines store whatever unit the author typed ("tbsp", "Tablespoon",
+"15 ml"). Each spelling is resolved once to a canonical unit with a
+dimension (mass, volume or count) and a factor relative to that
+dimension's base unit (g, ml, each). RecipeIngredient stores the converted
+base_quantity/base_unit at write time, so aggregation is a plain SUM.
+
+Units we don't recognise ("clove", "pinch") are kept as their own base
+unit after whitespace/case normalisation, so they still sum with
+themselves. A leading number on a known unit ("15 ml") is folded into the
+conversion factor.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+MASS = "mass"
+VOLUME = "volume"
+COUNT = "count"
+
+BASE_UNITS = {MASS: "g", VOLUME: "ml", COUNT: "each"}
+
+# Scale of RecipeIngredient.base_quantity (Numeric(14, 4))
+BASE_QUANTITY_EXPONENT = Decimal("0.0001")
+
+
+@dataclass(frozen=True)
+class Unit:
+    """A known unit: its canonical name, dimension and size in base units"""
+
+    name: str
+    dimension: str
+    factor: Decimal
+
+    @property
+    def base_unit(self) -> str:
+        # Kitchen units such as "clove" are their own dimension and base
+        return BASE_UNITS.get(self.dimension, self.dimension)
+
+
+class UnitConversionError(ValueError):
+    """Raised when a conversion involves an unknown unit or mixes dimensions"""
+
+
+_UNITS: Dict[str, Unit] = {}
+_ALIASES: Dict[str, str] = {}
+
+# "15 ml" / "2 tbsp" style units that carry their own multiplier
+_MULTIPLIED = re.compile(r"^(\d+(?:\.\d+)?)\s*(.+)$")
+
+
+def _clean(text: str) -> str:
+    # Drop abbreviation dots ("Tbsp.", "fl. oz") but keep decimal points
+    return " ".join(re.sub(r"(?<=[a-z])\.", " ", text.lower()).split())
+
+
+@lru_cache(maxsize=1024)
+def resolve_unit(text: str) -> Tuple[Decimal, str, Optional[Unit]]:
+    """
+    Resolve a free-form unit string to (factor, base_unit, unit).
+
+    factor converts a quantity in ``text`` to ``base_unit``; ``unit`` is the
+    registered Unit, or None for spellings we don't know, which become
+    their own base unit with factor 1. Results are cached per spelling.
+    """
+    key = _clean(text)
+    multiplier = Decimal(1)
+    name = _ALIASES.get(key)
+    if name is None:
+        match = _MULTIPLIED.match(key)
+        if match and _lookup(match.group(2)):
+            multiplier = Decimal(match.group(1))
+            name = _lookup(match.group(2))
+        else:
+            name = _lookup(key)
+
+    if name is None:
+        return Decimal(1), key, None
+    unit = _UNITS[name]
+    return multiplier * unit.factor, unit.base_unit, unit
+
+
+def _lookup(key: str) -> Optional[str]:
+    name = _ALIASES.get(key)
+    if name is None and key.endswith("s"):
+        name = _ALIASES.get(key[:-1])
+    return name
+
+
+def register_unit(
+    name: str, dimension: str, factor: str, aliases: Iterable[str] = ()
+) -> Unit:
+    """Add a unit (and its spellings) to the registry"""
+    unit = Unit(name=name, dimension=dimension, factor=Decimal(factor))
+    _UNITS[name] = unit
+    for alias in (name, *aliases):
+        _ALIASES[_clean(alias)] = name
+    resolve_unit.cache_clear()
+    return unit
+
+
+# fmt: off
+register_unit("g", MASS, "1", ["gram", "grams", "gr", "gm", "gms"])
+register_unit("kg", MASS, "1000", ["kilogram", "kilograms", "kilo", "kilos", "kgs"])
+register_unit("mg", MASS, "0.001", ["milligram", "milligrams"])
+register_unit("oz", MASS, "28.349523125", ["ounce", "ounces"])
+register_unit("lb", MASS, "453.59237", ["lbs", "pound", "pounds"])
+
+register_unit("ml", VOLUME, "1", ["milliliter", "milliliters", "millilitre", "millilitres", "mls", "cc"])
+register_unit("cl", VOLUME, "10", ["centiliter", "centiliters", "centilitre", "centilitres"])
+register_unit("dl", VOLUME, "100", ["deciliter", "deciliters", "decilitre", "decilitres"])
+register_unit("l", VOLUME, "1000", ["liter", "liters", "litre", "litres", "ltr"])
+register_unit("tsp", VOLUME, "4.92892159375", ["teaspoon", "teaspoons", "tsps"])
+register_unit("tbsp", VOLUME, "14.78676478125", ["tablespoon", "tablespoons", "tbsps", "tbs", "tbl"])
+register_unit("fl oz", VOLUME, "29.5735295625", ["fluid ounce", "fluid ounces", "floz"])
+register_unit("cup", VOLUME, "236.5882365", ["cups"])
+register_unit("pint", VOLUME, "473.176473", ["pints", "pt"])
+register_unit("quart", VOLUME, "946.352946", ["quarts", "qt"])
+register_unit("gallon", VOLUME, "3785.411784", ["gallons", "gal"])
+
+register_unit("each", COUNT, "1", ["ea", "whole", "piece", "pieces", "pc", "pcs"])
+register_unit("dozen", COUNT, "12", ["doz"])
+
+# Kitchen measures that don't convert to anything else: each is its own base
+for _name, _aliases in [
+    ("clove", ["cloves"]), ("pinch", ["pinches"]), ("dash", ["dashes"]),
+    ("can", ["cans", "tin", "tins"]), ("bunch", ["bunches"]),
+    ("slice", ["slices"]), ("sprig", ["sprigs"]), ("stalk", ["stalks"]),
+    ("head", ["heads"]), ("handful", ["handfuls"]),
+]:
+    register_unit(_name, _name, "1", _aliases)
+# fmt: on
+
+
+def _as_decimal(quantity: object) -> Decimal:
+    return quantity if isinstance(quantity, Decimal) else Decimal(str(quantity))
+
+
+def canonicalize(
+    quantity: object, unit: Optional[str]
+) -> Tuple[Optional[Decimal], Optional[str]]:
+    """Convert a quantity in a free-form unit to (base_quantity, base_unit)"""
+    base_quantities, base_units = canonicalize_many([quantity], [unit])
+    return base_quantities[0], base_units[0]
+
+
+def canonicalize_many(
+    quantities: Sequence[object], units: Sequence[Optional[str]]
+) -> Tuple[List[Optional[Decimal]], List[Optional[str]]]:
+    """
+    Batch form of canonicalize for import and aggregation paths.
+
+    Each distinct unit spelling is resolved once; every row is then a
+    single multiply. Returns parallel lists of base quantities and units.
+    """
+    if len(quantities) != len(units):
+        raise ValueError("quantities and units must be the same length")
+
+    resolved: Dict[Optional[str], Tuple[Decimal, Optional[str]]] = {}
+    for unit in set(units):
+        if unit is None or not unit.strip():
+            resolved[unit] = (Decimal(1), None)
+        else:
+            factor, base_unit, _ = resolve_unit(unit)
+            resolved[unit] = (factor, base_unit)
+
+    base_quantities: List[Optional[Decimal]] = []
+    base_units: List[Optional[str]] = []
+    for quantity, unit in zip(quantities, units):
+        factor, base_unit = resolved[unit]
+        base_units.append(base_unit)
+        base_quantities.append(
+            None
+            if quantity is None
+            else (_as_decimal(quantity) * factor).quantize(BASE_QUANTITY_EXPONENT)
+        )
+    return base_quantities, base_units
+
+
+def convert(quantity: object, from_unit: str, to_unit: str) -> Decimal:
+    """Convert between two registered units of the same dimension"""
+    from_factor, _, source = resolve_unit(from_unit)
+    to_factor, _, target = resolve_unit(to_unit)
+    if source is None or target is None:
+        unknown = from_unit if source is None else to_unit
+        raise UnitConversionError(f"Unknown unit: {unknown}")
+    if source.dimension != target.dimension:
+        raise UnitConversionError(
+            f"Cannot convert {source.dimension} ({from_unit}) "
+            f"to {target.dimension} ({to_unit})"
+        )
+    return _as_decimal(quantity) * from_factor / to_factor
@@ -1,50 +1,134 @@
-from fastapi import FastAPI
-import os
-import psycopg2
+import logging
+from contextlib import asynccontextmanager
 
-app = FastAPI(title="MealMind API", version="0.1.0")
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.conditional import ConditionalMiddleware, NotModified, not_modified_handler
+from core.config import settings
+from core.db import (
+    SessionDep,
+    dispose_db,
+    get_engine,
+    get_sessionmaker,
+    init_db,
+    pool_stats,
+)
+from core.health import ReadinessCheck
+from core.instrumentation import MetricsMiddleware, update_pool_metrics
+from core.metrics import CONTENT_TYPE, process_exited, render
+from core.profiling import ProfilerMiddleware
+from routers import grocery, ingredients, meal_plans, profiles, recipes, search
+from services.catalog import catalog
+from services.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+readiness = ReadinessCheck(
+    ttl=settings.READINESS_CACHE_SECONDS, timeout=settings.READINESS_TIMEOUT_SECONDS
+)
+
+
+async def warm_catalog() -> None:
+    """Fill the catalog cache; an unreachable database only delays it"""
+    try:
+        async with get_sessionmaker()() as session:
+            rows = await catalog.warm(session)
+    except (OSError, SQLAlchemyError) as e:
+        logger.warning("Catalog cache not warmed: %s", e)
+    else:
+        logger.info("Catalog cache warmed with %d rows", rows)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared database engine on startup and dispose it on shutdown"""
+    init_db()
+    if settings.CATALOG_CACHE_WARM:
+        await warm_catalog()
+    try:
+        yield
+    finally:
+        await response_cache.close()
+        await dispose_db()
+        process_exited()
+
+
+app = FastAPI(title="MealMind API", version="0.1.0", lifespan=lifespan)
+app.add_middleware(ConditionalMiddleware)
+app.add_middleware(ProfilerMiddleware)
+# Added last so it is outermost and times the other middleware too
+app.add_middleware(MetricsMiddleware)
+app.add_exception_handler(NotModified, not_modified_handler)
+app.include_router(grocery.router)
+app.include_router(ingredients.router)
+app.include_router(meal_plans.router)
+app.include_router(profiles.router)
+app.include_router(recipes.router)
+app.include_router(search.router)
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to MealMind API!"}
 
 
 @app.get("/health")
-def health_check():
+@app.get("/health/live")
+async def health_check():
+    """Liveness: the process is up; does not touch the database"""
     return {"status": "healthy"}
 
 
+@app.get("/health/ready", responses={503: {"description": "Database unavailable"}})
+async def readiness_check():
+    """Readiness: a time-bounded SELECT 1 through the pool, cached briefly"""
+    result = await readiness.check(lambda: get_engine().connect())
+    return JSONResponse(result.as_dict(), status_code=200 if result.ready else 503)
+
+
 @app.get("/db-test")
-def test_database_connection():
-    """Test database connectivity"""
+async def test_database_connection(session: SessionDep):
+    """Test database connectivity through the shared connection pool"""
     try:
-        database_url = os.getenv(
-            "DATABASE_URL", "postgres://postgres:postgres@db:5432/postgres"
-        )
-
-        # Parse the connection string
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
+        version = await session.scalar(text("SELECT version();"))
 
         return {
             "status": "success",
             "message": "Database connection successful",
             "database_version": version,
         }
-    except ImportError:
-        return {
-            "status": "error",
-            "message": "psycopg2 not installed. Install with: pip install psycopg2-binary",
-        }
     except Exception as e:
         return {"status": "error", "message": f"Database connection failed: {str(e)}"}
 
 
+@app.get("/db-pool")
+async def database_pool_stats():
+    """Connection pool occupancy, saturation and checkout wait metrics"""
+    return pool_stats()
+
+
+@app.get("/catalog-cache")
+async def catalog_cache_stats():
+    """Catalog cache size and hit/miss counters per table"""
+    return catalog.stats()
+
+
+@app.get("/response-cache")
+async def response_cache_stats():
+    """Shared response cache hit/miss, single-flight and error counters"""
+    return response_cache.stats.as_dict()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Request, SQL statement and connection pool metrics of every worker"""
+    update_pool_metrics()
+    return Response(render(), media_type=CONTENT_TYPE)
+
+
 def hello() -> str:
     return "Hello from api!"
 
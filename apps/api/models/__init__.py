@@ -6,6 +6,7 @@ from models.ingredient import Ingredient
 from models.meal_plan import MealPlan
 from models.recipe import Recipe
 from models.recipe_ingredient import RecipeIngredient
+from models.weekly_grocery_item import WeeklyGroceryItem
 
 __all__ = [
     "Base",
@@ -16,4 +17,5 @@ __all__ = [
     "MealType",
     "Recipe",
     "RecipeIngredient",
+    "WeeklyGroceryItem",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -19,6 +19,16 @@ class Ingredient(Base):
     """Ingredient model - master catalog of reusable ingredients"""
 
     __tablename__ = "ingredients"
+    __table_args__ = (
+        # Keyset pagination order (see core/pagination.py)
+        Index("ix_ingredients_name_id", "name", "id"),
+        Index(
+            "ix_ingredients_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
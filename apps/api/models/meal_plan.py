@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Date, Enum, ForeignKey, Text
+from sqlalchemy import Date, Enum, ForeignKey, Index, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -18,12 +18,24 @@ class MealPlan(Base):
     """Meal plan model - plan recipes for specific dates and meal types"""
 
     __tablename__ = "meal_plans"
+    __table_args__ = (
+        # Date-range scans and keyset pagination (see core/pagination.py)
+        Index("ix_meal_plans_planned_date_id", "planned_date", "id"),
+        # One plan per slot; batch scheduling upserts on it, and calendar
+        # grid reads (see services/meal_plans.py) are index-only on it
+        UniqueConstraint(
+            "planned_date",
+            "meal_type",
+            name="uq_meal_plans_planned_date_meal_type",
+            postgresql_include=["id", "recipe_id"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     recipe_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("recipes.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("recipes.id", ondelete="SET NULL"), nullable=True, index=True
     )
-    planned_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    planned_date: Mapped[date] = mapped_column(Date, nullable=False)
     meal_type: Mapped[MealType] = mapped_column(
         Enum(MealType, name="meal_type_enum"), nullable=False
     )
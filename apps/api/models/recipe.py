@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, Text
+from sqlalchemy import Computed, Index, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -13,14 +14,33 @@ if TYPE_CHECKING:
     from models.meal_plan import MealPlan
     from models.recipe_ingredient import RecipeIngredient
 
+# Weighted search document: name matches rank above description, which
+# rank above instructions. Must stay in sync with migration 3c5f0e7a9b21.
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(instructions, '')), 'C')"
+)
+
 
 class Recipe(Base):
     """Recipe model - stores recipe information"""
 
     __tablename__ = "recipes"
+    __table_args__ = (
+        # Keyset pagination order (see core/pagination.py)
+        Index("ix_recipes_name_id", "name", "id"),
+        Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_recipes_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     prep_time_minutes: Mapped[Optional[int]] = mapped_column(nullable=True)
     cook_time_minutes: Mapped[Optional[int]] = mapped_column(nullable=True)
@@ -32,7 +52,13 @@ class Recipe(Base):
     updated_at: Mapped[datetime] = mapped_column(
         default=func.now(), server_default=func.now(), onupdate=func.now()
     )
+    # Maintained by Postgres; deferred so ordinary loads don't fetch it
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SEARCH_DOCUMENT, persisted=True), deferred=True
+    )
     recipe_ingredients: Mapped[List["RecipeIngredient"]] = relationship(
-        back_populates="recipe", cascade="all, delete-orphan"
+        back_populates="recipe",
+        cascade="all, delete-orphan",
+        order_by="[RecipeIngredient.display_order, RecipeIngredient.id]",
     )
     meal_plans: Mapped[List["MealPlan"]] = relationship(back_populates="recipe")
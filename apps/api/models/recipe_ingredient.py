@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Numeric, Boolean, Text
+from sqlalchemy import ForeignKey, Integer, String, Numeric, Boolean, Text, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from core.units import canonicalize
 from models.base import Base
 
 if TYPE_CHECKING:
@@ -20,13 +22,19 @@ class RecipeIngredient(Base):
     __tablename__ = "recipe_ingredients"
     id: Mapped[int] = mapped_column(primary_key=True)
     recipe_id: Mapped[int] = mapped_column(
-        ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False, index=True
     )
     ingredient_id: Mapped[int] = mapped_column(
         ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False
     )
     quantity: Mapped[Optional[float]] = mapped_column(Numeric(10, 2), nullable=True)
     unit: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    # quantity/unit converted once at write time (g, ml, each, ...) so that
+    # grocery totals are a plain SUM; maintained by the listener below
+    base_quantity: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(14, 4), nullable=True
+    )
+    base_unit: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     preparation: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     display_order: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     is_optional: Mapped[bool] = mapped_column(
@@ -40,3 +48,10 @@ class RecipeIngredient(Base):
     )
     recipe: Mapped["Recipe"] = relationship(back_populates="recipe_ingredients")
     ingredient: Mapped["Ingredient"] = relationship(back_populates="recipe_ingredients")
+
+
+@event.listens_for(RecipeIngredient, "before_insert")
+@event.listens_for(RecipeIngredient, "before_update")
+def _canonicalize_quantity(mapper, connection, target: RecipeIngredient) -> None:
+    """Keep base_quantity/base_unit in step with quantity/unit"""
+    target.base_quantity, target.base_unit = canonicalize(target.quantity, target.unit)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Boolean, Date, ForeignKey, Numeric, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from models.base import Base
+
+
+class WeeklyGroceryItem(Base):
+    """Materialized grocery line for one week (Monday-based).
+
+    Rows are maintained incrementally by database triggers on meal_plans and
+    recipe_ingredients (see migration f630f10f0423), never by application
+    code; services/weekly_grocery.py reads, checks and rebuilds them.
+    """
+
+    __tablename__ = "weekly_grocery_items"
+    __table_args__ = (
+        UniqueConstraint(
+            "week_start",
+            "ingredient_id",
+            "base_unit",
+            "is_optional",
+            name="uq_weekly_grocery_items_line",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    week_start: Mapped[date] = mapped_column(Date, nullable=False)
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    base_unit: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    is_optional: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    # Sum of the non-NULL base quantities; meaningful only if quantity_count > 0
+    quantity: Mapped[Decimal] = mapped_column(
+        Numeric(14, 4), nullable=False, server_default="0"
+    )
+    quantity_count: Mapped[int] = mapped_column(nullable=False, server_default="0")
+    line_count: Mapped[int] = mapped_column(nullable=False, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
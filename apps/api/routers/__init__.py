@@ -0,0 +1,3 @@
+from routers import grocery, ingredients, meal_plans, recipes, search
+
+__all__ = ["grocery", "ingredients", "meal_plans", "recipes", "search"]
@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from core.db import SessionDep
+from schemas.grocery import GroceryList
+from services.grocery import build_grocery_list
+from services.response_cache import (
+    CATALOG,
+    MEAL_PLANS,
+    RECIPE_INGREDIENTS,
+    WEEKLY_GROCERY,
+    response_cache,
+)
+from services.weekly_grocery import read_weekly_grocery_list, week_start
+
+router = APIRouter(prefix="/grocery-list", tags=["grocery"])
+
+GROCERY_SCOPES = [MEAL_PLANS, RECIPE_INGREDIENTS, CATALOG]
+
+
+@router.get("", response_model=GroceryList)
+async def get_grocery_list(
+    session: SessionDep,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """Aggregated grocery list for meals planned in a date range (default: next 7 days)"""
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=6)
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+    return await response_cache.response(
+        f"grocery-list:{start_date}:{end_date}",
+        GROCERY_SCOPES,
+        lambda: build_grocery_list(session, start_date, end_date),
+    )
+
+
+@router.get("/weeks/{day}", response_model=GroceryList)
+async def get_weekly_grocery_list(session: SessionDep, day: date):
+    """Materialized grocery list for the Monday-based week containing ``day``"""
+    return await response_cache.response(
+        f"grocery-week:{week_start(day)}",
+        [*GROCERY_SCOPES, WEEKLY_GROCERY],
+        lambda: read_weekly_grocery_list(session, day),
+    )
@@ -0,0 +1,33 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from core.config import settings
+from core.db import SessionDep
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from core.serialization import FastJSONResponse
+from schemas.ingredient import IngredientSummary
+from schemas.pagination import Page
+from services.ingredients import ingredient_list_page, list_ingredients
+
+router = APIRouter(prefix="/ingredients", tags=["ingredients"])
+
+
+@router.get("", response_model=Page[IngredientSummary])
+async def get_ingredients(
+    session: SessionDep,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    category_id: Optional[int] = None,
+):
+    """Ingredients in name order; follow next_cursor for further pages"""
+    try:
+        if settings.FAST_JSON_RESPONSES:
+            return FastJSONResponse(
+                await ingredient_list_page(session, cursor, limit, category_id)
+            )
+        return await list_ingredients(
+            session, cursor=cursor, limit=limit, category_id=category_id
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,156 @@
+from datetime import date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
+
+from core.conditional import check_conditional
+from core.config import settings
+from core.db import SessionDep, SessionFactoryDep
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from schemas.meal_plan import (
+    MealPlanBatch,
+    MealPlanCalendar,
+    MealPlanCopy,
+    MealPlanScheduleReport,
+    MealPlanSummary,
+)
+from schemas.pagination import Page
+from services.exports import MEDIA_TYPES, export_meal_plans
+from services.meal_plan_scheduling import (
+    UnknownRecipeError,
+    copy_weeks,
+    schedule_meals,
+)
+from services.meal_plans import (
+    build_calendar,
+    list_meal_plans,
+    meal_plan_list_page,
+    meal_plan_validators,
+    month_range,
+)
+from services.response_cache import MEAL_PLANS, RECIPE_NAMES, response_cache
+from services.weekly_grocery import week_end, week_start
+
+router = APIRouter(prefix="/meal-plans", tags=["meal-plans"])
+
+CALENDAR_SCOPES = [MEAL_PLANS, RECIPE_NAMES]
+
+
+async def meal_plan_preconditions(
+    request: Request,
+    session: SessionDep,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> None:
+    """Answer 304 when the client already holds the current listing page"""
+    check_conditional(
+        request,
+        await meal_plan_validators(session, start_date, end_date, cursor, limit),
+    )
+
+
+@router.get(
+    "",
+    response_model=Page[MealPlanSummary],
+    dependencies=[Depends(meal_plan_preconditions)],
+    responses={304: {"description": "Not modified"}},
+)
+async def get_meal_plans(
+    session: SessionDep,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """Meal plans in date order; follow next_cursor for further pages"""
+    if start_date and end_date and end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+
+    async def load():
+        page = meal_plan_list_page if settings.FAST_JSON_RESPONSES else list_meal_plans
+        try:
+            return await page(
+                session,
+                cursor=cursor,
+                limit=limit,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await response_cache.response(
+        f"meal-plans:{start_date}:{end_date}:{limit}:{cursor}", [MEAL_PLANS], load
+    )
+
+
+@router.post("/batch", response_model=MealPlanScheduleReport)
+async def schedule_meal_plans(session: SessionDep, batch: MealPlanBatch):
+    """Plan many slots in one statement and one transaction"""
+    try:
+        report = await schedule_meals(session, batch.entries, batch.overwrite)
+    except UnknownRecipeError as e:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    await session.commit()
+    return report
+
+
+@router.post("/copy", response_model=MealPlanScheduleReport)
+async def copy_meal_plan_weeks(session: SessionDep, copy: MealPlanCopy):
+    """Copy one week's plans onto ``weeks`` consecutive weeks"""
+    report = await copy_weeks(
+        session, copy.source_week, copy.target_week, copy.weeks, copy.overwrite
+    )
+    await session.commit()
+    return report
+
+
+@router.get("/export")
+async def export_meal_plan_file(
+    sessions: SessionFactoryDep,
+    format: Literal["jsonl", "csv"] = "jsonl",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """Stream meal plans in date order as NDJSON or CSV"""
+    if start_date and end_date and end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+    return StreamingResponse(
+        export_meal_plans(sessions, format, start_date, end_date),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="meal-plans.{format}"'},
+    )
+
+
+@router.get("/calendar/weeks/{day}", response_model=MealPlanCalendar)
+async def get_week_calendar(session: SessionDep, day: date):
+    """Lunch and dinner for each day of the Monday-based week containing ``day``"""
+    start_date = week_start(day)
+    return await response_cache.response(
+        f"calendar:{start_date}",
+        CALENDAR_SCOPES,
+        lambda: build_calendar(session, start_date, week_end(start_date)),
+    )
+
+
+@router.get("/calendar/months/{year}/{month}", response_model=MealPlanCalendar)
+async def get_month_calendar(
+    session: SessionDep,
+    year: int = Path(ge=1, le=9999),
+    month: int = Path(ge=1, le=12),
+):
+    """Lunch and dinner for each day of a month, with weekly rollups"""
+    start_date, end_date = month_range(year, month)
+    return await response_cache.response(
+        f"calendar:{start_date}:{end_date}",
+        CALENDAR_SCOPES,
+        lambda: build_calendar(session, start_date, end_date),
+    )
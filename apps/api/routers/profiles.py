@@ -0,0 +1,48 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from core.profiling import profiles, profiling_allowed
+
+
+async def require_profiling(x_profile: Optional[str] = Header(None)) -> None:
+    """Profiles expose code paths and SQL; unlock them like profiling itself"""
+    if not profiling_allowed(x_profile):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+router = APIRouter(
+    prefix="/profiles",
+    tags=["profiling"],
+    dependencies=[Depends(require_profiling)],
+)
+
+
+@router.get("")
+async def list_profiles():
+    """Summaries of the profiles kept in this worker, newest first"""
+    return [profile.summary() for profile in reversed(profiles.values())]
+
+
+@router.get("/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: Literal["speedscope", "collapsed", "statements"] = "speedscope",
+):
+    """A profile as speedscope JSON, collapsed stacks or its SQL statements"""
+    profile = profiles.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(profile.collapsed())
+    if format == "statements":
+        return {**profile.summary(), "sql": profile.statement_list()}
+    return JSONResponse(
+        profile.speedscope(),
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{profile.id}.speedscope.json"'
+            )
+        },
+    )
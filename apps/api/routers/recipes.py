@@ -0,0 +1,112 @@
+import io
+from tempfile import SpooledTemporaryFile
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from core.conditional import check_conditional
+from core.config import settings
+from core.db import SessionDep, SessionFactoryDep
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from core.serialization import FastJSONResponse
+from schemas.pagination import Page
+from schemas.recipe import RecipeDetail, RecipeImportReport, RecipeSummary
+from services.exports import MEDIA_TYPES, export_recipes
+from services.recipe_files import RecipeFileError, read_recipes
+from services.recipe_import import DEFAULT_BATCH_SIZE, import_recipes
+from services.recipes import (
+    get_recipe_detail,
+    list_recipes,
+    recipe_list_page,
+    recipe_detail_validators,
+)
+from services.response_cache import (
+    ALL_RECIPES,
+    CATALOG,
+    recipe_scope,
+    response_cache,
+)
+
+router = APIRouter(prefix="/recipes", tags=["recipes"])
+
+# Uploads larger than this are spooled to a temporary file while parsing
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+@router.get("", response_model=Page[RecipeSummary])
+async def get_recipes(
+    session: SessionDep,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Recipes in name order; follow next_cursor for further pages"""
+    try:
+        if settings.FAST_JSON_RESPONSES:
+            return FastJSONResponse(await recipe_list_page(session, cursor, limit))
+        return await list_recipes(session, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/import", response_model=RecipeImportReport)
+async def import_recipe_file(
+    request: Request,
+    session: SessionDep,
+    format: Literal["jsonl", "csv"] = "jsonl",
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=5000),
+):
+    """Bulk-import a JSON Lines or CSV recipe file sent as the request body"""
+    with SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        lines = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+        try:
+            report = await import_recipes(
+                session, read_recipes(lines, format), batch_size=batch_size
+            )
+        except (RecipeFileError, UnicodeDecodeError) as e:
+            await session.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+    await session.commit()
+    return report
+
+
+@router.get("/export")
+async def export_recipe_file(
+    sessions: SessionFactoryDep, format: Literal["jsonl", "csv"] = "jsonl"
+):
+    """Stream every recipe with its ingredients as NDJSON or CSV (importable)"""
+    return StreamingResponse(
+        export_recipes(sessions, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="recipes.{format}"'},
+    )
+
+
+async def recipe_preconditions(
+    recipe_id: int, request: Request, session: SessionDep
+) -> None:
+    """Answer 304 when the client already holds the current recipe detail"""
+    check_conditional(request, await recipe_detail_validators(session, recipe_id))
+
+
+@router.get(
+    "/{recipe_id}",
+    response_model=RecipeDetail,
+    dependencies=[Depends(recipe_preconditions)],
+    responses={304: {"description": "Not modified"}},
+)
+async def get_recipe(recipe_id: int, session: SessionDep):
+    """A recipe with its ingredients, their categories and brands"""
+
+    async def load() -> RecipeDetail:
+        recipe = await get_recipe_detail(session, recipe_id)
+        if recipe is None:
+            raise HTTPException(status_code=404, detail="Recipe not found")
+        return recipe
+
+    return await response_cache.response(
+        f"recipe:{recipe_id}", [recipe_scope(recipe_id), ALL_RECIPES, CATALOG], load
+    )
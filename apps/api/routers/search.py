@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Query
+
+from core.db import SessionDep
+from schemas.search import IngredientSearchResults, RecipeSearchResults
+from services.search import search_ingredients, search_recipes
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+QueryParam = Query(min_length=1, max_length=200, description="Search text")
+LimitParam = Query(20, ge=1, le=100)
+OffsetParam = Query(0, ge=0, le=10_000)
+
+
+@router.get("/recipes", response_model=RecipeSearchResults)
+async def get_recipe_search(
+    session: SessionDep,
+    q: str = QueryParam,
+    limit: int = LimitParam,
+    offset: int = OffsetParam,
+):
+    """Ranked recipe search over name, description and instructions"""
+    return await search_recipes(session, q, limit=limit, offset=offset)
+
+
+@router.get("/ingredients", response_model=IngredientSearchResults)
+async def get_ingredient_search(
+    session: SessionDep,
+    q: str = QueryParam,
+    limit: int = LimitParam,
+    offset: int = OffsetParam,
+):
+    """Typo-tolerant ingredient name search"""
+    return await search_ingredients(session, q, limit=limit, offset=offset)
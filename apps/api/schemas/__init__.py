@@ -0,0 +1,46 @@
+from schemas.grocery import GroceryAisle, GroceryItem, GroceryList
+from schemas.ingredient import (
+    BrandRef,
+    CategoryRef,
+    IngredientDetail,
+    IngredientSummary,
+)
+from schemas.meal_plan import MealPlanRecord, MealPlanSummary
+from schemas.pagination import Page
+from schemas.recipe import (
+    RecipeDetail,
+    RecipeImportReport,
+    RecipeIngredientLine,
+    RecipeIngredientRecord,
+    RecipeRecord,
+    RecipeSummary,
+)
+from schemas.search import (
+    IngredientSearchHit,
+    IngredientSearchResults,
+    RecipeSearchHit,
+    RecipeSearchResults,
+)
+
+__all__ = [
+    "BrandRef",
+    "CategoryRef",
+    "GroceryAisle",
+    "GroceryItem",
+    "GroceryList",
+    "IngredientDetail",
+    "IngredientSearchHit",
+    "IngredientSearchResults",
+    "IngredientSummary",
+    "MealPlanRecord",
+    "MealPlanSummary",
+    "Page",
+    "RecipeDetail",
+    "RecipeImportReport",
+    "RecipeIngredientLine",
+    "RecipeIngredientRecord",
+    "RecipeRecord",
+    "RecipeSearchHit",
+    "RecipeSearchResults",
+    "RecipeSummary",
+]
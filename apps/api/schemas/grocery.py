@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class GroceryItem(BaseModel):
+    """One aggregated grocery line - an ingredient in a single unit"""
+
+    ingredient_id: int
+    ingredient_name: str
+    # Base unit the quantity is expressed in (g, ml, each, clove, ...)
+    unit: Optional[str] = None
+    # NULL when every contributing recipe line omits a quantity ("to taste")
+    quantity: Optional[Decimal] = None
+    # Number of planned recipe lines folded into this item
+    line_count: int
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+
+
+class GroceryAisle(BaseModel):
+    """Grocery items sharing an ingredient category"""
+
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+    items: List[GroceryItem]
+
+
+class GroceryList(BaseModel):
+    """Aggregated grocery list for the meals planned in a date range"""
+
+    start_date: date
+    end_date: date
+    aisles: List[GroceryAisle]
+    optional_items: List[GroceryItem]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class IngredientSummary(BaseModel):
+    """Ingredient fields shown in listings"""
+
+    id: int
+    name: str
+    category_id: Optional[int] = None
+    brand_id: Optional[int] = None
+
+
+class CategoryRef(BaseModel):
+    """Category embedded in an ingredient"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class BrandRef(BaseModel):
+    """Brand embedded in an ingredient"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class IngredientDetail(BaseModel):
+    """Ingredient with its category and brand"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    category: Optional[CategoryRef] = None
+    brand: Optional[BrandRef] = None
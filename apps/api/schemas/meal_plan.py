@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from models.enums import MealType
+
+
+class MealPlanSummary(BaseModel):
+    """A planned meal as shown in listings"""
+
+    id: int
+    planned_date: date
+    meal_type: MealType
+    # NULL once the planned recipe has been deleted
+    recipe_id: Optional[int] = None
+    notes: Optional[str] = None
+
+
+class MealPlanRecord(BaseModel):
+    """A planned meal in an export file"""
+
+    planned_date: date
+    meal_type: MealType
+    # recipe_ref of the recipe in a recipe export of the same database
+    recipe_ref: Optional[str] = None
+    recipe_name: Optional[str] = None
+    notes: Optional[str] = None
+
+
+# Rows of one scheduling statement; 4 bind parameters each
+MAX_SCHEDULE_ENTRIES = 1000
+
+
+class MealPlanEntry(BaseModel):
+    """A meal to plan in one slot"""
+
+    planned_date: date
+    meal_type: MealType
+    recipe_id: Optional[int] = None
+    notes: Optional[str] = None
+
+
+class MealPlanBatch(BaseModel):
+    """Meals to plan at once, in distinct slots"""
+
+    entries: List[MealPlanEntry] = Field(min_length=1, max_length=MAX_SCHEDULE_ENTRIES)
+    # Replace the recipe and notes of slots already planned, or keep them
+    overwrite: bool = True
+
+    @model_validator(mode="after")
+    def _distinct_slots(self) -> MealPlanBatch:
+        slots = {(entry.planned_date, entry.meal_type) for entry in self.entries}
+        if len(slots) != len(self.entries):
+            raise ValueError("entries must not repeat a (planned_date, meal_type)")
+        return self
+
+
+class MealPlanCopy(BaseModel):
+    """Copy one week's plans onto one or more following weeks"""
+
+    # Any day of the source and first target week (weeks start on Monday)
+    source_week: date
+    target_week: date
+    # Consecutive target weeks to fill, starting with target_week
+    weeks: int = Field(1, ge=1, le=52)
+    overwrite: bool = True
+
+
+class MealPlanScheduleReport(BaseModel):
+    """Slots a scheduling request planned; slots left as they were are not counted"""
+
+    created: int = 0
+    updated: int = 0
+
+
+class CalendarMeal(BaseModel):
+    """A planned meal in a calendar slot"""
+
+    id: int
+    recipe_id: Optional[int] = None
+    recipe_name: Optional[str] = None
+
+
+class CalendarSlot(BaseModel):
+    """One meal type on one day; ``meal`` is null when nothing is planned"""
+
+    meal_type: MealType
+    meal: Optional[CalendarMeal] = None
+
+
+class CalendarDay(BaseModel):
+    """Every meal type of one day, in MealType order"""
+
+    day: date
+    slots: List[CalendarSlot]
+
+
+class CalendarRollup(BaseModel):
+    """How much of a date range is planned"""
+
+    start_date: date
+    end_date: date
+    # Days x meal types in the range
+    slots: int
+    # Slots with a meal planned
+    planned_slots: int
+
+
+class MealPlanCalendar(BaseModel):
+    """Dense day-by-meal-type grid of a week or month, with rollups"""
+
+    start_date: date
+    end_date: date
+    days: List[CalendarDay]
+    # One rollup per Monday-based week, clipped to the range
+    weeks: List[CalendarRollup]
+    totals: CalendarRollup
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing"""
+
+    items: List[T]
+    # Opaque token for the next page (pass back as ?cursor=); None on the last page
+    next_cursor: Optional[str] = None
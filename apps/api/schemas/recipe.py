@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from schemas.ingredient import IngredientDetail
+
+
+class RecipeSummary(BaseModel):
+    """Recipe fields shown in listings"""
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    servings: Optional[int] = None
+    prep_time_minutes: Optional[int] = None
+    cook_time_minutes: Optional[int] = None
+
+
+class RecipeIngredientLine(BaseModel):
+    """One ingredient line of a recipe, as written and in base units"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    quantity: Optional[Decimal] = None
+    unit: Optional[str] = None
+    base_quantity: Optional[Decimal] = None
+    base_unit: Optional[str] = None
+    preparation: Optional[str] = None
+    display_order: Optional[int] = None
+    is_optional: bool = False
+    ingredient: IngredientDetail
+
+
+class RecipeDetail(RecipeSummary):
+    """A recipe with its ingredient lines in display order"""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    instructions: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    ingredients: List[RecipeIngredientLine] = Field(
+        default_factory=list, validation_alias="recipe_ingredients"
+    )
+
+
+class RecipeIngredientRecord(BaseModel):
+    """An ingredient line in a recipe import/export file"""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    ingredient: str = Field(min_length=1, max_length=200)
+    category: Optional[str] = Field(None, min_length=1, max_length=100)
+    brand: Optional[str] = Field(None, min_length=1, max_length=100)
+    quantity: Optional[Decimal] = Field(None, max_digits=10, decimal_places=2)
+    unit: Optional[str] = Field(None, max_length=50)
+    preparation: Optional[str] = None
+    display_order: Optional[int] = None
+    is_optional: bool = False
+
+
+class RecipeRecord(BaseModel):
+    """A recipe and its ingredient lines in an import/export file"""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    # Identifies the recipe within a file (exports use the recipe id);
+    # meal plan exports refer to recipes by it. Not stored on import.
+    recipe_ref: Optional[str] = None
+    name: str = Field(min_length=1, max_length=200)
+    description: Optional[str] = None
+    instructions: Optional[str] = None
+    servings: Optional[int] = None
+    prep_time_minutes: Optional[int] = None
+    cook_time_minutes: Optional[int] = None
+    ingredients: List[RecipeIngredientRecord] = Field(default_factory=list)
+
+
+class RecipeImportReport(BaseModel):
+    """Counts and throughput of a bulk recipe import"""
+
+    recipes: int = 0
+    ingredient_lines: int = 0
+    categories_created: int = 0
+    brands_created: int = 0
+    ingredients_created: int = 0
+    seconds: float = 0.0
+    # Recipes plus ingredient lines written per second
+    rows_per_second: float = 0.0
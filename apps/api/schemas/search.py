@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class RecipeSearchHit(BaseModel):
+    """A recipe matching a search query"""
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    # Full-text score (plus a name-match boost), or name similarity for
+    # fuzzy results; higher is better
+    rank: float
+
+
+class IngredientSearchHit(BaseModel):
+    """An ingredient whose name matches a search query"""
+
+    id: int
+    name: str
+    category_id: Optional[int] = None
+    # Trigram similarity of the name to the query (0..1)
+    similarity: float
+
+
+class RecipeSearchResults(BaseModel):
+    """One page of ranked recipe search results"""
+
+    query: str
+    limit: int
+    offset: int
+    has_more: bool
+    # True when nothing matched exactly and these are typo-tolerant matches
+    fuzzy: bool = False
+    items: List[RecipeSearchHit]
+
+
+class IngredientSearchResults(BaseModel):
+    """One page of ranked ingredient search results"""
+
+    query: str
+    limit: int
+    offset: int
+    has_more: bool
+    # True when nothing matched exactly and these are typo-tolerant matches
+    fuzzy: bool = False
+    items: List[IngredientSearchHit]
@@ -0,0 +1,31 @@
+from services.exports import export_meal_plans, export_recipes
+from services.grocery import build_grocery_list, grocery_list_query
+from services.ingredients import list_ingredients
+from services.meal_plans import list_meal_plans
+from services.recipe_import import import_recipes
+from services.recipes import get_recipe_detail, list_recipes
+from services.search import search_ingredients, search_recipes
+from services.weekly_grocery import (
+    diff_week,
+    read_weekly_grocery_list,
+    rebuild_week,
+    week_start,
+)
+
+__all__ = [
+    "build_grocery_list",
+    "diff_week",
+    "export_meal_plans",
+    "export_recipes",
+    "get_recipe_detail",
+    "grocery_list_query",
+    "import_recipes",
+    "list_ingredients",
+    "list_meal_plans",
+    "list_recipes",
+    "read_weekly_grocery_list",
+    "rebuild_week",
+    "search_ingredients",
+    "search_recipes",
+    "week_start",
+]
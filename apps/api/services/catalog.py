@@ -0,0 +1,208 @@
+"""
+Reference catalog cache.
+
+Categories, brands and ingredients are small, read-mostly tables whose
+names appear in almost every response. CatalogCache keeps id -> row
+lookups for each of them in a bounded LRU with a TTL (core/cache.py). A
+lookup answers what it can from memory and fetches all of its misses in
+one ``IN`` query, so a warm cache serves names without a round trip.
+
+Writes made through an ORM session evict the rows they touched once the
+session's transaction ends: ``after_flush`` records the catalog rows each
+flush wrote, and ``after_commit`` evicts them. A rolled-back transaction
+evicts them too, since lookups inside it may have cached its uncommitted
+rows. UPDATE and DELETE statements against a catalog table evict the
+whole table. Writes made by other processes are picked up when entries
+expire, which is what the TTL bounds.
+
+``catalog`` is the process-wide instance; main.py warms it at startup.
+Recipe details (the default ``cached`` loader in services/recipes.py) and
+grocery lists (services/grocery.py) take their names from it.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Select, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+
+from core.cache import LRUCache
+from core.config import settings
+from models import Brand, Category, Ingredient
+from schemas.ingredient import BrandRef, CategoryRef, IngredientDetail
+from schemas.ingredient import IngredientSummary
+
+# table name -> (model, cached row schema)
+CATALOG_TABLES: Dict[str, Tuple[type, Type[BaseModel]]] = {
+    "categories": (Category, CategoryRef),
+    "brands": (Brand, BrandRef),
+    "ingredients": (Ingredient, IngredientSummary),
+}
+
+# session.info key of the catalog rows written in the current transaction,
+# as (table, id) pairs; an id of None stands for the whole table
+PENDING_KEY = "catalog_writes"
+
+
+def catalog_query(table: str) -> Select:
+    """The cached columns of a catalog table"""
+    model, schema = CATALOG_TABLES[table]
+    return select(*(getattr(model, field) for field in schema.model_fields))
+
+
+class CatalogCache:
+    """id -> row caches for the catalog tables"""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.caches: Dict[str, LRUCache[int, BaseModel]] = {
+            table: LRUCache(maxsize, ttl, clock) for table in CATALOG_TABLES
+        }
+
+    async def _lookup(
+        self, session: AsyncSession, table: str, ids: Iterable[Optional[int]]
+    ) -> Dict[int, BaseModel]:
+        cache = self.caches[table]
+        wanted = {row_id for row_id in ids if row_id is not None}
+        found = cache.get_many(wanted)
+        missing = wanted - found.keys()
+        if missing:
+            model, schema = CATALOG_TABLES[table]
+            result = await session.execute(
+                catalog_query(table).where(model.id.in_(missing))
+            )
+            for row in result:
+                entry = schema(**row._mapping)
+                cache.set(entry.id, entry)
+                found[entry.id] = entry
+        return found
+
+    async def categories(
+        self, session: AsyncSession, ids: Iterable[Optional[int]]
+    ) -> Dict[int, CategoryRef]:
+        return await self._lookup(session, "categories", ids)  # type: ignore[return-value]
+
+    async def brands(
+        self, session: AsyncSession, ids: Iterable[Optional[int]]
+    ) -> Dict[int, BrandRef]:
+        return await self._lookup(session, "brands", ids)  # type: ignore[return-value]
+
+    async def ingredients(
+        self, session: AsyncSession, ids: Iterable[Optional[int]]
+    ) -> Dict[int, IngredientSummary]:
+        return await self._lookup(session, "ingredients", ids)  # type: ignore[return-value]
+
+    async def ingredient_details(
+        self, session: AsyncSession, ids: Iterable[Optional[int]]
+    ) -> Dict[int, IngredientDetail]:
+        """Ingredients with their category and brand; up to 3 queries when cold"""
+        ingredients = await self.ingredients(session, ids)
+        categories = await self.categories(
+            session, (ingredient.category_id for ingredient in ingredients.values())
+        )
+        brands = await self.brands(
+            session, (ingredient.brand_id for ingredient in ingredients.values())
+        )
+        return {
+            ingredient_id: IngredientDetail(
+                id=ingredient_id,
+                name=ingredient.name,
+                category=categories.get(ingredient.category_id),
+                brand=brands.get(ingredient.brand_id),
+            )
+            for ingredient_id, ingredient in ingredients.items()
+        }
+
+    async def warm(self, session: AsyncSession) -> int:
+        """Load up to ``maxsize`` rows of every table; returns the rows cached"""
+        loaded = 0
+        for table, cache in self.caches.items():
+            model, schema = CATALOG_TABLES[table]
+            result = await session.execute(
+                catalog_query(table).order_by(model.id).limit(cache.maxsize)
+            )
+            for row in result:
+                entry = schema(**row._mapping)
+                cache.set(entry.id, entry)
+                loaded += 1
+        return loaded
+
+    def invalidate(self, table: str, row_id: Optional[int] = None) -> None:
+        """Evict one row, or the whole table when ``row_id`` is None"""
+        cache = self.caches[table]
+        if row_id is None:
+            cache.clear()
+        else:
+            cache.invalidate(row_id)
+
+    def clear(self) -> None:
+        for cache in self.caches.values():
+            cache.clear()
+
+    def stats(self) -> Dict[str, dict]:
+        """Size and hit/miss counters per table"""
+        return {
+            table: {
+                "size": len(cache),
+                "maxsize": cache.maxsize,
+                "ttl_seconds": cache.ttl,
+                **cache.stats.as_dict(),
+            }
+            for table, cache in self.caches.items()
+        }
+
+
+catalog = CatalogCache(
+    maxsize=settings.CATALOG_CACHE_SIZE, ttl=settings.CATALOG_CACHE_TTL_SECONDS
+)
+
+
+def _pending(session: Session) -> Set[Tuple[str, Optional[int]]]:
+    return session.info.setdefault(PENDING_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_writes(session: Session, flush_context) -> None:
+    # dirty/deleted still hold the pre-flush state here. New rows get ids
+    # the cache has never seen, so they need no eviction
+    for obj in (*session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in CATALOG_TABLES:
+            _pending(session).add((table, obj.id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_statement_writes(state: ORMExecuteState) -> None:
+    # INSERTs add rows under ids the cache has never seen; UPDATE and DELETE
+    # statements may touch any row
+    if state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None and table.name in CATALOG_TABLES:
+            _pending(state.session).add((table.name, None))
+
+
+def _evict_pending(session: Session) -> None:
+    for table, row_id in session.info.pop(PENDING_KEY, ()):
+        catalog.invalidate(table, row_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_writes(session: Session) -> None:
+    _evict_pending(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _evict_rolled_back_writes(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    # Anything still pending when the outermost transaction ends was rolled back
+    if transaction.parent is None:
+        _evict_pending(session)
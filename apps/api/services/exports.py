@@ -0,0 +1,220 @@
+"""
+Streaming exports of recipes and meal plans.
+
+Exports read through a server-side cursor (``session.stream`` with
+``yield_per``), so only one partition of rows is in memory at a time, and
+are produced as an async iterator of text chunks that can be handed
+straight to a StreamingResponse or written to a file.
+
+Recipes are fetched as one flat, ordered join - a row per ingredient line
+with its ingredient, category and brand names - and regrouped into
+RecipeRecords as consecutive rows of the same recipe, which costs one
+query however many recipes there are. The output uses the recipe file
+formats (services/recipe_files.py) with the recipe id as ``recipe_ref``,
+so an export imports back unchanged. Meal plans refer to recipes by the
+same ``recipe_ref``.
+
+Each export runs in its own session from a session factory: the response
+body is still being produced after request-scoped dependencies close.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import SessionFactory
+from models import Brand, Category, Ingredient, MealPlan, Recipe, RecipeIngredient
+from schemas.meal_plan import MealPlanRecord
+from schemas.recipe import RecipeIngredientRecord, RecipeRecord
+from services.recipe_files import (
+    CSV_COLUMNS,
+    csv_line,
+    jsonl_line,
+    recipe_csv_rows,
+)
+
+EXPORT_BATCH_SIZE = 1000
+# Text is sent in chunks of about this many characters
+CHUNK_SIZE = 64 * 1024
+
+MEAL_PLAN_COLUMNS = list(MealPlanRecord.model_fields)
+MEDIA_TYPES = {"jsonl": "application/x-ndjson", "csv": "text/csv"}
+
+
+def recipe_export_query() -> Select:
+    """Every recipe and ingredient line, flattened, in recipe then line order"""
+    return (
+        select(
+            Recipe.id,
+            Recipe.name,
+            Recipe.description,
+            Recipe.instructions,
+            Recipe.servings,
+            Recipe.prep_time_minutes,
+            Recipe.cook_time_minutes,
+            Ingredient.name.label("ingredient"),
+            Category.name.label("category"),
+            Brand.name.label("brand"),
+            RecipeIngredient.quantity,
+            RecipeIngredient.unit,
+            RecipeIngredient.preparation,
+            RecipeIngredient.display_order,
+            RecipeIngredient.is_optional,
+        )
+        .outerjoin(RecipeIngredient, RecipeIngredient.recipe_id == Recipe.id)
+        .outerjoin(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+        .outerjoin(Category, Category.id == Ingredient.category_id)
+        .outerjoin(Brand, Brand.id == Ingredient.brand_id)
+        # Same line order as Recipe.recipe_ingredients
+        .order_by(Recipe.id, RecipeIngredient.display_order, RecipeIngredient.id)
+    )
+
+
+def meal_plan_export_query(
+    start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Select:
+    """Meal plans in date order with their recipe names"""
+    query = (
+        select(
+            MealPlan.planned_date,
+            MealPlan.meal_type,
+            MealPlan.recipe_id,
+            Recipe.name.label("recipe_name"),
+            MealPlan.notes,
+        )
+        .outerjoin(Recipe, Recipe.id == MealPlan.recipe_id)
+        .order_by(MealPlan.planned_date, MealPlan.id)
+    )
+    if start_date is not None:
+        query = query.where(MealPlan.planned_date >= start_date)
+    if end_date is not None:
+        query = query.where(MealPlan.planned_date <= end_date)
+    return query
+
+
+async def iter_recipe_records(
+    session: AsyncSession, batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[RecipeRecord]:
+    """Every recipe with its ingredient lines, streamed in id order"""
+    result = await session.stream(
+        recipe_export_query().execution_options(yield_per=batch_size)
+    )
+    current: Optional[RecipeRecord] = None
+    current_id: Optional[int] = None
+    # One await per partition; iterating the AsyncResult row by row would
+    # switch greenlets for every row
+    async for partition in result.partitions():
+        for row in partition:
+            if row.id != current_id:
+                if current is not None:
+                    yield current
+                current_id = row.id
+                # Rows come from constrained columns: skip re-validation
+                current = RecipeRecord.model_construct(
+                    recipe_ref=str(row.id),
+                    name=row.name,
+                    description=row.description,
+                    instructions=row.instructions,
+                    servings=row.servings,
+                    prep_time_minutes=row.prep_time_minutes,
+                    cook_time_minutes=row.cook_time_minutes,
+                    ingredients=[],
+                )
+            if row.ingredient is not None:
+                current.ingredients.append(
+                    RecipeIngredientRecord.model_construct(
+                        ingredient=row.ingredient,
+                        category=row.category,
+                        brand=row.brand,
+                        quantity=row.quantity,
+                        unit=row.unit,
+                        preparation=row.preparation,
+                        display_order=row.display_order,
+                        is_optional=row.is_optional,
+                    )
+                )
+    if current is not None:
+        yield current
+
+
+async def iter_meal_plan_records(
+    session: AsyncSession,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[MealPlanRecord]:
+    """Meal plans in date order, streamed"""
+    result = await session.stream(
+        meal_plan_export_query(start_date, end_date).execution_options(
+            yield_per=batch_size
+        )
+    )
+    async for partition in result.partitions():
+        for row in partition:
+            yield MealPlanRecord.model_construct(
+                planned_date=row.planned_date,
+                meal_type=row.meal_type,
+                recipe_ref=None if row.recipe_id is None else str(row.recipe_id),
+                recipe_name=row.recipe_name,
+                notes=row.notes,
+            )
+
+
+async def _chunked(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    # Many small writes cost more than the data; the first chunk still goes
+    # out as soon as it is full, keeping time to first byte low
+    buffer, size = [], 0
+    async for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def _recipe_lines(session: AsyncSession, format: str) -> AsyncIterator[str]:
+    if format == "csv":
+        yield csv_line(CSV_COLUMNS)
+    async for record in iter_recipe_records(session):
+        yield recipe_csv_rows(record) if format == "csv" else jsonl_line(record)
+
+
+async def _meal_plan_lines(
+    session: AsyncSession,
+    format: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> AsyncIterator[str]:
+    if format == "csv":
+        yield csv_line(MEAL_PLAN_COLUMNS)
+    async for record in iter_meal_plan_records(session, start_date, end_date):
+        if format == "csv":
+            yield csv_line(getattr(record, column) for column in MEAL_PLAN_COLUMNS)
+        else:
+            yield jsonl_line(record)
+
+
+async def export_recipes(sessions: SessionFactory, format: str) -> AsyncIterator[str]:
+    """Text chunks of a full recipe export in ``format`` (jsonl or csv)"""
+    async with sessions() as session:
+        async for chunk in _chunked(_recipe_lines(session, format)):
+            yield chunk
+
+
+async def export_meal_plans(
+    sessions: SessionFactory,
+    format: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> AsyncIterator[str]:
+    """Text chunks of a meal plan export in ``format`` (jsonl or csv)"""
+    async with sessions() as session:
+        lines = _meal_plan_lines(session, format, start_date, end_date)
+        async for chunk in _chunked(lines):
+            yield chunk
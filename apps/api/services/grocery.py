@@ -0,0 +1,186 @@
+"""
+Grocery list aggregation.
+
+The totals for a date range are computed by one set-based query that
+joins meal_plans -> recipe_ingredients and groups by (ingredient, base
+unit, optional flag). Lines are summed in their write-time base units
+(see core/units.py), so "1 tbsp" and "15 ml" of the same ingredient land
+on one line. Quantities are summed by Postgres as NUMERIC, so Decimal
+precision survives to the response.
+
+Totals are read into GroceryTotalRow read models (see core/projections.py)
+and named from the catalog cache (services/catalog.py), so a warm cache
+leaves the list at one statement. Named GroceryRows are put in aisle
+order here: category name (uncategorized last), ingredient name, unit
+(none first), comparing names by code point.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from itertools import groupby
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.projections import fetch_into, read_model, select_into
+from models import MealPlan, RecipeIngredient
+from schemas.grocery import GroceryAisle, GroceryItem, GroceryList
+from services.catalog import catalog
+
+
+@read_model
+class GroceryTotalRow:
+    """One aggregated (ingredient, unit, optional) line"""
+
+    ingredient_id: int
+    unit: Optional[str]
+    is_optional: bool
+    quantity: Optional[Decimal]
+    line_count: int
+
+
+@read_model
+class GroceryRow:
+    """One aggregated (ingredient, unit, optional) line with its names"""
+
+    ingredient_id: int
+    ingredient_name: str
+    unit: Optional[str]
+    is_optional: bool
+    quantity: Optional[Decimal]
+    line_count: int
+    category_id: Optional[int]
+    category_name: Optional[str]
+
+
+def grocery_totals_query(start_date: date, end_date: date) -> Select:
+    """Per (ingredient, base unit, optional) totals for meals in [start, end]"""
+    return (
+        select(
+            RecipeIngredient.ingredient_id,
+            RecipeIngredient.base_unit.label("unit"),
+            RecipeIngredient.is_optional,
+            func.sum(RecipeIngredient.base_quantity).label("quantity"),
+            func.count(RecipeIngredient.base_quantity).label("quantity_count"),
+            func.count().label("line_count"),
+        )
+        .select_from(MealPlan)
+        .join(RecipeIngredient, RecipeIngredient.recipe_id == MealPlan.recipe_id)
+        .where(MealPlan.planned_date.between(start_date, end_date))
+        .group_by(
+            RecipeIngredient.ingredient_id,
+            RecipeIngredient.base_unit,
+            RecipeIngredient.is_optional,
+        )
+    )
+
+
+def grocery_list_query(start_date: date, end_date: date) -> Select:
+    """Build the single-round-trip aggregation over the given date range"""
+    # Names come from the catalog cache afterwards, so no text is carried
+    # through the aggregation
+    totals = grocery_totals_query(start_date, end_date).subquery("totals")
+    return select_into(
+        GroceryTotalRow,
+        totals.c.ingredient_id,
+        totals.c.unit,
+        totals.c.is_optional,
+        totals.c.quantity,
+        totals.c.line_count,
+    )
+
+
+def _aisle_order(row: GroceryRow) -> tuple:
+    return (
+        row.category_name is None,
+        row.category_name or "",
+        row.ingredient_name,
+        row.unit is not None,
+        row.unit or "",
+    )
+
+
+async def name_grocery_rows(
+    session: AsyncSession, totals: List[GroceryTotalRow]
+) -> List[GroceryRow]:
+    """Totals with their ingredient and category names, in aisle order"""
+    ingredients = await catalog.ingredients(
+        session, (total.ingredient_id for total in totals)
+    )
+    categories = await catalog.categories(
+        session, (ingredient.category_id for ingredient in ingredients.values())
+    )
+    rows = []
+    for total in totals:
+        ingredient = ingredients[total.ingredient_id]
+        category = categories.get(ingredient.category_id)
+        rows.append(
+            GroceryRow(
+                ingredient_id=total.ingredient_id,
+                ingredient_name=ingredient.name,
+                unit=total.unit,
+                is_optional=total.is_optional,
+                quantity=total.quantity,
+                line_count=total.line_count,
+                category_id=category.id if category else None,
+                category_name=category.name if category else None,
+            )
+        )
+    rows.sort(key=_aisle_order)
+    return rows
+
+
+def grocery_item(row: GroceryRow) -> GroceryItem:
+    """Map an aggregated (ingredient, unit) row onto the response schema"""
+    return GroceryItem(
+        ingredient_id=row.ingredient_id,
+        ingredient_name=row.ingredient_name,
+        unit=row.unit,
+        quantity=row.quantity,
+        line_count=row.line_count,
+        category_id=row.category_id,
+        category_name=row.category_name,
+    )
+
+
+def split_grocery_rows(
+    rows: Iterable[GroceryRow], start_date: date, end_date: date
+) -> GroceryList:
+    """Separate optional items and group the rest into aisles"""
+    required: List[GroceryItem] = []
+    optional: List[GroceryItem] = []
+    for row in rows:
+        (optional if row.is_optional else required).append(grocery_item(row))
+
+    return GroceryList(
+        start_date=start_date,
+        end_date=end_date,
+        aisles=group_into_aisles(required),
+        optional_items=optional,
+    )
+
+
+def group_into_aisles(items: Iterable[GroceryItem]) -> List[GroceryAisle]:
+    """Group items (already ordered by category) into per-category aisles"""
+    return [
+        GroceryAisle(
+            category_id=category_id, category_name=category_name, items=list(group)
+        )
+        for (category_id, category_name), group in groupby(
+            items, key=lambda item: (item.category_id, item.category_name)
+        )
+    ]
+
+
+async def build_grocery_list(
+    session: AsyncSession, start_date: date, end_date: date
+) -> GroceryList:
+    """Aggregate every ingredient needed by meals planned in [start, end]"""
+    totals = await fetch_into(
+        session, GroceryTotalRow, grocery_list_query(start_date, end_date)
+    )
+    rows = await name_grocery_rows(session, totals)
+    return split_grocery_rows(rows, start_date, end_date)
@@ -0,0 +1,81 @@
+"""
+Ingredient listing.
+
+Ingredients are listed in (name, id) order with keyset pagination, served
+by ix_ingredients_name_id. ingredient_list_page returns IngredientListRow
+read models (core/projections.py), which fast JSON responses encode as
+they are (core/serialization.py).
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.pagination import DEFAULT_PAGE_SIZE, Keyset, KeysetPage, fetch_keyset_page
+from core.projections import read_model, select_into
+from models import Ingredient
+from schemas.ingredient import IngredientSummary
+from schemas.pagination import Page
+
+INGREDIENT_KEYSET = Keyset(Ingredient.name, Ingredient.id)
+
+
+@read_model
+class IngredientListRow:
+    """An ingredient as listed; the fields of IngredientSummary"""
+
+    id: int
+    name: str
+    category_id: Optional[int]
+    brand_id: Optional[int]
+
+
+def ingredient_list_query(category_id: Optional[int] = None) -> Select:
+    """Columns of an ingredient listing, optionally for one category"""
+    query = select_into(
+        IngredientListRow,
+        Ingredient.id,
+        Ingredient.name,
+        Ingredient.category_id,
+        Ingredient.brand_id,
+    )
+    if category_id is not None:
+        query = query.where(Ingredient.category_id == category_id)
+    return query
+
+
+async def ingredient_list_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    category_id: Optional[int] = None,
+) -> KeysetPage[IngredientListRow]:
+    """One page of ingredients in name order, after ``cursor`` if given"""
+    return await fetch_keyset_page(
+        session,
+        ingredient_list_query(category_id),
+        INGREDIENT_KEYSET,
+        cursor,
+        limit,
+        model=IngredientListRow,
+    )
+
+
+async def list_ingredients(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    category_id: Optional[int] = None,
+) -> Page[IngredientSummary]:
+    """ingredient_list_page validated as IngredientSummary models"""
+    page = await ingredient_list_page(session, cursor, limit, category_id)
+    return Page[IngredientSummary](
+        items=[
+            IngredientSummary.model_validate(row, from_attributes=True)
+            for row in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
@@ -0,0 +1,164 @@
+"""
+Meal plan import: the reverse of the meal plan export (services/exports.py).
+
+Files use the export's formats, one MealPlanRecord per JSON line or per
+CSV row with a header of MEAL_PLAN_COLUMNS. A slot listed twice is an
+error, since one statement cannot plan a slot twice.
+
+A record names its recipe by ``recipe_ref``, the recipe's id in the
+exporting database, and by ``recipe_name``. The ref is used when this
+database has a recipe with that id and name, as when plans are restored
+where they were exported. Otherwise the recipe is found by name, as when
+recipes were moved with the recipe export and import and took new ids;
+of several recipes with one name, the oldest is used. A record that names
+a recipe found neither way raises UnknownRecipeError.
+
+Records are planned in batches with schedule_meals, so a batch costs one
+SELECT of its recipes and one upsert. Nothing is committed here: the
+caller owns the transaction, and an import lands completely or not at
+all.
+"""
+
+from __future__ import annotations
+
+import csv
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import MealType, Recipe
+from schemas.meal_plan import (
+    MAX_SCHEDULE_ENTRIES,
+    MealPlanEntry,
+    MealPlanRecord,
+    MealPlanScheduleReport,
+)
+from services.exports import MEAL_PLAN_COLUMNS
+from services.meal_plan_scheduling import UnknownRecipeError, schedule_meals
+from services.recipe_files import validation_message
+
+
+class MealPlanFileError(ValueError):
+    """Raised when a meal plan file cannot be parsed"""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+def _numbered_jsonl(lines: Iterable[str]) -> Iterator[Tuple[int, MealPlanRecord]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, MealPlanRecord.model_validate_json(line)
+        except ValidationError as e:
+            raise MealPlanFileError(number, validation_message(e)) from e
+
+
+def _numbered_csv(lines: Iterable[str]) -> Iterator[Tuple[int, MealPlanRecord]]:
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    missing = [c for c in ("planned_date", "meal_type") if c not in reader.fieldnames]
+    if missing:
+        raise MealPlanFileError(1, f"missing required columns {missing}")
+    for row in reader:
+        cells = {column: row[column] for column in MEAL_PLAN_COLUMNS if row.get(column)}
+        try:
+            yield reader.line_num, MealPlanRecord.model_validate(cells)
+        except ValidationError as e:
+            raise MealPlanFileError(reader.line_num, validation_message(e)) from e
+
+
+def read_meal_plans(lines: Iterable[str], format: str) -> Iterator[MealPlanRecord]:
+    """Parse meal plans in ``format`` (jsonl or csv)"""
+    if format == "csv":
+        numbered = _numbered_csv(lines)
+    elif format == "jsonl":
+        numbered = _numbered_jsonl(lines)
+    else:
+        raise ValueError(f"Unknown meal plan file format: {format!r}")
+    seen: Set[Tuple[date, MealType]] = set()
+    for number, record in numbered:
+        slot = (record.planned_date, record.meal_type)
+        if slot in seen:
+            raise MealPlanFileError(
+                number,
+                f"{record.planned_date} {record.meal_type.value} is listed twice",
+            )
+        seen.add(slot)
+        yield record
+
+
+def _ref_id(record: MealPlanRecord) -> Optional[int]:
+    ref = record.recipe_ref
+    return int(ref) if ref is not None and ref.isdigit() else None
+
+
+async def _resolve_recipes(
+    session: AsyncSession, records: List[MealPlanRecord]
+) -> Tuple[Dict[int, str], Dict[str, int]]:
+    # (name by id for the refs, oldest id by name for the names) in one query
+    ids = {ref for ref in map(_ref_id, records) if ref is not None}
+    names = {record.recipe_name for record in records if record.recipe_name}
+    if not ids and not names:
+        return {}, {}
+    rows = await session.execute(
+        select(Recipe.id, Recipe.name).where(
+            or_(Recipe.id.in_(ids), Recipe.name.in_(names))
+        )
+    )
+    by_id: Dict[int, str] = {}
+    by_name: Dict[str, int] = {}
+    for recipe_id, name in rows:
+        by_id[recipe_id] = name
+        if name not in by_name or recipe_id < by_name[name]:
+            by_name[name] = recipe_id
+    return by_id, by_name
+
+
+def _recipe_id(
+    record: MealPlanRecord, by_id: Dict[int, str], by_name: Dict[str, int]
+) -> Optional[int]:
+    if record.recipe_ref is None and record.recipe_name is None:
+        return None
+    ref = _ref_id(record)
+    if ref in by_id and record.recipe_name in (None, by_id[ref]):
+        return ref
+    if record.recipe_name in by_name:
+        return by_name[record.recipe_name]
+    raise UnknownRecipeError(
+        f"{record.planned_date} {record.meal_type.value}: no recipe"
+        f" {record.recipe_name!r} (recipe_ref {record.recipe_ref})"
+    )
+
+
+async def import_meal_plans(
+    session: AsyncSession,
+    records: Iterable[MealPlanRecord],
+    overwrite: bool = True,
+    batch_size: int = MAX_SCHEDULE_ENTRIES,
+) -> MealPlanScheduleReport:
+    """Plan every record's slot without committing; see schedule_meals"""
+    report = MealPlanScheduleReport()
+    iterator = iter(records)
+    while batch := list(islice(iterator, batch_size)):
+        by_id, by_name = await _resolve_recipes(session, batch)
+        entries = [
+            MealPlanEntry(
+                planned_date=record.planned_date,
+                meal_type=record.meal_type,
+                recipe_id=_recipe_id(record, by_id, by_name),
+                notes=record.notes,
+            )
+            for record in batch
+        ]
+        planned = await schedule_meals(session, entries, overwrite=overwrite)
+        report.created += planned.created
+        report.updated += planned.updated
+    return report
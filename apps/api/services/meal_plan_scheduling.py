@@ -0,0 +1,129 @@
+"""
+Batch meal plan scheduling.
+
+Each operation is a single statement against the unique (planned_date,
+meal_type) slot constraint, so scheduling a week costs one round trip and
+conflicts with plans already in place are resolved by the database:
+
+- schedule_meals: one multi-row ``INSERT ... VALUES`` of the given entries
+- copy_weeks: one ``INSERT ... SELECT`` of a source week's plans, shifted
+  onto ``weeks`` consecutive target weeks
+
+With ``overwrite`` a planned slot takes the new recipe and notes
+(``ON CONFLICT DO UPDATE``, skipped when both are unchanged, so identical
+plans keep their updated_at); otherwise it is left alone (``ON CONFLICT
+DO NOTHING``). ``RETURNING xmax = 0`` tells inserted rows from updated
+ones; slots left as they were are not returned. Rows are written in slot
+order so concurrent batches lock slots in the same order and cannot
+deadlock: by date, then meal type in declaration order, which is how
+Postgres sorts meal_type_enum (comparing the str values would put
+"dinner" first). Nothing is committed here: the caller owns the
+transaction.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import List
+
+from sqlalchemy import func, literal_column, or_, select, true
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import MealPlan, MealType
+from schemas.meal_plan import MealPlanEntry, MealPlanScheduleReport
+from services.weekly_grocery import week_start
+
+SLOT_CONSTRAINT = "uq_meal_plans_planned_date_meal_type"
+
+# SQLSTATE foreign_key_violation
+FOREIGN_KEY_VIOLATION = "23503"
+
+# meal_type_enum's sort order: the order MealType declares its members
+MEAL_TYPE_ORDER = {meal_type: index for index, meal_type in enumerate(MealType)}
+
+
+class UnknownRecipeError(ValueError):
+    """An entry names a recipe that does not exist"""
+
+
+def _upsert(statement: Insert, overwrite: bool) -> Insert:
+    if overwrite:
+        table = MealPlan.__table__
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            constraint=SLOT_CONSTRAINT,
+            set_={
+                "recipe_id": excluded.recipe_id,
+                "notes": excluded.notes,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                table.c.recipe_id.is_distinct_from(excluded.recipe_id),
+                table.c.notes.is_distinct_from(excluded.notes),
+            ),
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(constraint=SLOT_CONSTRAINT)
+    return statement.returning(literal_column("xmax = 0").label("inserted"))
+
+
+async def _execute(session: AsyncSession, statement: Insert) -> MealPlanScheduleReport:
+    try:
+        inserted = (await session.scalars(statement)).all()
+    except IntegrityError as e:
+        if getattr(e.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+            raise UnknownRecipeError("recipe_id does not exist") from e
+        raise
+    created = sum(inserted)
+    return MealPlanScheduleReport(created=created, updated=len(inserted) - created)
+
+
+async def schedule_meals(
+    session: AsyncSession, entries: List[MealPlanEntry], overwrite: bool = True
+) -> MealPlanScheduleReport:
+    """Plan every entry's slot in one statement; entries must name distinct slots"""
+    if not entries:
+        return MealPlanScheduleReport()
+    rows = [
+        entry.model_dump()
+        for entry in sorted(
+            entries, key=lambda e: (e.planned_date, MEAL_TYPE_ORDER[e.meal_type])
+        )
+    ]
+    statement = _upsert(pg_insert(MealPlan.__table__).values(rows), overwrite)
+    return await _execute(session, statement)
+
+
+async def copy_weeks(
+    session: AsyncSession,
+    source: date,
+    target: date,
+    weeks: int = 1,
+    overwrite: bool = True,
+) -> MealPlanScheduleReport:
+    """Copy the week containing ``source`` onto ``weeks`` weeks from ``target``'s"""
+    source_start = week_start(source)
+    first_shift = (week_start(target) - source_start).days
+    shifts = (
+        func.generate_series(first_shift, first_shift + 7 * (weeks - 1), 7)
+        .table_valued("days")
+        .render_derived()
+    )
+    table = MealPlan.__table__
+    planned_date = (table.c.planned_date + shifts.c.days).label("planned_date")
+    copies = (
+        select(planned_date, table.c.meal_type, table.c.recipe_id, table.c.notes)
+        .select_from(table.join(shifts, true()))
+        .where(table.c.planned_date.between(source_start, source_start + timedelta(6)))
+        .order_by(planned_date, table.c.meal_type)
+    )
+    statement = _upsert(
+        pg_insert(table).from_select(
+            ["planned_date", "meal_type", "recipe_id", "notes"], copies
+        ),
+        overwrite,
+    )
+    return await _execute(session, statement)
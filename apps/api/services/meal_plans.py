@@ -0,0 +1,236 @@
+"""
+Meal plan listing.
+
+Meal plans are listed in (planned_date, id) order with keyset pagination,
+served by ix_meal_plans_planned_date_id. An optional date range narrows
+the same index range scan, which also serves meal_plan_validators'
+aggregate for conditional requests. meal_plan_list_page returns
+MealPlanListRow read models, which fast JSON responses encode as they
+are (core/serialization.py).
+
+The calendar reads a week or month in one query on the index of
+uq_meal_plans_planned_date_meal_type, which covers every meal plan column
+it selects, joined to recipe names by primary key. Rows come back as
+CalendarRow read models (core/projections.py) and are laid out into a
+dense grid of every day and meal type, so the cost follows the size of
+the range, not of the history.
+"""
+
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.conditional import Validators
+from core.pagination import DEFAULT_PAGE_SIZE, Keyset, KeysetPage, fetch_keyset_page
+from core.projections import fetch_into, read_model, select_into
+from models import MealPlan, MealType, Recipe
+from schemas.meal_plan import (
+    CalendarDay,
+    CalendarMeal,
+    CalendarRollup,
+    CalendarSlot,
+    MealPlanCalendar,
+    MealPlanSummary,
+)
+from schemas.pagination import Page
+from services.weekly_grocery import week_end
+
+MEAL_PLAN_KEYSET = Keyset(MealPlan.planned_date, MealPlan.id)
+
+
+@read_model
+class MealPlanListRow:
+    """A meal plan as listed; the fields of MealPlanSummary"""
+
+    id: int
+    planned_date: date
+    meal_type: MealType
+    recipe_id: Optional[int]
+    notes: Optional[str]
+
+
+def meal_plan_list_query(
+    start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Select:
+    """Columns of a meal plan listing, optionally within [start, end]"""
+    query = select_into(
+        MealPlanListRow,
+        MealPlan.id,
+        MealPlan.planned_date,
+        MealPlan.meal_type,
+        MealPlan.recipe_id,
+        MealPlan.notes,
+    )
+    return _in_range(query, start_date, end_date)
+
+
+def _in_range(
+    query: Select, start_date: Optional[date], end_date: Optional[date]
+) -> Select:
+    if start_date is not None:
+        query = query.where(MealPlan.planned_date >= start_date)
+    if end_date is not None:
+        query = query.where(MealPlan.planned_date <= end_date)
+    return query
+
+
+async def meal_plan_list_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> KeysetPage[MealPlanListRow]:
+    """One page of meal plans in date order, after ``cursor`` if given"""
+    return await fetch_keyset_page(
+        session,
+        meal_plan_list_query(start_date, end_date),
+        MEAL_PLAN_KEYSET,
+        cursor,
+        limit,
+        model=MealPlanListRow,
+    )
+
+
+async def list_meal_plans(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Page[MealPlanSummary]:
+    """meal_plan_list_page validated as MealPlanSummary models"""
+    page = await meal_plan_list_page(session, cursor, limit, start_date, end_date)
+    return Page[MealPlanSummary](
+        items=[
+            MealPlanSummary.model_validate(row, from_attributes=True)
+            for row in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
+
+
+def meal_plan_version_query(
+    start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Select:
+    """Latest updated_at and row counts of the meal plans within [start, end]"""
+    query = select(
+        func.max(MealPlan.updated_at).label("last_modified"),
+        # Deletes change no remaining updated_at, and deleting a recipe
+        # nulls out recipe_id in the database without touching updated_at
+        func.count().label("plans"),
+        func.count(MealPlan.recipe_id).label("with_recipe"),
+    )
+    return _in_range(query, start_date, end_date)
+
+
+async def meal_plan_validators(
+    session: AsyncSession,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Validators:
+    """ETag/Last-Modified of one page of a meal plan listing"""
+    row = (await session.execute(meal_plan_version_query(start_date, end_date))).one()
+    # Every page of the range shares its version, but each page is its own
+    # representation, so it needs its own strong validator
+    return Validators.of(
+        "meal-plans",
+        start_date,
+        end_date,
+        cursor,
+        limit,
+        row.plans,
+        row.with_recipe,
+        last_modified=row.last_modified,
+    )
+
+
+def month_range(year: int, month: int) -> Tuple[date, date]:
+    """First and last day of a month"""
+    return date(year, month, 1), date(year, month, monthrange(year, month)[1])
+
+
+@read_model
+class CalendarRow:
+    """A planned meal with its slot and recipe name"""
+
+    planned_date: date
+    meal_type: MealType
+    id: int
+    recipe_id: Optional[int]
+    recipe_name: Optional[str]
+
+
+def calendar_query(start_date: date, end_date: date) -> Select:
+    """Meals planned within [start, end] with their recipe names, in grid order"""
+    return (
+        select_into(
+            CalendarRow,
+            MealPlan.planned_date,
+            MealPlan.meal_type,
+            MealPlan.id,
+            MealPlan.recipe_id,
+            Recipe.name,
+        )
+        .outerjoin(Recipe, Recipe.id == MealPlan.recipe_id)
+        .where(MealPlan.planned_date.between(start_date, end_date))
+        .order_by(MealPlan.planned_date, MealPlan.meal_type)
+    )
+
+
+def _rollup(
+    start_date: date, end_date: date, days: List[CalendarDay]
+) -> CalendarRollup:
+    slots = [slot for day in days for slot in day.slots]
+    return CalendarRollup(
+        start_date=start_date,
+        end_date=end_date,
+        slots=len(slots),
+        planned_slots=sum(1 for slot in slots if slot.meal is not None),
+    )
+
+
+async def build_calendar(
+    session: AsyncSession, start_date: date, end_date: date
+) -> MealPlanCalendar:
+    """Every day and meal type within [start, end], planned or not"""
+    planned: Dict[Tuple[date, MealType], CalendarMeal] = {}
+    rows = await fetch_into(session, CalendarRow, calendar_query(start_date, end_date))
+    for row in rows:
+        planned[row.planned_date, row.meal_type] = CalendarMeal(
+            id=row.id, recipe_id=row.recipe_id, recipe_name=row.recipe_name
+        )
+
+    days = []
+    day = start_date
+    while day <= end_date:
+        slots = [
+            CalendarSlot(meal_type=meal_type, meal=planned.get((day, meal_type)))
+            for meal_type in MealType
+        ]
+        days.append(CalendarDay(day=day, slots=slots))
+        day += timedelta(days=1)
+
+    weeks = []
+    first = start_date
+    while first <= end_date:
+        last = min(week_end(first), end_date)
+        offset = (first - start_date).days
+        week_days = days[offset : offset + (last - first).days + 1]
+        weeks.append(_rollup(first, last, week_days))
+        first = last + timedelta(days=1)
+
+    return MealPlanCalendar(
+        start_date=start_date,
+        end_date=end_date,
+        days=days,
+        weeks=weeks,
+        totals=_rollup(start_date, end_date, days),
+    )
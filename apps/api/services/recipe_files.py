@@ -0,0 +1,168 @@
+"""
+Recipe interchange files.
+
+Two formats describe the same RecipeRecord (schemas/recipe.py):
+
+- ``jsonl``: one JSON recipe object per line, its ingredient lines in an
+  ``ingredients`` array. Blank lines are skipped.
+- ``csv``: one row per ingredient line with a header row of CSV_COLUMNS
+  (any order, missing optional columns allowed). Consecutive rows with the
+  same ``recipe_ref`` - or the same ``name`` when the file has no
+  ``recipe_ref`` column - form one recipe, whose fields come from its first
+  row. A recipe without ingredients is a single row with a blank
+  ``ingredient``. Blank cells are NULL.
+
+Readers are generators over an iterable of lines, so a file of any size is
+parsed one recipe at a time. Malformed input raises RecipeFileError naming
+the offending line. Writers turn one record into its lines of text, so
+exports stream as well; whatever they write, the readers read back.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from schemas.recipe import RecipeRecord
+
+FORMATS = ("jsonl", "csv")
+
+RECIPE_COLUMNS = [
+    "name",
+    "description",
+    "instructions",
+    "servings",
+    "prep_time_minutes",
+    "cook_time_minutes",
+]
+INGREDIENT_COLUMNS = [
+    "ingredient",
+    "category",
+    "brand",
+    "quantity",
+    "unit",
+    "preparation",
+    "display_order",
+    "is_optional",
+]
+CSV_COLUMNS = ["recipe_ref", *RECIPE_COLUMNS, *INGREDIENT_COLUMNS]
+
+
+class RecipeFileError(ValueError):
+    """Raised when a recipe file cannot be parsed"""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+def format_for_path(path: str) -> str:
+    """File format implied by a file name (csv or, by default, jsonl)"""
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'record'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def read_jsonl(lines: Iterable[str]) -> Iterator[RecipeRecord]:
+    """Parse JSON Lines recipes"""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield RecipeRecord.model_validate_json(line)
+        except ValidationError as e:
+            raise RecipeFileError(number, validation_message(e)) from e
+
+
+def _cells(row: Dict[str, Optional[str]], columns: List[str]) -> Dict[str, str]:
+    return {column: row[column] for column in columns if row.get(column)}
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[RecipeRecord]:
+    """Parse CSV recipes, one row per ingredient line"""
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    if "name" not in reader.fieldnames:
+        raise RecipeFileError(1, "missing required column 'name'")
+    group_by = "recipe_ref" if "recipe_ref" in reader.fieldnames else "name"
+
+    current: Optional[dict] = None
+    current_key: Optional[str] = None
+    first_line = 0
+    for row in reader:
+        # line_num counts physical lines, so quoted newlines are accounted for
+        line = reader.line_num
+        key = row.get(group_by)
+        if current is None or key != current_key:
+            if current is not None:
+                yield _csv_record(current, first_line)
+            current = {
+                **_cells(row, ["recipe_ref", *RECIPE_COLUMNS]),
+                "ingredients": [],
+            }
+            current_key, first_line = key, line
+        if row.get("ingredient"):
+            current["ingredients"].append(_cells(row, INGREDIENT_COLUMNS))
+    if current is not None:
+        yield _csv_record(current, first_line)
+
+
+def _csv_record(data: dict, line: int) -> RecipeRecord:
+    try:
+        return RecipeRecord.model_validate(data)
+    except ValidationError as e:
+        raise RecipeFileError(line, validation_message(e)) from e
+
+
+def read_recipes(lines: Iterable[str], format: str) -> Iterator[RecipeRecord]:
+    """Parse recipes in ``format`` (one of FORMATS)"""
+    if format == "csv":
+        return read_csv(lines)
+    if format == "jsonl":
+        return read_jsonl(lines)
+    raise ValueError(f"Unknown recipe file format: {format!r}")
+
+
+def jsonl_line(record: BaseModel) -> str:
+    """A record as one JSON Lines line (NULL fields omitted)"""
+    return record.model_dump_json(exclude_none=True) + "\n"
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def csv_line(values: Iterable[Any]) -> str:
+    """One CSV row (blank cells for NULL)"""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(
+        [_csv_value(value) for value in values]
+    )
+    return buffer.getvalue()
+
+
+def recipe_csv_rows(record: RecipeRecord) -> str:
+    """CSV rows of a recipe: one per ingredient line, or one bare row"""
+    recipe = [getattr(record, column) for column in ["recipe_ref", *RECIPE_COLUMNS]]
+    if not record.ingredients:
+        return csv_line(recipe + [None] * len(INGREDIENT_COLUMNS))
+    return "".join(
+        csv_line(recipe + [getattr(line, column) for column in INGREDIENT_COLUMNS])
+        for line in record.ingredients
+    )
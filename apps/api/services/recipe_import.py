@@ -0,0 +1,190 @@
+"""
+Bulk recipe import.
+
+Recipes are read from an iterator of RecipeRecord (see recipe_files.py)
+and written in batches of ``batch_size`` recipes, so memory stays bounded
+by one batch whatever the size of the file. Each batch costs a handful of
+statements instead of one round trip per row:
+
+1. Categories and brands named in the batch: ``INSERT ... ON CONFLICT
+   (name) DO NOTHING RETURNING``, then one SELECT for the names that
+   already existed.
+2. Ingredients the same way; a new ingredient takes the category and brand
+   of its first line in the batch, existing ingredients are left as they
+   are.
+3. Recipes: one multi-row INSERT ... RETURNING id, in input order.
+4. Ingredient lines: ``COPY recipe_ingredients`` through asyncpg's binary
+   copy protocol. COPY skips the ORM, so base_quantity/base_unit are
+   computed here with the same unit registry the before_insert listener
+   uses.
+
+Names are upserted in sorted order so concurrent imports lock rows in the
+same order and cannot deadlock. Nothing is committed here: the caller owns
+the transaction, and an import either lands completely or not at all.
+"""
+
+from __future__ import annotations
+
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Table, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.units import canonicalize_many
+from models import Brand, Category, Ingredient, Recipe, RecipeIngredient
+from schemas.recipe import RecipeImportReport, RecipeRecord
+from services.recipe_files import RECIPE_COLUMNS
+
+DEFAULT_BATCH_SIZE = 500
+
+COPY_COLUMNS = [
+    "recipe_id",
+    "ingredient_id",
+    "quantity",
+    "unit",
+    "base_quantity",
+    "base_unit",
+    "preparation",
+    "display_order",
+    "is_optional",
+]
+
+
+def _batches(
+    records: Iterable[RecipeRecord], size: int
+) -> Iterator[List[RecipeRecord]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def _resolve_names(
+    session: AsyncSession, table: Table, rows: Dict[str, dict]
+) -> Tuple[Dict[str, int], int]:
+    """Ids of the named rows, inserting missing ones; returns (ids, created)"""
+    if not rows:
+        return {}, 0
+    statement = (
+        pg_insert(table)
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(table.c.id, table.c.name)
+    )
+    created = await session.execute(
+        statement, [{"name": name, **rows[name]} for name in sorted(rows)]
+    )
+    ids = {name: id for id, name in created}
+    new = len(ids)
+    existing = [name for name in rows if name not in ids]
+    if existing:
+        result = await session.execute(
+            select(table.c.id, table.c.name).where(table.c.name.in_(existing))
+        )
+        ids.update({name: id for id, name in result})
+    return ids, new
+
+
+async def _import_batch(
+    session: AsyncSession, batch: List[RecipeRecord], report: RecipeImportReport
+) -> None:
+    lines = [line for record in batch for line in record.ingredients]
+
+    categories, created = await _resolve_names(
+        session,
+        Category.__table__,
+        {line.category: {} for line in lines if line.category},
+    )
+    report.categories_created += created
+    brands, created = await _resolve_names(
+        session, Brand.__table__, {line.brand: {} for line in lines if line.brand}
+    )
+    report.brands_created += created
+
+    new_ingredients: Dict[str, dict] = {}
+    for line in lines:
+        new_ingredients.setdefault(
+            line.ingredient,
+            {
+                "category_id": categories.get(line.category),
+                "brand_id": brands.get(line.brand),
+            },
+        )
+    ingredients, created = await _resolve_names(
+        session, Ingredient.__table__, new_ingredients
+    )
+    report.ingredients_created += created
+
+    recipe_ids = (
+        await session.scalars(
+            insert(Recipe.__table__).returning(
+                Recipe.__table__.c.id, sort_by_parameter_order=True
+            ),
+            [record.model_dump(include=set(RECIPE_COLUMNS)) for record in batch],
+        )
+    ).all()
+
+    if lines:
+        base_quantities, base_units = canonicalize_many(
+            [line.quantity for line in lines], [line.unit for line in lines]
+        )
+        owners = [
+            recipe_id
+            for recipe_id, record in zip(recipe_ids, batch)
+            for _ in record.ingredients
+        ]
+        records = [
+            (
+                recipe_id,
+                ingredients[line.ingredient],
+                line.quantity,
+                line.unit,
+                base_quantity,
+                base_unit,
+                line.preparation,
+                line.display_order,
+                line.is_optional,
+            )
+            for recipe_id, line, base_quantity, base_unit in zip(
+                owners, lines, base_quantities, base_units
+            )
+        ]
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            RecipeIngredient.__tablename__, records=records, columns=COPY_COLUMNS
+        )
+
+    report.recipes += len(batch)
+    report.ingredient_lines += len(lines)
+
+
+async def import_recipes(
+    session: AsyncSession,
+    records: Iterable[RecipeRecord],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[RecipeImportReport], None]] = None,
+) -> RecipeImportReport:
+    """
+    Write ``records`` in batches without committing.
+
+    ``progress`` is called with the running report after every batch.
+    Parse errors raised by ``records`` propagate; the caller should roll
+    back.
+    """
+    report = RecipeImportReport()
+    started = time.perf_counter()
+    for batch in _batches(records, batch_size):
+        await _import_batch(session, batch, report)
+        _update_rate(report, time.perf_counter() - started)
+        if progress is not None:
+            progress(report)
+    _update_rate(report, time.perf_counter() - started)
+    return report
+
+
+def _update_rate(report: RecipeImportReport, seconds: float) -> None:
+    report.seconds = round(seconds, 3)
+    rows = report.recipes + report.ingredient_lines
+    report.rows_per_second = round(rows / seconds, 1) if seconds > 0 else 0.0
@@ -0,0 +1,309 @@
+"""
+Recipe listing and detail.
+
+Recipes are listed in (name, id) order with keyset pagination, served by
+ix_recipes_name_id, so every page costs the same regardless of depth.
+recipe_list_page returns RecipeListRow read models, which fast JSON
+responses encode as they are (core/serialization.py).
+
+A recipe detail is the recipe, its ingredient lines, and each line's
+ingredient with category and brand. Left to default lazy loading that is
+1 + N + 2N queries for N lines; the loader strategies below fetch the
+whole graph in a fixed number of statements instead:
+
+- ``selectin``: the recipe, then one ``IN`` query for its lines joined to
+  ingredient, category and brand - 2 statements, no duplicated recipe
+  columns.
+- ``joined``: a single statement joining everything, repeating the recipe
+  columns on every line.
+- ``cached`` (default): a single statement for the recipe and its lines
+  only; the ingredients with their categories and brands come from the
+  catalog cache (services/catalog.py), which costs nothing when it is
+  warm.
+- ``projection``: the same 2 statements as ``selectin``, selecting plain
+  columns into RecipeRow and RecipeLineRow read models
+  (core/projections.py) instead of loading entities into the session.
+
+The ORM strategies finish with ``raiseload("*")``, so touching any
+relationship the strategy did not plan for raises instead of silently
+issuing a query.
+
+recipe_detail_validators answers conditional requests for a detail from
+one aggregate over the ``updated_at`` of every row the detail shows.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Literal, Optional, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from core.conditional import Validators
+from core.config import settings
+from core.pagination import DEFAULT_PAGE_SIZE, Keyset, KeysetPage, fetch_keyset_page
+from core.projections import fetch_into, fetch_one_into, read_model, select_into
+from models import Brand, Category, Ingredient, Recipe, RecipeIngredient
+from schemas.ingredient import BrandRef, CategoryRef, IngredientDetail
+from schemas.pagination import Page
+from schemas.recipe import RecipeDetail, RecipeIngredientLine, RecipeSummary
+from services.catalog import catalog
+
+LoaderStrategy = Literal["selectin", "joined", "cached", "projection"]
+
+RECIPE_KEYSET = Keyset(Recipe.name, Recipe.id)
+
+
+@read_model
+class RecipeListRow:
+    """A recipe as listed; the fields of RecipeSummary"""
+
+    id: int
+    name: str
+    description: Optional[str]
+    servings: Optional[int]
+    prep_time_minutes: Optional[int]
+    cook_time_minutes: Optional[int]
+
+
+def recipe_list_query() -> Select:
+    """Columns of a recipe listing (keyset order is applied by the caller)"""
+    return select_into(
+        RecipeListRow,
+        Recipe.id,
+        Recipe.name,
+        Recipe.description,
+        Recipe.servings,
+        Recipe.prep_time_minutes,
+        Recipe.cook_time_minutes,
+    )
+
+
+async def recipe_list_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> KeysetPage[RecipeListRow]:
+    """One page of recipes in name order, after ``cursor`` if given"""
+    return await fetch_keyset_page(
+        session, recipe_list_query(), RECIPE_KEYSET, cursor, limit, model=RecipeListRow
+    )
+
+
+async def list_recipes(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page[RecipeSummary]:
+    """recipe_list_page validated as RecipeSummary models"""
+    page = await recipe_list_page(session, cursor, limit)
+    return Page[RecipeSummary](
+        items=[
+            RecipeSummary.model_validate(row, from_attributes=True)
+            for row in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
+
+
+def _ingredient_graph(line_loader) -> LoaderOption:
+    # ingredient_id is NOT NULL, so the ingredient can be an inner join;
+    # category and brand are optional
+    return line_loader(Recipe.recipe_ingredients).options(
+        joinedload(RecipeIngredient.ingredient, innerjoin=True).options(
+            joinedload(Ingredient.category), joinedload(Ingredient.brand)
+        )
+    )
+
+
+RECIPE_DETAIL_LOADERS: Dict[str, Tuple[LoaderOption, ...]] = {
+    "selectin": (_ingredient_graph(selectinload), raiseload("*")),
+    "joined": (_ingredient_graph(joinedload), raiseload("*")),
+    "cached": (joinedload(Recipe.recipe_ingredients), raiseload("*")),
+}
+
+# Columns copied from the loaded rows when details come from the catalog
+_RECIPE_FIELDS = [name for name in RecipeDetail.model_fields if name != "ingredients"]
+_LINE_FIELDS = [
+    name for name in RecipeIngredientLine.model_fields if name != "ingredient"
+]
+
+
+@read_model
+class RecipeRow:
+    """The recipe columns of a recipe detail"""
+
+    id: int
+    name: str
+    description: Optional[str]
+    servings: Optional[int]
+    prep_time_minutes: Optional[int]
+    cook_time_minutes: Optional[int]
+    instructions: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+@read_model
+class RecipeLineRow:
+    """An ingredient line with its ingredient, category and brand"""
+
+    id: int
+    quantity: Optional[Decimal]
+    unit: Optional[str]
+    base_quantity: Optional[Decimal]
+    base_unit: Optional[str]
+    preparation: Optional[str]
+    display_order: Optional[int]
+    is_optional: bool
+    ingredient_id: int
+    ingredient_name: str
+    category_id: Optional[int]
+    category_name: Optional[str]
+    brand_id: Optional[int]
+    brand_name: Optional[str]
+
+
+def recipe_row_query(recipe_id: int) -> Select:
+    return select_into(
+        RecipeRow,
+        *(getattr(Recipe, name) for name in RecipeRow.__dataclass_fields__),
+    ).where(Recipe.id == recipe_id)
+
+
+def recipe_line_rows_query(recipe_id: int) -> Select:
+    """Lines of ``recipe_id`` in display order, joined to their catalog rows"""
+    return (
+        select_into(
+            RecipeLineRow,
+            RecipeIngredient.id,
+            RecipeIngredient.quantity,
+            RecipeIngredient.unit,
+            RecipeIngredient.base_quantity,
+            RecipeIngredient.base_unit,
+            RecipeIngredient.preparation,
+            RecipeIngredient.display_order,
+            RecipeIngredient.is_optional,
+            Ingredient.id,
+            Ingredient.name,
+            Category.id,
+            Category.name,
+            Brand.id,
+            Brand.name,
+        )
+        .join(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+        .outerjoin(Category, Category.id == Ingredient.category_id)
+        .outerjoin(Brand, Brand.id == Ingredient.brand_id)
+        .where(RecipeIngredient.recipe_id == recipe_id)
+        .order_by(RecipeIngredient.display_order, RecipeIngredient.id)
+    )
+
+
+def _line_detail(line: RecipeLineRow) -> RecipeIngredientLine:
+    category = brand = None
+    if line.category_id is not None:
+        category = CategoryRef(id=line.category_id, name=line.category_name)
+    if line.brand_id is not None:
+        brand = BrandRef(id=line.brand_id, name=line.brand_name)
+    return RecipeIngredientLine(
+        **{name: getattr(line, name) for name in _LINE_FIELDS},
+        ingredient=IngredientDetail(
+            id=line.ingredient_id,
+            name=line.ingredient_name,
+            category=category,
+            brand=brand,
+        ),
+    )
+
+
+async def _projected_recipe_detail(
+    session: AsyncSession, recipe_id: int
+) -> Optional[RecipeDetail]:
+    recipe = await fetch_one_into(session, RecipeRow, recipe_row_query(recipe_id))
+    if recipe is None:
+        return None
+    lines = await fetch_into(session, RecipeLineRow, recipe_line_rows_query(recipe_id))
+    return RecipeDetail(
+        **{name: getattr(recipe, name) for name in _RECIPE_FIELDS},
+        ingredients=[_line_detail(line) for line in lines],
+    )
+
+
+def recipe_detail_query(
+    recipe_id: int, strategy: Optional[LoaderStrategy] = None
+) -> Select:
+    """Recipe ``recipe_id`` with its ingredient graph loaded by ORM ``strategy``"""
+    loaders = RECIPE_DETAIL_LOADERS[strategy or settings.RECIPE_DETAIL_LOADER]
+    return select(Recipe).where(Recipe.id == recipe_id).options(*loaders)
+
+
+async def get_recipe_detail(
+    session: AsyncSession, recipe_id: int, strategy: Optional[LoaderStrategy] = None
+) -> Optional[RecipeDetail]:
+    """Recipe ``recipe_id`` with its ingredients, or None if it does not exist"""
+    strategy = strategy or settings.RECIPE_DETAIL_LOADER
+    if strategy == "projection":
+        return await _projected_recipe_detail(session, recipe_id)
+    result = await session.execute(recipe_detail_query(recipe_id, strategy))
+    # unique() collapses the per-line rows of the joined strategies
+    recipe = result.unique().scalar_one_or_none()
+    if recipe is None:
+        return None
+    if strategy != "cached":
+        return RecipeDetail.model_validate(recipe)
+
+    lines = recipe.recipe_ingredients
+    ingredients = await catalog.ingredient_details(
+        session, (line.ingredient_id for line in lines)
+    )
+    return RecipeDetail(
+        **{name: getattr(recipe, name) for name in _RECIPE_FIELDS},
+        ingredients=[
+            RecipeIngredientLine(
+                **{name: getattr(line, name) for name in _LINE_FIELDS},
+                ingredient=ingredients[line.ingredient_id],
+            )
+            for line in lines
+        ],
+    )
+
+
+def recipe_detail_version_query(recipe_id: int) -> Select:
+    """Latest updated_at across a recipe detail's rows, and its line count"""
+    return (
+        select(
+            # greatest() skips the NULLs of missing lines, categories, brands
+            func.greatest(
+                func.max(Recipe.updated_at),
+                func.max(RecipeIngredient.updated_at),
+                func.max(Ingredient.updated_at),
+                func.max(Category.updated_at),
+                func.max(Brand.updated_at),
+            ).label("last_modified"),
+            # Deleting a line changes no remaining updated_at
+            func.count(RecipeIngredient.id).label("lines"),
+        )
+        .select_from(Recipe)
+        .outerjoin(RecipeIngredient, RecipeIngredient.recipe_id == Recipe.id)
+        .outerjoin(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+        .outerjoin(Category, Category.id == Ingredient.category_id)
+        .outerjoin(Brand, Brand.id == Ingredient.brand_id)
+        .where(Recipe.id == recipe_id)
+        .group_by(Recipe.id)
+    )
+
+
+async def recipe_detail_validators(
+    session: AsyncSession, recipe_id: int
+) -> Optional[Validators]:
+    """ETag/Last-Modified of recipe ``recipe_id``, or None if it does not exist"""
+    row = (await session.execute(recipe_detail_version_query(recipe_id))).first()
+    if row is None:
+        return None
+    return Validators.of(
+        "recipe", recipe_id, row.lines, last_modified=row.last_modified
+    )
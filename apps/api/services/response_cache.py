@@ -0,0 +1,338 @@
+"""
+Shared response cache for hot read endpoints.
+
+Serialized responses are kept in a CacheBackend shared by every worker
+process (Redis when RESPONSE_CACHE_URL points at one, process memory
+otherwise) under versioned keys: a key embeds the current version of each
+scope the response depends on - the recipe it shows, the meal plans, the
+catalog. Changing data never deletes entries. It bumps the versions of its
+scopes, every worker computes new keys from then on, and the old entries
+expire unread. KEY_VERSION is part of every key, so a deploy that changes
+a response schema starts from an empty cache.
+
+Scopes are bumped from session events, as the catalog cache is evicted
+(services/catalog.py): ``after_flush`` records the scopes of the recipes,
+ingredient lines, meal plans and catalog rows a flush wrote, statements
+against those tables record table-wide scopes, and the versions are bumped
+when the transaction commits, or rolls back, since reads inside it may
+have cached its uncommitted rows. A version that has gone missing restarts
+from the current time in nanoseconds rather than from 1, so it can never
+return to a value that old entries were stored under.
+
+Concurrent misses of one key are computed once (single-flight): inside a
+worker by awaiting the same future, across workers by a short lock taken
+with set-if-absent while the other workers poll for the result.
+
+The cache is best effort: backend errors are logged and the response is
+computed from the database instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import MissingGreenlet
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+from sqlalchemy.util import await_only
+from starlette.responses import Response
+
+from core.cache import CacheBackend, CacheError, CacheStats, create_backend
+from core.config import settings
+from core.serialization import render as render_json
+from models import MealPlan, Recipe, RecipeIngredient
+from services.catalog import CATALOG_TABLES
+
+# Part of every key; bump when a cached response schema changes
+KEY_VERSION = 1
+
+# Scopes; a response is cached under the versions of the scopes it reads
+ALL_RECIPES = "recipes"
+CATALOG = "catalog"
+MEAL_PLANS = "meal_plans"
+RECIPE_INGREDIENTS = "recipe_ingredients"
+# Names of existing recipes, as shown next to meal plans
+RECIPE_NAMES = "recipe_names"
+WEEKLY_GROCERY = "weekly_grocery"
+
+
+def recipe_scope(recipe_id: int) -> str:
+    """One recipe and its ingredient lines"""
+    return f"recipe:{recipe_id}"
+
+
+# Scopes of a statement that may write any row of a table. Recipe deletes
+# cascade to ingredient lines and null out meal plans in the database
+TABLE_SCOPES: Dict[str, Sequence[str]] = {
+    "recipes": (ALL_RECIPES, RECIPE_INGREDIENTS, MEAL_PLANS, RECIPE_NAMES),
+    "recipe_ingredients": (ALL_RECIPES, RECIPE_INGREDIENTS),
+    "meal_plans": (MEAL_PLANS,),
+    "weekly_grocery_items": (WEEKLY_GROCERY,),
+    **{table: (CATALOG,) for table in CATALOG_TABLES},
+}
+
+# session.info key of the scopes written in the current transaction
+PENDING_KEY = "response_cache_scopes"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResponseCacheStats(CacheStats):
+    """CacheStats plus single-flight and backend failure counters"""
+
+    coalesced: int = 0
+    errors: int = 0
+
+
+class ResponseCache:
+    """Versioned-key cache of serialized responses on a shared backend"""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: Optional[float] = 60.0,
+        namespace: str = "mealmind",
+        lock_ttl: float = 5.0,
+        poll_interval: float = 0.02,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = f"{namespace}:{KEY_VERSION}"
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.stats = ResponseCacheStats()
+        # Scopes written by synchronous sessions, bumped on the next use
+        self.pending: Set[str] = set()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _version_key(self, scope: str) -> str:
+        return f"{self.namespace}:version:{scope}"
+
+    async def versions(self, scopes: Sequence[str]) -> List[str]:
+        """Current version of each scope, starting a new one where missing"""
+        keys = [self._version_key(scope) for scope in scopes]
+        values = await self.backend.get_many(keys)
+        for index, value in enumerate(values):
+            if value is None:
+                fresh = str(time.time_ns()).encode()
+                if not await self.backend.add(keys[index], fresh):
+                    fresh = await self.backend.get(keys[index]) or fresh
+                values[index] = fresh
+        return [value.decode() for value in values]
+
+    async def bump(self, scopes: Iterable[str]) -> None:
+        """Move every scope to a new version, orphaning entries cached under it"""
+        for scope in scopes:
+            key = self._version_key(scope)
+            if not await self.backend.add(key, str(time.time_ns()).encode()):
+                await self.backend.incr(key)
+            self.stats.invalidations += 1
+
+    async def flush_pending(self) -> None:
+        """Bump the scopes left by synchronous sessions (kept on failure)"""
+        scopes = set(self.pending)
+        if scopes:
+            await self.bump(scopes)
+            self.pending -= scopes
+
+    async def get_or_set(
+        self,
+        name: str,
+        scopes: Sequence[str],
+        load: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """The cached value of ``name``, or the result of ``load`` (then cached)"""
+        try:
+            await self.flush_pending()
+            versions = await self.versions(scopes)
+        except CacheError as e:
+            self._failed(e)
+            return await load()
+
+        key = f"{self.namespace}:{name}:{'.'.join(versions)}"
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._fetch(key, load)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; without any, it must not be logged as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def _fetch(self, key: str, load: Callable[[], Awaitable[bytes]]) -> bytes:
+        try:
+            cached = await self.backend.get(key)
+        except CacheError as e:
+            self._failed(e)
+            return await load()
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+        self.stats.misses += 1
+
+        lock = f"{key}:lock"
+        try:
+            leader = await self.backend.add(lock, b"1", self.lock_ttl)
+        except CacheError as e:
+            self._failed(e)
+            leader = True
+        if not leader:
+            cached = await self._wait_for(key)
+            if cached is not None:
+                self.stats.coalesced += 1
+                return cached
+
+        try:
+            value = await load()
+        except BaseException:
+            if leader:
+                # Let the waiting workers try themselves instead of timing out
+                await self._forget(lock)
+            raise
+        try:
+            # The lock is left to expire: the value is there for anyone waiting
+            await self.backend.set(key, value, self.ttl)
+        except CacheError as e:
+            self._failed(e)
+        return value
+
+    async def _wait_for(self, key: str) -> Optional[bytes]:
+        """Poll for a value another worker is computing, up to the lock TTL"""
+        deadline = time.monotonic() + self.lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                cached = await self.backend.get(key)
+            except CacheError as e:
+                self._failed(e)
+                return None
+            if cached is not None:
+                return cached
+        return None
+
+    async def _forget(self, key: str) -> None:
+        try:
+            await self.backend.delete(key)
+        except CacheError as e:
+            self._failed(e)
+
+    def _failed(self, error: CacheError) -> None:
+        self.stats.errors += 1
+        logger.warning("Response cache unavailable: %s", error)
+
+    async def response(
+        self,
+        name: str,
+        scopes: Sequence[str],
+        load: Callable[[], Awaitable[Any]],
+    ) -> Response:
+        """A JSON response of the model or read models returned by ``load``, cached"""
+
+        async def render() -> bytes:
+            return render_json(await load())
+
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return Response(await render(), media_type="application/json")
+        body = await self.get_or_set(name, scopes, render)
+        return Response(body, media_type="application/json")
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+response_cache = ResponseCache(
+    create_backend(settings.RESPONSE_CACHE_URL),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def _object_scopes(obj: object, deleted: bool) -> Iterable[str]:
+    if isinstance(obj, Recipe):
+        yield recipe_scope(obj.id)
+        if inspect(obj).attrs.name.history.has_changes():
+            yield RECIPE_NAMES
+        if deleted:
+            yield from TABLE_SCOPES["recipes"]
+    elif isinstance(obj, RecipeIngredient):
+        yield RECIPE_INGREDIENTS
+        # A line moved to another recipe changes both recipes
+        history = inspect(obj).attrs.recipe_id.history
+        for recipe_id in {obj.recipe_id, *history.deleted}:
+            yield recipe_scope(recipe_id)
+    elif isinstance(obj, MealPlan):
+        yield MEAL_PLANS
+    elif getattr(obj, "__tablename__", None) in CATALOG_TABLES:
+        yield CATALOG
+
+
+def _pending(session: Session) -> Set[str]:
+    return session.info.setdefault(PENDING_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_writes(session: Session, flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state here, with ids assigned
+    for objects, deleted in (
+        (session.new, False),
+        (session.dirty, False),
+        (session.deleted, True),
+    ):
+        for obj in objects:
+            _pending(session).update(_object_scopes(obj, deleted))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_statement_writes(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None and table.name in TABLE_SCOPES:
+            _pending(state.session).update(TABLE_SCOPES[table.name])
+
+
+def _bump_pending(session: Session) -> None:
+    scopes = session.info.pop(PENDING_KEY, None)
+    if not scopes:
+        return
+    response_cache.pending.update(scopes)
+    bump = response_cache.flush_pending()
+    try:
+        # AsyncSession runs this hook inside its greenlet, so the bump can
+        # be awaited before commit() returns to the caller
+        await_only(bump)
+    except MissingGreenlet:
+        # A synchronous Session: bumped on the cache's next use
+        bump.close()
+    except CacheError as e:
+        response_cache._failed(e)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_writes(session: Session) -> None:
+    _bump_pending(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _bump_rolled_back_writes(session: Session, transaction: SessionTransaction) -> None:
+    # Anything still pending when the outermost transaction ends was rolled back
+    if transaction.parent is None:
+        _bump_pending(session)
@@ -0,0 +1,219 @@
+"""
+Recipe and ingredient search.
+
+Search runs in two tiers, each served by GIN indexes:
+
+1. Exact: the weighted full-text document (``search_vector @@
+   websearch_to_tsquery``, ix_recipes_search_vector) matches stemmed words
+   anywhere in name, description or instructions, and ``name ILIKE
+   '%query%'`` (ix_recipes_name_trgm) matches partial words ("chick").
+   Postgres combines the two with a BitmapOr. Results are ranked by
+   full-text cover density, with a boost for a literal name match, so a
+   name hit outranks a match buried in the instructions.
+2. Fuzzy: only when nothing matches exactly, trigram word similarity on
+   the name (``name %> query``, same trigram index) finds typos
+   ("chiken"), ranked by similarity.
+
+The fuzzy predicate has to recompute word_similarity for every candidate
+row the index returns, which costs several times more than the exact
+tier; running it only as a fallback keeps common queries cheap.
+
+pg_trgm's default word similarity threshold (0.6) rejects common one-letter
+typos in short words, so fuzzy searches lower it for their own transaction
+to SEARCH_WORD_SIMILARITY_THRESHOLD. Ingredients only have a name, so their
+exact tier is the ILIKE match alone.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, Row, Select, case, exists, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models import Ingredient, Recipe
+from schemas.search import (
+    IngredientSearchHit,
+    IngredientSearchResults,
+    RecipeSearchHit,
+    RecipeSearchResults,
+)
+
+SEARCH_CONFIG = "english"
+# ts_rank_cd normalization 32 maps the rank into 0..1 (rank / (rank + 1))
+RANK_NORMALIZATION = 32
+# Added to the rank of recipes whose name contains the query verbatim
+NAME_MATCH_BOOST = 1.0
+
+
+def normalize_query(query: str) -> str:
+    """Trim and collapse whitespace in a user-supplied query"""
+    return " ".join(query.split())
+
+
+def contains_pattern(query: str) -> str:
+    """ILIKE pattern matching ``query`` anywhere, with wildcards escaped"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _recipe_exact_match(query: str) -> ColumnElement[bool]:
+    return or_(
+        Recipe.search_vector.bool_op("@@")(
+            func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        ),
+        Recipe.name.ilike(contains_pattern(query)),
+    )
+
+
+def recipe_search_query(query: str) -> Select:
+    """Exact-tier recipe matches for ``query``, best first"""
+    rank = (
+        func.ts_rank_cd(
+            Recipe.search_vector,
+            func.websearch_to_tsquery(SEARCH_CONFIG, query),
+            RANK_NORMALIZATION,
+        )
+        + case(
+            (Recipe.name.ilike(contains_pattern(query)), NAME_MATCH_BOOST),
+            else_=0.0,
+        )
+    ).label("rank")
+    return (
+        select(Recipe.id, Recipe.name, Recipe.description, rank)
+        .where(_recipe_exact_match(query))
+        .order_by(rank.desc(), Recipe.id)
+    )
+
+
+def recipe_fuzzy_query(query: str) -> Select:
+    """Typo-tolerant recipe name matches for ``query``, most similar first"""
+    rank = func.word_similarity(query, Recipe.name).label("rank")
+    return (
+        select(Recipe.id, Recipe.name, Recipe.description, rank)
+        .where(Recipe.name.op("%>")(query))
+        .order_by(rank.desc(), Recipe.id)
+    )
+
+
+def ingredient_search_query(query: str) -> Select:
+    """Exact-tier ingredient matches: names containing ``query``"""
+    similarity = func.word_similarity(query, Ingredient.name).label("similarity")
+    return (
+        select(Ingredient.id, Ingredient.name, Ingredient.category_id, similarity)
+        .where(Ingredient.name.ilike(contains_pattern(query)))
+        .order_by(similarity.desc(), Ingredient.name, Ingredient.id)
+    )
+
+
+def ingredient_fuzzy_query(query: str) -> Select:
+    """Typo-tolerant ingredient name matches for ``query``"""
+    similarity = func.word_similarity(query, Ingredient.name).label("similarity")
+    return (
+        select(Ingredient.id, Ingredient.name, Ingredient.category_id, similarity)
+        .where(Ingredient.name.op("%>")(query))
+        .order_by(similarity.desc(), Ingredient.name, Ingredient.id)
+    )
+
+
+async def _set_similarity_threshold(session: AsyncSession) -> None:
+    # Transaction-local, so pooled connections are not left modified
+    await session.execute(
+        select(
+            func.set_config(
+                "pg_trgm.word_similarity_threshold",
+                str(settings.SEARCH_WORD_SIMILARITY_THRESHOLD),
+                True,
+            )
+        )
+    )
+
+
+async def _page(
+    session: AsyncSession, query: Select, limit: int, offset: int
+) -> Tuple[Sequence[Row], bool]:
+    # One extra row tells us whether another page exists without a COUNT
+    rows = (await session.execute(query.limit(limit + 1).offset(offset))).all()
+    return rows[:limit], len(rows) > limit
+
+
+async def _tiered_page(
+    session: AsyncSession, exact: Select, fuzzy: Select, limit: int, offset: int
+) -> Tuple[Sequence[Row], bool, bool]:
+    """Page through exact matches, or fuzzy ones if there are none at all"""
+    rows, has_more = await _page(session, exact, limit, offset)
+    if rows:
+        return rows, has_more, False
+    if offset and await session.scalar(select(exists(exact.order_by(None)))):
+        # Past the last page of exact matches
+        return rows, False, False
+
+    await _set_similarity_threshold(session)
+    rows, has_more = await _page(session, fuzzy, limit, offset)
+    return rows, has_more, True
+
+
+async def search_recipes(
+    session: AsyncSession, query: str, limit: int = 20, offset: int = 0
+) -> RecipeSearchResults:
+    """One page of recipes matching ``query``, best match first"""
+    query = normalize_query(query)
+    items: List[RecipeSearchHit] = []
+    has_more = fuzzy = False
+    if query:
+        rows, has_more, fuzzy = await _tiered_page(
+            session,
+            recipe_search_query(query),
+            recipe_fuzzy_query(query),
+            limit,
+            offset,
+        )
+        items = [
+            RecipeSearchHit(
+                id=row.id, name=row.name, description=row.description, rank=row.rank
+            )
+            for row in rows
+        ]
+    return RecipeSearchResults(
+        query=query,
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+        fuzzy=fuzzy,
+        items=items,
+    )
+
+
+async def search_ingredients(
+    session: AsyncSession, query: str, limit: int = 20, offset: int = 0
+) -> IngredientSearchResults:
+    """One page of ingredients whose names match ``query``"""
+    query = normalize_query(query)
+    items: List[IngredientSearchHit] = []
+    has_more = fuzzy = False
+    if query:
+        rows, has_more, fuzzy = await _tiered_page(
+            session,
+            ingredient_search_query(query),
+            ingredient_fuzzy_query(query),
+            limit,
+            offset,
+        )
+        items = [
+            IngredientSearchHit(
+                id=row.id,
+                name=row.name,
+                category_id=row.category_id,
+                similarity=row.similarity,
+            )
+            for row in rows
+        ]
+    return IngredientSearchResults(
+        query=query,
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+        fuzzy=fuzzy,
+        items=items,
+    )
@@ -0,0 +1,180 @@
+"""
+Materialized weekly grocery lists.
+
+weekly_grocery_items holds one row per (week, ingredient, base unit,
+optional flag) and is kept up to date by database triggers on meal_plans
+and recipe_ingredients (migration f630f10f0423), so reading a week is a
+lookup of its items rather than a walk over meals x ingredients. Items
+are named from the catalog cache, as in services/grocery.py.
+
+This module reads the materialized rows and provides the consistency
+checker: diff_week recomputes a week from scratch with the same
+aggregation as services/grocery.py and compares it to the stored state;
+rebuild_week replaces the stored rows with the recomputed ones.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Date, Select, case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.projections import fetch_into, select_into
+from models import WeeklyGroceryItem
+from schemas.grocery import GroceryList
+from services.grocery import (
+    GroceryTotalRow,
+    grocery_totals_query,
+    name_grocery_rows,
+    split_grocery_rows,
+)
+
+# (ingredient_id, base_unit, is_optional)
+LineKey = Tuple[int, Optional[str], bool]
+# (quantity, quantity_count, line_count)
+LineTotals = Tuple[Decimal, int, int]
+
+
+def week_start(day: date) -> date:
+    """Monday of the week containing ``day`` (matches date_trunc('week'))"""
+    return day - timedelta(days=day.weekday())
+
+
+def week_end(day: date) -> date:
+    return week_start(day) + timedelta(days=6)
+
+
+def weekly_grocery_query(week: date) -> Select:
+    """Read the materialized items of one week"""
+    return select_into(
+        GroceryTotalRow,
+        WeeklyGroceryItem.ingredient_id,
+        WeeklyGroceryItem.base_unit,
+        WeeklyGroceryItem.is_optional,
+        case(
+            (WeeklyGroceryItem.quantity_count > 0, WeeklyGroceryItem.quantity),
+            else_=None,
+        ),
+        WeeklyGroceryItem.line_count,
+    ).where(WeeklyGroceryItem.week_start == week)
+
+
+async def read_weekly_grocery_list(session: AsyncSession, day: date) -> GroceryList:
+    """Grocery list for the week containing ``day`` from the materialized rows"""
+    week = week_start(day)
+    totals = await fetch_into(session, GroceryTotalRow, weekly_grocery_query(week))
+    rows = await name_grocery_rows(session, totals)
+    return split_grocery_rows(rows, week, week_end(week))
+
+
+@dataclass(frozen=True)
+class WeekDiscrepancy:
+    """A line whose stored totals differ from a fresh recomputation"""
+
+    week_start: date
+    ingredient_id: int
+    unit: Optional[str]
+    is_optional: bool
+    # None when the line is missing on that side
+    expected: Optional[LineTotals]
+    actual: Optional[LineTotals]
+
+
+async def _expected_totals(
+    session: AsyncSession, week: date
+) -> Dict[LineKey, LineTotals]:
+    result = await session.execute(grocery_totals_query(week, week_end(week)))
+    return {
+        (row.ingredient_id, row.unit, row.is_optional): (
+            row.quantity if row.quantity is not None else Decimal(0),
+            row.quantity_count,
+            row.line_count,
+        )
+        for row in result
+    }
+
+
+async def _stored_totals(
+    session: AsyncSession, week: date
+) -> Dict[LineKey, LineTotals]:
+    result = await session.execute(
+        select(
+            WeeklyGroceryItem.ingredient_id,
+            WeeklyGroceryItem.base_unit,
+            WeeklyGroceryItem.is_optional,
+            WeeklyGroceryItem.quantity,
+            WeeklyGroceryItem.quantity_count,
+            WeeklyGroceryItem.line_count,
+        ).where(WeeklyGroceryItem.week_start == week)
+    )
+    return {
+        (row.ingredient_id, row.base_unit, row.is_optional): (
+            row.quantity,
+            row.quantity_count,
+            row.line_count,
+        )
+        for row in result
+    }
+
+
+async def diff_week(session: AsyncSession, day: date) -> List[WeekDiscrepancy]:
+    """Recompute the week containing ``day`` and diff it against stored rows"""
+    week = week_start(day)
+    expected = await _expected_totals(session, week)
+    actual = await _stored_totals(session, week)
+
+    return [
+        WeekDiscrepancy(
+            week_start=week,
+            ingredient_id=key[0],
+            unit=key[1],
+            is_optional=key[2],
+            expected=expected.get(key),
+            actual=actual.get(key),
+        )
+        for key in sorted(
+            expected.keys() | actual.keys(),
+            key=lambda key: (key[0], key[1] or "", key[2]),
+        )
+        if expected.get(key) != actual.get(key)
+    ]
+
+
+async def rebuild_week(session: AsyncSession, day: date) -> int:
+    """
+    Replace the stored rows of the week containing ``day`` with a fresh
+    aggregation. Returns the number of rows written; the caller commits.
+    """
+    week = week_start(day)
+    await session.execute(
+        delete(WeeklyGroceryItem).where(WeeklyGroceryItem.week_start == week)
+    )
+
+    totals = grocery_totals_query(week, week_end(week)).subquery("totals")
+    result = await session.execute(
+        insert(WeeklyGroceryItem).from_select(
+            [
+                WeeklyGroceryItem.week_start,
+                WeeklyGroceryItem.ingredient_id,
+                WeeklyGroceryItem.base_unit,
+                WeeklyGroceryItem.is_optional,
+                WeeklyGroceryItem.quantity,
+                WeeklyGroceryItem.quantity_count,
+                WeeklyGroceryItem.line_count,
+            ],
+            select(
+                literal(week, Date),
+                totals.c.ingredient_id,
+                totals.c.unit,
+                totals.c.is_optional,
+                func.coalesce(totals.c.quantity, 0),
+                totals.c.quantity_count,
+                totals.c.line_count,
+            ),
+        )
+    )
+    return result.rowcount
@@ -4,12 +4,18 @@ Pytest configuration and fixtures
 
 import os
 import sys
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from pathlib import Path
+from typing import List
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from alembic.config import Config
 from alembic import command
 
@@ -26,6 +32,17 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL environment variable must be set for tests.")
 
+# Imported after .env is loaded: core.config reads DATABASE_URL at import time
+from core.config import Settings  # noqa: E402
+from core.db import get_session, get_session_factory, to_async_url  # noqa: E402
+from tests.fixtures.databases import (  # noqa: E402
+    drop_database,
+    provision_database,
+    rolled_back_session,
+)
+from tests.fixtures.factories import Scale, SeedReport, seed  # noqa: E402
+from tests.fixtures.queries import QueryCounter  # noqa: E402
+
 # Parse DATABASE_URL to extract connection components
 db_url = make_url(DATABASE_URL)
 POSTGRES_USER = db_url.username or "postgres"
@@ -33,37 +50,35 @@ POSTGRES_PASSWORD = db_url.password or "postgres"
 POSTGRES_HOST = db_url.host or "localhost"
 POSTGRES_PORT = str(db_url.port or 54322)
 
-# Test database configuration
-TEST_DB_NAME = os.getenv("TEST_DB_NAME", "mealmind_test")
+# Test database configuration; under pytest-xdist every worker (gw0, gw1,
+# ...) gets a database of its own, cloned from the same template
+TEST_DB_PREFIX = os.getenv("TEST_DB_NAME", "mealmind_test")
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+TEST_DB_NAME = f"{TEST_DB_PREFIX}_{XDIST_WORKER}" if XDIST_WORKER else TEST_DB_PREFIX
 
-# Connection strings
-ADMIN_DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/postgres"
-TEST_DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{TEST_DB_NAME}"
 
+def _database_url(db_name: str) -> str:
+    return f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{db_name}"
 
-def _database_exists(engine, db_name: str) -> bool:
-    """Check if a database exists."""
-    with engine.connect() as conn:
-        result = conn.execute(
-            text("SELECT 1 FROM pg_database WHERE datname=:name"),
-            {"name": db_name},
-        )
-        return result.fetchone() is not None
+
+# Connection strings
+ADMIN_DATABASE_URL = _database_url("postgres")
+TEST_DATABASE_URL = _database_url(TEST_DB_NAME)
+ASYNC_TEST_DATABASE_URL = to_async_url(TEST_DATABASE_URL)
+
+# Summaries of how test databases were provisioned, filled in by
+# setup_test_database (and from every xdist worker), reported at the end
+PROVISIONED: List[str] = []
 
 
-def _create_database(admin_engine, db_name: str) -> None:
-    """Create a new database."""
-    with admin_engine.connect() as conn:
-        conn.execution_options(isolation_level="AUTOCOMMIT")
-        conn.execute(text(f'CREATE DATABASE "{db_name}"'))
-        print(f"Created test database '{db_name}'.")
+def _alembic_config() -> Config:
+    return Config(str(api_dir / "alembic.ini"))
 
 
-def _run_migrations(database_url: str) -> None:
+def _run_migrations(db_name: str) -> None:
     """Run Alembic migrations on the specified database."""
-    alembic_ini_path = api_dir / "alembic.ini"
-    alembic_cfg = Config(str(alembic_ini_path))
-    alembic_cfg.set_main_option("sqlalchemy.url", database_url)
+    alembic_cfg = _alembic_config()
+    alembic_cfg.set_main_option("sqlalchemy.url", _database_url(db_name))
     command.upgrade(alembic_cfg, "head")
     print("Alembic migrations applied.")
 
@@ -71,39 +86,104 @@ def _run_migrations(database_url: str) -> None:
 @pytest.fixture(scope="session")
 def setup_test_database():
     """
-    Session-scoped fixture to ensure test database exists and is migrated.
+    Session-scoped fixture providing a freshly migrated test database.
 
     This runs ONCE per test session (not per test).
     - Loads configuration from .env file
-    - Checks if mealmind_test database exists
-    - Creates it if missing
-    - Runs Alembic migrations to set up schema
+    - Runs the Alembic chain into a template database, only when no
+      template holds the current migrations yet
+    - Recreates mealmind_test (mealmind_test_gw0, ... per xdist worker) as
+      a copy of that template, in milliseconds (see tests/fixtures/databases.py)
 
-    The autouse=True means it runs automatically before any tests.
+    The test database is dropped first, disconnecting anyone still
+    connected to it; every session starts from an empty schema.
     """
     print("\n🔧 Setting up test database...")
     print(f"Database server: {POSTGRES_HOST}:{POSTGRES_PORT}")
 
     # Connect to PostgreSQL server (not a specific database)
     admin_engine = create_engine(ADMIN_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        report = provision_database(
+            admin_engine,
+            TEST_DB_NAME,
+            _alembic_config(),
+            _run_migrations,
+            template_prefix=TEST_DB_PREFIX,
+        )
+    finally:
+        admin_engine.dispose()
+
+    PROVISIONED.append(report.summary())
+    print(f"{report.summary()}\nTest database ready!\n")
+
+
+@pytest.fixture
+def migration_database(setup_test_database):
+    """
+    Alembic config for a scratch copy of the migrated test database.
+
+    For tests that move the schema up and down through migrations, which
+    cannot happen inside the shared database's rolled-back transactions.
+    The copy is cloned from the test template and dropped afterwards.
+
+    Usage:
+        def test_backfill(migration_database):
+            command.downgrade(migration_database, "52e21a81b390")
+    """
+    name = f"{TEST_DB_NAME}_migrations"
+    admin_engine = create_engine(ADMIN_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        provision_database(
+            admin_engine,
+            name,
+            _alembic_config(),
+            _run_migrations,
+            template_prefix=TEST_DB_PREFIX,
+        )
+        alembic_cfg = _alembic_config()
+        alembic_cfg.set_main_option("sqlalchemy.url", _database_url(name))
+        yield alembic_cfg
+    finally:
+        drop_database(admin_engine, name)
+        admin_engine.dispose()
+
+
+def pytest_sessionfinish(session):
+    # An xdist worker hands its summary to the controlling process
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["provisioned"] = PROVISIONED
 
-    # Check if test database exists
-    if not _database_exists(admin_engine, TEST_DB_NAME):
-        print(f"Test database '{TEST_DB_NAME}' does not exist, creating...")
-        _create_database(admin_engine, TEST_DB_NAME)
-    else:
-        print(f"Test database '{TEST_DB_NAME}' already exists")
 
-    # Run migrations to ensure schema is up to date
-    print(f"Running Alembic migrations on '{TEST_DB_NAME}'...")
-    _run_migrations(TEST_DATABASE_URL)
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    PROVISIONED.extend(getattr(node, "workeroutput", {}).get("provisioned", []))
 
-    admin_engine.dispose()
-    print("Test database ready!\n")
+
+def pytest_terminal_summary(terminalreporter):
+    for summary in sorted(PROVISIONED):
+        terminalreporter.write_line(summary)
+
+
+@pytest.fixture(scope="session")
+def test_engine(setup_test_database):
+    """Engine on the test database, shared by every test of the session."""
+    engine = create_engine(TEST_DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_test_engine(setup_test_database):
+    """Async engine on the test database, shared by every test of the session."""
+    engine = create_async_engine(ASYNC_TEST_DATABASE_URL)
+    yield engine
+    await engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def db_session(setup_test_database):
+def db_session(test_engine):
     """
     Provide a database session with automatic transaction rollback.
 
@@ -121,17 +201,18 @@ def db_session(setup_test_database):
             db_session.commit()
             # After test: automatic rollback, recipe disappears
     """
-    # Create engine for test database
-    engine = create_engine(TEST_DATABASE_URL)
-
-    # Create a connection
-    connection = engine.connect()
+    # Check a connection out of the shared engine
+    connection = test_engine.connect()
 
     # Begin a transaction
     transaction = connection.begin()
 
-    # Create a session bound to this connection and transaction
-    SessionLocal = sessionmaker(bind=connection)
+    # Create a session bound to this connection and transaction; commit and
+    # rollback only touch a SAVEPOINT, so a test that rolls back after an
+    # IntegrityError cannot end the outer transaction and commit for real
+    SessionLocal = sessionmaker(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
     session = SessionLocal()
 
     # Provide the session to the test
@@ -144,5 +225,135 @@ def db_session(setup_test_database):
     if transaction.is_active:
         transaction.rollback()  # Rollback all changes
 
-    connection.close()  # Close the connection
-    engine.dispose()  # Dispose the engine
+    connection.close()  # Return the connection to the pool
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_db_session(async_test_engine):
+    """
+    Async counterpart of db_session for code built on core.db.
+
+    The session is joined to an outer transaction that is rolled back after
+    the test; session.commit() only releases a SAVEPOINT, so services that
+    commit still leave the database clean.
+
+    Usage:
+        @pytest.mark.asyncio
+        async def test_grocery_list(async_db_session):
+            async_db_session.add(Recipe(name="Pasta"))
+            await async_db_session.flush()
+    """
+    async with rolled_back_session(async_test_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def test_settings(setup_test_database):
+    """Application settings pointed at the migrated test database."""
+    return Settings(DATABASE_URL=TEST_DATABASE_URL)
+
+
+@pytest_asyncio.fixture
+async def api_client(async_db_session):
+    """
+    HTTP client for the FastAPI app, sharing async_db_session.
+
+    Requests go straight to the ASGI app (no server, no lifespan), and every
+    endpoint's SessionDep is the test's rolled-back session, so data added in
+    the test is visible to the API and disappears afterwards. The response cache
+    starts empty.
+
+    Usage:
+        @pytest.mark.asyncio
+        async def test_list_recipes(api_client):
+            response = await api_client.get("/recipes")
+    """
+    from core.cache import MemoryBackend
+    from main import app
+    from services.response_cache import ResponseCacheStats, response_cache
+
+    response_cache.backend = MemoryBackend()
+    response_cache.stats = ResponseCacheStats()
+
+    async def _test_session():
+        yield async_db_session
+
+    # Streaming endpoints open sessions from a factory; hand out the same one
+    @asynccontextmanager
+    async def _test_sessions():
+        yield async_db_session
+
+    app.dependency_overrides[get_session] = _test_session
+    app.dependency_overrides[get_session_factory] = lambda: _test_sessions
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        app.dependency_overrides.pop(get_session_factory, None)
+
+
+@pytest_asyncio.fixture
+async def fresh_catalog():
+    """The process-wide catalog cache, emptied and with zeroed counters."""
+    from core.cache import CacheStats
+    from services.catalog import catalog
+
+    def reset():
+        catalog.clear()
+        for cache in catalog.caches.values():
+            cache.stats = CacheStats()
+
+    reset()
+    yield catalog
+    reset()
+
+
+@pytest.fixture
+def count_queries(async_db_session):
+    """
+    Factory for QueryCounters on the engine behind async_db_session.
+
+    The session's identity map is cleared first, so objects created by the
+    test do not satisfy loads that production requests would have to run.
+
+    Usage:
+        @pytest.mark.asyncio
+        async def test_recipe_detail(api_client, count_queries):
+            with count_queries() as queries:
+                await api_client.get("/recipes/1")
+            queries.assert_at_most(2)
+    """
+
+    def _counter() -> QueryCounter:
+        async_db_session.expunge_all()
+        return QueryCounter(async_db_session.bind.sync_engine)
+
+    return _counter
+
+
+@pytest.fixture
+def synthetic_data(async_db_session):
+    """
+    Factory seeding synthetic data into async_db_session's transaction.
+
+    Takes a scale name from tests/fixtures/factories.py SCALES (or a Scale)
+    plus Scale overrides, and returns the SeedReport. Everything seeded is
+    rolled back with the test. The load alters recipe_ingredients (see
+    seed()), so the rest of the test should go through the same session.
+
+    Usage:
+        @pytest.mark.asyncio
+        async def test_listing_at_scale(api_client, synthetic_data):
+            report = await synthetic_data("10k", seed=3)
+            response = await api_client.get("/recipes")
+    """
+
+    async def _seed(scale="1k", **overrides) -> SeedReport:
+        if isinstance(scale, str):
+            scale = Scale.named(scale)
+        return await seed(async_db_session, replace(scale, **overrides))
+
+    return _seed
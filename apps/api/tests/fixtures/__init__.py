@@ -2,14 +2,15 @@
 Shared test fixtures and factories.
 
 This module contains reusable test data creation utilities:
-- factories.py - Factory functions for creating test database records
+- factories.py - Deterministic synthetic datasets, bulk-loaded at scale
+- databases.py - Test database provisioning from a migrated template
+- queries.py - QueryCounter for asserting SQL statement budgets
 
-Factory functions follow the pattern:
-    def create_<model>(db_session, **kwargs):
-        # Create and return model instance with sensible defaults
-        # Override defaults with kwargs
+Synthetic data is seeded through the ``synthetic_data`` fixture, or from
+the command line into a development database.
 
 Example usage:
-    recipe = create_recipe(db_session, name="Custom Name")
-    category = create_category(db_session)
+    report = await synthetic_data("100k", seed=7)
+
+    uv run python -m tests.fixtures.factories --scale 1m --seed 42
 """
@@ -0,0 +1,216 @@
+"""
+Test database provisioning from a migrated template.
+
+Migrating a fresh database runs the whole Alembic chain, which only grows;
+copying a database that already holds the schema is a file-level copy that
+takes milliseconds. So the chain runs once into a template database named
+after the migrations it holds, and every test session (or worker) clones
+its own database from it with ``CREATE DATABASE ... TEMPLATE``; under
+pytest-xdist every worker clones the one template into a database of its
+own.
+
+The template name ends in ``migration_key()``, a digest of the Alembic
+heads and every migration script, so adding or editing a migration builds
+a new template on the next run and templates of older keys are dropped.
+Templates are built under an advisory lock, so concurrent sessions build
+each one once, into a scratch database that is only renamed into place
+once migrated. A template accepts no connections, since a clone fails
+while anyone is connected to its source. The time migrating took is kept
+as the template's comment, so every clone can report what it saved.
+
+Example usage:
+    report = provision_database(admin_engine, "mealmind_test", alembic_cfg, migrate)
+    print(report.summary())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# Appended to a database name, before the migration key
+TEMPLATE_SUFFIX = "_tmpl_"
+
+
+@dataclass
+class ProvisionReport:
+    """How a test database was provisioned"""
+
+    database: str
+    template: str
+    # Whether this session migrated the template rather than reusing it
+    built: bool
+    migrate_seconds: float
+    clone_seconds: float
+
+    @property
+    def saved_seconds(self) -> float:
+        """Time saved by cloning rather than migrating the database"""
+        return self.migrate_seconds - self.clone_seconds
+
+    def summary(self) -> str:
+        clone = f"cloned {self.template} in {self.clone_seconds * 1000:.0f} ms"
+        migrate = f"{self.migrate_seconds * 1000:.0f} ms"
+        if self.built:
+            return f"{self.database}: migrated the template in {migrate}, {clone}"
+        return (
+            f"{self.database}: {clone} instead of migrating in {migrate} "
+            f"(saved {self.saved_seconds * 1000:.0f} ms)"
+        )
+
+
+def migration_key(alembic_cfg: Config) -> str:
+    """Digest of the Alembic heads and the source of every migration"""
+    script = ScriptDirectory.from_config(alembic_cfg)
+    digest = hashlib.sha256(" ".join(sorted(script.get_heads())).encode())
+    for revision in sorted(script.walk_revisions(), key=lambda r: r.revision):
+        digest.update(Path(revision.path).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _exists(conn: Connection, name: str) -> bool:
+    return (
+        conn.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": name}
+        ).first()
+        is not None
+    )
+
+
+def _drop(conn: Connection, name: str) -> None:
+    conn.execute(text(f'ALTER DATABASE "{name}" WITH IS_TEMPLATE false'))
+    conn.execute(text(f'DROP DATABASE "{name}" WITH (FORCE)'))
+
+
+def _build_template(
+    conn: Connection, template: str, migrate: Callable[[str], None]
+) -> None:
+    scratch = f"{template}_build"
+    conn.execute(text(f'DROP DATABASE IF EXISTS "{scratch}" WITH (FORCE)'))
+    conn.execute(text(f'CREATE DATABASE "{scratch}"'))
+    started = time.perf_counter()
+    migrate(scratch)
+    seconds = time.perf_counter() - started
+    conn.execute(text(f'ALTER DATABASE "{scratch}" RENAME TO "{template}"'))
+    conn.execute(
+        text(
+            f'ALTER DATABASE "{template}" WITH IS_TEMPLATE true ALLOW_CONNECTIONS false'
+        )
+    )
+    conn.execute(text(f"COMMENT ON DATABASE \"{template}\" IS '{seconds:.6f}'"))
+
+
+def _migrate_seconds(conn: Connection, template: str) -> float:
+    comment = conn.execute(
+        text(
+            "SELECT shobj_description(oid, 'pg_database') FROM pg_database"
+            " WHERE datname = :name"
+        ),
+        {"name": template},
+    ).scalar()
+    return float(comment or 0)
+
+
+def ensure_template(
+    admin_engine: Engine, template: str, migrate: Callable[[str], None]
+) -> bool:
+    """Build ``template`` with ``migrate(name)`` unless it exists; whether it was built"""
+    with admin_engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        lock = {"name": template.split(TEMPLATE_SUFFIX)[0]}
+        conn.execute(text("SELECT pg_advisory_lock(hashtext(:name))"), lock)
+        try:
+            if _exists(conn, template):
+                return False
+            _build_template(conn, template, migrate)
+            # Templates of older migration keys will not be cloned again
+            prefix = template[: template.index(TEMPLATE_SUFFIX) + len(TEMPLATE_SUFFIX)]
+            stale = conn.execute(
+                text(
+                    "SELECT datname FROM pg_database WHERE datistemplate"
+                    " AND starts_with(datname, :prefix) AND datname <> :template"
+                ),
+                {"prefix": prefix, "template": template},
+            ).scalars()
+            for name in list(stale):
+                _drop(conn, name)
+            return True
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), lock)
+
+
+def clone_database(admin_engine: Engine, template: str, name: str) -> float:
+    """Replace database ``name`` with a copy of ``template``; seconds taken"""
+    with admin_engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        started = time.perf_counter()
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        conn.execute(text(f'CREATE DATABASE "{name}" TEMPLATE "{template}"'))
+        return time.perf_counter() - started
+
+
+def drop_database(admin_engine: Engine, name: str) -> None:
+    """Drop database ``name`` if it exists, disconnecting anyone connected"""
+    with admin_engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+
+
+def provision_database(
+    admin_engine: Engine,
+    name: str,
+    alembic_cfg: Config,
+    migrate: Callable[[str], None],
+    template_prefix: Optional[str] = None,
+    key: Optional[str] = None,
+) -> ProvisionReport:
+    """
+    Clone database ``name`` from the template of the current migrations.
+
+    ``migrate(database)`` runs the Alembic chain into the named database;
+    it is only called when no template holds the current migrations yet.
+    Templates are named after ``template_prefix`` (``name`` by default),
+    so databases sharing a prefix share a template, and after ``key``
+    (``migration_key()`` by default): a template whose ``migrate`` also
+    loads data passes a key covering that data too.
+    """
+    prefix = template_prefix or name
+    template = f"{prefix}{TEMPLATE_SUFFIX}{key or migration_key(alembic_cfg)}"
+    built = ensure_template(admin_engine, template, migrate)
+    clone_seconds = clone_database(admin_engine, template, name)
+    with admin_engine.connect() as conn:
+        migrate_seconds = _migrate_seconds(conn, template)
+    return ProvisionReport(name, template, built, migrate_seconds, clone_seconds)
+
+
+@asynccontextmanager
+async def rolled_back_session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """
+    An AsyncSession joined to an outer transaction that is rolled back on exit.
+
+    session.commit() only releases a SAVEPOINT, so code that commits still
+    leaves the database as it found it.
+    """
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        yield session
+
+        await session.close()
+        if transaction.is_active:
+            await transaction.rollback()
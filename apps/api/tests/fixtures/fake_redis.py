@@ -0,0 +1,115 @@
+"""
+In-process Redis protocol server for cache tests.
+
+FakeRedis speaks RESP2 on a local port and implements the commands
+RedisBackend uses (PING, AUTH, SELECT, GET, MGET, SET with PX/NX,
+INCRBY, DEL), so the backend is tested over a real socket without a
+Redis server. Anything else, such as the CLIENT SETINFO the client sends
+on connecting, gets an error reply. Every command received is recorded
+in ``commands``.
+
+Example usage:
+    async with FakeRedis() as server:
+        backend = RedisBackend(server.url)
+        await backend.set("key", b"value")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class FakeRedis:
+    def __init__(self, password: Optional[str] = None) -> None:
+        self.password = password
+        # key -> (value, expires_at)
+        self.data: Dict[bytes, Tuple[bytes, float]] = {}
+        self.commands: List[Tuple[bytes, ...]] = []
+        self.connections = 0
+        self._server: Optional[asyncio.Server] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}{host}:{port}/0"
+
+    async def __aenter__(self) -> "FakeRedis":
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            self.data.pop(key, None)
+            return None
+        return entry[0]
+
+    async def _serve(self, reader, writer) -> None:
+        self.connections += 1
+        authenticated = self.password is None
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                self.commands.append(tuple(args))
+                name = args[0].upper()
+                if name == b"AUTH":
+                    authenticated = args[-1].decode() == self.password
+                    reply = b"+OK\r\n" if authenticated else b"-WRONGPASS\r\n"
+                elif not authenticated:
+                    reply = b"-NOAUTH Authentication required.\r\n"
+                else:
+                    reply = self._execute(name, args[1:])
+                writer.write(reply)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _execute(self, name: bytes, args: List[bytes]) -> bytes:
+        if name in (b"PING", b"SELECT"):
+            return b"+PONG\r\n" if name == b"PING" else b"+OK\r\n"
+        if name == b"GET":
+            return _bulk(self._get(args[0]))
+        if name == b"MGET":
+            return b"*%d\r\n" % len(args) + b"".join(_bulk(self._get(k)) for k in args)
+        if name == b"SET":
+            key, value, options = args[0], args[1], [a.upper() for a in args[2:]]
+            if b"NX" in options and self._get(key) is not None:
+                return b"$-1\r\n"
+            expires_at = float("inf")
+            if b"PX" in options:
+                expires_at = (
+                    time.monotonic() + int(args[2 + options.index(b"PX") + 1]) / 1000
+                )
+            self.data[key] = (value, expires_at)
+            return b"+OK\r\n"
+        if name == b"INCRBY":
+            current = self._get(args[0])
+            try:
+                value = int(current or 0) + int(args[1])
+            except ValueError:
+                return b"-ERR value is not an integer or out of range\r\n"
+            expires_at = self.data.get(args[0], (None, float("inf")))[1]
+            self.data[args[0]] = (str(value).encode(), expires_at)
+            return b":%d\r\n" % value
+        if name == b"DEL":
+            return b":%d\r\n" % sum(self.data.pop(k, None) is not None for k in args)
+        return b"-ERR unknown command '%s'\r\n" % name
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
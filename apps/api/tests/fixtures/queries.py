@@ -0,0 +1,52 @@
+"""
+SQL statement counting for query-budget tests.
+
+QueryCounter listens to an engine's ``before_cursor_execute`` event and
+records every statement sent to the database while it is active. SAVEPOINT
+bookkeeping from the rolled-back test session is not counted, since it
+never happens outside tests.
+
+Example usage:
+    with QueryCounter(engine) as queries:
+        await get_recipe_detail(session, recipe_id)
+    queries.assert_at_most(2)
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryCounter:
+    """Records the SQL statements executed on an engine inside a with block"""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.statements: List[str] = []
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(IGNORED_PREFIXES):
+            self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def assert_at_most(self, budget: int, label: str = "block") -> None:
+        """Fail, listing the statements, if more than ``budget`` were executed"""
+        assert self.count <= budget, (
+            f"{label} executed {self.count} SQL statements (budget {budget}):\n"
+            + "\n---\n".join(self.statements)
+        )
@@ -7,7 +7,7 @@ Update these when you add/modify migrations.
 Organization:
     CORE_TABLES: Main entity tables (recipes, categories, brands, ingredients)
     JUNCTION_TABLES: Many-to-many relationship tables (recipe_ingredients)
-    FEATURE_TABLES: Feature-specific tables (meal_plans)
+    FEATURE_TABLES: Feature-specific tables (meal_plans, weekly_grocery_items)
     SYSTEM_TABLES: Framework/system tables (alembic_version)
     
     ALL_SCHEMAS: Dictionary mapping table names to their schemas
@@ -30,6 +30,7 @@ JUNCTION_TABLES = {
 
 FEATURE_TABLES = {
     "meal_plans",
+    "weekly_grocery_items",
 }
 
 SYSTEM_TABLES = {
@@ -55,6 +56,7 @@ RECIPE_SCHEMA = {
         "instructions",
         "created_at",
         "updated_at",
+        "search_vector",
     },
     "not_null": {
         "id",
@@ -100,6 +102,8 @@ RECIPE_INGREDIENT_SCHEMA = {
         "ingredient_id",
         "quantity",
         "unit",
+        "base_quantity",
+        "base_unit",
         "preparation",
         "display_order",
         "is_optional",
@@ -135,6 +139,30 @@ MEAL_PLAN_SCHEMA = {
     },
 }
 
+WEEKLY_GROCERY_ITEM_SCHEMA = {
+    "columns": {
+        "id",
+        "week_start",
+        "ingredient_id",
+        "base_unit",
+        "is_optional",
+        "quantity",
+        "quantity_count",
+        "line_count",
+        "updated_at",
+    },
+    "not_null": {
+        "id",
+        "week_start",
+        "ingredient_id",
+        "is_optional",
+        "quantity",
+        "quantity_count",
+        "line_count",
+        "updated_at",
+    },
+}
+
 
 # ============================================================================
 # ALL SCHEMAS DICTIONARY
@@ -152,4 +180,5 @@ ALL_SCHEMAS = {
     "recipe_ingredients": RECIPE_INGREDIENT_SCHEMA,
     # Feature tables
     "meal_plans": MEAL_PLAN_SCHEMA,
+    "weekly_grocery_items": WEEKLY_GROCERY_ITEM_SCHEMA,
 }
@@ -0,0 +1,231 @@
+"""
+Integration tests for the reference catalog cache.
+
+These tests verify that a warm catalog answers lookups without touching
+the database, that misses are fetched in one query per table, that
+committed and rolled-back writes evict what they touched, that the
+cached recipe detail strategy matches the query-only ones in fewer
+statements, and that the default recipe detail and grocery list reads
+take their names from the catalog.
+"""
+
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+
+from models import Brand, Category, Ingredient, MealPlan, MealType, Recipe
+from models import RecipeIngredient
+from services.recipes import get_recipe_detail
+
+
+@pytest_asyncio.fixture
+async def pantry(async_db_session):
+    """Three ingredients sharing a category, one with a brand."""
+    category = Category(name="Pantry")
+    brand = Brand(name="Acme")
+    ingredients = [
+        Ingredient(name="Flour", category=category, brand=brand),
+        Ingredient(name="Sugar", category=category),
+        Ingredient(name="Salt"),
+    ]
+    async_db_session.add_all(ingredients)
+    await async_db_session.flush()
+    return ingredients
+
+
+@pytest.mark.integration
+class TestCatalogLookups:
+    """Test serving catalog rows from memory."""
+
+    @pytest.mark.asyncio
+    async def test_misses_fetched_once_then_served_from_memory(
+        self, async_db_session, count_queries, fresh_catalog, pantry
+    ):
+        ids = [ingredient.id for ingredient in pantry]
+
+        with count_queries() as cold:
+            details = await fresh_catalog.ingredient_details(async_db_session, ids)
+        with count_queries() as warm:
+            again = await fresh_catalog.ingredient_details(async_db_session, ids)
+
+        assert cold.count == 3
+        assert warm.count == 0
+        assert again == details
+        flour = details[pantry[0].id]
+        assert (flour.name, flour.category.name, flour.brand.name) == (
+            "Flour",
+            "Pantry",
+            "Acme",
+        )
+        assert details[pantry[2].id].category is None
+        stats = fresh_catalog.stats()["ingredients"]
+        assert (stats["hits"], stats["misses"]) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_warm_loads_every_table(
+        self, async_db_session, count_queries, fresh_catalog, pantry
+    ):
+        assert await fresh_catalog.warm(async_db_session) >= 5
+
+        with count_queries() as queries:
+            await fresh_catalog.ingredient_details(
+                async_db_session, [ingredient.id for ingredient in pantry]
+            )
+
+        assert queries.count == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_ids_are_left_out(self, async_db_session, fresh_catalog):
+        assert await fresh_catalog.ingredients(async_db_session, [-1, None]) == {}
+        assert len(fresh_catalog.caches["ingredients"]) == 0
+
+
+@pytest.mark.integration
+class TestCatalogInvalidation:
+    """Test evicting rows written through a session."""
+
+    @pytest.mark.asyncio
+    async def test_commit_evicts_updated_rows(
+        self, async_db_session, fresh_catalog, pantry
+    ):
+        session = async_db_session
+        flour, sugar, _ = pantry
+        await fresh_catalog.warm(session)
+
+        flour.name = "Bread flour"
+        await session.commit()
+
+        cache = fresh_catalog.caches["ingredients"]
+        assert flour.id not in cache
+        assert sugar.id in cache
+        found = await fresh_catalog.ingredients(session, [flour.id])
+        assert found[flour.id].name == "Bread flour"
+
+    @pytest.mark.asyncio
+    async def test_flush_alone_does_not_evict(
+        self, async_db_session, fresh_catalog, pantry
+    ):
+        await fresh_catalog.warm(async_db_session)
+
+        pantry[0].name = "Bread flour"
+        await async_db_session.flush()
+
+        assert pantry[0].id in fresh_catalog.caches["ingredients"]
+
+    @pytest.mark.asyncio
+    async def test_rollback_evicts_rows_read_inside_the_transaction(
+        self, async_db_session, fresh_catalog, pantry
+    ):
+        session = async_db_session
+        await session.commit()
+        category = pantry[0].category
+        category.name = "Baking"
+        await session.flush()
+        # Cached while the rename is visible only to this transaction
+        await fresh_catalog.categories(session, [category.id])
+        category_id = category.id
+
+        await session.rollback()
+
+        assert category_id not in fresh_catalog.caches["categories"]
+
+    @pytest.mark.asyncio
+    async def test_update_statement_evicts_the_table(
+        self, async_db_session, fresh_catalog, pantry
+    ):
+        session = async_db_session
+        await fresh_catalog.warm(session)
+
+        await session.execute(
+            update(Brand).where(Brand.name == "Acme").values(name="Acme Foods")
+        )
+        await session.commit()
+
+        assert len(fresh_catalog.caches["brands"]) == 0
+        assert len(fresh_catalog.caches["ingredients"]) > 0
+
+
+@pytest.mark.integration
+class TestCachedRecipeDetail:
+    """Test the recipe detail strategy backed by the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_matches_selectin_in_one_statement(
+        self, async_db_session, count_queries, fresh_catalog, pantry
+    ):
+        session = async_db_session
+        recipe = Recipe(
+            name="Bread",
+            recipe_ingredients=[
+                RecipeIngredient(ingredient=ingredient, display_order=order)
+                for order, ingredient in enumerate(pantry, start=1)
+            ],
+        )
+        session.add(recipe)
+        await session.flush()
+        expected = await get_recipe_detail(session, recipe.id, "selectin")
+        await fresh_catalog.warm(session)
+
+        with count_queries() as queries:
+            detail = await get_recipe_detail(session, recipe.id, "cached")
+
+        assert queries.count == 1
+        assert detail == expected
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint(
+        self, api_client, async_db_session, fresh_catalog, pantry
+    ):
+        await fresh_catalog.warm(async_db_session)
+
+        response = await api_client.get("/catalog-cache")
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert set(stats) == {"categories", "brands", "ingredients"}
+        assert stats["ingredients"]["size"] > 0
+        assert {"hits", "misses", "hit_ratio"} <= set(stats["brands"])
+
+
+@pytest.mark.integration
+class TestDefaultReadPaths:
+    """Test that the default read endpoints are served by the catalog."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/recipes/{recipe_id}",
+            "/grocery-list?start_date=2025-03-03&end_date=2025-03-09",
+            "/grocery-list/weeks/2025-03-03",
+        ],
+    )
+    async def test_warm_catalog_serves_names(
+        self, api_client, async_db_session, fresh_catalog, pantry, path
+    ):
+        session = async_db_session
+        recipe = Recipe(
+            name="Bread",
+            recipe_ingredients=[
+                RecipeIngredient(ingredient=ingredient, quantity=1, unit="g")
+                for ingredient in pantry
+            ],
+        )
+        session.add(
+            MealPlan(
+                recipe=recipe, planned_date=date(2025, 3, 4), meal_type=MealType.DINNER
+            )
+        )
+        await session.flush()
+        await fresh_catalog.warm(session)
+
+        response = await api_client.get(path.format(recipe_id=recipe.id))
+
+        assert response.status_code == 200
+        assert "Flour" in response.text and "Pantry" in response.text
+        stats = fresh_catalog.stats()
+        assert stats["ingredients"]["hits"] == len(pantry)
+        assert stats["categories"]["hits"] == 1
+        assert all(table["misses"] == 0 for table in stats.values())
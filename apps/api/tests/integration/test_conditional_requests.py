@@ -0,0 +1,193 @@
+"""
+Integration tests for HTTP conditional requests.
+
+These tests verify that recipe details and meal plan listings carry
+ETag/Last-Modified headers, that a matching If-None-Match is answered with
+304 after a single aggregate query, and that every kind of change to the
+rows behind a response - including deletes, which leave no updated_at
+behind - produces a new ETag.
+
+All writes of a test share one transaction, where now() does not advance,
+so "later" writes set updated_at explicitly.
+"""
+
+from datetime import date, datetime
+
+import pytest
+import pytest_asyncio
+
+from models import Category, Ingredient, MealPlan, MealType, Recipe
+from models import RecipeIngredient
+
+LATER = datetime(2030, 1, 1, 8, 0, 0)
+WEEK = "/meal-plans?start_date=2025-03-03&end_date=2025-03-09"
+
+
+@pytest_asyncio.fixture
+async def recipe(async_db_session):
+    """A recipe with two lines, one ingredient in a category."""
+    recipe = Recipe(
+        name="Soup",
+        recipe_ingredients=[
+            RecipeIngredient(
+                ingredient=Ingredient(name="Leek", category=Category(name="Produce")),
+                display_order=1,
+            ),
+            RecipeIngredient(ingredient=Ingredient(name="Salt"), display_order=2),
+        ],
+    )
+    async_db_session.add(recipe)
+    await async_db_session.flush()
+    return recipe
+
+
+async def _etag(api_client, url):
+    response = await api_client.get(url)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+@pytest.mark.integration
+class TestRecipeDetailConditional:
+    """Test conditional GET /recipes/{recipe_id}."""
+
+    @pytest.mark.asyncio
+    async def test_validators_on_response(self, api_client, recipe):
+        response = await api_client.get(f"/recipes/{recipe.id}")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["last-modified"].endswith(" GMT")
+        assert response.headers["cache-control"] == "no-cache"
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_is_304_after_one_query(
+        self, api_client, count_queries, recipe
+    ):
+        url = f"/recipes/{recipe.id}"
+        etag = await _etag(api_client, url)
+
+        with count_queries() as queries:
+            response = await api_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert queries.count == 1
+
+    @pytest.mark.asyncio
+    async def test_if_modified_since(self, api_client, recipe):
+        url = f"/recipes/{recipe.id}"
+        last_modified = (await api_client.get(url)).headers["last-modified"]
+
+        response = await api_client.get(
+            url, headers={"If-Modified-Since": last_modified}
+        )
+
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("change", ["recipe", "line", "category", "deleted line"])
+    async def test_change_gives_new_etag(
+        self, api_client, async_db_session, recipe, change
+    ):
+        url = f"/recipes/{recipe.id}"
+        etag = await _etag(api_client, url)
+        leek, salt = recipe.recipe_ingredients
+
+        if change == "recipe":
+            recipe.updated_at = LATER
+        elif change == "line":
+            salt.updated_at = LATER
+        elif change == "category":
+            leek.ingredient.category.updated_at = LATER
+        else:
+            await async_db_session.delete(salt)
+        await async_db_session.commit()
+
+        response = await api_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_missing_recipe_has_no_validators(self, api_client):
+        response = await api_client.get("/recipes/0", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+
+@pytest.mark.integration
+class TestMealPlanListingConditional:
+    """Test conditional GET /meal-plans for a week."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_week_is_304(self, api_client, async_db_session, recipe):
+        async_db_session.add(
+            MealPlan(
+                recipe=recipe, planned_date=date(2025, 3, 3), meal_type=MealType.LUNCH
+            )
+        )
+        await async_db_session.flush()
+        etag = await _etag(api_client, WEEK)
+
+        response = await api_client.get(WEEK, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_plan_outside_the_week_keeps_etag(self, api_client, async_db_session):
+        etag = await _etag(api_client, WEEK)
+        async_db_session.add(
+            MealPlan(planned_date=date(2025, 4, 1), meal_type=MealType.LUNCH)
+        )
+        await async_db_session.commit()
+
+        assert await _etag(api_client, WEEK) == etag
+
+    @pytest.mark.asyncio
+    async def test_deleted_recipe_gives_new_etag(
+        self, api_client, async_db_session, recipe
+    ):
+        async_db_session.add(
+            MealPlan(
+                recipe=recipe, planned_date=date(2025, 3, 4), meal_type=MealType.DINNER
+            )
+        )
+        await async_db_session.commit()
+        etag = await _etag(api_client, WEEK)
+
+        # ON DELETE SET NULL rewrites the plan without touching updated_at
+        await async_db_session.delete(recipe)
+        await async_db_session.commit()
+
+        assert await _etag(api_client, WEEK) != etag
+
+    @pytest.mark.asyncio
+    async def test_each_page_has_its_own_etag(self, api_client, async_db_session):
+        async_db_session.add_all(
+            MealPlan(planned_date=date(2025, 3, day), meal_type=MealType.LUNCH)
+            for day in range(3, 10)
+        )
+        await async_db_session.flush()
+        first = await api_client.get(f"{WEEK}&limit=3")
+        cursor = first.json()["next_cursor"]
+        second_page = f"{WEEK}&limit=3&cursor={cursor}"
+
+        second = await api_client.get(second_page)
+        revalidated = await api_client.get(
+            second_page, headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert second.headers["etag"] != first.headers["etag"]
+        assert await _etag(api_client, f"{WEEK}&limit=4") != first.headers["etag"]
+        assert revalidated.status_code == 200
+        assert revalidated.json() == second.json()
+
+    @pytest.mark.asyncio
+    async def test_other_endpoints_have_no_validators(self, api_client):
+        response = await api_client.get("/recipes")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
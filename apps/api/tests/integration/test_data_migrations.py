@@ -0,0 +1,126 @@
+"""
+Integration tests for migrations over existing rows.
+
+Each test runs on a scratch copy of the test database, moved down to the
+revision before the migration, loaded with rows, and upgraded again: a
+backfill converts the rows, and a new constraint that existing rows
+break fails the upgrade rather than deleting them.
+"""
+
+from decimal import Decimal
+
+import pytest
+from alembic import command
+from sqlalchemy import create_engine, text
+
+
+def _engine(alembic_cfg):
+    return create_engine(alembic_cfg.get_main_option("sqlalchemy.url"))
+
+
+@pytest.mark.integration
+class TestBaseQuantityBackfill:
+    """Test the base_quantity backfill of revision 8263ff324382."""
+
+    def test_existing_lines_are_converted(self, migration_database):
+        command.downgrade(migration_database, "52e21a81b390")
+        engine = _engine(migration_database)
+        try:
+            with engine.begin() as conn:
+                recipe_id = conn.execute(
+                    text("INSERT INTO recipes (name) VALUES ('Soup') RETURNING id")
+                ).scalar_one()
+                ingredient_id = conn.execute(
+                    text("INSERT INTO ingredients (name) VALUES ('Leek') RETURNING id")
+                ).scalar_one()
+                conn.execute(
+                    text(
+                        "INSERT INTO recipe_ingredients"
+                        " (recipe_id, ingredient_id, quantity, unit)"
+                        " VALUES (:recipe, :ingredient, :quantity, :unit)"
+                    ),
+                    [
+                        {"quantity": quantity, "unit": unit}
+                        | {"recipe": recipe_id, "ingredient": ingredient_id}
+                        for quantity, unit in [
+                            (2, "Tbsp."),
+                            (1, "2 lbs"),
+                            (3, "Cloves"),
+                            (None, "cup"),
+                            (4, None),
+                        ]
+                    ],
+                )
+
+            command.upgrade(migration_database, "8263ff324382")
+
+            with engine.connect() as conn:
+                rows = conn.execute(
+                    text(
+                        "SELECT base_quantity, base_unit FROM recipe_ingredients"
+                        " ORDER BY id"
+                    )
+                ).all()
+        finally:
+            engine.dispose()
+
+        assert [tuple(row) for row in rows] == [
+            (Decimal("29.5735"), "ml"),
+            (Decimal("907.1847"), "g"),
+            (Decimal("3.0000"), "clove"),
+            (None, "ml"),
+            (Decimal("4.0000"), None),
+        ]
+
+
+@pytest.mark.integration
+class TestUniqueMealPlanSlot:
+    """Test that revision c7a1f4d8e260 refuses to drop duplicate plans."""
+
+    def _plan(self, conn, planned_date, meal_type):
+        conn.execute(
+            text(
+                "INSERT INTO meal_plans (planned_date, meal_type)"
+                " VALUES (:planned_date, :meal_type)"
+            ),
+            {"planned_date": planned_date, "meal_type": meal_type},
+        )
+
+    def test_duplicates_fail_the_upgrade(self, migration_database):
+        command.downgrade(migration_database, "b5d3e9f1a274")
+        engine = _engine(migration_database)
+        try:
+            with engine.begin() as conn:
+                self._plan(conn, "2025-03-03", "LUNCH")
+                self._plan(conn, "2025-03-03", "LUNCH")
+                self._plan(conn, "2025-03-03", "DINNER")
+
+            with pytest.raises(RuntimeError) as error:
+                command.upgrade(migration_database, "c7a1f4d8e260")
+
+            with engine.connect() as conn:
+                plans = conn.execute(text("SELECT count(*) FROM meal_plans")).scalar()
+        finally:
+            engine.dispose()
+
+        assert plans == 3
+        assert "1 meal plan slots hold more than one plan" in str(error.value)
+        assert "2025-03-03 LUNCH: meal_plans.id" in str(error.value)
+        assert "DINNER" not in str(error.value)
+
+    def test_upgrade_after_dedup(self, migration_database):
+        command.downgrade(migration_database, "b5d3e9f1a274")
+        engine = _engine(migration_database)
+        try:
+            with engine.begin() as conn:
+                self._plan(conn, "2025-03-03", "LUNCH")
+                self._plan(conn, "2025-03-03", "DINNER")
+
+            command.upgrade(migration_database, "head")
+
+            with engine.connect() as conn:
+                plans = conn.execute(text("SELECT count(*) FROM meal_plans")).scalar()
+        finally:
+            engine.dispose()
+
+        assert plans == 2
@@ -0,0 +1,115 @@
+"""
+Integration tests for the shared async engine and connection pool.
+
+These tests verify that sessions handed out by core.db reuse pooled
+connections instead of opening a new one per request.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.util import greenlet_spawn
+
+from core.db import dispose_db, get_session, init_db, pool_stats
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSharedEngine:
+    """Test the process-wide engine, session dependency and pool metrics."""
+
+    async def test_sessions_reuse_pooled_connection(self, test_settings):
+        """Sequential sessions check out the same pooled connection."""
+        init_db(test_settings.model_copy(update={"DB_POOL_SIZE": 2}))
+        try:
+            for _ in range(5):
+                async for session in get_session():
+                    assert await session.scalar(text("SELECT 1")) == 1
+
+            stats = pool_stats()
+            assert stats["checkouts"] == 5
+            assert stats["checked_out"] == 0
+            # Only one physical connection was ever opened
+            assert stats["checked_in"] == 1
+        finally:
+            await dispose_db()
+
+    async def test_saturation_reported_while_connections_held(self, test_settings):
+        """Saturation reflects connections checked out of the pool."""
+        init_db(
+            test_settings.model_copy(update={"DB_POOL_SIZE": 2, "DB_MAX_OVERFLOW": 2})
+        )
+        try:
+            held = asyncio.Event()
+            release = asyncio.Event()
+
+            async def hold_connection():
+                async for session in get_session():
+                    await session.execute(text("SELECT 1"))
+                    held.set()
+                    await release.wait()
+
+            task = asyncio.create_task(hold_connection())
+            await held.wait()
+            assert pool_stats()["saturation"] == pytest.approx(1 / 4)
+
+            release.set()
+            await task
+            assert pool_stats()["saturation"] == 0
+        finally:
+            await dispose_db()
+
+    async def test_pool_stats_empty_before_startup(self):
+        """No engine means no metrics rather than an error."""
+        assert pool_stats() == {}
+
+    async def test_waiting_checkouts_are_served_in_order(self, test_settings):
+        """Callers waiting on a saturated pool are served first come, first served."""
+        pool = init_db(
+            test_settings.model_copy(update={"DB_POOL_SIZE": 1, "DB_MAX_OVERFLOW": 0})
+        ).sync_engine.pool
+        try:
+            served = []
+
+            async def checkout(name):
+                connection = await greenlet_spawn(pool.connect)
+                served.append(name)
+                await greenlet_spawn(connection.close)
+
+            await checkout("warm-up")
+            connection = await greenlet_spawn(pool.connect)
+            waiters = []
+            for i in range(3):
+                waiters.append(asyncio.create_task(checkout(i)))
+                # Let each waiter queue up before the next one arrives
+                await asyncio.sleep(0.01)
+            await greenlet_spawn(connection.close)
+            # Asking again before the woken waiter has run does not jump the queue
+            await checkout("late")
+            await asyncio.gather(*waiters)
+
+            assert served == ["warm-up", 0, 1, 2, "late"]
+            assert pool_stats()["checked_out"] == 0
+        finally:
+            await dispose_db()
+
+    async def test_checkout_times_out_when_saturated(self, test_settings):
+        """Waiting longer than DB_POOL_TIMEOUT raises and is counted."""
+        init_db(
+            test_settings.model_copy(
+                update={"DB_POOL_SIZE": 1, "DB_MAX_OVERFLOW": 0, "DB_POOL_TIMEOUT": 0.1}
+            )
+        )
+        try:
+            async for session in get_session():
+                await session.execute(text("SELECT 1"))
+                with pytest.raises(exc.TimeoutError):
+                    async for other in get_session():
+                        await other.execute(text("SELECT 1"))
+
+            assert pool_stats()["timeouts"] == 1
+            async for session in get_session():
+                assert await session.scalar(text("SELECT 1")) == 1
+        finally:
+            await dispose_db()
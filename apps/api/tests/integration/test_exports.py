@@ -0,0 +1,184 @@
+"""
+Integration tests for streaming exports.
+
+These tests verify that recipe exports read back through the importer
+unchanged in both formats, that rows are regrouped correctly across
+server-side cursor partitions, and that the export endpoints stream files
+whose meal plans refer to recipes of the recipe export.
+"""
+
+import csv
+import io
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from models import MealPlan, MealType, Recipe
+from schemas.recipe import RecipeRecord
+from services.exports import export_recipes, iter_recipe_records
+from services.recipe_files import read_recipes
+from services.recipe_import import import_recipes
+
+RECIPES = [
+    RecipeRecord(
+        name="Pancakes",
+        description='Fluffy, "American" style',
+        instructions="Whisk.\nFry, flip, fry.",
+        servings=4,
+        prep_time_minutes=5,
+        cook_time_minutes=10,
+        ingredients=[
+            {
+                "ingredient": "Flour",
+                "category": "Pantry",
+                "brand": "Acme",
+                "quantity": "200.00",
+                "unit": "g",
+                "display_order": 1,
+            },
+            {
+                "ingredient": "Syrup",
+                "preparation": "warmed",
+                "display_order": 2,
+                "is_optional": True,
+            },
+        ],
+    ),
+    RecipeRecord(name="Water"),
+    RecipeRecord(
+        name="Toast",
+        ingredients=[{"ingredient": "Bread", "quantity": "2.00", "unit": "slice"}],
+    ),
+]
+
+
+def _sessions(session):
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+async def _export(session, format):
+    return "".join(
+        [chunk async for chunk in export_recipes(_sessions(session), format)]
+    )
+
+
+def _without_refs(records):
+    return [record.model_copy(update={"recipe_ref": None}) for record in records]
+
+
+@pytest.mark.integration
+class TestRecipeExport:
+    """Test exporting recipes and importing them back."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format", ["jsonl", "csv"])
+    async def test_round_trip(self, async_db_session, format):
+        session = async_db_session
+        await import_recipes(session, RECIPES)
+
+        exported = list(
+            read_recipes(io.StringIO(await _export(session, format)), format)
+        )
+        assert _without_refs(exported) == RECIPES
+
+        await import_recipes(session, exported)
+        again = list(read_recipes(io.StringIO(await _export(session, format)), format))
+        assert _without_refs(again) == RECIPES * 2
+
+    @pytest.mark.asyncio
+    async def test_groups_lines_across_partitions(self, async_db_session):
+        session = async_db_session
+        await import_recipes(session, RECIPES)
+
+        records = [
+            record async for record in iter_recipe_records(session, batch_size=1)
+        ]
+
+        assert [len(record.ingredients) for record in records] == [2, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_reads_through_server_side_cursor(self, async_db_session):
+        session = async_db_session
+        await import_recipes(session, RECIPES)
+
+        count_cursors = text("SELECT count(*) FROM pg_cursors")
+        before = await session.scalar(count_cursors)
+
+        records = iter_recipe_records(session, batch_size=1)
+        await anext(records)
+        during = await session.scalar(count_cursors)
+        await records.aclose()
+
+        assert during == before + 1
+
+
+@pytest.mark.integration
+class TestExportEndpoints:
+    """Test GET /recipes/export and /meal-plans/export."""
+
+    @pytest.mark.asyncio
+    async def test_recipe_export_streams_ndjson(self, api_client, async_db_session):
+        await import_recipes(async_db_session, RECIPES)
+
+        response = await api_client.get("/recipes/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="recipes.jsonl"' in response.headers["content-disposition"]
+        assert len(response.text.splitlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_meal_plan_export_refers_to_recipe_refs(
+        self, api_client, async_db_session
+    ):
+        session = async_db_session
+        recipe = Recipe(name="Soup")
+        session.add_all(
+            [
+                MealPlan(
+                    recipe=recipe,
+                    planned_date=date(2025, 3, 3),
+                    meal_type=MealType.LUNCH,
+                    notes="Double, please",
+                ),
+                MealPlan(planned_date=date(2025, 3, 4), meal_type=MealType.DINNER),
+                MealPlan(planned_date=date(2025, 4, 1), meal_type=MealType.DINNER),
+            ]
+        )
+        await session.flush()
+
+        response = await api_client.get(
+            "/meal-plans/export",
+            params={"format": "csv", "end_date": "2025-03-31"},
+        )
+        recipes = await api_client.get("/recipes/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [(row["planned_date"], row["meal_type"]) for row in rows] == [
+            ("2025-03-03", "lunch"),
+            ("2025-03-04", "dinner"),
+        ]
+        assert rows[0]["notes"] == "Double, please"
+        assert rows[0]["recipe_name"] == "Soup"
+        assert rows[1]["recipe_ref"] == ""
+        recipe_refs = {
+            row["recipe_ref"] for row in csv.DictReader(io.StringIO(recipes.text))
+        }
+        assert rows[0]["recipe_ref"] in recipe_refs
+
+    @pytest.mark.asyncio
+    async def test_meal_plan_export_rejects_inverted_range(self, api_client):
+        response = await api_client.get(
+            "/meal-plans/export",
+            params={"start_date": "2025-03-10", "end_date": "2025-03-01"},
+        )
+
+        assert response.status_code == 400
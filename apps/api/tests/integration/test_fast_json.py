@@ -0,0 +1,114 @@
+"""
+Integration tests for fast JSON listing responses.
+
+These tests verify that with FAST_JSON_RESPONSES on every listing endpoint
+returns the same bytes as the validated Pydantic path, cursors included,
+without validating anything on the way.
+"""
+
+from datetime import date
+
+import fastapi.routing
+import pytest
+import pytest_asyncio
+
+from core.config import settings
+from models import Category, Ingredient, MealPlan, MealType, Recipe
+from schemas.ingredient import IngredientSummary
+from schemas.meal_plan import MealPlanSummary
+from schemas.recipe import RecipeSummary
+
+LISTINGS = [
+    "/recipes?limit=2",
+    "/ingredients?limit=2",
+    "/meal-plans?limit=2",
+    "/meal-plans?start_date=2025-03-04&end_date=2025-03-04",
+]
+
+
+@pytest_asyncio.fixture
+async def listed(async_db_session):
+    """Three recipes, ingredients and meal plans, with non-ASCII text."""
+    session = async_db_session
+    herbs = Category(name="Herbes")
+    recipes = [
+        Recipe(name="Crème brûlée", servings=4, prep_time_minutes=20),
+        Recipe(name="Pho", description="Bún phở"),
+        Recipe(name="Soup"),
+    ]
+    session.add_all(
+        [
+            *recipes,
+            Ingredient(name="Cerfeuil", category=herbs),
+            Ingredient(name="Crème fraîche"),
+            Ingredient(name="Leek"),
+            MealPlan(
+                planned_date=date(2025, 3, 3),
+                meal_type=MealType.LUNCH,
+                recipe=recipes[0],
+                notes="Dessert — à partager",
+            ),
+            MealPlan(planned_date=date(2025, 3, 3), meal_type=MealType.DINNER),
+            MealPlan(
+                planned_date=date(2025, 3, 4),
+                meal_type=MealType.LUNCH,
+                recipe=recipes[1],
+            ),
+        ]
+    )
+    await session.flush()
+
+
+@pytest.mark.integration
+class TestFastJSONResponses:
+    """Test that fast listings are byte-identical to validated ones."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url", LISTINGS)
+    async def test_same_body(self, api_client, listed, monkeypatch, url):
+        # Each mode must compute its body rather than read the other's
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+        validated = await api_client.get(url)
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        fast = await api_client.get(url)
+
+        assert validated.status_code == fast.status_code == 200
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.content == validated.content
+
+    @pytest.mark.asyncio
+    async def test_next_page(self, api_client, listed, monkeypatch):
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        first = (await api_client.get("/recipes?limit=2")).json()
+
+        second = await api_client.get(f"/recipes?limit=2&cursor={first['next_cursor']}")
+
+        assert [item["name"] for item in second.json()["items"]] == ["Soup"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_is_validated(self, api_client, listed, monkeypatch):
+        validated = []
+        serialize_response = fastapi.routing.serialize_response
+
+        async def record(**kwargs):
+            validated.append(kwargs["field"])
+            return await serialize_response(**kwargs)
+
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        monkeypatch.setattr(fastapi.routing, "serialize_response", record)
+        for summary in (RecipeSummary, IngredientSummary, MealPlanSummary):
+            monkeypatch.setattr(summary, "model_validate", validated.append)
+
+        for url in LISTINGS:
+            assert (await api_client.get(url)).status_code == 200
+
+        assert validated == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, api_client, monkeypatch):
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+
+        response = await api_client.get("/ingredients?cursor=bogus")
+
+        assert response.status_code == 400
@@ -0,0 +1,172 @@
+"""
+Integration tests for grocery list aggregation.
+
+These tests verify that the set-based aggregation sums quantities per
+ingredient and unit across every meal planned in a date range.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import event
+
+from models import Category, Ingredient, MealPlan, MealType, Recipe, RecipeIngredient
+from services.grocery import build_grocery_list
+
+
+@pytest_asyncio.fixture
+async def planned_week(async_db_session):
+    """Two recipes planned across a week, sharing some ingredients."""
+    session = async_db_session
+    dairy = Category(name="Dairy")
+    produce = Category(name="Produce")
+    butter = Ingredient(name="Butter", category=dairy)
+    onion = Ingredient(name="Onion", category=produce)
+    salt = Ingredient(name="Salt")
+    oil = Ingredient(name="Olive Oil")
+    parsley = Ingredient(name="Parsley", category=produce)
+    risotto = Recipe(name="Risotto")
+    soup = Recipe(name="Onion Soup")
+    session.add_all([dairy, produce, butter, onion, salt, oil, parsley, risotto, soup])
+    await session.flush()
+
+    session.add_all(
+        [
+            RecipeIngredient(
+                recipe=risotto, ingredient=butter, quantity=Decimal("25.50"), unit="g"
+            ),
+            RecipeIngredient(
+                recipe=risotto, ingredient=onion, quantity=1, unit="whole"
+            ),
+            RecipeIngredient(
+                recipe=risotto, ingredient=oil, quantity=1, unit="Tablespoon"
+            ),
+            RecipeIngredient(
+                recipe=risotto,
+                ingredient=parsley,
+                quantity=Decimal("0.25"),
+                unit="cup",
+                is_optional=True,
+            ),
+            RecipeIngredient(
+                recipe=soup, ingredient=butter, quantity=Decimal("40.25"), unit="g"
+            ),
+            RecipeIngredient(recipe=soup, ingredient=onion, quantity=3, unit="pieces"),
+            RecipeIngredient(recipe=soup, ingredient=oil, quantity=2, unit="15 ml"),
+            RecipeIngredient(recipe=soup, ingredient=butter, quantity=1, unit="tbsp"),
+            RecipeIngredient(recipe=soup, ingredient=salt, quantity=None, unit=None),
+            MealPlan(
+                recipe=risotto, planned_date=date(2025, 3, 3), meal_type=MealType.LUNCH
+            ),
+            MealPlan(
+                recipe=soup, planned_date=date(2025, 3, 4), meal_type=MealType.DINNER
+            ),
+            MealPlan(
+                recipe=risotto, planned_date=date(2025, 3, 5), meal_type=MealType.DINNER
+            ),
+            # Outside the range - must not be counted
+            MealPlan(
+                recipe=soup, planned_date=date(2025, 3, 20), meal_type=MealType.LUNCH
+            ),
+            # Empty slot left behind by a deleted recipe
+            MealPlan(
+                recipe_id=None, planned_date=date(2025, 3, 6), meal_type=MealType.LUNCH
+            ),
+        ]
+    )
+    await session.flush()
+    return session
+
+
+def _by_key(items):
+    return {(item.ingredient_name, item.unit): item for item in items}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestGroceryListGeneration:
+    """Test grocery aggregation against the database."""
+
+    async def test_quantities_summed_per_ingredient_and_unit(self, planned_week):
+        """Same ingredient and unit across meals collapses to one line."""
+        grocery_list = await build_grocery_list(
+            planned_week, date(2025, 3, 3), date(2025, 3, 9)
+        )
+        items = _by_key(item for aisle in grocery_list.aisles for item in aisle.items)
+
+        assert items[("Butter", "g")].quantity == Decimal("91.25")
+        assert items[("Butter", "g")].line_count == 3
+        # Mass and volume never mix
+        assert items[("Butter", "ml")].quantity == Decimal("14.7868")
+
+    async def test_unit_spellings_summed_in_base_unit(self, planned_week):
+        """ "Tablespoon" and "15 ml", "whole" and "pieces" sum together."""
+        grocery_list = await build_grocery_list(
+            planned_week, date(2025, 3, 3), date(2025, 3, 9)
+        )
+        items = _by_key(item for aisle in grocery_list.aisles for item in aisle.items)
+
+        assert items[("Olive Oil", "ml")].quantity == Decimal("59.5736")
+        assert items[("Onion", "each")].quantity == Decimal("5.0000")
+
+    async def test_quantity_keeps_numeric_precision(self, planned_week):
+        """Summed quantities come back as Decimal, not float."""
+        grocery_list = await build_grocery_list(
+            planned_week, date(2025, 3, 3), date(2025, 3, 9)
+        )
+        butter = _by_key(grocery_list.aisles[0].items)[("Butter", "g")]
+
+        assert isinstance(butter.quantity, Decimal)
+
+    async def test_optional_items_split_out(self, planned_week):
+        """Optional ingredients are listed separately from required ones."""
+        grocery_list = await build_grocery_list(
+            planned_week, date(2025, 3, 3), date(2025, 3, 9)
+        )
+
+        assert [item.ingredient_name for item in grocery_list.optional_items] == [
+            "Parsley"
+        ]
+        assert grocery_list.optional_items[0].quantity == Decimal("118.2942")
+
+    async def test_items_grouped_into_category_aisles(self, planned_week):
+        """Aisles follow category name with uncategorised items last."""
+        grocery_list = await build_grocery_list(
+            planned_week, date(2025, 3, 3), date(2025, 3, 9)
+        )
+
+        assert [aisle.category_name for aisle in grocery_list.aisles] == [
+            "Dairy",
+            "Produce",
+            None,
+        ]
+        salt = grocery_list.aisles[-1].items[-1]
+        assert salt.ingredient_name == "Salt"
+        assert salt.quantity is None
+
+    async def test_single_round_trip(self, planned_week, fresh_catalog):
+        """With a warm catalog cache the list is a single SQL statement."""
+        await fresh_catalog.warm(planned_week)
+        statements = []
+        sync_engine = planned_week.bind.sync_engine
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", count)
+        try:
+            await build_grocery_list(planned_week, date(2025, 3, 3), date(2025, 3, 9))
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count)
+
+        assert len(statements) == 1
+
+    async def test_empty_range_returns_empty_list(self, planned_week):
+        """A range without planned meals yields an empty list."""
+        grocery_list = await build_grocery_list(
+            planned_week, date(2024, 1, 1), date(2024, 1, 7)
+        )
+
+        assert grocery_list.aisles == []
+        assert grocery_list.optional_items == []
@@ -0,0 +1,94 @@
+"""
+Integration tests for the liveness and readiness endpoints.
+
+These tests verify that readiness probes the database through the shared
+pool, that repeated polls reuse one result, and that a saturated pool or
+an unreachable server is reported as unavailable within the timeout.
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from core.db import dispose_db, get_engine, init_db, pool_stats
+from main import readiness
+
+
+@pytest_asyncio.fixture
+async def ready_check(monkeypatch):
+    """The app's readiness check, empty, with a short timeout."""
+    monkeypatch.setattr(readiness, "timeout", 0.2)
+    readiness.reset()
+    yield readiness
+    readiness.reset()
+
+
+@pytest_asyncio.fixture
+async def shared_engine(test_settings):
+    """The shared engine with one connection and no overflow."""
+    init_db(test_settings.model_copy(update={"DB_POOL_SIZE": 1, "DB_MAX_OVERFLOW": 0}))
+    yield get_engine()
+    await dispose_db()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestHealthEndpoints:
+    """Test liveness and readiness over HTTP."""
+
+    async def test_liveness_does_not_touch_the_database(self, api_client):
+        for path in ("/health", "/health/live"):
+            response = await api_client.get(path)
+            assert response.json() == {"status": "healthy"}
+
+    async def test_ready_through_the_pool(self, api_client, ready_check, shared_engine):
+        responses = [await api_client.get("/health/ready") for _ in range(5)]
+
+        assert [r.status_code for r in responses] == [200] * 5
+        assert responses[0].json()["status"] == "ready"
+        assert ready_check.probes == 1
+        assert pool_stats()["checkouts"] == 1
+        assert pool_stats()["checked_out"] == 0
+
+    async def test_saturated_pool_is_unavailable(
+        self, api_client, ready_check, shared_engine
+    ):
+        async with shared_engine.connect() as held:
+            await held.execute(text("SELECT 1"))
+            start = time.perf_counter()
+            response = await api_client.get("/health/ready")
+            elapsed = time.perf_counter() - start
+
+        assert response.status_code == 503
+        assert response.json()["database"]["error"] == "No answer within 0.2s"
+        assert elapsed < 1
+        # The abandoned checkout did not leave a connection behind
+        await asyncio.sleep(0)
+        assert pool_stats()["checked_out"] == 0
+
+    async def test_unreachable_server_is_unavailable(
+        self, api_client, ready_check, test_settings
+    ):
+        url = make_url(test_settings.DATABASE_URL).set(port=1)
+        init_db(
+            test_settings.model_copy(
+                update={"DATABASE_URL": url.render_as_string(False)}
+            )
+        )
+        try:
+            response = await api_client.get("/health/ready")
+        finally:
+            await dispose_db()
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "unavailable"
+
+    async def test_not_started_is_unavailable(self, api_client, ready_check):
+        response = await api_client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["database"]["error"] == "RuntimeError"
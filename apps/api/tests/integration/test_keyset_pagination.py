@@ -0,0 +1,184 @@
+"""
+Integration tests for keyset-paginated listings.
+
+These tests verify that walking the cursors visits every row exactly once
+in order (including ties on the sort key), that the list endpoints expose
+the cursors, and that deep pages are a single index range scan.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import date, timedelta
+from sqlalchemy import text
+
+from core.explain import explain, index_names, plan_nodes
+from core.pagination import InvalidCursorError
+from models import Ingredient, MealPlan, MealType, Recipe
+from services.ingredients import list_ingredients
+from services.meal_plans import MEAL_PLAN_KEYSET, list_meal_plans, meal_plan_list_query
+from services.recipes import RECIPE_KEYSET, list_recipes, recipe_list_query
+
+START = date(2025, 3, 3)
+
+
+@pytest_asyncio.fixture
+async def recipes(async_db_session):
+    """25 recipes with repeated names so the id tie-breaker matters."""
+    session = async_db_session
+    session.add_all([Recipe(name=f"Recipe {i % 7:02d}") for i in range(25)])
+    await session.flush()
+    return session
+
+
+@pytest_asyncio.fixture
+async def meal_plans(async_db_session):
+    """Lunch and dinner for 10 days."""
+    session = async_db_session
+    session.add_all(
+        [
+            MealPlan(planned_date=START + timedelta(days=day), meal_type=meal_type)
+            for day in range(10)
+            for meal_type in (MealType.LUNCH, MealType.DINNER)
+        ]
+    )
+    await session.flush()
+    return session
+
+
+async def _walk(list_page, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = await list_page(cursor=cursor, **kwargs)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.integration
+class TestKeysetPagination:
+    """Test walking listings page by page."""
+
+    @pytest.mark.asyncio
+    async def test_recipes_visited_once_in_order(self, recipes):
+        pages = await _walk(lambda **kw: list_recipes(recipes, limit=4, **kw))
+
+        seen = [(item.name, item.id) for page in pages for item in page]
+        assert len(seen) == 25 and len(set(seen)) == 25
+        assert seen == sorted(seen)
+        assert [len(page) for page in pages] == [4] * 6 + [1]
+
+    @pytest.mark.asyncio
+    async def test_exact_multiple_ends_without_empty_page(self, recipes):
+        pages = await _walk(lambda **kw: list_recipes(recipes, limit=5, **kw))
+
+        assert [len(page) for page in pages] == [5] * 5
+
+    @pytest.mark.asyncio
+    async def test_meal_plans_in_date_range(self, meal_plans):
+        pages = await _walk(
+            lambda **kw: list_meal_plans(
+                meal_plans,
+                limit=3,
+                start_date=START + timedelta(days=2),
+                end_date=START + timedelta(days=5),
+                **kw,
+            )
+        )
+
+        dates = [item.planned_date for page in pages for item in page]
+        assert len(dates) == 8
+        assert dates == sorted(dates)
+        assert dates[0] == START + timedelta(days=2)
+
+    @pytest.mark.asyncio
+    async def test_ingredients_by_category(self, async_db_session):
+        session = async_db_session
+        session.add_all([Ingredient(name=f"Spice {i}") for i in range(3)])
+        await session.flush()
+
+        page = await list_ingredients(session, limit=10)
+
+        assert [item.name for item in page.items] == ["Spice 0", "Spice 1", "Spice 2"]
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, async_db_session):
+        with pytest.raises(InvalidCursorError):
+            await list_recipes(async_db_session, cursor="bogus")
+
+
+@pytest.mark.integration
+class TestKeysetIndexUsage:
+    """Test that a deep page is an index range scan with no sort."""
+
+    @pytest_asyncio.fixture
+    async def no_seqscan(self, async_db_session):
+        # Tiny test tables favour seq and bitmap scans (which lose the index
+        # order); forbid them so the plan shows whether the composite index
+        # alone can serve the page in order.
+        await async_db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        await async_db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+        return async_db_session
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "keyset,query,after,index",
+        [
+            (RECIPE_KEYSET, recipe_list_query, ("M", 1000), "ix_recipes_name_id"),
+            (
+                MEAL_PLAN_KEYSET,
+                meal_plan_list_query,
+                (START, 1000),
+                "ix_meal_plans_planned_date_id",
+            ),
+        ],
+        ids=["recipes", "meal_plans"],
+    )
+    async def test_page_uses_composite_index(
+        self, no_seqscan, keyset, query, after, index
+    ):
+        plan = await explain(no_seqscan, keyset.apply(query(), after, 50))
+        nodes = list(plan_nodes(plan))
+
+        assert index_names(plan) == {index}
+        assert not [node for node in nodes if node["Node Type"] == "Sort"]
+        scan = next(node for node in nodes if node.get("Index Name") == index)
+        assert scan["Node Type"] in ("Index Scan", "Index Only Scan")
+        assert "ROW(" in scan["Index Cond"]
+
+
+@pytest.mark.integration
+class TestListEndpoints:
+    """Test the cursor round trip over HTTP."""
+
+    @pytest.mark.asyncio
+    async def test_follow_next_cursor(self, api_client, recipes):
+        first = (await api_client.get("/recipes", params={"limit": 20})).json()
+        second = (
+            await api_client.get(
+                "/recipes", params={"limit": 20, "cursor": first["next_cursor"]}
+            )
+        ).json()
+
+        assert len(first["items"]) == 20 and len(second["items"]) == 5
+        assert second["next_cursor"] is None
+        assert first["items"][-1]["name"] <= second["items"][0]["name"]
+
+    @pytest.mark.asyncio
+    async def test_meal_plan_listing(self, api_client, meal_plans):
+        response = await api_client.get(
+            "/meal-plans", params={"start_date": "2025-03-12", "limit": 10}
+        )
+
+        body = response.json()
+        assert response.status_code == 200
+        assert [item["meal_type"] for item in body["items"]] == ["lunch", "dinner"]
+        assert body["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/recipes", "/ingredients", "/meal-plans"])
+    async def test_invalid_cursor_is_400(self, api_client, path):
+        response = await api_client.get(path, params={"cursor": "bogus"})
+
+        assert response.status_code == 400
@@ -0,0 +1,166 @@
+"""
+Integration tests for the meal plan calendar.
+
+These tests verify that a week or month comes back as a dense grid of
+every day and meal type with recipe names and rollups, that it is read
+with one query served index-only by the calendar index, and that the
+cached calendar follows recipe renames.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from core.explain import explain, index_names, plan_nodes
+from models import MealPlan, MealType, Recipe
+from services.meal_plans import build_calendar, calendar_query, month_range
+
+# A Wednesday
+WEDNESDAY = date(2025, 10, 15)
+MONDAY = date(2025, 10, 13)
+
+
+@pytest_asyncio.fixture
+async def planned_week(async_db_session):
+    """Soup for lunch on Monday and for dinner on Wednesday, plus a dinner
+    whose recipe was deleted on Friday and a lunch the week before."""
+    session = async_db_session
+    soup = Recipe(name="Soup")
+    session.add_all(
+        [
+            MealPlan(planned_date=MONDAY, meal_type=MealType.LUNCH, recipe=soup),
+            MealPlan(planned_date=WEDNESDAY, meal_type=MealType.DINNER, recipe=soup),
+            MealPlan(planned_date=date(2025, 10, 17), meal_type=MealType.DINNER),
+            MealPlan(planned_date=date(2025, 10, 12), meal_type=MealType.LUNCH),
+        ]
+    )
+    await session.flush()
+    return soup
+
+
+@pytest.mark.integration
+class TestCalendar:
+    """Test laying out planned meals as a calendar grid."""
+
+    @pytest.mark.asyncio
+    async def test_week_is_dense(self, async_db_session, planned_week):
+        calendar = await build_calendar(
+            async_db_session, MONDAY, MONDAY + timedelta(days=6)
+        )
+
+        assert [day.day for day in calendar.days] == [
+            MONDAY + timedelta(days=i) for i in range(7)
+        ]
+        for day in calendar.days:
+            assert [slot.meal_type for slot in day.slots] == list(MealType)
+        assert calendar.days[0].slots[0].meal.recipe_name == "Soup"
+        assert calendar.days[2].slots[1].meal.recipe_name == "Soup"
+        friday_dinner = calendar.days[4].slots[1].meal
+        assert (friday_dinner.recipe_id, friday_dinner.recipe_name) == (None, None)
+        assert calendar.days[1].slots[0].meal is None
+        assert calendar.totals.model_dump() == {
+            "start_date": MONDAY,
+            "end_date": MONDAY + timedelta(days=6),
+            "slots": 14,
+            "planned_slots": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_month_has_clipped_weekly_rollups(
+        self, async_db_session, planned_week
+    ):
+        start_date, end_date = month_range(2025, 10)
+        calendar = await build_calendar(async_db_session, start_date, end_date)
+
+        assert (start_date, end_date) == (date(2025, 10, 1), date(2025, 10, 31))
+        assert len(calendar.days) == 31
+        # October 2025 starts on a Wednesday and ends on a Friday
+        assert [(week.start_date, week.end_date) for week in calendar.weeks] == [
+            (date(2025, 10, 1), date(2025, 10, 5)),
+            (date(2025, 10, 6), date(2025, 10, 12)),
+            (date(2025, 10, 13), date(2025, 10, 19)),
+            (date(2025, 10, 20), date(2025, 10, 26)),
+            (date(2025, 10, 27), date(2025, 10, 31)),
+        ]
+        assert [week.slots for week in calendar.weeks] == [10, 14, 14, 14, 10]
+        assert [week.planned_slots for week in calendar.weeks] == [0, 1, 3, 0, 0]
+        assert calendar.totals.slots == 62
+        assert calendar.totals.planned_slots == 4
+
+    @pytest.mark.asyncio
+    async def test_one_query(self, async_db_session, planned_week, count_queries):
+        start_date, end_date = month_range(2025, 10)
+
+        with count_queries() as queries:
+            await build_calendar(async_db_session, start_date, end_date)
+
+        assert queries.count == 1
+
+    @pytest.mark.asyncio
+    async def test_month_is_an_index_only_range_scan(self, async_db_session):
+        # Tiny test tables favour seq scans and hashing every recipe; forbid
+        # them so the plan is the one a month out of years of history gets
+        for setting in ("seqscan", "bitmapscan", "hashjoin", "mergejoin"):
+            await async_db_session.execute(text(f"SET LOCAL enable_{setting} = off"))
+
+        plan = await explain(async_db_session, calendar_query(*month_range(2025, 10)))
+        nodes = list(plan_nodes(plan))
+
+        assert "uq_meal_plans_planned_date_meal_type" in index_names(plan)
+        assert not [node for node in nodes if node["Node Type"] == "Sort"]
+        scan = next(
+            node
+            for node in nodes
+            if node.get("Index Name") == "uq_meal_plans_planned_date_meal_type"
+        )
+        assert scan["Node Type"] == "Index Only Scan"
+
+
+@pytest.mark.integration
+class TestCalendarEndpoints:
+    """Test the week and month calendar endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_week_containing_a_day(self, api_client, planned_week):
+        response = await api_client.get(f"/meal-plans/calendar/weeks/{WEDNESDAY}")
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["start_date"] == str(MONDAY)
+        assert body["days"][0]["slots"][0] == {
+            "meal_type": "lunch",
+            "meal": {
+                "id": body["days"][0]["slots"][0]["meal"]["id"],
+                "recipe_id": planned_week.id,
+                "recipe_name": "Soup",
+            },
+        }
+        assert len(body["weeks"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_month(self, api_client, planned_week):
+        response = await api_client.get("/meal-plans/calendar/months/2024/2")
+
+        assert response.status_code == 200
+        assert len(response.json()["days"]) == 29
+
+    @pytest.mark.asyncio
+    async def test_invalid_month(self, api_client):
+        response = await api_client.get("/meal-plans/calendar/months/2025/13")
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_recipe_rename_invalidates(
+        self, api_client, async_db_session, planned_week
+    ):
+        url = f"/meal-plans/calendar/weeks/{MONDAY}"
+        await api_client.get(url)
+
+        planned_week.name = "Leek soup"
+        await async_db_session.commit()
+
+        body = (await api_client.get(url)).json()
+        assert body["days"][0]["slots"][0]["meal"]["recipe_name"] == "Leek soup"
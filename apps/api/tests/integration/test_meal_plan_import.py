@@ -0,0 +1,125 @@
+"""
+Integration tests for the meal plan import.
+
+These tests verify that a meal plan export imports back unchanged in both
+formats, that plans find their recipes by name once the recipes have been
+moved and took new ids, that existing slots are kept on request, and that
+an unknown recipe plans nothing.
+"""
+
+import io
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from models import MealPlan, MealType, Recipe
+from services.exports import export_meal_plans
+from services.meal_plan_import import import_meal_plans, read_meal_plans
+from services.meal_plan_scheduling import UnknownRecipeError
+
+
+def _sessions(session):
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+async def _export(session, format):
+    chunks = export_meal_plans(_sessions(session), format)
+    return "".join([chunk async for chunk in chunks])
+
+
+async def _import(session, text, format, **kwargs):
+    records = read_meal_plans(io.StringIO(text), format)
+    return await import_meal_plans(session, records, **kwargs)
+
+
+async def _plan(session):
+    soup, stew = Recipe(name="Soup"), Recipe(name="Stew")
+    session.add_all(
+        [
+            MealPlan(
+                recipe=soup,
+                planned_date=date(2025, 3, 3),
+                meal_type=MealType.LUNCH,
+                notes='Double, "please"',
+            ),
+            MealPlan(
+                recipe=stew, planned_date=date(2025, 3, 3), meal_type=MealType.DINNER
+            ),
+            MealPlan(planned_date=date(2025, 3, 4), meal_type=MealType.LUNCH),
+        ]
+    )
+    await session.flush()
+    return soup, stew
+
+
+@pytest.mark.integration
+class TestMealPlanImport:
+    """Test importing meal plan exports."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format", ["jsonl", "csv"])
+    async def test_round_trip(self, async_db_session, format):
+        session = async_db_session
+        await _plan(session)
+        exported = await _export(session, format)
+        await session.execute(delete(MealPlan))
+
+        report = await _import(session, exported, format)
+
+        assert (report.created, report.updated) == (3, 0)
+        assert await _export(session, format) == exported
+
+    @pytest.mark.asyncio
+    async def test_recipes_with_new_ids_are_found_by_name(self, async_db_session):
+        session = async_db_session
+        soup, stew = await _plan(session)
+        exported = await _export(session, "jsonl")
+        await session.execute(delete(MealPlan))
+        await session.execute(delete(Recipe))
+        # the recipes again, as the recipe import would create them
+        moved = [Recipe(name="Stew"), Recipe(name="Soup")]
+        session.add_all(moved)
+        await session.flush()
+        assert {recipe.id for recipe in moved}.isdisjoint({soup.id, stew.id})
+
+        await _import(session, exported, "jsonl")
+
+        plans = await session.execute(
+            select(MealPlan.meal_type, Recipe.name)
+            .join(Recipe)
+            .where(MealPlan.planned_date == date(2025, 3, 3))
+        )
+        assert dict(plans.all()) == {MealType.LUNCH: "Soup", MealType.DINNER: "Stew"}
+
+    @pytest.mark.asyncio
+    async def test_keeps_existing_slots_on_request(self, async_db_session):
+        session = async_db_session
+        await _plan(session)
+        exported = await _export(session, "csv")
+        await session.execute(
+            delete(MealPlan).where(MealPlan.meal_type == MealType.DINNER)
+        )
+
+        report = await _import(session, exported, "csv", overwrite=False)
+
+        assert (report.created, report.updated) == (1, 0)
+        assert await _export(session, "csv") == exported
+
+    @pytest.mark.asyncio
+    async def test_unknown_recipe_plans_nothing(self, async_db_session):
+        session = async_db_session
+        lines = (
+            '{"planned_date": "2025-03-03", "meal_type": "lunch", '
+            '"recipe_ref": "999999", "recipe_name": "Gone"}\n'
+        )
+
+        with pytest.raises(UnknownRecipeError, match="'Gone'"):
+            await _import(session, lines, "jsonl")
+
+        assert await session.scalar(select(func.count(MealPlan.id))) == 0
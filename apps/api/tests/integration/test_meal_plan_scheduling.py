@@ -0,0 +1,271 @@
+"""
+Integration tests for batch meal plan scheduling.
+
+These tests verify that a batch of entries and a week copy are each one
+statement, that conflicts with planned slots are resolved by the unique
+slot constraint (overwritten, kept, or left alone when unchanged), that
+the weekly grocery triggers follow upserts, and the HTTP endpoints.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from models import Ingredient, MealPlan, MealType, Recipe, RecipeIngredient
+from schemas.meal_plan import MealPlanEntry, MealPlanScheduleReport
+from services.meal_plan_scheduling import (
+    UnknownRecipeError,
+    copy_weeks,
+    schedule_meals,
+)
+from services.weekly_grocery import diff_week
+
+MONDAY = date(2025, 3, 3)
+
+
+@pytest_asyncio.fixture
+async def recipes(async_db_session):
+    """Soup and stew, each with one ingredient line."""
+    session = async_db_session
+    soup = Recipe(
+        name="Soup",
+        recipe_ingredients=[
+            RecipeIngredient(
+                ingredient=Ingredient(name="Leek"), quantity=2, unit="each"
+            )
+        ],
+    )
+    stew = Recipe(
+        name="Stew",
+        recipe_ingredients=[
+            RecipeIngredient(ingredient=Ingredient(name="Beef"), quantity=500, unit="g")
+        ],
+    )
+    session.add_all([soup, stew])
+    await session.flush()
+    return soup, stew
+
+
+def week_of(recipe_id, start=MONDAY):
+    """Lunch and dinner of ``recipe_id`` for the week starting ``start``."""
+    return [
+        MealPlanEntry(
+            planned_date=start + timedelta(days=day),
+            meal_type=meal_type,
+            recipe_id=recipe_id,
+        )
+        for day in range(7)
+        for meal_type in MealType
+    ]
+
+
+async def planned(session, start, end):
+    rows = await session.execute(
+        select(MealPlan.planned_date, MealPlan.meal_type, MealPlan.recipe_id)
+        .where(MealPlan.planned_date.between(start, end))
+        .order_by(MealPlan.planned_date, MealPlan.meal_type)
+        .execution_options(populate_existing=True)
+    )
+    return [tuple(row) for row in rows]
+
+
+@pytest.mark.integration
+class TestScheduleMeals:
+    """Test planning many slots with one upsert."""
+
+    @pytest.mark.asyncio
+    async def test_week_is_one_statement(
+        self, async_db_session, recipes, count_queries
+    ):
+        soup, _ = recipes
+
+        with count_queries() as queries:
+            report = await schedule_meals(async_db_session, week_of(soup.id))
+
+        assert queries.count == 1
+        assert report == MealPlanScheduleReport(created=14, updated=0)
+        assert len(await planned(async_db_session, MONDAY, MONDAY + timedelta(6))) == 14
+
+    @pytest.mark.asyncio
+    async def test_overwrite_updates_changed_slots_only(
+        self, async_db_session, recipes
+    ):
+        soup, stew = recipes
+        await schedule_meals(async_db_session, week_of(soup.id))
+        entries = week_of(soup.id)
+        entries[0].recipe_id = stew.id
+        entries[1].notes = "Leftovers"
+
+        report = await schedule_meals(async_db_session, entries)
+
+        assert report == MealPlanScheduleReport(created=0, updated=2)
+        rows = await planned(async_db_session, MONDAY, MONDAY)
+        assert rows == [
+            (MONDAY, MealType.LUNCH, stew.id),
+            (MONDAY, MealType.DINNER, soup.id),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_without_overwrite_planned_slots_are_kept(
+        self, async_db_session, recipes
+    ):
+        soup, stew = recipes
+        await schedule_meals(async_db_session, week_of(soup.id)[:2])
+
+        report = await schedule_meals(
+            async_db_session, week_of(stew.id)[:4], overwrite=False
+        )
+
+        assert report == MealPlanScheduleReport(created=2, updated=0)
+        rows = await planned(async_db_session, MONDAY, MONDAY + timedelta(1))
+        assert [recipe_id for *_, recipe_id in rows] == [
+            soup.id,
+            soup.id,
+            stew.id,
+            stew.id,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_recipe(self, async_db_session, recipes):
+        with pytest.raises(UnknownRecipeError):
+            await schedule_meals(async_db_session, week_of(-1)[:1])
+
+    @pytest.mark.asyncio
+    async def test_slot_is_unique(self, async_db_session):
+        async_db_session.add_all(
+            MealPlan(planned_date=MONDAY, meal_type=MealType.LUNCH) for _ in range(2)
+        )
+
+        with pytest.raises(IntegrityError):
+            await async_db_session.flush()
+
+    @pytest.mark.asyncio
+    async def test_weekly_grocery_items_follow_upserts(self, async_db_session, recipes):
+        soup, stew = recipes
+        await schedule_meals(async_db_session, week_of(soup.id))
+        entries = week_of(stew.id)[:3]
+
+        await schedule_meals(async_db_session, entries)
+
+        assert await diff_week(async_db_session, MONDAY) == []
+
+
+@pytest.mark.integration
+class TestCopyWeeks:
+    """Test copying a week onto following weeks with one INSERT ... SELECT."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_for_three_weeks(
+        self, async_db_session, recipes, count_queries
+    ):
+        soup, _ = recipes
+        await schedule_meals(async_db_session, week_of(soup.id)[:3])
+
+        with count_queries() as queries:
+            # Any day names its week
+            report = await copy_weeks(
+                async_db_session, MONDAY + timedelta(4), date(2025, 3, 12), weeks=3
+            )
+
+        assert queries.count == 1
+        assert report == MealPlanScheduleReport(created=9, updated=0)
+        for week in range(1, 4):
+            start = MONDAY + timedelta(weeks=week)
+            assert await planned(async_db_session, start, start + timedelta(6)) == [
+                (start, MealType.LUNCH, soup.id),
+                (start, MealType.DINNER, soup.id),
+                (start + timedelta(1), MealType.LUNCH, soup.id),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_conflicts(self, async_db_session, recipes):
+        soup, stew = recipes
+        next_monday = MONDAY + timedelta(weeks=1)
+        await schedule_meals(async_db_session, week_of(soup.id)[:2])
+        await schedule_meals(async_db_session, week_of(stew.id, next_monday)[:1])
+
+        kept = await copy_weeks(async_db_session, MONDAY, next_monday, overwrite=False)
+        replaced = await copy_weeks(async_db_session, MONDAY, next_monday)
+
+        assert kept == MealPlanScheduleReport(created=1, updated=0)
+        assert replaced == MealPlanScheduleReport(created=0, updated=1)
+        assert await planned(async_db_session, next_monday, next_monday) == [
+            (next_monday, MealType.LUNCH, soup.id),
+            (next_monday, MealType.DINNER, soup.id),
+        ]
+
+
+@pytest.mark.integration
+class TestSlotOrder:
+    """Test that both write paths lock the slots of a day in one order."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_and_copy_write_slots_in_the_same_order(
+        self, async_db_session, recipes
+    ):
+        soup, _ = recipes
+        # Ids are drawn as rows are inserted, so they show the write order
+        await schedule_meals(async_db_session, list(reversed(week_of(soup.id)[:2])))
+        await copy_weeks(async_db_session, MONDAY, MONDAY + timedelta(weeks=1))
+
+        written = {}
+        for day in (MONDAY, MONDAY + timedelta(weeks=1)):
+            rows = await async_db_session.scalars(
+                select(MealPlan.meal_type)
+                .where(MealPlan.planned_date == day)
+                .order_by(MealPlan.id)
+            )
+            written[day] = rows.all()
+
+        assert list(written.values()) == [[MealType.LUNCH, MealType.DINNER]] * 2
+
+
+@pytest.mark.integration
+class TestSchedulingEndpoints:
+    """Test the batch and copy endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_batch(self, api_client, recipes):
+        soup, _ = recipes
+        entries = [entry.model_dump(mode="json") for entry in week_of(soup.id)]
+
+        response = await api_client.post("/meal-plans/batch", json={"entries": entries})
+        calendar = await api_client.get(f"/meal-plans/calendar/weeks/{MONDAY}")
+
+        assert response.status_code == 200
+        assert response.json() == {"created": 14, "updated": 0}
+        assert calendar.json()["totals"]["planned_slots"] == 14
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_repeated_slots(self, api_client):
+        entry = {"planned_date": str(MONDAY), "meal_type": "lunch"}
+
+        response = await api_client.post(
+            "/meal-plans/batch", json={"entries": [entry, entry]}
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_batch_unknown_recipe(self, api_client):
+        entry = {"planned_date": str(MONDAY), "meal_type": "lunch", "recipe_id": -1}
+
+        response = await api_client.post("/meal-plans/batch", json={"entries": [entry]})
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_copy(self, api_client, async_db_session, recipes):
+        soup, _ = recipes
+        await schedule_meals(async_db_session, week_of(soup.id))
+
+        response = await api_client.post(
+            "/meal-plans/copy",
+            json={"source_week": str(MONDAY), "target_week": "2025-03-10", "weeks": 2},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"created": 28, "updated": 0}
@@ -0,0 +1,172 @@
+"""
+Integration tests for the /metrics endpoint and its instrumentation.
+
+These tests verify that requests are recorded under their route template,
+that SQL statements run through the API are timed under their normalized
+text, that a request repeating one SELECT is reported as an N+1, and that
+pool gauges are exported once the shared engine exists.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from core.config import settings
+from core.db import dispose_db, init_db
+from prometheus_client import REGISTRY
+
+from core.instrumentation import (
+    OTHER_STATEMENT,
+    MetricsMiddleware,
+    statement_label,
+    statement_labels,
+)
+from models import Ingredient, Recipe, RecipeIngredient
+
+SELECT_RECIPE_NAME = "SELECT recipes.name FROM recipes WHERE recipes.id = ?"
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def n_plus_one_total() -> float:
+    return sum(
+        s.value
+        for metric in REGISTRY.collect()
+        for s in metric.samples
+        if s.name == "mealmind_db_n_plus_one_total"
+    )
+
+
+@pytest.fixture
+def looping_client(async_db_session):
+    """Client for an app whose endpoint loads recipe names one query at a time."""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/names")
+    async def names(count: int):
+        recipe_ids = (await async_db_session.scalars(select(Recipe.id))).all()
+        return [
+            await async_db_session.scalar(
+                select(Recipe.name).where(Recipe.id == recipe_id)
+            )
+            for recipe_id in recipe_ids[:count]
+        ]
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.integration
+class TestMetricsEndpoint:
+    """Test the Prometheus exposition of request and SQL metrics."""
+
+    @pytest.mark.asyncio
+    async def test_request_and_statement_metrics(self, api_client, async_db_session):
+        recipe = Recipe(name="Soup")
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+        route = {"method": "GET", "route": "/recipes/{recipe_id}"}
+        before = sample("mealmind_http_request_duration_seconds_count", **route)
+
+        await api_client.get(f"/recipes/{recipe.id}")
+        response = await api_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=")
+        assert (
+            sample("mealmind_http_request_duration_seconds_count", **route)
+            == before + 1
+        )
+        assert (
+            'mealmind_http_requests_total{method="GET",'
+            'route="/recipes/{recipe_id}",status="200"}' in response.text
+        )
+        assert "# TYPE mealmind_db_statement_seconds summary" in response.text
+        assert any(
+            sql.startswith("SELECT recipes.id") and "recipes.id = ?" in sql
+            for sql in statement_labels
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_paths_share_a_label(self, api_client):
+        await api_client.get("/no-such-path/1")
+        response = await api_client.get("/metrics")
+
+        assert 'route="unmatched",status="404"' in response.text
+        assert "/no-such-path" not in response.text
+
+    @pytest.mark.asyncio
+    async def test_statements_beyond_the_cap_are_other(self, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_MAX_STATEMENTS", len(statement_labels))
+
+        assert statement_label("SELECT never_seen_before") == OTHER_STATEMENT
+
+    @pytest.mark.asyncio
+    async def test_pool_gauges_after_startup(self, api_client, test_settings):
+        init_db(test_settings)
+        try:
+            response = await api_client.get("/metrics")
+        finally:
+            await dispose_db()
+
+        assert "mealmind_db_pool_capacity 15.0" in response.text
+        assert "# TYPE mealmind_db_pool_checkouts_total counter" in response.text
+
+
+@pytest.mark.integration
+class TestNPlusOneDetector:
+    """Test flagging requests that repeat one SELECT."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_select_is_reported(
+        self, looping_client, async_db_session, caplog
+    ):
+        async_db_session.add_all(Recipe(name=f"Soup {i}") for i in range(6))
+        await async_db_session.flush()
+        flagged = {"method": "GET", "route": "/names", "statement": SELECT_RECIPE_NAME}
+        before = sample("mealmind_db_n_plus_one_total", **flagged)
+
+        with caplog.at_level(logging.WARNING, logger="core.instrumentation"):
+            async with looping_client as client:
+                await client.get("/names", params={"count": 6})
+
+        assert sample("mealmind_db_n_plus_one_total", **flagged) == before + 1
+        assert "ran the same SELECT 6 times" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_is_not_reported(
+        self, looping_client, async_db_session
+    ):
+        async_db_session.add_all(Recipe(name=f"Soup {i}") for i in range(6))
+        await async_db_session.flush()
+        before = n_plus_one_total()
+
+        async with looping_client as client:
+            await client.get(
+                "/names", params={"count": settings.N_PLUS_ONE_THRESHOLD - 1}
+            )
+
+        assert n_plus_one_total() == before
+
+    @pytest.mark.asyncio
+    async def test_recipe_detail_is_not_reported(self, api_client, async_db_session):
+        recipe = Recipe(
+            name="Stew",
+            recipe_ingredients=[
+                RecipeIngredient(ingredient=Ingredient(name=f"Item {i}"))
+                for i in range(10)
+            ],
+        )
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+        async_db_session.expunge_all()
+        before = n_plus_one_total()
+
+        await api_client.get(f"/recipes/{recipe.id}")
+
+        assert n_plus_one_total() == before
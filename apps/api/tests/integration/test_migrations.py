@@ -37,6 +37,7 @@ class TestDatabaseMigrations:
             ("ingredients", ALL_SCHEMAS["ingredients"]),
             ("recipe_ingredients", ALL_SCHEMAS["recipe_ingredients"]),
             ("meal_plans", ALL_SCHEMAS["meal_plans"]),
+            ("weekly_grocery_items", ALL_SCHEMAS["weekly_grocery_items"]),
         ],
         ids=[
             "recipes",
@@ -45,6 +46,7 @@ class TestDatabaseMigrations:
             "ingredients",
             "recipe_ingredients",
             "meal_plans",
+            "weekly_grocery_items",
         ],
     )
     def test_table_schema(self, db_inspector, table_name, expected_schema):
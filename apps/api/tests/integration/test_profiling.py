@@ -0,0 +1,113 @@
+"""
+Integration tests for per-request profiling.
+
+These tests verify that only requests with an allowed X-Profile header are
+profiled, that the profile of an API request holds its stacks and the SQL
+it ran, and that stored profiles are only served to holders of a token.
+"""
+
+import time
+
+import pytest
+import pytest_asyncio
+
+from core.config import settings
+from core.profiling import PROFILE_ID_HEADER, profiles, sign_token
+from models import Ingredient, Recipe, RecipeIngredient
+
+
+@pytest.fixture
+def token(monkeypatch):
+    """A valid X-Profile token, with DEBUG off."""
+    monkeypatch.setattr(settings, "DEBUG", False)
+    monkeypatch.setattr(settings, "PROFILING_SECRET", "secret")
+    profiles.clear()
+    return {"X-Profile": sign_token("secret", int(time.time()) + 60)}
+
+
+@pytest_asyncio.fixture
+async def recipe(async_db_session):
+    recipe = Recipe(
+        name="Soup",
+        recipe_ingredients=[RecipeIngredient(ingredient=Ingredient(name="Leek"))],
+    )
+    async_db_session.add(recipe)
+    await async_db_session.flush()
+    return recipe
+
+
+@pytest.mark.integration
+class TestProfiledRequests:
+    """Test profiling API requests on demand."""
+
+    @pytest.mark.asyncio
+    async def test_only_allowed_requests_are_profiled(self, api_client, token):
+        plain = await api_client.get("/health")
+        forged = await api_client.get("/health", headers={"X-Profile": "1"})
+
+        assert PROFILE_ID_HEADER.lower() not in plain.headers
+        assert PROFILE_ID_HEADER.lower() not in forged.headers
+        assert len(profiles) == 0
+
+    @pytest.mark.asyncio
+    async def test_profile_holds_stacks_and_sql(
+        self, api_client, token, recipe, monkeypatch
+    ):
+        # On a warm pool the request can finish within the default interval
+        monkeypatch.setattr(settings, "PROFILING_INTERVAL_SECONDS", 0.0001)
+        response = await api_client.get(f"/recipes/{recipe.id}", headers=token)
+        profile_id = response.headers[PROFILE_ID_HEADER]
+
+        statements = await api_client.get(
+            f"/profiles/{profile_id}", params={"format": "statements"}, headers=token
+        )
+        speedscope = await api_client.get(f"/profiles/{profile_id}", headers=token)
+
+        assert response.status_code == 200
+        summary = statements.json()
+        assert summary["name"] == f"GET /recipes/{recipe.id}"
+        assert summary["status"] == 200
+        assert summary["statements"] == len(summary["sql"]) >= 2
+        assert any("FROM recipes" in s["sql"] for s in summary["sql"])
+        sampled, evented = speedscope.json()["profiles"]
+        assert sampled["samples"] and evented["name"] == "SQL"
+        # Stacks of the request itself start at its middleware frame
+        frames = speedscope.json()["shared"]["frames"]
+        assert "ProfilerMiddleware.__call__" in {frame["name"] for frame in frames}
+        assert len(evented["events"]) == 2 * summary["statements"]
+
+    @pytest.mark.asyncio
+    async def test_collapsed_and_listing(self, api_client, token):
+        response = await api_client.get("/recipes", headers=token)
+        profile_id = response.headers[PROFILE_ID_HEADER]
+
+        collapsed = await api_client.get(
+            f"/profiles/{profile_id}", params={"format": "collapsed"}, headers=token
+        )
+        listing = await api_client.get("/profiles", headers=token)
+
+        assert collapsed.headers["content-type"].startswith("text/plain")
+        assert all(
+            line.rsplit(" ", 1)[1].isdigit() for line in collapsed.text.splitlines()
+        )
+        assert [p["id"] for p in listing.json()] == [profile_id]
+
+    @pytest.mark.asyncio
+    async def test_profiles_hidden_without_token(self, api_client, token):
+        response = await api_client.get("/health", headers=token)
+        profile_id = response.headers[PROFILE_ID_HEADER]
+
+        assert (await api_client.get("/profiles")).status_code == 404
+        assert (await api_client.get(f"/profiles/{profile_id}")).status_code == 404
+        assert (await api_client.get("/profiles/0", headers=token)).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_profiles_written_to_directory(
+        self, api_client, token, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+
+        response = await api_client.get("/health", headers=token)
+
+        profile_id = response.headers[PROFILE_ID_HEADER]
+        assert (tmp_path / f"{profile_id}.speedscope.json").exists()
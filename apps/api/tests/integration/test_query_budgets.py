@@ -0,0 +1,162 @@
+"""
+Integration tests for recipe detail loading and per-endpoint query budgets.
+
+These tests verify that the recipe detail graph is loaded in a fixed
+number of statements whatever the number of ingredient lines, and pin the
+number of SQL statements each read endpoint executes so that an accidental
+lazy load (an N+1) fails the suite instead of slowing production.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.exc import InvalidRequestError
+
+from models import Brand, Category, Ingredient, MealPlan, MealType, Recipe
+from models import RecipeIngredient
+from services.recipes import get_recipe_detail, recipe_detail_query
+
+MONDAY = date(2025, 3, 3)
+
+# Maximum statements per request, with the catalog cache warm as after
+# startup. Lower a budget when an endpoint gets cheaper; raising one needs a
+# reason in the commit message. Endpoints answering conditional requests
+# include their ETag aggregate.
+ENDPOINT_BUDGETS = {
+    "/recipes/{recipe_id}": 2,
+    "/recipes": 1,
+    "/ingredients": 1,
+    "/meal-plans": 2,
+    "/grocery-list?start_date=2025-03-03&end_date=2025-03-09": 1,
+    "/grocery-list/weeks/2025-03-03": 1,
+    "/search/recipes?q=pasta": 1,
+    "/search/ingredients?q=flour": 1,
+}
+# "cached" with a cold catalog cache; it needs 1 when the cache is warm
+STRATEGY_BUDGETS = {"selectin": 2, "joined": 1, "cached": 4, "projection": 2}
+
+
+async def _recipe_with_lines(session, lines: int) -> Recipe:
+    category = Category(name="Pantry")
+    brand = Brand(name="Acme")
+    recipe = Recipe(name="Pasta", servings=2)
+    session.add_all(
+        [
+            recipe,
+            *(
+                RecipeIngredient(
+                    recipe=recipe,
+                    ingredient=Ingredient(
+                        name=f"Flour {i}",
+                        category=category if i % 2 else None,
+                        brand=brand if i % 3 else None,
+                    ),
+                    quantity=100 + i,
+                    unit="g",
+                    # Reverse of insertion order, so ordering is observable
+                    display_order=lines - i,
+                )
+                for i in range(lines)
+            ),
+        ]
+    )
+    await session.flush()
+    return recipe
+
+
+@pytest_asyncio.fixture
+async def pasta(async_db_session):
+    """A planned recipe with 12 ingredient lines."""
+    recipe = await _recipe_with_lines(async_db_session, 12)
+    async_db_session.add(
+        MealPlan(recipe=recipe, planned_date=MONDAY, meal_type=MealType.DINNER)
+    )
+    await async_db_session.flush()
+    return recipe
+
+
+@pytest.mark.integration
+class TestRecipeDetail:
+    """Test loading the recipe detail graph."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", STRATEGY_BUDGETS)
+    async def test_detail_contents(self, async_db_session, pasta, strategy):
+        async_db_session.expunge_all()
+
+        detail = await get_recipe_detail(async_db_session, pasta.id, strategy)
+
+        assert detail.name == "Pasta"
+        assert [line.display_order for line in detail.ingredients] == list(range(1, 13))
+        first = detail.ingredients[0]
+        assert first.ingredient.name == "Flour 11"
+        assert first.quantity == Decimal("111.00")
+        assert first.base_quantity == Decimal("111.0000")
+        assert first.base_unit == "g"
+        assert first.ingredient.category.name == "Pantry"
+        assert first.ingredient.brand.name == "Acme"
+        assert detail.ingredients[1].ingredient.category is None
+        assert detail.ingredients[2].ingredient.brand is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", STRATEGY_BUDGETS)
+    async def test_statement_count_independent_of_lines(
+        self, async_db_session, count_queries, strategy
+    ):
+        small = await _recipe_with_lines(async_db_session, 1)
+        large = Recipe(name="Feast")
+        large.recipe_ingredients = [
+            RecipeIngredient(ingredient=Ingredient(name=f"Spice {i}"), quantity=1)
+            for i in range(40)
+        ]
+        async_db_session.add(large)
+        await async_db_session.flush()
+
+        counts = []
+        for recipe_id in (small.id, large.id):
+            with count_queries() as queries:
+                await get_recipe_detail(async_db_session, recipe_id, strategy)
+            queries.assert_at_most(STRATEGY_BUDGETS[strategy], strategy)
+            counts.append(queries.count)
+
+        assert counts[0] == counts[1]
+
+    @pytest.mark.asyncio
+    async def test_unplanned_relationship_raises(self, async_db_session, pasta):
+        async_db_session.expunge_all()
+
+        result = await async_db_session.execute(recipe_detail_query(pasta.id))
+        recipe = result.unique().scalar_one()
+
+        with pytest.raises(InvalidRequestError):
+            recipe.meal_plans
+
+    @pytest.mark.asyncio
+    async def test_missing_recipe(self, async_db_session):
+        assert await get_recipe_detail(async_db_session, -1) is None
+
+
+@pytest.mark.integration
+class TestEndpointQueryBudgets:
+    """Test the number of statements each read endpoint executes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ENDPOINT_BUDGETS)
+    async def test_within_budget(
+        self, api_client, async_db_session, count_queries, fresh_catalog, pasta, path
+    ):
+        url = path.format(recipe_id=pasta.id)
+        await fresh_catalog.warm(async_db_session)
+
+        with count_queries() as queries:
+            response = await api_client.get(url)
+
+        assert response.status_code == 200
+        queries.assert_at_most(ENDPOINT_BUDGETS[path], path)
+
+    @pytest.mark.asyncio
+    async def test_recipe_detail_not_found(self, api_client):
+        response = await api_client.get("/recipes/0")
+
+        assert response.status_code == 404
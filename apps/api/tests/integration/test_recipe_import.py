@@ -0,0 +1,171 @@
+"""
+Integration tests for the bulk recipe import pipeline.
+
+These tests verify that imports resolve catalog rows by name (reusing
+existing ones), write ingredient lines through COPY with canonical base
+quantities, consume their input one batch at a time, and that the API
+endpoint is all-or-nothing.
+"""
+
+import json
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from models import Brand, Category, Ingredient, Recipe, RecipeIngredient
+from schemas.recipe import RecipeRecord
+from services.recipe_import import import_recipes
+from services.recipes import get_recipe_detail
+
+
+def _record(name, *lines):
+    return RecipeRecord(
+        name=name,
+        servings=2,
+        ingredients=[
+            {
+                "ingredient": ingredient,
+                "category": category,
+                "brand": brand,
+                "quantity": quantity,
+                "unit": unit,
+                "display_order": order,
+            }
+            for order, (ingredient, category, brand, quantity, unit) in enumerate(
+                lines, start=1
+            )
+        ],
+    )
+
+
+async def _count(session, model):
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.integration
+class TestImportRecipes:
+    """Test the import service."""
+
+    @pytest.mark.asyncio
+    async def test_imports_graph_and_reuses_existing_names(self, async_db_session):
+        session = async_db_session
+        session.add(Ingredient(name="Flour", category=Category(name="Pantry")))
+        await session.flush()
+        records = [
+            _record(
+                "Pancakes",
+                ("Flour", "Pantry", None, 200, "g"),
+                ("Milk", "Dairy", "Acme", 1, "cup"),
+            ),
+            _record(
+                "Crepes",
+                ("Milk", "Dairy", None, 250, "ml"),
+                ("Egg", None, None, 2, None),
+            ),
+            _record("Water"),
+        ]
+
+        report = await import_recipes(session, records, batch_size=2)
+
+        assert (report.recipes, report.ingredient_lines) == (3, 4)
+        assert report.ingredients_created == 2
+        assert report.categories_created == 1
+        assert report.brands_created == 1
+        assert report.rows_per_second > 0
+        assert await _count(session, Ingredient) == 3
+        assert await _count(session, Category) == 2
+        assert await _count(session, Brand) == 1
+
+        recipe_id = await session.scalar(
+            select(Recipe.id).where(Recipe.name == "Pancakes")
+        )
+        detail = await get_recipe_detail(session, recipe_id)
+        milk = detail.ingredients[1]
+        assert [line.ingredient.name for line in detail.ingredients] == [
+            "Flour",
+            "Milk",
+        ]
+        assert milk.ingredient.category.name == "Dairy"
+        assert milk.ingredient.brand.name == "Acme"
+        assert (milk.base_quantity, milk.base_unit) == (Decimal("236.5882"), "ml")
+
+    @pytest.mark.asyncio
+    async def test_reads_input_one_batch_at_a_time(self, async_db_session):
+        consumed = []
+
+        def records():
+            for i in range(7):
+                consumed.append(i)
+                yield _record(f"Recipe {i}", ("Salt", None, None, None, None))
+
+        batches = []
+        report = await import_recipes(
+            async_db_session,
+            records(),
+            batch_size=3,
+            progress=lambda report: batches.append((report.recipes, len(consumed))),
+        )
+
+        assert report.recipes == 7
+        # When a batch is written, at most one batch has been read ahead
+        assert batches == [(3, 3), (6, 6), (7, 7)]
+
+    @pytest.mark.asyncio
+    async def test_copied_lines_get_server_defaults(self, async_db_session):
+        session = async_db_session
+        await import_recipes(session, [_record("Soup", ("Leek", None, None, 2, None))])
+
+        line = await session.scalar(select(RecipeIngredient))
+
+        assert line.base_quantity == Decimal("2.0000")
+        assert line.created_at is not None
+
+
+@pytest.mark.integration
+class TestImportEndpoint:
+    """Test POST /recipes/import."""
+
+    @pytest.mark.asyncio
+    async def test_jsonl(self, api_client, async_db_session):
+        body = "\n".join(
+            json.dumps(record.model_dump(mode="json"))
+            for record in [
+                _record("Pancakes", ("Flour", "Pantry", None, 200, "g")),
+                _record("Toast", ("Bread", None, None, 2, "slice")),
+            ]
+        )
+
+        response = await api_client.post(
+            "/recipes/import", content=body, params={"batch_size": 1}
+        )
+
+        assert response.status_code == 200
+        report = response.json()
+        assert (report["recipes"], report["ingredient_lines"]) == (2, 2)
+        assert await _count(async_db_session, RecipeIngredient) == 2
+
+    @pytest.mark.asyncio
+    async def test_csv(self, api_client, async_db_session):
+        body = "name,ingredient,quantity,unit\nSoup,Leek,2,\nSoup,Stock,1,l\n"
+
+        response = await api_client.post(
+            "/recipes/import", content=body, params={"format": "csv"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["ingredient_lines"] == 2
+        assert await _count(async_db_session, Recipe) == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_line_writes_nothing(self, api_client, async_db_session):
+        body = '{"name": "Ok", "ingredients": [{"ingredient": "Salt"}]}\n{"name": ""}\n'
+
+        response = await api_client.post(
+            "/recipes/import", content=body, params={"batch_size": 1}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("line 2:")
+        assert await _count(async_db_session, Recipe) == 0
+        assert await _count(async_db_session, Ingredient) == 0
@@ -0,0 +1,311 @@
+"""
+Integration tests for the shared response cache.
+
+These tests verify the Redis protocol backend against an in-process fake
+server, versioned keys and single-flight on both backends (including two
+"workers" sharing one server), and that the cached endpoints are served
+without loading rows until a committed write bumps the scopes they depend
+on.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+import pytest_asyncio
+
+from core.cache import CacheError, MemoryBackend
+from core.config import settings
+from core.redis import RedisBackend
+from models import Ingredient, MealPlan, MealType, Recipe, RecipeIngredient
+from services.response_cache import (
+    MEAL_PLANS,
+    ResponseCache,
+    recipe_scope,
+    response_cache,
+)
+from tests.fixtures.fake_redis import FakeRedis
+
+MONDAY = date(2025, 3, 3)
+
+
+@pytest_asyncio.fixture
+async def fake_redis():
+    """A Redis protocol server on a local port."""
+    async with FakeRedis() as server:
+        yield server
+
+
+@pytest_asyncio.fixture(params=["memory", "redis"])
+async def backend(request, fake_redis):
+    """Each CacheBackend implementation."""
+    backend = (
+        MemoryBackend() if request.param == "memory" else RedisBackend(fake_redis.url)
+    )
+    yield backend
+    await backend.close()
+
+
+class SlowLoader:
+    """Counts calls; each call yields to the loop before answering."""
+
+    def __init__(self, value: bytes = b"{}", delay: float = 0.05):
+        self.calls = 0
+        self.value = value
+        self.delay = delay
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+@pytest.mark.integration
+class TestRedisBackend:
+    """Test the Redis protocol backend over a socket."""
+
+    @pytest.mark.asyncio
+    async def test_commands(self, fake_redis):
+        backend = RedisBackend(fake_redis.url)
+        await backend.set("a", b"1")
+
+        assert await backend.get("a") == b"1"
+        assert await backend.get_many(["a", "missing"]) == [b"1", None]
+        assert await backend.add("a", b"2") is False
+        assert await backend.add("b", b"2", ttl=0.01) is True
+        assert await backend.incr("n") == 1
+        assert await backend.ping()
+        await backend.delete("a")
+        await asyncio.sleep(0.02)
+        assert await backend.get_many(["a", "b"]) == [None, None]
+        assert fake_redis.connections == 1
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_authenticates(self):
+        async with FakeRedis(password="secret") as server:
+            backend = RedisBackend(server.url)
+
+            await backend.set("a", b"1")
+
+            assert server.commands[0] == (b"AUTH", b"secret")
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_error_reply_keeps_the_connection(self, fake_redis):
+        backend = RedisBackend(fake_redis.url)
+        await backend.set("a", b"text")
+
+        with pytest.raises(CacheError):
+            await backend.incr("a")
+
+        assert await backend.get("a") == b"text"
+        assert fake_redis.connections == 1
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server(self, fake_redis):
+        url = fake_redis.url
+        await fake_redis.__aexit__(None, None, None)
+
+        with pytest.raises(CacheError):
+            await RedisBackend(url, timeout=0.5).get("a")
+
+
+@pytest.mark.integration
+class TestResponseCache:
+    """Test versioned keys and single-flight on every backend."""
+
+    @pytest.mark.asyncio
+    async def test_bumped_scope_misses(self, backend):
+        cache = ResponseCache(backend)
+        load = SlowLoader(delay=0)
+
+        for _ in range(2):
+            assert await cache.get_or_set("plans", [MEAL_PLANS], load) == b"{}"
+        await cache.bump([MEAL_PLANS])
+        await cache.get_or_set("plans", [MEAL_PLANS], load)
+        await cache.get_or_set("other", [recipe_scope(1)], load)
+
+        assert load.calls == 3
+        assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, backend):
+        cache = ResponseCache(backend)
+        load = SlowLoader()
+
+        values = await asyncio.gather(
+            *(cache.get_or_set("plans", [MEAL_PLANS], load) for _ in range(20))
+        )
+
+        assert values == [b"{}"] * 20
+        assert load.calls == 1
+        assert cache.stats.coalesced == 19
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_shared_and_not_cached(self, backend):
+        cache = ResponseCache(backend)
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise LookupError("gone")
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("plans", [MEAL_PLANS], load) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, LookupError) for result in results)
+        assert calls == 1
+        assert await cache.get_or_set("plans", [MEAL_PLANS], SlowLoader(b"ok", 0))
+
+    @pytest.mark.asyncio
+    async def test_missing_version_never_goes_back(self, backend):
+        cache = ResponseCache(backend)
+        [before] = await cache.versions([MEAL_PLANS])
+
+        await backend.delete(cache._version_key(MEAL_PLANS))
+        await cache.bump([MEAL_PLANS])
+        [after] = await cache.versions([MEAL_PLANS])
+
+        assert int(after) > int(before)
+
+    @pytest.mark.asyncio
+    async def test_workers_sharing_redis_load_once(self, fake_redis):
+        workers = [
+            ResponseCache(RedisBackend(fake_redis.url), poll_interval=0.01)
+            for _ in range(2)
+        ]
+        load = SlowLoader()
+
+        values = await asyncio.gather(
+            *(
+                worker.get_or_set("plans", [MEAL_PLANS], load)
+                for worker in workers
+                for _ in range(5)
+            )
+        )
+
+        assert values == [b"{}"] * 10
+        assert load.calls == 1
+        for worker in workers:
+            await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_backend_falls_back_to_load(self, fake_redis):
+        url = fake_redis.url
+        await fake_redis.__aexit__(None, None, None)
+        cache = ResponseCache(RedisBackend(url, timeout=0.5))
+
+        assert await cache.get_or_set("plans", [MEAL_PLANS], SlowLoader()) == b"{}"
+        assert cache.stats.errors == 1
+
+
+@pytest_asyncio.fixture
+async def planned_recipe(async_db_session):
+    """A committed recipe planned for MONDAY's dinner."""
+    recipe = Recipe(
+        name="Soup",
+        recipe_ingredients=[
+            RecipeIngredient(ingredient=Ingredient(name="Leek"), quantity=2, unit="g")
+        ],
+    )
+    async_db_session.add(
+        MealPlan(recipe=recipe, planned_date=MONDAY, meal_type=MealType.DINNER)
+    )
+    await async_db_session.commit()
+    return recipe
+
+
+@pytest.mark.integration
+class TestCachedEndpoints:
+    """Test serving hot endpoints from the cache and invalidating them."""
+
+    @pytest.mark.asyncio
+    async def test_recipe_detail_served_from_cache(
+        self, api_client, count_queries, planned_recipe
+    ):
+        url = f"/recipes/{planned_recipe.id}"
+        first = await api_client.get(url)
+
+        with count_queries() as queries:
+            second = await api_client.get(url)
+
+        # Only the ETag aggregate of the conditional request check
+        assert queries.count == 1
+        assert second.json() == first.json()
+        assert response_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_recipe_detail(
+        self, api_client, async_db_session, planned_recipe
+    ):
+        url = f"/recipes/{planned_recipe.id}"
+        await api_client.get(url)
+
+        planned_recipe.name = "Leek soup"
+        await async_db_session.commit()
+
+        # Bumped inside commit(), not deferred to the next cache lookup
+        assert not response_cache.pending
+        assert (await api_client.get(url)).json()["name"] == "Leek soup"
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_grocery_lists(
+        self, api_client, async_db_session, planned_recipe
+    ):
+        urls = [
+            "/grocery-list?start_date=2025-03-03&end_date=2025-03-09",
+            "/grocery-list/weeks/2025-03-05",
+        ]
+        for url in urls:
+            await api_client.get(url)
+
+        async_db_session.add(
+            MealPlan(
+                recipe=planned_recipe, planned_date=MONDAY, meal_type=MealType.LUNCH
+            )
+        )
+        await async_db_session.commit()
+
+        for url in urls:
+            [aisle] = (await api_client.get(url)).json()["aisles"]
+            assert aisle["items"][0]["quantity"] == "4.0000"
+
+    @pytest.mark.asyncio
+    async def test_meal_plans_invalidated_by_recipe_delete(
+        self, api_client, async_db_session, planned_recipe
+    ):
+        url = "/meal-plans?start_date=2025-03-03&end_date=2025-03-09"
+        [plan] = (await api_client.get(url)).json()["items"]
+        assert plan["recipe_id"] == planned_recipe.id
+
+        await async_db_session.delete(planned_recipe)
+        await async_db_session.commit()
+
+        [plan] = (await api_client.get(url)).json()["items"]
+        assert plan["recipe_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_cached_body_matches_uncached(
+        self, api_client, planned_recipe, monkeypatch
+    ):
+        url = f"/recipes/{planned_recipe.id}"
+        cached = await api_client.get(url)
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+
+        uncached = await api_client.get(url)
+
+        assert cached.content == uncached.content
+        assert cached.headers["content-type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_cached(self, api_client):
+        for _ in range(2):
+            assert (await api_client.get("/recipes/0")).status_code == 404
+
+        assert response_cache.stats.misses == 2
@@ -0,0 +1,163 @@
+"""
+Integration tests for recipe and ingredient search.
+
+These tests verify matching (full text, typos, substrings), ranking,
+pagination, and that every search predicate can be served by an index.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from core.explain import explain, index_names, seq_scans
+from models import Ingredient, Recipe
+from services.search import (
+    ingredient_fuzzy_query,
+    ingredient_search_query,
+    recipe_fuzzy_query,
+    recipe_search_query,
+    search_ingredients,
+    search_recipes,
+)
+
+
+@pytest_asyncio.fixture
+async def catalog(async_db_session):
+    """A handful of recipes and ingredients with overlapping words."""
+    session = async_db_session
+    session.add_all(
+        [
+            Recipe(
+                name="Chicken Tikka Masala",
+                description="Creamy tomato curry",
+                instructions="Marinate the chicken overnight.",
+            ),
+            Recipe(
+                name="Vegetable Curry",
+                description="Weeknight curry with chickpeas",
+                instructions="Simmer everything.",
+            ),
+            Recipe(
+                name="Roast Potatoes",
+                description="Crispy sides",
+                instructions="Serve next to roasted chicken.",
+            ),
+            Recipe(name="100% Rye Bread", instructions="Knead and bake."),
+            Ingredient(name="Chicken Thigh"),
+            Ingredient(name="Chickpeas"),
+            Ingredient(name="Cumin"),
+        ]
+    )
+    await session.flush()
+    return session
+
+
+@pytest.mark.integration
+class TestRecipeSearch:
+    """Test ranked recipe search."""
+
+    @pytest.mark.asyncio
+    async def test_name_match_outranks_instructions_match(self, catalog):
+        results = await search_recipes(catalog, "chicken")
+
+        names = [hit.name for hit in results.items]
+        assert names[0] == "Chicken Tikka Masala"
+        assert "Roast Potatoes" in names
+        assert results.items[0].rank > results.items[-1].rank
+
+    @pytest.mark.asyncio
+    async def test_stemmed_full_text_match(self, catalog):
+        results = await search_recipes(catalog, "simmered")
+
+        assert [hit.name for hit in results.items] == ["Vegetable Curry"]
+
+    @pytest.mark.asyncio
+    async def test_typo_tolerant(self, catalog):
+        results = await search_recipes(catalog, "chiken")
+
+        assert results.fuzzy is True
+        assert results.items[0].name == "Chicken Tikka Masala"
+
+    @pytest.mark.asyncio
+    async def test_exact_matches_suppress_fuzzy_tier(self, catalog):
+        results = await search_recipes(catalog, "curry")
+
+        assert results.fuzzy is False
+        # "Chicken Tikka Masala" mentions curry in its description only
+        assert [hit.name for hit in results.items][0] == "Vegetable Curry"
+
+    @pytest.mark.asyncio
+    async def test_substring_of_name(self, catalog):
+        results = await search_recipes(catalog, "tabl")
+
+        assert [hit.name for hit in results.items] == ["Vegetable Curry"]
+
+    @pytest.mark.asyncio
+    async def test_like_wildcards_are_literal(self, catalog):
+        results = await search_recipes(catalog, "100%")
+
+        assert [hit.name for hit in results.items] == ["100% Rye Bread"]
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, catalog):
+        first = await search_recipes(catalog, "curry", limit=1)
+        second = await search_recipes(catalog, "curry", limit=1, offset=1)
+        third = await search_recipes(catalog, "curry", limit=1, offset=2)
+
+        assert first.has_more and second.has_more is False
+        assert first.items[0].id != second.items[0].id
+        # Past the end of the exact matches: no fuzzy fallback
+        assert third.items == [] and third.fuzzy is False
+
+    @pytest.mark.asyncio
+    async def test_blank_query_returns_nothing(self, catalog):
+        results = await search_recipes(catalog, "   ")
+
+        assert results.items == [] and results.has_more is False
+
+
+@pytest.mark.integration
+class TestIngredientSearch:
+    """Test ingredient name search."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_and_typo(self, catalog):
+        prefix = await search_ingredients(catalog, "chick")
+        typo = await search_ingredients(catalog, "cumn")
+
+        assert {hit.name for hit in prefix.items} == {"Chicken Thigh", "Chickpeas"}
+        assert prefix.fuzzy is False
+        assert [hit.name for hit in typo.items] == ["Cumin"]
+        assert typo.fuzzy is True
+
+
+@pytest.mark.integration
+class TestSearchIndexUsage:
+    """Test that the search predicates are index-backed (no seq scans)."""
+
+    @pytest_asyncio.fixture
+    async def no_seqscan(self, async_db_session):
+        # Tiny test tables always favour a seq scan; forbid it so the plan
+        # shows whether an index *can* serve the query.
+        await async_db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        return async_db_session
+
+    @pytest.mark.asyncio
+    async def test_recipe_search_uses_gin_indexes(self, no_seqscan):
+        exact = await explain(no_seqscan, recipe_search_query("chicken"))
+        fuzzy = await explain(no_seqscan, recipe_fuzzy_query("chiken"))
+
+        assert seq_scans(exact) == [] and seq_scans(fuzzy) == []
+        assert index_names(exact) == {
+            "ix_recipes_search_vector",
+            "ix_recipes_name_trgm",
+        }
+        assert index_names(fuzzy) == {"ix_recipes_name_trgm"}
+
+    @pytest.mark.asyncio
+    async def test_ingredient_search_uses_trigram_index(self, no_seqscan):
+        for query in (ingredient_search_query("chick"), ingredient_fuzzy_query("cumn")):
+            plan = await explain(no_seqscan, query)
+
+            assert seq_scans(plan) == []
+            assert index_names(plan) == {"ix_ingredients_name_trgm"}
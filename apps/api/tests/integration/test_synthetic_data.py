@@ -0,0 +1,173 @@
+"""
+Integration tests for the synthetic data generator.
+
+These tests verify that a scale and seed always generate the same rows,
+that the generated data has the intended shape (exact line counts,
+skewed ingredient popularity, one plan per slot), and that seeding loads
+exactly what was generated, keeps the weekly grocery lists consistent and
+leaves the table's triggers and foreign keys in place.
+"""
+
+from collections import Counter
+from datetime import timedelta
+from statistics import median
+
+import pytest
+from sqlalchemy import func, select, text
+
+from models import Ingredient, MealPlan, Recipe, RecipeIngredient
+from services.weekly_grocery import diff_week
+from tests.fixtures.factories import MAX_LINES, Scale, SyntheticData
+
+
+def _generate(scale):
+    data = SyntheticData(scale)
+    return data.ingredients(), list(data.recipes())
+
+
+@pytest.mark.integration
+class TestGenerator:
+    """Rows generated for a Scale, without a database."""
+
+    def test_same_seed_same_rows(self):
+        first = SyntheticData(Scale.named("1k", seed=7))
+        second = SyntheticData(Scale.named("1k", seed=7))
+
+        assert first.ingredients() == second.ingredients()
+        assert list(first.recipes()) == list(second.recipes())
+        assert first.meal_plans(100) == second.meal_plans(100)
+
+    def test_seed_changes_rows(self):
+        _, first = _generate(Scale.named("1k", seed=1))
+        _, second = _generate(Scale.named("1k", seed=2))
+
+        assert first != second
+
+    def test_plan_density_leaves_recipes_alone(self):
+        _, sparse = _generate(Scale.named("1k", plan_density=0.2))
+        _, dense = _generate(Scale.named("1k", plan_density=1.0))
+
+        assert sparse == dense
+
+    def test_exact_line_count(self):
+        _, recipes = _generate(Scale(lines=1234))
+
+        assert sum(len(recipe.lines) for recipe in recipes) == 1234
+
+    def test_lines_per_recipe(self):
+        _, recipes = _generate(Scale.named("10k", lines_per_recipe=9))
+        sizes = [len(recipe.lines) for recipe in recipes]
+
+        assert 8 <= median(sizes) <= 10
+        assert max(sizes) <= MAX_LINES
+        assert min(sizes[:-1]) >= 1
+        for recipe in recipes:
+            used = [line.ingredient for line in recipe.lines]
+            assert len(used) == len(set(used))
+            assert [line.display_order for line in recipe.lines] == list(
+                range(1, len(used) + 1)
+            )
+
+    def test_popularity_is_skewed(self):
+        _, recipes = _generate(Scale.named("10k"))
+        uses = Counter(line.ingredient for recipe in recipes for line in recipe.lines)
+        counts = sorted(uses.values(), reverse=True)
+
+        # The most popular ingredient is in a large share of recipes; the
+        # typical one in a handful
+        assert uses[0] == counts[0]
+        assert counts[0] > len(recipes) / 4
+        assert median(counts) < counts[0] / 20
+
+    def test_base_quantities(self):
+        _, recipes = _generate(Scale.named("1k"))
+        lines = [line for recipe in recipes for line in recipe.lines]
+
+        assert any(line.quantity is None for line in lines)
+        for line in lines:
+            assert (line.quantity is None) == (line.base_quantity is None)
+        pounds = next(line for line in lines if line.unit == "lb" and line.quantity)
+        assert pounds.base_unit == "g"
+        assert pounds.base_quantity > pounds.quantity * 400
+
+    def test_one_plan_per_slot(self):
+        scale = Scale.named("1k", plan_days=28, plan_density=0.5)
+        plans = SyntheticData(scale).meal_plans(100)
+        slots = {(plan.planned_date, plan.meal_type) for plan in plans}
+
+        assert len(slots) == len(plans)
+        assert 14 <= len(plans) <= 42
+        assert all(
+            scale.plan_start <= plan.planned_date < scale.plan_start + timedelta(28)
+            for plan in plans
+        )
+
+    def test_unknown_scale(self):
+        with pytest.raises(ValueError, match="Unknown scale"):
+            Scale.named("7k")
+
+
+@pytest.mark.integration
+class TestSeed:
+    """Bulk-loading a dataset into the test transaction."""
+
+    @pytest.mark.asyncio
+    async def test_seeds_generated_rows(self, async_db_session, synthetic_data):
+        report = await synthetic_data("1k", seed=3, plan_days=56)
+
+        lines = await async_db_session.scalar(
+            select(func.count())
+            .select_from(RecipeIngredient)
+            .where(RecipeIngredient.recipe_id.in_(report.recipe_ids))
+        )
+        plans = await async_db_session.scalar(select(func.count(MealPlan.id)))
+        assert lines == report.lines == 1000
+        assert plans == report.meal_plans > 0
+
+        _, recipes = _generate(report.scale)
+        first = await async_db_session.get(Recipe, report.recipe_ids[0])
+        assert first.name == recipes[0].name
+        assert len(report.recipe_ids) == len(recipes)
+
+    @pytest.mark.asyncio
+    async def test_weekly_grocery_lists_match(self, async_db_session, synthetic_data):
+        report = await synthetic_data("1k", plan_days=21)
+
+        for week in range(3):
+            day = report.scale.plan_start + timedelta(weeks=week)
+            assert await diff_week(async_db_session, day) == []
+
+    @pytest.mark.asyncio
+    async def test_triggers_and_foreign_keys_restored(
+        self, async_db_session, synthetic_data
+    ):
+        await synthetic_data("1k")
+
+        disabled = await async_db_session.scalar(
+            text(
+                "SELECT count(*) FROM pg_trigger WHERE NOT tgisinternal"
+                " AND tgrelid = 'recipe_ingredients'::regclass"
+                " AND tgenabled = 'D'"
+            )
+        )
+        foreign_keys = await async_db_session.scalars(
+            text(
+                "SELECT conname FROM pg_constraint WHERE contype = 'f'"
+                " AND conrelid = 'recipe_ingredients'::regclass ORDER BY conname"
+            )
+        )
+        assert disabled == 0
+        assert foreign_keys.all() == [
+            "recipe_ingredients_ingredient_id_fkey",
+            "recipe_ingredients_recipe_id_fkey",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_seeding_twice_reuses_catalog(self, async_db_session, synthetic_data):
+        first = await synthetic_data("1k", plan_days=0)
+        second = await synthetic_data("1k", plan_days=0)
+
+        ingredients = await async_db_session.scalar(select(func.count(Ingredient.id)))
+        assert ingredients == first.ingredients == second.ingredients
+        assert second.lines == 1000
+        assert not set(first.recipe_ids) & set(second.recipe_ids)
@@ -0,0 +1,147 @@
+"""
+Integration tests for test database provisioning.
+
+These tests verify that the migration key follows the migration scripts,
+that a clone of the template holds the current Alembic head, that
+building a template for new migrations drops the templates of old ones,
+and that tests are isolated: each xdist worker has a database of its own
+and a commit inside a test never reaches other connections.
+"""
+
+import os
+import shutil
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import make_url
+
+from models import Category
+from tests.fixtures.databases import (
+    TEMPLATE_SUFFIX,
+    ensure_template,
+    migration_key,
+    provision_database,
+)
+
+SCRATCH = "mealmind_provisioning_test"
+
+
+@pytest.fixture
+def alembic_cfg():
+    return Config("alembic.ini")
+
+
+@pytest.fixture
+def admin_engine(test_settings):
+    url = make_url(test_settings.DATABASE_URL).set(database="postgres")
+    engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    yield engine
+    with engine.connect() as conn:
+        names = conn.execute(
+            text("SELECT datname FROM pg_database WHERE starts_with(datname, :name)"),
+            {"name": SCRATCH},
+        ).scalars()
+        for name in list(names):
+            conn.execute(text(f'ALTER DATABASE "{name}" WITH IS_TEMPLATE false'))
+            conn.execute(text(f'DROP DATABASE "{name}" WITH (FORCE)'))
+    engine.dispose()
+
+
+def _templates(engine):
+    with engine.connect() as conn:
+        return (
+            conn.execute(
+                text(
+                    "SELECT datname FROM pg_database WHERE datistemplate"
+                    " AND starts_with(datname, :name) ORDER BY datname"
+                ),
+                {"name": SCRATCH},
+            )
+            .scalars()
+            .all()
+        )
+
+
+@pytest.mark.integration
+class TestProvisioning:
+    """Test cloning test databases from a migrated template."""
+
+    def test_migration_key_follows_scripts(self, alembic_cfg, tmp_path):
+        shutil.copytree("alembic", tmp_path / "alembic")
+        copy = Config("alembic.ini")
+        copy.set_main_option("script_location", str(tmp_path / "alembic"))
+        key = migration_key(copy)
+
+        script = next((tmp_path / "alembic" / "versions").glob("*.py"))
+        script.write_text(script.read_text() + "\n# edited in place\n")
+
+        assert key == migration_key(alembic_cfg)
+        assert len(key) == 12
+        assert migration_key(copy) != key
+
+    def test_clone_is_at_head(self, admin_engine, alembic_cfg, test_settings):
+        migrated = []
+
+        def migrate(name):
+            migrated.append(name)
+            url = make_url(test_settings.DATABASE_URL).set(database=name)
+            alembic_cfg.set_main_option(
+                "sqlalchemy.url", url.render_as_string(hide_password=False)
+            )
+            command.upgrade(alembic_cfg, "head")
+
+        first = provision_database(admin_engine, SCRATCH, alembic_cfg, migrate)
+        second = provision_database(admin_engine, SCRATCH, alembic_cfg, migrate)
+
+        assert (first.built, second.built) == (True, False)
+        assert len(migrated) == 1
+        assert second.migrate_seconds == pytest.approx(first.migrate_seconds)
+        clone = create_engine(
+            make_url(test_settings.DATABASE_URL).set(database=SCRATCH)
+        )
+        with clone.connect() as conn:
+            version = conn.execute(text("SELECT version_num FROM alembic_version"))
+            assert (
+                version.scalar()
+                == ScriptDirectory.from_config(alembic_cfg).get_current_head()
+            )
+        clone.dispose()
+
+    def test_new_template_drops_old_ones(self, admin_engine):
+        old, new = (f"{SCRATCH}{TEMPLATE_SUFFIX}{key}" for key in ("aaaa", "bbbb"))
+
+        assert ensure_template(admin_engine, old, lambda name: None)
+        assert not ensure_template(admin_engine, old, lambda name: None)
+        assert _templates(admin_engine) == [old]
+        assert ensure_template(admin_engine, new, lambda name: None)
+        assert _templates(admin_engine) == [new]
+
+
+@pytest.mark.integration
+class TestIsolation:
+    """Test that tests cannot see each other's writes."""
+
+    @pytest.mark.asyncio
+    async def test_database_per_worker(self, async_db_session):
+        name = os.getenv("TEST_DB_NAME", "mealmind_test")
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+
+        current = await async_db_session.scalar(select(func.current_database()))
+
+        assert current == (f"{name}_{worker}" if worker else name)
+
+    @pytest.mark.asyncio
+    async def test_commit_only_releases_a_savepoint(
+        self, async_db_session, async_test_engine
+    ):
+        async_db_session.add(Category(name="Committed in a test"))
+        await async_db_session.commit()
+
+        count = select(func.count()).where(Category.name == "Committed in a test")
+        async with async_test_engine.connect() as other:
+            assert await other.scalar(count) == 0
+        assert await async_db_session.scalar(count) == 1
+        assert async_db_session.bind.in_transaction()
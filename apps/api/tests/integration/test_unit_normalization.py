@@ -0,0 +1,45 @@
+"""
+Integration tests for write-time unit normalization.
+
+These tests verify that RecipeIngredient rows store their quantity in the
+base unit whenever they are inserted or updated through the ORM.
+"""
+
+import pytest
+from decimal import Decimal
+from models.recipe import Recipe
+from models.ingredient import Ingredient
+from models.recipe_ingredient import RecipeIngredient
+
+
+@pytest.mark.integration
+class TestUnitNormalization:
+    """Test base_quantity/base_unit maintenance on RecipeIngredient."""
+
+    def _line(self, db_session, **kwargs):
+        recipe = Recipe(name="Pancakes")
+        ingredient = Ingredient(name="Flour")
+        line = RecipeIngredient(recipe=recipe, ingredient=ingredient, **kwargs)
+        db_session.add(line)
+        db_session.commit()
+        return line
+
+    def test_insert_stores_base_quantity(self, db_session):
+        """Inserting a line converts its quantity to the base unit."""
+        line = self._line(db_session, quantity=Decimal("1.5"), unit="Cups")
+
+        db_session.refresh(line)
+        assert line.base_unit == "ml"
+        assert line.base_quantity == Decimal("354.8824")
+
+    def test_update_recomputes_base_quantity(self, db_session):
+        """Changing quantity or unit keeps the base columns in step."""
+        line = self._line(db_session, quantity=250, unit="g")
+
+        line.quantity = 1
+        line.unit = "lb"
+        db_session.commit()
+
+        db_session.refresh(line)
+        assert line.base_unit == "g"
+        assert line.base_quantity == Decimal("453.5924")
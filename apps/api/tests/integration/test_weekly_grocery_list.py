@@ -0,0 +1,298 @@
+"""
+Integration tests for the materialized weekly grocery list.
+
+These tests verify that the database triggers keep weekly_grocery_items in
+step with meal_plans and recipe_ingredients for every kind of write, and
+that the consistency checker detects and repairs drift.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import delete, select, update
+
+from models import (
+    Ingredient,
+    MealPlan,
+    MealType,
+    Recipe,
+    RecipeIngredient,
+    WeeklyGroceryItem,
+)
+from services.grocery import build_grocery_list
+from services.weekly_grocery import (
+    diff_week,
+    read_weekly_grocery_list,
+    rebuild_week,
+    week_start,
+)
+
+MONDAY = date(2025, 3, 3)
+NEXT_MONDAY = date(2025, 3, 10)
+
+
+async def stored_lines(session, week=MONDAY):
+    """Stored (ingredient name, unit, optional) -> (quantity, lines) of a week."""
+    result = await session.execute(
+        select(
+            Ingredient.name,
+            WeeklyGroceryItem.base_unit,
+            WeeklyGroceryItem.is_optional,
+            WeeklyGroceryItem.quantity,
+            WeeklyGroceryItem.line_count,
+        )
+        .join(Ingredient, Ingredient.id == WeeklyGroceryItem.ingredient_id)
+        .where(WeeklyGroceryItem.week_start == week)
+    )
+    return {
+        (row.name, row.base_unit, row.is_optional): (row.quantity, row.line_count)
+        for row in result
+    }
+
+
+@pytest_asyncio.fixture
+async def pasta(async_db_session):
+    """A recipe with a gram, a volume and an unquantified line."""
+    session = async_db_session
+    recipe = Recipe(name="Pasta")
+    flour = Ingredient(name="Flour")
+    oil = Ingredient(name="Olive Oil")
+    salt = Ingredient(name="Salt")
+    session.add_all(
+        [
+            recipe,
+            RecipeIngredient(recipe=recipe, ingredient=flour, quantity=200, unit="g"),
+            RecipeIngredient(recipe=recipe, ingredient=oil, quantity=1, unit="tbsp"),
+            RecipeIngredient(recipe=recipe, ingredient=salt, quantity=None, unit=None),
+        ]
+    )
+    await session.flush()
+    return recipe
+
+
+@pytest.mark.integration
+class TestWeekStart:
+    """Test that weeks start on Monday like date_trunc('week')."""
+
+    def test_week_start(self):
+        assert week_start(date(2025, 3, 3)) == MONDAY
+        assert week_start(date(2025, 3, 9)) == MONDAY
+        assert week_start(date(2025, 3, 10)) == NEXT_MONDAY
+
+
+@pytest.mark.integration
+class TestMealPlanTriggers:
+    """Test maintenance on meal_plans writes."""
+
+    @pytest.mark.asyncio
+    async def test_insert_adds_recipe_lines(self, async_db_session, pasta):
+        session = async_db_session
+        session.add_all(
+            [
+                MealPlan(recipe=pasta, planned_date=MONDAY, meal_type=MealType.LUNCH),
+                MealPlan(
+                    recipe=pasta,
+                    planned_date=date(2025, 3, 6),
+                    meal_type=MealType.DINNER,
+                ),
+            ]
+        )
+        await session.flush()
+
+        assert await stored_lines(session) == {
+            ("Flour", "g", False): (Decimal("400.0000"), 2),
+            ("Olive Oil", "ml", False): (Decimal("29.5736"), 2),
+            ("Salt", None, False): (Decimal("0.0000"), 2),
+        }
+        assert await stored_lines(session, NEXT_MONDAY) == {}
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_lines(self, async_db_session, pasta):
+        session = async_db_session
+        plan = MealPlan(recipe=pasta, planned_date=MONDAY, meal_type=MealType.LUNCH)
+        session.add(plan)
+        await session.flush()
+
+        await session.delete(plan)
+        await session.flush()
+
+        assert await stored_lines(session) == {}
+
+    @pytest.mark.asyncio
+    async def test_moving_a_meal_moves_its_lines(self, async_db_session, pasta):
+        session = async_db_session
+        plan = MealPlan(recipe=pasta, planned_date=MONDAY, meal_type=MealType.LUNCH)
+        session.add(plan)
+        await session.flush()
+
+        plan.planned_date = date(2025, 3, 11)
+        await session.flush()
+
+        assert await stored_lines(session) == {}
+        assert len(await stored_lines(session, NEXT_MONDAY)) == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_slot_contributes_nothing(self, async_db_session, pasta):
+        session = async_db_session
+        plan = MealPlan(recipe_id=None, planned_date=MONDAY, meal_type=MealType.LUNCH)
+        session.add(plan)
+        await session.flush()
+        assert await stored_lines(session) == {}
+
+        plan.recipe_id = pasta.id
+        await session.flush()
+        assert len(await stored_lines(session)) == 3
+
+
+@pytest.mark.integration
+class TestRecipeIngredientTriggers:
+    """Test maintenance on recipe_ingredients writes for planned recipes."""
+
+    @pytest_asyncio.fixture
+    async def planned(self, async_db_session, pasta):
+        session = async_db_session
+        session.add_all(
+            [
+                MealPlan(recipe=pasta, planned_date=MONDAY, meal_type=MealType.LUNCH),
+                MealPlan(
+                    recipe=pasta, planned_date=NEXT_MONDAY, meal_type=MealType.LUNCH
+                ),
+            ]
+        )
+        await session.flush()
+        return pasta
+
+    @pytest.mark.asyncio
+    async def test_new_line_is_added_to_every_planned_week(
+        self, async_db_session, planned
+    ):
+        session = async_db_session
+        session.add(
+            RecipeIngredient(
+                recipe=planned,
+                ingredient=Ingredient(name="Basil"),
+                quantity=1,
+                unit="bunch",
+                is_optional=True,
+            )
+        )
+        await session.flush()
+
+        for week in (MONDAY, NEXT_MONDAY):
+            lines = await stored_lines(session, week)
+            assert lines[("Basil", "bunch", True)] == (Decimal("1.0000"), 1)
+
+    @pytest.mark.asyncio
+    async def test_quantity_and_unit_change(self, async_db_session, planned):
+        session = async_db_session
+        line = await session.scalar(
+            select(RecipeIngredient).join(Ingredient).where(Ingredient.name == "Flour")
+        )
+        line.quantity = Decimal("0.5")
+        line.unit = "kg"
+        await session.flush()
+
+        lines = await stored_lines(session)
+        assert lines[("Flour", "g", False)] == (Decimal("500.0000"), 1)
+
+    @pytest.mark.asyncio
+    async def test_line_delete(self, async_db_session, planned):
+        session = async_db_session
+        await session.execute(
+            delete(RecipeIngredient).where(
+                RecipeIngredient.recipe_id == planned.id,
+                RecipeIngredient.unit == "tbsp",
+            )
+        )
+
+        assert ("Olive Oil", "ml", False) not in await stored_lines(session)
+
+    @pytest.mark.asyncio
+    async def test_recipe_delete_removes_contribution_once(
+        self, async_db_session, planned
+    ):
+        """CASCADE and SET NULL both fire; the lines must drop exactly once."""
+        session = async_db_session
+        other = Recipe(name="Bread")
+        session.add_all(
+            [
+                other,
+                RecipeIngredient(
+                    recipe=other,
+                    ingredient_id=(
+                        await session.scalar(
+                            select(Ingredient.id).where(Ingredient.name == "Flour")
+                        )
+                    ),
+                    quantity=300,
+                    unit="g",
+                ),
+                MealPlan(recipe=other, planned_date=MONDAY, meal_type=MealType.DINNER),
+            ]
+        )
+        await session.flush()
+
+        await session.execute(delete(Recipe).where(Recipe.id == planned.id))
+
+        assert await stored_lines(session) == {
+            ("Flour", "g", False): (Decimal("300.0000"), 1),
+        }
+        assert await stored_lines(session, NEXT_MONDAY) == {}
+
+
+@pytest.mark.integration
+class TestWeeklyReadAndConsistency:
+    """Test the read path and the consistency checker."""
+
+    @pytest_asyncio.fixture
+    async def planned(self, async_db_session, pasta):
+        session = async_db_session
+        session.add_all(
+            [
+                MealPlan(recipe=pasta, planned_date=MONDAY, meal_type=MealType.LUNCH),
+                MealPlan(
+                    recipe=pasta,
+                    planned_date=date(2025, 3, 8),
+                    meal_type=MealType.DINNER,
+                ),
+            ]
+        )
+        await session.flush()
+        return pasta
+
+    @pytest.mark.asyncio
+    async def test_matches_on_demand_aggregation(self, async_db_session, planned):
+        session = async_db_session
+        materialized = await read_weekly_grocery_list(session, date(2025, 3, 5))
+        on_demand = await build_grocery_list(session, MONDAY, date(2025, 3, 9))
+
+        assert materialized == on_demand
+
+    @pytest.mark.asyncio
+    async def test_diff_is_empty_after_writes(self, async_db_session, planned):
+        session = async_db_session
+        await session.execute(
+            update(RecipeIngredient)
+            .where(RecipeIngredient.recipe_id == planned.id)
+            .values(is_optional=True)
+        )
+
+        assert await diff_week(session, MONDAY) == []
+
+    @pytest.mark.asyncio
+    async def test_rebuild_repairs_drift(self, async_db_session, planned):
+        session = async_db_session
+        await session.execute(
+            update(WeeklyGroceryItem)
+            .where(
+                WeeklyGroceryItem.week_start == MONDAY,
+                WeeklyGroceryItem.quantity_count > 0,
+            )
+            .values(quantity=Decimal("1"))
+        )
+        discrepancies = await diff_week(session, MONDAY)
+        assert {line.unit for line in discrepancies} == {"g", "ml"}
+
+        assert await rebuild_week(session, MONDAY) == 3
+        assert await diff_week(session, MONDAY) == []
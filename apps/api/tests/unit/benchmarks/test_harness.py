@@ -0,0 +1,162 @@
+"""
+Unit tests for the benchmark harness.
+"""
+
+import pytest
+
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    Stats,
+    Threshold,
+    compare,
+    load,
+    save,
+)
+
+
+def _result(name, median):
+    stats = Stats(
+        rounds=5,
+        min=median,
+        max=median,
+        mean=median,
+        median=median,
+        stddev=0.0,
+        p95=median,
+    )
+    return BenchmarkResult(name=name, group="path", params={}, stats=stats)
+
+
+@pytest.mark.unit
+class TestStats:
+    """Summaries of a path's round timings."""
+
+    def test_from_timings(self):
+        stats = Stats.from_timings([0.004, 0.001, 0.003, 0.002, 0.010])
+
+        assert stats.rounds == 5
+        assert (stats.min, stats.max, stats.median) == (0.001, 0.010, 0.003)
+        assert stats.mean == pytest.approx(0.004)
+        assert stats.p95 == 0.010
+
+    def test_single_round(self):
+        stats = Stats.from_timings([0.002])
+
+        assert stats.stddev == 0.0
+        assert stats.p95 == 0.002
+
+    def test_no_timings(self):
+        with pytest.raises(ValueError):
+            Stats.from_timings([])
+
+
+@pytest.mark.unit
+class TestBenchmark:
+    """The benchmark fixture's timing loop."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_rounds_are_not_timed(self):
+        calls = []
+
+        async def target(value):
+            calls.append(value)
+            return value * 2
+
+        benchmark = Benchmark("test_path[1k]", "path", rounds=5, warmup=2)
+        result = await benchmark(target, 21)
+
+        assert result == 42
+        assert len(calls) == 7
+        assert benchmark.result.stats.rounds == 5
+        assert benchmark.result.name == "test_path[1k]"
+
+    @pytest.mark.asyncio
+    async def test_pedantic_setup_and_teardown(self):
+        events = []
+
+        async def setup():
+            events.append("setup")
+
+        async def teardown():
+            events.append("teardown")
+
+        async def target():
+            events.append("target")
+
+        benchmark = Benchmark(
+            "test_path", "path", between_rounds=lambda: events.append("clear")
+        )
+        await benchmark.pedantic(
+            target, setup=setup, teardown=teardown, rounds=2, warmup=0
+        )
+
+        assert events == ["clear", "setup", "target", "teardown"] * 2
+
+    @pytest.mark.asyncio
+    async def test_once_per_test(self):
+        async def target():
+            return None
+
+        benchmark = Benchmark("test_path", "path", rounds=1, warmup=0)
+        await benchmark(target)
+
+        with pytest.raises(RuntimeError):
+            await benchmark(target)
+
+
+@pytest.mark.unit
+class TestThreshold:
+    """Parsing regression thresholds."""
+
+    def test_percent(self):
+        threshold = Threshold.parse("median:25%")
+
+        assert threshold == Threshold("median", 25.0, percent=True)
+        assert threshold.allowed(0.004) == pytest.approx(0.005)
+        assert str(threshold) == "median:25%"
+
+    def test_seconds(self):
+        threshold = Threshold.parse("p95:0.002")
+
+        assert threshold.allowed(0.004) == pytest.approx(0.006)
+
+    @pytest.mark.parametrize("text", ["median", "fastest:10%", "mean:"])
+    def test_invalid(self, text):
+        with pytest.raises(ValueError, match="Invalid threshold"):
+            Threshold.parse(text)
+
+
+@pytest.mark.unit
+class TestCompare:
+    """Gating results against a saved baseline."""
+
+    def test_regressions_beyond_threshold(self):
+        baseline = {"a": _result("a", 0.010).stats, "b": _result("b", 0.010).stats}
+        results = [_result("a", 0.0124), _result("b", 0.0126), _result("c", 1.0)]
+
+        comparison = compare(results, baseline, [Threshold.parse("median:25%")])
+
+        assert [r.name for r in comparison.regressions] == ["b"]
+        assert comparison.new == ["c"]
+        assert "+26%" in str(comparison.regressions[0])
+
+    def test_every_threshold_is_checked(self):
+        baseline = {"a": _result("a", 0.010).stats}
+        thresholds = [Threshold.parse("median:50%"), Threshold.parse("median:0.001")]
+
+        comparison = compare([_result("a", 0.012)], baseline, thresholds)
+
+        assert [str(r.threshold) for r in comparison.regressions] == ["median:0.001"]
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "results" / "baseline.json"
+        results = [_result("a", 0.010), _result("b", 0.020)]
+
+        save(path, results, scales=["1k"])
+
+        assert load(path) == {result.name: result.stats for result in results}
+        assert (
+            compare(results, load(path), [Threshold.parse("median:0%")]).regressions
+            == []
+        )
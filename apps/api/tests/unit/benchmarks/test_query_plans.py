@@ -0,0 +1,116 @@
+"""
+Unit tests for the query plan assertions.
+"""
+
+import pytest
+
+from benchmarks.query_plans import (
+    LARGE_TABLE_ROWS,
+    CriticalQuery,
+    PlanCheck,
+    outline,
+    plan_problems,
+)
+
+WEEK = CriticalQuery(
+    "meal_plan_week", lambda db: None, indexes=("ix_meal_plans_planned_date_id",)
+)
+
+INDEXED = {
+    "Node Type": "Limit",
+    "Plan Rows": 15,
+    "Actual Rows": 14.0,
+    "Actual Loops": 1,
+    "Plans": [
+        {
+            "Node Type": "Index Scan",
+            "Index Name": "ix_meal_plans_planned_date_id",
+            "Relation Name": "meal_plans",
+            "Plan Rows": 11680,
+            "Actual Rows": 14.0,
+            "Actual Loops": 1,
+        }
+    ],
+}
+
+SEQUENTIAL = {
+    "Node Type": "Sort",
+    "Plan Rows": 19,
+    "Actual Rows": 14.0,
+    "Actual Loops": 1,
+    "Plans": [
+        {
+            "Node Type": "Seq Scan",
+            "Relation Name": "meal_plans",
+            "Plan Rows": 19,
+            "Actual Rows": 400.0,
+            "Actual Loops": 1,
+        }
+    ],
+}
+
+
+@pytest.mark.unit
+class TestPlanProblems:
+    """Checking a plan against its critical query."""
+
+    def test_indexed_plan_passes(self):
+        # The scan's estimate covers the whole range; the Limit stops it
+        assert plan_problems(WEEK, INDEXED, {"meal_plans": LARGE_TABLE_ROWS}) == []
+
+    def test_seq_scan_on_large_table(self):
+        problems = plan_problems(WEEK, SEQUENTIAL, {"meal_plans": 11680})
+
+        assert problems == [
+            "Seq Scan on meal_plans (11680 rows)",
+            "Seq Scan on meal_plans estimated 19 rows and read 400 (allowed 10x)",
+            "ix_meal_plans_planned_date_id is not used",
+        ]
+
+    def test_seq_scan_on_small_table(self):
+        problems = plan_problems(WEEK, SEQUENTIAL, {"meal_plans": 500})
+
+        assert "Seq Scan on meal_plans (500 rows)" not in problems
+
+    def test_misestimate_allowance(self):
+        query = CriticalQuery("meal_plan_week", lambda db: None, (), misestimate=25)
+
+        assert plan_problems(query, SEQUENTIAL, {}) == []
+
+
+@pytest.mark.unit
+class TestOutline:
+    """Rendering and diffing plan outlines."""
+
+    def test_outline(self):
+        assert outline(INDEXED) == [
+            "Limit",
+            "    -> Index Scan using ix_meal_plans_planned_date_id on meal_plans",
+        ]
+        assert outline(SEQUENTIAL, rows=True) == [
+            "Sort  rows=19/14",
+            "    -> Seq Scan on meal_plans  rows=19/400",
+        ]
+
+    def test_join_type(self):
+        plan = {"Node Type": "Nested Loop", "Join Type": "Left", "Plan Rows": 1}
+
+        assert outline(plan) == ["Nested Loop (Left)"]
+
+    def test_diff_against_recorded(self):
+        check = PlanCheck(WEEK, SEQUENTIAL, [], outline(SEQUENTIAL), outline(INDEXED))
+
+        assert check.changed
+        assert check.diff().splitlines()[2:] == [
+            "@@ -1,2 +1,2 @@",
+            "-Limit",
+            "-    -> Index Scan using ix_meal_plans_planned_date_id on meal_plans",
+            "+Sort",
+            "+    -> Seq Scan on meal_plans",
+        ]
+
+    def test_nothing_recorded(self):
+        check = PlanCheck(WEEK, INDEXED, [], outline(INDEXED), None)
+
+        assert check.changed
+        assert check.diff().startswith("No recorded plan in ")
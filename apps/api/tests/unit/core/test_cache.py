@@ -0,0 +1,154 @@
+"""
+Unit tests for the LRU + TTL cache and the in-process cache backend.
+"""
+
+import pytest
+
+from core.cache import CacheStats, LRUCache, MemoryBackend, create_backend
+from core.redis import RedisBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """Test lookups, eviction order and expiry."""
+
+    def test_hits_and_misses_are_counted(self):
+        cache = LRUCache(maxsize=4)
+        cache.set(1, "one")
+
+        assert cache.get(1) == "one"
+        assert cache.get(2) is None
+        assert cache.get_many([1, 2, 3]) == {1: "one"}
+        assert (cache.stats.hits, cache.stats.misses) == (2, 3)
+        assert cache.stats.hit_ratio == pytest.approx(0.4)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set(1, "one")
+        cache.set(2, "two")
+        cache.get(1)
+        cache.set(3, "three")
+
+        assert 1 in cache and 3 in cache
+        assert 2 not in cache
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(maxsize=2, ttl=10, clock=clock)
+        cache.set(1, "one")
+
+        clock.now = 9.9
+        assert cache.get(1) == "one"
+        clock.now = 10.0
+        assert cache.get(1) is None
+        assert len(cache) == 0
+        assert cache.stats.expirations == 1
+
+    def test_set_refreshes_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(maxsize=2, ttl=10, clock=clock)
+        cache.set(1, "one")
+        clock.now = 8
+        cache.set(1, "uno")
+        clock.now = 15
+
+        assert cache.get(1) == "uno"
+
+    def test_invalidate_and_clear(self):
+        cache = LRUCache(maxsize=4)
+        cache.set_many([(1, "one"), (2, "two"), (3, "three")])
+
+        cache.invalidate(1)
+        cache.invalidate(99)
+        assert 1 not in cache
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats.invalidations == 3
+
+    def test_membership_is_not_a_lookup(self):
+        cache = LRUCache(maxsize=4)
+        cache.set(1, "one")
+
+        assert 1 in cache
+        assert 2 not in cache
+        assert cache.stats == CacheStats()
+
+    def test_values_skip_expired_entries(self):
+        clock = FakeClock()
+        cache = LRUCache(maxsize=4, ttl=10, clock=clock)
+        cache.set(1, "one")
+        cache.set(2, "two", ttl=20)
+        clock.now = 15
+
+        assert cache.values() == ["two"]
+        assert cache.stats == CacheStats()
+
+    def test_maxsize_must_be_positive(self):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+
+@pytest.mark.unit
+class TestMemoryBackend:
+    """Test the in-process CacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_set_get_and_expiry(self):
+        clock = FakeClock()
+        backend = MemoryBackend(clock=clock)
+        await backend.set("a", b"1", ttl=5)
+        await backend.set("b", b"2")
+
+        assert await backend.get_many(["a", "b", "c"]) == [b"1", b"2", None]
+        clock.now = 5
+        assert await backend.get("a") is None
+        assert await backend.get("b") == b"2"
+
+    @pytest.mark.asyncio
+    async def test_add_only_when_absent(self):
+        backend = MemoryBackend()
+
+        assert await backend.add("lock", b"1") is True
+        assert await backend.add("lock", b"2") is False
+        await backend.delete("lock")
+        assert await backend.add("lock", b"3") is True
+        assert await backend.get("lock") == b"3"
+
+    @pytest.mark.asyncio
+    async def test_incr_starts_from_zero(self):
+        backend = MemoryBackend()
+
+        assert await backend.incr("n") == 1
+        assert await backend.incr("n") == 2
+        assert await backend.get("n") == b"2"
+
+
+@pytest.mark.unit
+class TestCreateBackend:
+    """Test choosing a backend from a URL."""
+
+    @pytest.mark.parametrize("url", [None, "", "memory://"])
+    def test_memory(self, url):
+        assert isinstance(create_backend(url), MemoryBackend)
+
+    def test_redis(self):
+        backend = create_backend("redis://:secret@cache:6380/2")
+
+        assert isinstance(backend, RedisBackend)
+        options = backend.pool.connection_kwargs
+        assert (options["host"], options["port"], options["db"]) == ("cache", 6380, 2)
+        assert options["password"] == "secret"
+
+    def test_unknown_scheme(self):
+        with pytest.raises(ValueError):
+            create_backend("memcached://cache")
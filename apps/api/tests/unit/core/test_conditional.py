@@ -0,0 +1,92 @@
+"""
+Unit tests for ETag / Last-Modified validators and precondition evaluation.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from core.conditional import Validators, etag_matches, is_not_modified
+
+MODIFIED = datetime(2025, 3, 3, 12, 30, 15, 250000)
+
+
+@pytest.mark.unit
+class TestValidators:
+    """Test deriving validators from aggregate values."""
+
+    def test_etag_is_strong_and_stable(self):
+        first = Validators.of("recipe", 1, 3, last_modified=MODIFIED)
+        again = Validators.of("recipe", 1, 3, last_modified=MODIFIED)
+
+        assert first == again
+        assert first.etag.startswith('"') and first.etag.endswith('"')
+
+    @pytest.mark.parametrize(
+        "parts, last_modified",
+        [(("recipe", 1, 4), MODIFIED), (("recipe", 1, 3), datetime(2025, 3, 4))],
+        ids=["count", "timestamp"],
+    )
+    def test_etag_changes_with_state(self, parts, last_modified):
+        assert (
+            Validators.of(*parts, last_modified=last_modified).etag
+            != Validators.of("recipe", 1, 3, last_modified=MODIFIED).etag
+        )
+
+    def test_headers(self):
+        headers = Validators.of("recipe", last_modified=MODIFIED).headers()
+
+        assert headers["Last-Modified"] == "Mon, 03 Mar 2025 12:30:15 GMT"
+        assert headers["Cache-Control"] == "no-cache"
+        assert Validators.of("empty").headers().keys() == {"ETag", "Cache-Control"}
+
+    def test_naive_timestamps_are_utc(self):
+        aware = MODIFIED.replace(tzinfo=timezone.utc)
+
+        assert Validators.of(last_modified=MODIFIED).last_modified == aware
+
+
+@pytest.mark.unit
+class TestPreconditions:
+    """Test If-None-Match and If-Modified-Since evaluation."""
+
+    validators = Validators.of("recipe", 1, last_modified=MODIFIED)
+
+    @pytest.mark.parametrize(
+        "header, matches",
+        [
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"x", "abc"', True),
+            ("*", True),
+            ('"abcd"', False),
+        ],
+    )
+    def test_etag_matches(self, header, matches):
+        assert etag_matches(header, '"abc"') is matches
+
+    @pytest.mark.parametrize(
+        "headers, not_modified",
+        [
+            ({}, False),
+            ({"if-modified-since": "Mon, 03 Mar 2025 12:30:15 GMT"}, True),
+            ({"if-modified-since": "Mon, 03 Mar 2025 12:30:14 GMT"}, False),
+            ({"if-modified-since": "yesterday"}, False),
+            # If-None-Match takes precedence over If-Modified-Since
+            (
+                {
+                    "if-none-match": '"other"',
+                    "if-modified-since": "Mon, 03 Mar 2025 12:30:15 GMT",
+                },
+                False,
+            ),
+        ],
+        ids=["none", "same-second", "older", "invalid", "etag-first"],
+    )
+    def test_is_not_modified(self, headers, not_modified):
+        assert is_not_modified(headers, self.validators) is not_modified
+
+    def test_matching_etag(self):
+        headers = {"if-none-match": self.validators.etag}
+
+        assert is_not_modified(headers, self.validators)
@@ -0,0 +1,44 @@
+"""
+Unit tests for the shared database layer helpers.
+"""
+
+import pytest
+from core.db import PoolMetrics, to_async_url
+
+
+@pytest.mark.unit
+class TestAsyncUrl:
+    """Test DATABASE_URL rewriting for the asyncpg driver."""
+
+    @pytest.mark.parametrize(
+        "database_url",
+        [
+            "postgres://postgres:postgres@db:5432/postgres",
+            "postgresql://postgres:postgres@db:5432/postgres",
+            "postgresql+psycopg2://postgres:postgres@db:5432/postgres",
+        ],
+        ids=["postgres", "postgresql", "psycopg2"],
+    )
+    def test_driver_rewritten_to_asyncpg(self, database_url):
+        """Every accepted scheme is rewritten to postgresql+asyncpg."""
+        url = to_async_url(database_url)
+        assert url.drivername == "postgresql+asyncpg"
+        assert url.host == "db"
+        assert url.database == "postgres"
+        assert url.password == "postgres"
+
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Test checkout wait accounting."""
+
+    def test_record_wait_tracks_total_and_max(self):
+        """Waits accumulate and the longest one is remembered."""
+        metrics = PoolMetrics()
+        metrics.record_wait(0.01)
+        metrics.record_wait(0.05)
+        metrics.record_wait(0.02)
+
+        assert metrics.checkouts == 3
+        assert metrics.wait_seconds_total == pytest.approx(0.08)
+        assert metrics.wait_seconds_max == pytest.approx(0.05)
@@ -0,0 +1,52 @@
+"""
+Unit tests for EXPLAIN plan helpers.
+"""
+
+import pytest
+
+from core.explain import index_names, plan_nodes, seq_scans
+
+PLAN = {
+    "Node Type": "Limit",
+    "Plans": [
+        {
+            "Node Type": "Bitmap Heap Scan",
+            "Relation Name": "recipes",
+            "Plans": [
+                {
+                    "Node Type": "BitmapOr",
+                    "Plans": [
+                        {
+                            "Node Type": "Bitmap Index Scan",
+                            "Index Name": "ix_recipes_search_vector",
+                        },
+                        {
+                            "Node Type": "Bitmap Index Scan",
+                            "Index Name": "ix_recipes_name_trgm",
+                        },
+                    ],
+                }
+            ],
+        },
+        {"Node Type": "Seq Scan", "Relation Name": "categories"},
+    ],
+}
+
+
+@pytest.mark.unit
+class TestPlanHelpers:
+    """Test walking JSON plans."""
+
+    def test_plan_nodes_is_depth_first(self):
+        assert [node["Node Type"] for node in plan_nodes(PLAN)] == [
+            "Limit",
+            "Bitmap Heap Scan",
+            "BitmapOr",
+            "Bitmap Index Scan",
+            "Bitmap Index Scan",
+            "Seq Scan",
+        ]
+
+    def test_index_names_and_seq_scans(self):
+        assert index_names(PLAN) == {"ix_recipes_search_vector", "ix_recipes_name_trgm"}
+        assert seq_scans(PLAN) == ["categories"]
@@ -0,0 +1,132 @@
+"""
+Unit tests for the cached, time-bounded readiness check.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from core.health import ReadinessCheck
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeConnection:
+    """Records statements; each one takes ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.0, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.statements = []
+
+    @asynccontextmanager
+    async def connect(self):
+        if self.error is not None:
+            raise self.error
+        yield self
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+    async def rollback(self):
+        self.statements.append("ROLLBACK")
+
+    async def execute(self, statement):
+        await asyncio.sleep(self.delay)
+        self.statements.append(str(statement))
+
+    async def scalar(self, statement):
+        await self.execute(statement)
+        return 1
+
+
+@pytest.mark.unit
+class TestReadinessCheck:
+    """Test probing, caching and bounding the readiness check."""
+
+    @pytest.mark.asyncio
+    async def test_ready_with_statement_timeout(self):
+        connection = FakeConnection()
+
+        result = await ReadinessCheck(ttl=2, timeout=0.25).check(connection.connect)
+
+        assert result.ready
+        assert connection.statements == [
+            "SET LOCAL statement_timeout = 250",
+            "SELECT 1",
+            "ROLLBACK",
+        ]
+        assert result.as_dict()["status"] == "ready"
+
+    @pytest.mark.asyncio
+    async def test_result_cached_for_ttl(self):
+        clock = FakeClock()
+        check = ReadinessCheck(ttl=2, timeout=1, clock=clock)
+        connection = FakeConnection()
+
+        for now in (0, 1, 1.9):
+            clock.now = now
+            await check.check(connection.connect)
+        clock.now = 2
+        await check.check(connection.connect)
+
+        assert check.probes == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self):
+        check = ReadinessCheck(ttl=2, timeout=1)
+        connection = FakeConnection(delay=0.01)
+
+        results = await asyncio.gather(
+            *(check.check(connection.connect) for _ in range(10))
+        )
+
+        assert all(result.ready for result in results)
+        assert check.probes == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_database_is_not_ready(self):
+        check = ReadinessCheck(ttl=2, timeout=0.05)
+
+        result = await check.check(FakeConnection(delay=1).connect)
+
+        assert not result.ready
+        assert result.latency_seconds < 0.5
+        assert result.as_dict() == {
+            "status": "unavailable",
+            "database": {
+                "latency_seconds": result.latency_seconds,
+                "error": "No answer within 0.05s",
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_error_hides_details(self):
+        check = ReadinessCheck(ttl=2, timeout=1)
+
+        result = await check.check(
+            FakeConnection(error=OSError("connect to 10.0.0.5 refused")).connect
+        )
+
+        assert not result.ready
+        assert result.error == "OSError"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_probe(self):
+        check = ReadinessCheck(ttl=2, timeout=1)
+        connection = FakeConnection(delay=0.02)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(check.check(connection.connect), 0.01)
+        result = await check.check(connection.connect)
+
+        assert result.ready
+        assert check.probes == 1
@@ -0,0 +1,95 @@
+"""
+Unit tests for merging worker metrics and SQL normalization.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.instrumentation import normalize_sql
+from core.metrics import MULTIPROC_DIR_VARIABLE, render
+
+API_DIR = Path(__file__).resolve().parents[3]
+
+
+def run_worker(directory: Path, code: str) -> None:
+    env = {**os.environ, MULTIPROC_DIR_VARIABLE: str(directory)}
+    script = f"from core.instrumentation import *\nfrom core.metrics import *\n{code}"
+    subprocess.run([sys.executable, "-c", script], cwd=API_DIR, env=env, check=True)
+
+
+@pytest.mark.unit
+class TestMultiprocess:
+    """Test one exposition of the metrics of every worker."""
+
+    def test_workers_are_merged(self, tmp_path, monkeypatch):
+        serve = (
+            "HTTP_REQUESTS.labels('GET', '/recipes', 200).inc()\n"
+            "HTTP_REQUESTS_IN_PROGRESS.inc()\n"
+        )
+        run_worker(tmp_path, serve)
+        # A worker that shut down cleanly is no longer in progress, but its
+        # requests still count
+        run_worker(tmp_path, serve + "process_exited()")
+        monkeypatch.setenv(MULTIPROC_DIR_VARIABLE, str(tmp_path))
+
+        exposition = render().decode()
+
+        assert (
+            'mealmind_http_requests_total{method="GET",route="/recipes",status="200"}'
+            " 2.0" in exposition
+        )
+        assert "mealmind_http_requests_in_progress 1.0" in exposition
+
+    def test_single_process_without_the_directory(self, monkeypatch):
+        monkeypatch.delenv(MULTIPROC_DIR_VARIABLE, raising=False)
+
+        assert "# TYPE mealmind_http_requests_total counter" in render().decode()
+
+
+@pytest.mark.unit
+class TestNormalizeSql:
+    """Test grouping statements that differ only in their parameters."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "SELECT recipes.id FROM recipes WHERE recipes.id IN ($1::INTEGER)",
+            "SELECT recipes.id\nFROM recipes\nWHERE recipes.id IN "
+            "($1::INTEGER, $2::INTEGER, $3::INTEGER)",
+        ],
+    )
+    def test_in_lists_collapse(self, statement):
+        assert normalize_sql(statement) == (
+            "SELECT recipes.id FROM recipes WHERE recipes.id IN (?)"
+        )
+
+    def test_literals_and_placeholders(self):
+        statement = (
+            "SELECT * FROM t WHERE a = 'it''s' AND b = 42 AND c = %(c)s "
+            "AND d > $1::TIMESTAMP WITHOUT TIME ZONE LIMIT 10 -- note"
+        )
+
+        assert normalize_sql(statement) == (
+            "SELECT * FROM t WHERE a = ? AND b = ? AND c = ? AND d > ? LIMIT ?"
+        )
+
+    def test_multi_row_values_collapse(self):
+        statement = (
+            "INSERT INTO meal_plans (planned_date, meal_type) "
+            "VALUES ($1::DATE, $2), ($3::DATE, $4), ($5::DATE, $6) "
+            "RETURNING meal_plans.id"
+        )
+
+        assert normalize_sql(statement) == (
+            "INSERT INTO meal_plans (planned_date, meal_type) VALUES (?) "
+            "RETURNING meal_plans.id"
+        )
+
+    def test_identifiers_keep_their_digits(self):
+        statement = "SELECT anon_1.id, t2.name FROM t2 JOIN anon_1 ON true"
+
+        assert normalize_sql(statement) == statement
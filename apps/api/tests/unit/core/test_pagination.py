@@ -0,0 +1,70 @@
+"""
+Unit tests for keyset pagination helpers.
+"""
+
+import pytest
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from core.pagination import InvalidCursorError, Keyset
+from models import MealPlan, Recipe
+
+RECIPES = Keyset(Recipe.name, Recipe.id)
+MEAL_PLANS = Keyset(MealPlan.planned_date, MealPlan.id)
+
+
+@pytest.mark.unit
+class TestCursorTokens:
+    """Test encoding and decoding of opaque cursors."""
+
+    def test_round_trip(self):
+        assert RECIPES.decode(RECIPES.encode(("Pad Thai", 42))) == ("Pad Thai", 42)
+        assert MEAL_PLANS.decode(MEAL_PLANS.encode((date(2025, 3, 3), 7))) == (
+            date(2025, 3, 3),
+            7,
+        )
+
+    def test_cursor_is_url_safe(self):
+        cursor = RECIPES.encode(("Crème brûlée? & more/+", 1))
+
+        assert cursor.isascii()
+        assert not set(cursor) & set("+/=?&")
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not a cursor", "", "W10", RECIPES.encode(("only one value",))],
+        ids=["garbage", "empty", "empty-list", "wrong-arity"],
+    )
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            RECIPES.decode(cursor)
+
+    def test_cursor_from_other_keyset_is_rejected(self):
+        with pytest.raises(InvalidCursorError):
+            MEAL_PLANS.decode(RECIPES.encode(("Pad Thai", 42)))
+
+
+@pytest.mark.unit
+class TestKeysetQuery:
+    """Test the SQL a keyset adds to a listing query."""
+
+    def test_first_page_is_ordered_and_limited(self):
+        sql = str(
+            RECIPES.apply(select(Recipe.id, Recipe.name), None, 20).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "WHERE" not in sql
+        assert "ORDER BY recipes.name, recipes.id" in sql
+        assert "LIMIT" in sql
+
+    def test_next_page_uses_row_comparison(self):
+        sql = str(
+            RECIPES.apply(select(Recipe.id, Recipe.name), ("Pad Thai", 42), 20).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "WHERE (recipes.name, recipes.id) > (" in sql
@@ -0,0 +1,163 @@
+"""
+Unit tests for profiling tokens, the stack sampler and profile formats.
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from core.config import settings
+from core.profiling import (
+    NOT_RUNNING,
+    Frame,
+    Profile,
+    Sampler,
+    Statement,
+    profiling_allowed,
+    sign_token,
+    verify_token,
+)
+
+NOW = 1_750_000_000
+
+
+@pytest.mark.unit
+class TestTokens:
+    """Test signing and checking X-Profile tokens."""
+
+    def test_valid_until_expiry(self):
+        token = sign_token("secret", NOW + 60)
+
+        assert verify_token(token, "secret", now=NOW)
+        assert not verify_token(token, "secret", now=NOW + 61)
+
+    @pytest.mark.parametrize(
+        "token",
+        ["", "1", "abc.def", f"{NOW + 60}.{'0' * 64}", sign_token("other", NOW + 60)],
+    )
+    def test_forged_or_malformed(self, token):
+        assert not verify_token(token, "secret", now=NOW)
+
+    def test_allowed_with_debug_or_secret(self, monkeypatch):
+        token = sign_token("secret", int(time.time()) + 60)
+        monkeypatch.setattr(settings, "DEBUG", False)
+        monkeypatch.setattr(settings, "PROFILING_SECRET", None)
+
+        assert not profiling_allowed(token)
+        monkeypatch.setattr(settings, "PROFILING_SECRET", "secret")
+        assert profiling_allowed(token)
+        assert not profiling_allowed("1")
+        monkeypatch.setattr(settings, "DEBUG", True)
+        assert profiling_allowed("1")
+        assert not profiling_allowed(None)
+
+
+def busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.mark.unit
+class TestSampler:
+    """Test sampling the running task's stack."""
+
+    @pytest.mark.asyncio
+    async def test_samples_running_task_and_waits(self):
+        sampler = Sampler(0.001, root=sys._getframe())
+        sampler.start()
+        busy(0.05)
+        await asyncio.sleep(0.05)
+        sampler.stop()
+
+        names = {frame.name for stack, _ in sampler.samples for frame in stack}
+        assert "busy" in names
+        assert NOT_RUNNING in names
+        # Weighted samples add up to roughly the sampled wall time
+        assert sum(w for _, w in sampler.samples) == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_other_tasks_are_not_running(self):
+        async def other():
+            busy(0.05)
+
+        sampler = Sampler(0.001, root=sys._getframe())
+        sampler.start()
+        await asyncio.create_task(other())
+        sampler.stop()
+
+        names = {frame.name for stack, _ in sampler.samples for frame in stack}
+        assert names == {NOT_RUNNING}
+
+    def test_stop_does_not_wait_for_the_thread(self):
+        sampler = Sampler(60)
+        sampler.start()
+
+        started = time.perf_counter()
+        sampler.stop()
+
+        assert time.perf_counter() - started < 1
+        assert sampler.samples == []
+
+    def test_stack_is_cut_at_root(self):
+        def outer():
+            sampler.root = sys._getframe()
+            return inner()
+
+        def inner():
+            return sampler._stack()
+
+        sampler = Sampler(0.001)
+
+        # Sampled from its own thread, so the leaf is the sampler itself
+        assert [frame.name for frame in outer()] == [
+            outer.__qualname__,
+            inner.__qualname__,
+            "Sampler._stack",
+        ]
+
+
+def sample_profile() -> Profile:
+    handler = Frame("get_recipe", "routers/recipes.py", 60)
+    query = Frame("get_recipe_detail", "services/recipes.py", 120)
+    waiting = Frame(NOT_RUNNING, "", 0)
+    profile = Profile(method="GET", path="/recipes/1", duration=0.03)
+    profile.samples = [
+        ((handler, query), 0.01),
+        ((handler, query), 0.01),
+        ((waiting,), 0.01),
+    ]
+    profile.statements = [Statement("SELECT 1", start=0.01, duration=0.005)]
+    return profile
+
+
+@pytest.mark.unit
+class TestProfileFormats:
+    """Test collapsed stacks and the speedscope file."""
+
+    def test_collapsed(self):
+        assert sample_profile().collapsed() == (
+            "get_recipe (routers/recipes.py:60);"
+            "get_recipe_detail (services/recipes.py:120) 2\n"
+            f"{NOT_RUNNING} 1\n"
+        )
+
+    def test_speedscope(self):
+        document = sample_profile().speedscope()
+        frames = document["shared"]["frames"]
+        sampled, evented = document["profiles"]
+
+        assert [frame["name"] for frame in frames] == [
+            "get_recipe",
+            "get_recipe_detail",
+            NOT_RUNNING,
+            "SELECT 1",
+        ]
+        assert sampled["samples"] == [[0, 1], [0, 1], [2]]
+        assert sampled["weights"] == [0.01, 0.01, 0.01]
+        assert evented["events"] == [
+            {"type": "O", "frame": 3, "at": 0.01},
+            {"type": "C", "frame": 3, "at": 0.015},
+        ]
@@ -0,0 +1,38 @@
+"""
+Unit tests for read-model projections.
+"""
+
+from typing import Optional
+
+import pytest
+from sqlalchemy import column
+
+from core.projections import read_model, select_into
+
+
+@read_model
+class Line:
+    name: str
+    quantity: Optional[int] = None
+
+
+@pytest.mark.unit
+class TestReadModel:
+    """Test declaring read models and selecting into them."""
+
+    def test_instances_are_slotted(self):
+        line = Line("Leek", 2)
+
+        assert not hasattr(line, "__dict__")
+        assert line == Line(name="Leek", quantity=2)
+        with pytest.raises(AttributeError):
+            line.unit = "each"
+
+    def test_columns_are_labelled_after_fields(self):
+        statement = select_into(Line, column("ingredient_name"), column("qty"))
+
+        assert list(statement.selected_columns.keys()) == ["name", "quantity"]
+
+    def test_column_count_must_match(self):
+        with pytest.raises(ValueError, match="Line has 2 fields, got 1 columns"):
+            select_into(Line, column("ingredient_name"))
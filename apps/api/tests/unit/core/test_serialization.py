@@ -0,0 +1,79 @@
+"""
+Unit tests for fast JSON serialization.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from core.projections import read_model
+from core.serialization import FastJSONResponse, dumps, render
+
+
+class Meal(str, Enum):
+    LUNCH = "lunch"
+
+
+class Line(BaseModel):
+    name: str
+    quantity: Optional[Decimal] = None
+    planned_date: date
+    meal: Meal
+    updated_at: datetime
+
+
+@read_model
+class LineRow:
+    name: str
+    quantity: Optional[Decimal]
+    planned_date: date
+    meal: Meal
+    updated_at: datetime
+
+
+VALUES = [
+    ("Crème fraîche", Decimal("2.500"), timezone.utc),
+    ("Leek", Decimal("1E+2"), timezone(timedelta(hours=2))),
+    ("Salt", None, None),
+]
+
+
+@pytest.mark.unit
+class TestDumps:
+    """Test that read models encode as Pydantic encodes the same schema."""
+
+    @pytest.mark.parametrize("name, quantity, tz", VALUES)
+    def test_read_model_matches_pydantic(self, name, quantity, tz):
+        fields = dict(
+            name=name,
+            quantity=quantity,
+            planned_date=date(2025, 3, 3),
+            meal=Meal.LUNCH,
+            updated_at=datetime(2025, 3, 3, 12, 30, 5, 1500, tzinfo=tz),
+        )
+
+        assert dumps(LineRow(**fields)) == render(Line(**fields))
+
+    def test_nested_models_fall_back_to_pydantic(self):
+        line = Line(
+            name="Leek",
+            planned_date=date(2025, 3, 3),
+            meal=Meal.LUNCH,
+            updated_at=datetime(2025, 3, 3),
+        )
+
+        assert dumps({"items": [line]}) == b'{"items":[%s]}' % render(line)
+
+    def test_unknown_types_raise(self):
+        with pytest.raises(TypeError):
+            dumps({"tags": {"soup"}})
+
+    def test_response(self):
+        response = FastJSONResponse({"quantity": Decimal("0.5")})
+
+        assert response.body == b'{"quantity":"0.5"}'
+        assert response.media_type == "application/json"
@@ -0,0 +1,103 @@
+"""
+Unit tests for the unit registry and quantity conversion.
+"""
+
+import pytest
+from decimal import Decimal
+from core.units import (
+    UnitConversionError,
+    canonicalize,
+    canonicalize_many,
+    convert,
+    resolve_unit,
+)
+
+
+@pytest.mark.unit
+class TestResolveUnit:
+    """Test resolving free-form unit spellings."""
+
+    @pytest.mark.parametrize(
+        "spelling", ["tbsp", "Tablespoon", "tablespoons", "Tbsp.", " TBS "]
+    )
+    def test_spellings_resolve_to_same_unit(self, spelling):
+        """Case, plurals, dots and whitespace don't matter."""
+        factor, base_unit, unit = resolve_unit(spelling)
+
+        assert unit.name == "tbsp"
+        assert base_unit == "ml"
+        assert factor == Decimal("14.78676478125")
+
+    def test_leading_multiplier_folded_into_factor(self):
+        """ "15 ml" is fifteen millilitres per unit of quantity."""
+        factor, base_unit, unit = resolve_unit("15 ml")
+
+        assert (factor, base_unit, unit.name) == (Decimal(15), "ml", "ml")
+
+    def test_unknown_unit_is_its_own_base(self):
+        """Unrecognised units are normalised but kept as-is."""
+        factor, base_unit, unit = resolve_unit("  Big  Jar ")
+
+        assert (factor, base_unit, unit) == (Decimal(1), "big jar", None)
+
+    def test_kitchen_unit_plural_shares_base(self):
+        """ "cloves" and "clove" are the same base unit."""
+        assert resolve_unit("cloves")[1] == resolve_unit("Clove")[1] == "clove"
+
+
+@pytest.mark.unit
+class TestCanonicalize:
+    """Test conversion of quantities to base units."""
+
+    @pytest.mark.parametrize(
+        "quantity,unit,expected",
+        [
+            (2, "kg", (Decimal("2000.0000"), "g")),
+            (Decimal("1.5"), "l", (Decimal("1500.0000"), "ml")),
+            (1, "cup", (Decimal("236.5882"), "ml")),
+            (3, "whole", (Decimal("3.0000"), "each")),
+            (1, "dozen", (Decimal("12.0000"), "each")),
+            (None, "g", (None, "g")),
+            (2, None, (Decimal("2.0000"), None)),
+            (None, None, (None, None)),
+        ],
+        ids=["kg", "litre", "cup", "whole", "dozen", "no-quantity", "no-unit", "empty"],
+    )
+    def test_canonicalize(self, quantity, unit, expected):
+        """Quantities are converted and rounded to the stored scale."""
+        assert canonicalize(quantity, unit) == expected
+
+    def test_batch_matches_single_row(self):
+        """canonicalize_many gives the same answers as canonicalize."""
+        quantities = [1, 2, None, Decimal("0.5"), 4]
+        units = ["tbsp", "15 ml", "g", "lb", "pinch"]
+
+        base_quantities, base_units = canonicalize_many(quantities, units)
+
+        assert list(zip(base_quantities, base_units)) == [
+            canonicalize(quantity, unit) for quantity, unit in zip(quantities, units)
+        ]
+
+    def test_batch_rejects_mismatched_lengths(self):
+        """Parallel inputs must line up."""
+        with pytest.raises(ValueError):
+            canonicalize_many([1, 2], ["g"])
+
+
+@pytest.mark.unit
+class TestConvert:
+    """Test conversion between two registered units."""
+
+    def test_same_dimension(self):
+        """A cup is sixteen tablespoons."""
+        assert convert(1, "cup", "tbsp") == Decimal(16)
+
+    def test_cross_dimension_rejected(self):
+        """Mass cannot be converted to volume."""
+        with pytest.raises(UnitConversionError):
+            convert(1, "g", "ml")
+
+    def test_unknown_unit_rejected(self):
+        """Conversions need both units in the registry."""
+        with pytest.raises(UnitConversionError):
+            convert(1, "jar", "g")
@@ -0,0 +1,60 @@
+"""
+Unit tests for grocery list helpers that do not touch the database.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import date
+from services.grocery import grocery_list_query, group_into_aisles
+from schemas.grocery import GroceryItem
+
+
+def _item(ingredient_id, name, category_id=None, category_name=None):
+    return GroceryItem(
+        ingredient_id=ingredient_id,
+        ingredient_name=name,
+        unit="g",
+        quantity=Decimal("100.00"),
+        line_count=1,
+        category_id=category_id,
+        category_name=category_name,
+    )
+
+
+@pytest.mark.unit
+class TestGroupIntoAisles:
+    """Test grouping ordered grocery items by category."""
+
+    def test_consecutive_items_share_an_aisle(self):
+        """Items are grouped per category, preserving query order."""
+        items = [
+            _item(1, "Butter", 10, "Dairy"),
+            _item(2, "Milk", 10, "Dairy"),
+            _item(3, "Carrot", 20, "Produce"),
+            _item(4, "Salt"),
+        ]
+
+        aisles = group_into_aisles(items)
+
+        assert [aisle.category_name for aisle in aisles] == ["Dairy", "Produce", None]
+        assert [item.ingredient_name for item in aisles[0].items] == ["Butter", "Milk"]
+        assert aisles[2].category_id is None
+
+    def test_empty_list_has_no_aisles(self):
+        """An empty grocery list yields no aisles."""
+        assert group_into_aisles([]) == []
+
+
+@pytest.mark.unit
+class TestGroceryListQuery:
+    """Test the shape of the aggregation statement."""
+
+    def test_groups_by_ingredient_unit_and_optional_flag(self):
+        """The statement aggregates per ingredient, unit and optional flag."""
+        sql = str(grocery_list_query(date(2025, 1, 1), date(2025, 1, 7)))
+
+        assert (
+            "GROUP BY recipe_ingredients.ingredient_id, recipe_ingredients.base_unit, "
+            "recipe_ingredients.is_optional" in sql
+        )
+        assert "sum(recipe_ingredients.base_quantity)" in sql
@@ -0,0 +1,64 @@
+"""
+Unit tests for parsing meal plan files.
+"""
+
+import io
+from datetime import date
+
+import pytest
+
+from models import MealType
+from services.meal_plan_import import MealPlanFileError, read_meal_plans
+
+CSV = """planned_date,meal_type,recipe_ref,recipe_name,notes
+2025-03-03,lunch,7,Soup,"Double, please"
+2025-03-03,dinner,,,
+"""
+
+
+@pytest.mark.unit
+class TestReadMealPlans:
+    """Test meal plan file parsing."""
+
+    def test_reads_csv_with_blank_cells_as_null(self):
+        records = list(read_meal_plans(io.StringIO(CSV), "csv"))
+
+        assert [(r.planned_date, r.meal_type) for r in records] == [
+            (date(2025, 3, 3), MealType.LUNCH),
+            (date(2025, 3, 3), MealType.DINNER),
+        ]
+        assert records[0].recipe_ref == "7"
+        assert records[0].notes == "Double, please"
+        assert records[1].recipe_ref is None
+        assert records[1].recipe_name is None
+
+    def test_reads_jsonl_and_skips_blank_lines(self):
+        lines = [
+            '{"planned_date": "2025-03-03", "meal_type": "lunch", '
+            '"recipe_name": "Soup"}\n',
+            "\n",
+        ]
+
+        (record,) = read_meal_plans(lines, "jsonl")
+
+        assert record.recipe_name == "Soup"
+
+    def test_slot_listed_twice_names_the_line(self):
+        lines = CSV + "2025-03-03,lunch,,,\n"
+
+        with pytest.raises(MealPlanFileError, match="line 4: .* listed twice"):
+            list(read_meal_plans(io.StringIO(lines), "csv"))
+
+    def test_invalid_row_names_the_line(self):
+        lines = CSV + "2025-03-04,brunch,,,\n"
+
+        with pytest.raises(MealPlanFileError, match="line 4: meal_type"):
+            list(read_meal_plans(io.StringIO(lines), "csv"))
+
+    def test_requires_slot_columns(self):
+        with pytest.raises(MealPlanFileError, match="missing required columns"):
+            list(read_meal_plans(io.StringIO("recipe_name\nSoup\n"), "csv"))
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown meal plan file format"):
+            list(read_meal_plans([], "xml"))
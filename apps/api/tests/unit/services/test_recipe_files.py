@@ -0,0 +1,121 @@
+"""
+Unit tests for parsing recipe interchange files.
+"""
+
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from services.recipe_files import (
+    RecipeFileError,
+    format_for_path,
+    read_csv,
+    read_jsonl,
+    read_recipes,
+)
+
+CSV = """recipe_ref,name,servings,instructions,ingredient,category,quantity,unit,is_optional
+1,Pancakes,4,"Whisk.
+Fry.",Flour,Pantry,200,g,
+1,Pancakes,4,,Milk,Dairy,300,ml,false
+1,Pancakes,4,,Syrup,,,,true
+2,Pancakes,2,,,,,,
+3,Toast,1,,Bread,,2,slice,
+"""
+
+
+@pytest.mark.unit
+class TestReadJsonl:
+    """Test JSON Lines parsing."""
+
+    def test_parses_records_and_skips_blank_lines(self):
+        lines = [
+            json.dumps(
+                {
+                    "name": " Pancakes ",
+                    "servings": 4,
+                    "ingredients": [
+                        {"ingredient": "Flour", "quantity": "200", "unit": "g"}
+                    ],
+                }
+            ),
+            "\n",
+            json.dumps({"name": "Toast"}),
+        ]
+
+        recipes = list(read_jsonl(lines))
+
+        assert [recipe.name for recipe in recipes] == ["Pancakes", "Toast"]
+        assert recipes[0].ingredients[0].quantity == Decimal("200")
+        assert recipes[1].ingredients == []
+
+    @pytest.mark.parametrize(
+        "line,message",
+        [
+            ("{not json", "Invalid JSON"),
+            ('{"servings": 2}', "name: Field required"),
+            ('{"name": "X", "ingredients": [{"ingredient": ""}]}', "ingredients.0"),
+        ],
+    )
+    def test_errors_name_the_line(self, line, message):
+        with pytest.raises(RecipeFileError, match=f"line 2: .*{message}"):
+            list(read_jsonl(['{"name": "Ok"}', line]))
+
+
+@pytest.mark.unit
+class TestReadCsv:
+    """Test CSV parsing and row grouping."""
+
+    def test_groups_rows_by_recipe_ref(self):
+        recipes = list(read_csv(io.StringIO(CSV)))
+
+        assert [(r.name, len(r.ingredients)) for r in recipes] == [
+            ("Pancakes", 3),
+            ("Pancakes", 0),
+            ("Toast", 1),
+        ]
+        pancakes = recipes[0]
+        assert pancakes.instructions == "Whisk.\nFry."
+        assert pancakes.ingredients[1].category == "Dairy"
+        assert pancakes.ingredients[2].quantity is None
+        assert pancakes.ingredients[2].category is None
+        assert pancakes.ingredients[2].is_optional is True
+
+    def test_groups_rows_by_name_without_ref_column(self):
+        text = "name,ingredient\nSoup,Leek\nSoup,Potato\nSalad,Kale\n"
+
+        recipes = list(read_csv(io.StringIO(text)))
+
+        assert [(r.name, len(r.ingredients)) for r in recipes] == [
+            ("Soup", 2),
+            ("Salad", 1),
+        ]
+
+    def test_error_names_first_line_of_recipe(self):
+        text = "name,ingredient,quantity\nSoup,Leek,1\nStew,Beef,lots\n"
+
+        with pytest.raises(RecipeFileError, match="line 3: ingredients.0.quantity"):
+            list(read_csv(io.StringIO(text)))
+
+    def test_requires_name_column(self):
+        with pytest.raises(RecipeFileError, match="name"):
+            list(read_csv(io.StringIO("ingredient\nLeek\n")))
+
+    def test_empty_file(self):
+        assert list(read_csv(io.StringIO(""))) == []
+
+
+@pytest.mark.unit
+class TestFormats:
+    """Test format selection."""
+
+    def test_format_for_path(self):
+        assert format_for_path("recipes.CSV") == "csv"
+        assert format_for_path("recipes.jsonl") == "jsonl"
+        assert format_for_path("-") == "jsonl"
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            read_recipes([], "xml")
@@ -0,0 +1,37 @@
+"""
+Unit tests for search helpers that do not touch the database.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.search import (
+    contains_pattern,
+    normalize_query,
+    recipe_fuzzy_query,
+    recipe_search_query,
+)
+
+
+@pytest.mark.unit
+class TestQueryHelpers:
+    """Test query normalisation and ILIKE escaping."""
+
+    def test_normalize_query_collapses_whitespace(self):
+        assert normalize_query("  chicken \t tikka\n") == "chicken tikka"
+
+    def test_contains_pattern_escapes_wildcards(self):
+        assert contains_pattern("100%") == "%100\\%%"
+        assert contains_pattern("a_b") == "%a\\_b%"
+        assert contains_pattern("c:\\") == "%c:\\\\%"
+
+    def test_queries_use_indexable_operators(self):
+        exact = str(
+            recipe_search_query("chicken").compile(dialect=postgresql.dialect())
+        )
+        fuzzy = str(recipe_fuzzy_query("chicken").compile(dialect=postgresql.dialect()))
+
+        assert "search_vector @@ websearch_to_tsquery" in exact
+        assert "recipes.name ILIKE " in exact
+        assert "%%>" not in exact
+        assert "recipes.name %%> " in fuzzy
@@ -0,0 +1,37 @@
+"""
+Unit tests for the application's route table.
+"""
+
+import inspect
+
+import pytest
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from main import app
+
+
+def _calls(dependant: Dependant):
+    yield dependant.call
+    for dependency in dependant.dependencies:
+        yield from _calls(dependency)
+
+
+@pytest.mark.unit
+class TestRoutes:
+    """Test that requests are served on the event loop."""
+
+    def test_endpoints_and_dependencies_are_async(self):
+        # FastAPI runs plain def endpoints and dependencies in a threadpool
+        # of 40 threads, which then caps concurrency for the whole worker
+        blocking = [
+            f"{route.path}: {call.__qualname__}"
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for call in _calls(route.dependant)
+            if not (
+                inspect.iscoroutinefunction(call) or inspect.isasyncgenfunction(call)
+            )
+        ]
+
+        assert blocking == []